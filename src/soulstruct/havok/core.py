@@ -2,8 +2,11 @@ from __future__ import annotations
 
 __all__ = ["HKX", "HKX_ROOT_TYPING", "HavokFileFormat"]
 
+import contextlib
+import hashlib
 import io
 import logging
+import mmap
 import re
 import traceback
 import typing as tp
@@ -21,20 +24,27 @@ from soulstruct.havok.packfile.structs import PackfileHeaderInfo
 from soulstruct.havok.packfile.unpacker import PackFileUnpacker
 from soulstruct.havok.tagfile.packer import TagFilePacker
 from soulstruct.havok.tagfile.unpacker import TagFileUnpacker, MissingCompendiumError
-from soulstruct.havok.types import hk2010, hk2014, hk2015, hk2016, hk2018
+from soulstruct.havok.types.hk import hk
 from soulstruct.havok.types.info import TypeInfo
+from soulstruct.havok.utilities.memory_reader import MemoryReader, map_file
+
+if tp.TYPE_CHECKING:
+    from soulstruct.havok.types import hk2010, hk2014, hk2015, hk2016, hk2018
 
 _LOGGER = logging.getLogger(__name__)
 
+# Version type modules are only imported as needed, so root types are forward references.
 HKX_ROOT_TYPING = tp.Union[
     None,
-    hk2010.hkRootLevelContainer,
-    hk2014.hkRootLevelContainer,
-    hk2015.hkRootLevelContainer,
-    hk2016.hkRootLevelContainer,
-    hk2018.hkRootLevelContainer,
+    "hk2010.hkRootLevelContainer",
+    "hk2014.hkRootLevelContainer",
+    "hk2015.hkRootLevelContainer",
+    "hk2016.hkRootLevelContainer",
+    "hk2018.hkRootLevelContainer",
 ]
 
+# Compendium HKX files parsed in this process, keyed by a hash of their binary data. See `HKX.get_cached_compendium()`.
+_COMPENDIUM_CACHE = {}  # type: dict[bytes, HKX]
 
 
 class HKX(GameFile):
@@ -77,7 +87,19 @@ class HKX(GameFile):
     packfile_header_info: None | PackfileHeaderInfo = None
 
     @classmethod
-    def from_reader(cls, reader: BinaryReader, hk_format: HavokFileFormat = None, compendium: HKX = None) -> tp.Self:
+    def from_reader(
+        cls,
+        reader: BinaryReader,
+        hk_format: HavokFileFormat = None,
+        compendium: HKX = None,
+        variants: tp.Container[str] = None,
+    ) -> tp.Self:
+        """Unpack HKX from `reader`, auto-detecting its format if `hk_format` is not given.
+
+        If `variants` is given, only root container named variants whose `className` (e.g. 'hkaAnimationContainer') is
+        in `variants` are unpacked, which can be much faster for large files. Other variants are set to `None`, so the
+        HKX should not be written afterward.
+        """
         if hk_format is None:
             # Auto-detect format.
             hk_format = cls._detect_hk_format(reader)
@@ -87,33 +109,56 @@ class HKX(GameFile):
         if hk_format == HavokFileFormat.Packfile:
             if compendium is not None:
                 raise ValueError("`compendium` was passed with HKX packfile source (used only by newer tagfiles).")
-            return cls.from_packfile_reader(reader)
+            return cls.from_packfile_reader(reader, variants)
         elif hk_format == HavokFileFormat.Tagfile:
-            return cls.from_tagfile_reader(reader, compendium=compendium)
+            return cls.from_tagfile_reader(reader, compendium=compendium, variants=variants)
 
         raise ValueError(f"Invalid `hk_format` value: {hk_format}")
 
     @classmethod
     def from_bytes(
         cls,
-        data: bytes | bytearray | io.BufferedIOBase | BinaryReader,
+        data: bytes | bytearray | memoryview | mmap.mmap | BinderEntry | io.BufferedIOBase | BinaryReader,
         hk_format: HavokFileFormat = None,
         compendium: HKX = None,
+        variants: tp.Container[str] = None,
+        zero_copy=False,
     ) -> tp.Self:
-        """Load instance from binary data or binary stream (or `BinderEntry.data`)."""
-        reader = BinaryReader(data) if not isinstance(data, BinaryReader) else data  # type: BinaryReader
+        """Load instance from binary data or binary stream (or `BinderEntry`).
+
+        In-memory data (including `BinderEntry.data`) is parsed in place with a `MemoryReader`, without being copied.
+
+        If `zero_copy` is True, arrays of primitive types are unpacked as NumPy arrays (including `uint8` bytes), as
+        with `hk.numpy_primitive_arrays()`, and fixed-layout float struct arrays as `StructArray`s, as with
+        `hk.struct_arrays()`. These arrays are views of `data` rather than copies. They are read-only if `data` is, and
+        keep `data` alive. (DCX-compressed data is decompressed first.)
+
+        See `from_reader()` for `variants`.
+        """
+        if isinstance(data, BinderEntry):
+            data = data.get_uncompressed_data()
+        if isinstance(data, BinaryReader):
+            reader = data
+        elif isinstance(data, (bytes, bytearray, memoryview, mmap.mmap)):
+            reader = MemoryReader(data, zero_copy=zero_copy)
+        else:
+            reader = BinaryReader(data)
 
         if is_dcx(reader):
             try:
                 data, dcx_type = decompress(reader)
             finally:
                 reader.close()
-            reader = BinaryReader(data)
+            reader = MemoryReader(data, zero_copy=zero_copy)
         else:
             dcx_type = DCXType.Null
 
         try:
-            binary_file = cls.from_reader(reader, hk_format, compendium)
+            with contextlib.ExitStack() as stack:
+                if zero_copy:
+                    stack.enter_context(hk.numpy_primitive_arrays())
+                    stack.enter_context(hk.struct_arrays())
+                binary_file = cls.from_reader(reader, hk_format, compendium, variants)
             binary_file.dcx_type = dcx_type
         except Exception:
             traceback.print_exc()
@@ -124,10 +169,27 @@ class HKX(GameFile):
         return binary_file
 
     @classmethod
-    def from_path(cls, path: str | Path, hk_format: HavokFileFormat = None, compendium: HKX = None) -> tp.Self:
+    def from_path(
+        cls,
+        path: str | Path,
+        hk_format: HavokFileFormat = None,
+        compendium: HKX = None,
+        variants: tp.Container[str] = None,
+        memory_map=False,
+    ) -> tp.Self:
+        """Load instance from file `path`.
+
+        If `memory_map` is True, the file is mapped into memory (with copy-on-write access) and parsed in place with
+        `zero_copy=True` (see `from_bytes()`), so large arrays are writable views of the mapped file rather than copies.
+        This is fastest for scanning many large files. The mapping is kept open until all such arrays are deleted, and
+        on Windows, the file cannot be overwritten until then.
+        """
         path = Path(path)
         try:
-            game_file = cls.from_bytes(BinaryReader(path), hk_format, compendium)
+            if memory_map:
+                game_file = cls.from_bytes(map_file(path), hk_format, compendium, variants, zero_copy=True)
+            else:
+                game_file = cls.from_bytes(BinaryReader(path), hk_format, compendium, variants)
         except Exception:
             # Traceback already printed.
             _LOGGER.error(f"Error occurred while reading `{cls.__name__}` with path '{path}'. See traceback.")
@@ -158,13 +220,14 @@ class HKX(GameFile):
         entry_spec: int | Path | str | re.Pattern = None,
         hk_format: HavokFileFormat = None,
         compendium_name: str = "",
+        variants: tp.Container[str] = None,
     ) -> tp.Self:
         """Use or auto-detect `{binder_source.name}.compendium` file in binder, if present."""
         compendium, compendium_name = cls.get_compendium_from_binder(binder, compendium_name)
 
         entry = binder[entry_spec]
         try:
-            hkx = cls.from_bytes(entry, hk_format=hk_format, compendium=compendium)
+            hkx = cls.from_bytes(entry, hk_format=hk_format, compendium=compendium, variants=variants)
         except MissingCompendiumError:
             if compendium_name != "":
                 raise MissingCompendiumError(
@@ -182,13 +245,14 @@ class HKX(GameFile):
     def get_compendium_from_binder(binder: Binder, compendium_name="") -> tuple[HKX | None, str]:
         """Search for '.compendium' HKX type file in `binder`. Name may be given, or the extension alone may be sought.
 
-        Returns the compendium found (may be `None`) and its name.
+        Returns the compendium found (may be `None`) and its name. Compendiums are parsed once per process and shared
+        (see `get_cached_compendium()`).
         """
         if compendium_name == "":
             # Search for '*.compendium' binder entry.
             compendium_entries = binder.find_entries_by_name_regex(r".*\.compendium")
             if len(compendium_entries) == 1:
-                compendium = HKX.from_bytes(compendium_entries[0])
+                compendium = HKX.get_cached_compendium(compendium_entries[0])
                 compendium_name = compendium_entries[0].name
             elif len(compendium_entries) > 1:
                 # This can happen in `DivBinder`s, where the same compendium is duplicated into every written Binder.
@@ -198,7 +262,7 @@ class HKX(GameFile):
                         f"Multiple '.compendium' files found in binder: {[e.name for e in compendium_entries]}."
                     )
                 else:
-                    compendium = HKX.from_bytes(compendium_entries[0])
+                    compendium = HKX.get_cached_compendium(compendium_entries[0])
                     compendium_name = compendium_entries[0].name
             else:
                 # Otherwise, no compendiums found; assume not needed and complain below if otherwise.
@@ -208,14 +272,38 @@ class HKX(GameFile):
                 compendium_entry = binder.find_entry_by_name(compendium_name)
             except EntryNotFoundError:
                 raise MissingCompendiumError(f"Compendium file '{compendium_name}' not present in given binder.")
-            compendium = compendium_entry.to_binary_file(HKX)  # always base `HKX` class
+            compendium = HKX.get_cached_compendium(compendium_entry)
         return compendium, compendium_name
 
+    @staticmethod
+    def get_cached_compendium(compendium_source: bytes | BinderEntry) -> HKX:
+        """Parse compendium HKX from `compendium_source` (always with base `HKX` class), or return the compendium already
+        parsed from identical data in this process.
+
+        Every TCRF file in a binder (e.g. all Elden Ring animations in an ANIBND) refers to the same compendium, so its
+        type section is only parsed, and its type infos only matched to Python classes, once. The returned compendium is
+        shared and should not be modified.
+        """
+        data = compendium_source.data if isinstance(compendium_source, BinderEntry) else compendium_source
+        data_hash = hashlib.sha1(data).digest()
+        try:
+            return _COMPENDIUM_CACHE[data_hash]
+        except KeyError:
+            pass
+        compendium = _COMPENDIUM_CACHE[data_hash] = HKX.from_bytes(compendium_source)
+        return compendium
+
+    @staticmethod
+    def clear_compendium_cache():
+        """Forget all compendiums parsed by `get_cached_compendium()`."""
+        _COMPENDIUM_CACHE.clear()
+
     @classmethod
-    def from_packfile_reader(cls, reader: BinaryReader) -> tp.Self:
+    def from_packfile_reader(cls, reader: BinaryReader, variants: tp.Container[str] = None) -> tp.Self:
         """`reader` HKX file format is known to be `packfile`."""
         unpacker = PackFileUnpacker()
-        unpacker.unpack(reader)
+        unpacker.unpack(reader, variants=variants)
+        unpacker.detach_item_data()
 
         return cls(
             unpacker=unpacker,
@@ -227,10 +315,12 @@ class HKX(GameFile):
         )
 
     @classmethod
-    def from_tagfile_reader(cls, reader: BinaryReader, compendium: tp.Optional[HKX] = None) -> tp.Self:
+    def from_tagfile_reader(
+        cls, reader: BinaryReader, compendium: tp.Optional[HKX] = None, variants: tp.Container[str] = None
+    ) -> tp.Self:
         """Buffer is known to be `tagfile`."""
         unpacker = TagFileUnpacker()
-        unpacker.unpack(reader, compendium=compendium)
+        unpacker.unpack(reader, compendium=compendium, variants=variants)
 
         return cls(
             unpacker=unpacker,
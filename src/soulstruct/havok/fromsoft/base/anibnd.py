@@ -10,7 +10,9 @@ import abc
 import copy
 import logging
 import typing as tp
+from collections.abc import MutableMapping
 from dataclasses import dataclass, field
+from multiprocessing import Pool
 from pathlib import Path
 
 import numpy as np
@@ -21,8 +23,9 @@ try:
 except ModuleNotFoundError:
     plt = cm = None
 
-from soulstruct.containers import Binder
+from soulstruct.containers import Binder, BinderEntry
 
+from soulstruct.havok.core import HKX
 from soulstruct.havok.spline_compression import *
 from soulstruct.havok.tagfile.unpacker import MissingCompendiumError
 from soulstruct.havok.utilities.maths import Quaternion, TRSTransform, Vector3
@@ -38,6 +41,61 @@ except ImportError:
 _LOGGER = logging.getLogger(__name__)
 
 
+class LazyAnimationsHKX(MutableMapping[int, BaseAnimationHKX]):
+    """Maps animation IDs to `AnimationHKX` files that are only unpacked from their Binder entries when first accessed.
+
+    Otherwise behaves like the usual `dict` of `BaseANIBND.animations_hkx`, including preserving entry order.
+    """
+
+    def __init__(self, animation_hkx_class: type[BaseAnimationHKX], entries: dict[int, BinderEntry], compendium=None):
+        self._animation_hkx_class = animation_hkx_class
+        self._compendium = compendium
+        self._animations = dict(entries)  # type: dict[int, BaseAnimationHKX | BinderEntry]
+
+    def is_loaded(self, anim_id: int) -> bool:
+        """Check if animation `anim_id` has been unpacked yet."""
+        return not isinstance(self._animations[anim_id], BinderEntry)
+
+    def __getitem__(self, anim_id: int) -> BaseAnimationHKX:
+        animation_hkx = self._animations[anim_id]
+        if isinstance(animation_hkx, BinderEntry):
+            animation_hkx = self._animation_hkx_class.from_bytes(animation_hkx, compendium=self._compendium)
+            self._animations[anim_id] = animation_hkx
+        return animation_hkx
+
+    def __setitem__(self, anim_id: int, animation_hkx: BaseAnimationHKX):
+        self._animations[anim_id] = animation_hkx
+
+    def __delitem__(self, anim_id: int):
+        del self._animations[anim_id]
+
+    def __iter__(self) -> tp.Iterator[int]:
+        return iter(self._animations)
+
+    def __len__(self) -> int:
+        return len(self._animations)
+
+    def __repr__(self) -> str:
+        loaded_count = sum(self.is_loaded(anim_id) for anim_id in self._animations)
+        return f"LazyAnimationsHKX({len(self)} animations, {loaded_count} loaded)"
+
+
+# Compendium HKX unpacked once by each `load_from_entries()` worker process.
+_WORKER_COMPENDIUM = None  # type: HKX | None
+
+
+def _init_animation_worker(compendium_data: bytes | None):
+    global _WORKER_COMPENDIUM
+    _WORKER_COMPENDIUM = HKX.get_cached_compendium(compendium_data) if compendium_data is not None else None
+
+
+def _unpack_animation_hkx(animation_hkx_class: type[BaseAnimationHKX], data: bytes) -> BaseAnimationHKX:
+    animation_hkx = animation_hkx_class.from_bytes(data, compendium=_WORKER_COMPENDIUM)
+    # Unpacker is not needed to use or write the animation, and more than doubles the size sent back to the parent.
+    animation_hkx.unpacker = None
+    return animation_hkx
+
+
 class BaseANIBND(Binder, abc.ABC):
 
     ANIMATION_HKX: tp.ClassVar[tp.Type[BaseAnimationHKX]]
@@ -56,11 +114,15 @@ class BaseANIBND(Binder, abc.ABC):
     # Can be passed to `load_from_entries()` to only load certain animations from the Binder.
     animation_ids_to_load: list[int] = field(default_factory=list)
 
-    def load_from_entries(self, *animation_ids_to_load: int):
+    def load_from_entries(self, *animation_ids_to_load: int, lazy=False, processes=1):
         """Load managed HKX skeleton and animations from Binder entries.
 
         Must be called manually so user has a chance to set `animation_ids_to_load` first.
 
+        If `lazy=True`, `animations_hkx` will be a `LazyAnimationsHKX` mapping that only unpacks each animation when it
+        is first accessed. Otherwise, if `processes > 1`, animations are unpacked in parallel by a pool of that many
+        worker processes (without their `unpacker`). Either way, `animations_hkx` has the same (Binder entry) order.
+
         TODO: refactor to `load_animation_entries()`.
         """
         if animation_ids_to_load:
@@ -77,22 +139,38 @@ class BaseANIBND(Binder, abc.ABC):
                 skeleton_entry = self.find_entry_by_name_regex(r"[Ss]keleton\.[Hh][Kk][Xx]")
                 self.skeleton_hkx = self.SKELETON_HKX.from_bytes(skeleton_entry, compendium=compendium)
 
+            anim_entries = {}  # type: dict[int, BinderEntry]
             if not self.animation_ids_to_load:
                 # Load ALL animations.
-                self.animations_hkx = {}
                 for anim_entry in self.find_entries_by_name_regex(r"a[\d_]+\.[Hh][Kk][Xx]"):
                     anim_id = int(anim_entry.stem[1:])
-                    self.animations_hkx[anim_id] = self.ANIMATION_HKX.from_bytes(anim_entry, compendium=compendium)
+                    anim_entries[anim_id] = anim_entry
             else:
                 # Load selected (also asserted) animation IDs only.
-                self.animations_hkx = {}
                 for anim_id in self.animation_ids_to_load:
                     entry_name = self.animation_id_to_entry_basename(anim_id)
                     try:
-                        anim_entry = self.find_entry_by_name(entry_name)
+                        anim_entries[anim_id] = self.find_entry_by_name(entry_name)
                     except KeyError:
                         raise ValueError(f"Could not find animation entry '{entry_name}' for animation ID {anim_id}.")
-                    self.animations_hkx[anim_id] = self.ANIMATION_HKX.from_bytes(anim_entry, compendium=compendium)
+
+            if lazy:
+                self.animations_hkx = LazyAnimationsHKX(self.ANIMATION_HKX, anim_entries, compendium)
+            elif processes > 1 and len(anim_entries) > 1:
+                compendium_data = None
+                if compendium is not None:
+                    compendium_data = next(entry.data for entry in self.entries if entry.name == compendium_name)
+                with Pool(processes, initializer=_init_animation_worker, initargs=(compendium_data,)) as pool:
+                    animations = pool.starmap(
+                        _unpack_animation_hkx,
+                        [(self.ANIMATION_HKX, anim_entry.data) for anim_entry in anim_entries.values()],
+                    )
+                self.animations_hkx = dict(zip(anim_entries, animations))
+            else:
+                self.animations_hkx = {
+                    anim_id: self.ANIMATION_HKX.from_bytes(anim_entry, compendium=compendium)
+                    for anim_id, anim_entry in anim_entries.items()
+                }
 
         except MissingCompendiumError:
             if compendium_name != "":
@@ -664,24 +742,18 @@ class BaseANIBND(Binder, abc.ABC):
         animation.load_interleaved_data()
         mapping = animation.hkx_binding.transformTrackToBoneIndices
         track_index = mapping.index(bone.index)
-        transforms = [frame[track_index] for frame in animation.interleaved_data]
 
         if not in_armature_space:
-            return transforms  # local transforms requested
+            return [frame[track_index] for frame in animation.interleaved_data]  # local transforms requested
 
-        # Compose transforms with all parents.
-        frame_count = len(transforms)
-        for parent in bone.ascending_hierarchy[1:]:  # exclude this bone (already retrieved)
-            parent_transforms = self.get_bone_interleaved_transforms(parent)
-            for i in range(frame_count):
-                transforms[i] = parent_transforms[i] @ transforms[i]
-        return transforms
+        # Compose transforms with all parents (for all frames at once).
+        arma_array = animation.get_interleaved_array_in_armature_space(self.skeleton)
+        return [frame[0] for frame in animation.array_to_transforms(arma_array[:, track_index:track_index + 1])]
 
     def get_all_armature_space_transforms_in_frame(self, frame_index: int, anim_id: int = None) -> list[TRSTransform]:
         """Resolve all transforms to get all tracks' armature space transforms at the given `frame_index`.
 
-        Avoids recomputing transforms multiple times; each bone is only processed once, using parents' accumulating
-        world transforms.
+        Each level of the track hierarchy is composed with its parents' world transforms at once.
 
         NOTE: Returned list of transforms should be indexed by TRACK index, which may not always match bone index.
         """
@@ -692,28 +764,11 @@ class BaseANIBND(Binder, abc.ABC):
         if frame_index > len(animation.interleaved_data):
             raise ValueError(f"Frame must be between 0 and {len(animation.interleaved_data)}, not {frame_index}.")
 
-        frame_local_transforms = animation.interleaved_data[frame_index]
-        # NOTE: `world_transforms` is ordered by TRACK.
-        bone_track_indices = {v: i for i, v in enumerate(animation.hkx_binding.transformTrackToBoneIndices)}
-        track_world_transforms = [TRSTransform.identity() for _ in range(len(bone_track_indices))]
-
-        def bone_local_to_world(bone: Bone, world_transform: TRSTransform):
-            try:
-                track_index = bone_track_indices[bone.index]
-            except KeyError:
-                # Bone has no track (not animated). We don't recur on child bones below.
-                return
-            else:
-                track_world_transforms[track_index] = world_transform @ frame_local_transforms[track_index]
-            # Recur on children, using this bone's just-computed world transform.
-            for child_bone in bone.children:
-                bone_local_to_world(child_bone, track_world_transforms[track_index])
-
-        for root_bone in self.skeleton.get_root_bones():
-            # Start recurring transformer on root bones. (Their local space IS armature space.)
-            bone_local_to_world(root_bone, TRSTransform.identity())
-
-        return track_world_transforms
+        frame_local_array = animation.transforms_to_array([animation.interleaved_data[frame_index]])
+        track_parent_indices = animation.get_track_parent_indices(self.skeleton)
+        return animation.array_to_transforms(
+            animation.local_array_to_armature_array(frame_local_array, track_parent_indices)
+        )[0]
 
     def get_immediate_child_bone_interleaved_animation_transforms(
         self, parent_bone: Bone, anim_id: int = None
@@ -784,8 +839,8 @@ class BaseANIBND(Binder, abc.ABC):
         # noinspection PyPackageRequirements
         # Even if only some `bone_names` are given, we collect all of them to draw connective lines from parents.
         bone_translations = [
-            scale * bone.get_reference_pose_in_arma_space().translation
-            for bone in self.bones
+            Vector3(scale * translation)
+            for translation in self.skeleton.get_arma_space_reference_pose_array()[:, 0:3]
         ]
 
         if not bone_names:
@@ -11,7 +11,19 @@ import numpy as np
 from soulstruct.havok.enums import HavokModule
 from soulstruct.havok.exceptions import TypeNotDefinedError
 from soulstruct.havok.spline_compression import SplineCompressedAnimationData
-from soulstruct.havok.utilities.maths import TRSTransform, Vector3, Vector4
+from soulstruct.havok.types.struct_array import StructArray, get_struct_array_or_list
+from soulstruct.havok.wavelet_compression import WaveletCompressedAnimationData
+from soulstruct.havok.utilities.maths import (
+    Quaternion,
+    TRSTransform,
+    TRSTransformArray,
+    Vector3,
+    Vector4,
+    float32,
+    compose_trs_arrays,
+    invert_trs_arrays,
+    normalize_quaternions,
+)
 
 from soulstruct.havok.fromsoft.base.type_vars import (
     QS_TRANSFORM_T,
@@ -45,25 +57,35 @@ class AnimationContainer(tp.Generic[
     # explicit `save_spline_data()` call.
     spline_data: SplineCompressedAnimationData | None = None
 
-    # Loaded upon first use or explicit `load_interleaved_data()` call. Will be resaved on `pack()` if present, or with
-    # explicit `save_spline_data()` call. All this data does is split the frame transforms into separate 'track' lists,
-    # since by default, all the tracks and frames are in a single merged list.
+    # Loaded upon first access of `interleaved_data` or explicit `load_interleaved_data()` call. Will be resaved on
+    # `pack()` if present, or with explicit `save_spline_data()` call. All this data does is split the frame transforms
+    # into separate 'track' lists, since by default, all the tracks and frames are in a single merged list.
     # Note that the outer list is frames and the inner list is tracks (bones)! In other words, iterate like this:
     # ```
     # for frame in self.interleaved_data:
     #     for bone_transforms in frame:
     #         ...
     # ```
-    interleaved_data: list[list[TRSTransform]] | None = None
+    _interleaved_data: list[list[TRSTransform]] | None = None
 
     def __init__(self, havok_module: HavokModule, hkx_animation_container: ANIMATION_CONTAINER_T):
         self.havok_module = havok_module
         self.hkx_container = hkx_animation_container
         self.spline_data = None
-        self.interleaved_data = None
+        self._interleaved_data = None
 
-        if hkx_animation_container.animations and self.is_interleaved:  # basic enough to do outomatically
+    @property
+    def interleaved_data(self) -> list[list[TRSTransform]] | None:
+        """Interleaved `TRSTransform`s, sorted by frame then track. Created upon first access for interleaved animations,
+        as creating a `TRSTransform` for every frame of every track is slow.
+        """
+        if self._interleaved_data is None and self.hkx_container.animations and self.is_interleaved:
             self.load_interleaved_data()
+        return self._interleaved_data
+
+    @interleaved_data.setter
+    def interleaved_data(self, value: list[list[TRSTransform]] | None):
+        self._interleaved_data = value
 
     @property
     def hkx_animation(self) -> ANIMATION_T:
@@ -115,7 +137,7 @@ class AnimationContainer(tp.Generic[
         if not self.is_interleaved:
             raise TypeError(f"Animation type `{type(self.hkx_animation).__name__}` is not interleaved.")
 
-        if self.interleaved_data is not None and not reload:
+        if self._interleaved_data is not None and not reload:
             # Already exists. Do nothing.
             return
         # Otherwise, reorganize lists and convert transforms to `TRSTransform`.
@@ -126,6 +148,17 @@ class AnimationContainer(tp.Generic[
                 f"Number of transforms in interleaved animation data ({len(transforms)}) is not a multiple of the "
                 f"number of transform tracks: {track_count}")
         frame_count = len(transforms) // track_count
+        if isinstance(transforms, StructArray):
+            # Read rows directly rather than creating an `hkQsTransform` for every transform first.
+            rows = transforms.to_array().tolist()
+            self.interleaved_data = [
+                [
+                    TRSTransform(Vector3(row[0:3]), Quaternion(row[4:8]), Vector3(row[8:11]))
+                    for row in rows[i * track_count:(i + 1) * track_count]
+                ]
+                for i in range(frame_count)
+            ]
+            return
         self.interleaved_data = []
         for i in range(frame_count):
             frame = [t.to_trs_transform() for t in transforms[i * track_count:(i + 1) * track_count]]
@@ -139,7 +172,6 @@ class AnimationContainer(tp.Generic[
         if not self.interleaved_data:
             raise ValueError("Interleaved data has not been loaded yet. Nothing to save.")
         qs_transform_type = self.havok_module.get_type_from_var(QS_TRANSFORM_T)
-        transforms = []
         track_count = None
         for frame in self.interleaved_data:
             if track_count is None:
@@ -149,8 +181,8 @@ class AnimationContainer(tp.Generic[
                     f"Interleaved animation data has inconsistent track counts between frames: "
                     f"{track_count} vs {len(frame)}."
                 )
-            transforms += [qs_transform_type.from_trs_transform(t) for t in frame]
-        self.hkx_animation.transforms = transforms
+        transforms = TRSTransformArray.from_trs_transforms(t for frame in self.interleaved_data for t in frame)
+        self.hkx_animation.transforms = get_struct_array_or_list(qs_transform_type, transforms.to_qs_transform_rows())
         self.hkx_animation.numberOfTransformTracks = track_count  # guaranteed to be set above
         _LOGGER.info("Saved interleaved data to animation.")
 
@@ -294,7 +326,7 @@ class AnimationContainer(tp.Generic[
             self.spline_data.reverse()
         elif self.is_interleaved:
             self.hkx_animation.transforms = list(reversed(self.hkx_animation.transforms))
-            if self.interleaved_data:
+            if self._interleaved_data:
                 # Reload interleaved data if it's already loaded.
                 self.load_interleaved_data(reload=True)
         else:
@@ -332,11 +364,12 @@ class AnimationContainer(tp.Generic[
         TODO: Tracks may sometimes 'skip' a generation of bones. I should use the reference pose in this case.
         """
         track_bone_indices = self.hkx_binding.transformTrackToBoneIndices
+        bone_track_indices = {bone_index: track_index for track_index, bone_index in enumerate(track_bone_indices)}
         track_parent_indices = []  # type: list[int]
-        for track_index, bone_index in enumerate(track_bone_indices):
+        for bone_index in track_bone_indices:
             bone = skeleton.bones[bone_index]
-            if bone.parent and bone.parent.index in track_bone_indices:
-                track_parent_indices.append(track_bone_indices.index(bone.parent.index))
+            if bone.parent and bone.parent.index in bone_track_indices:
+                track_parent_indices.append(bone_track_indices[bone.parent.index])
             else:
                 track_parent_indices.append(-1)  # root bone (or bone with non-animated parent)
         return track_parent_indices
@@ -373,52 +406,127 @@ class AnimationContainer(tp.Generic[
                 root_track_indices.append(track_index)
         return root_track_indices
 
+    def get_interleaved_array(self) -> np.ndarray:
+        """Get interleaved transforms as a `(frame_count, track_count, 10)` array of `TRSTransform.ravel()` values.
+
+        Read directly from the Havok transforms unless `interleaved_data` has been loaded (and possibly modified).
+        """
+        if not self.is_interleaved:
+            raise TypeError(f"Animation type `{type(self.hkx_animation).__name__}` is not interleaved.")
+        if self._interleaved_data is not None:
+            return self.transforms_to_array(self._interleaved_data)
+        transforms = self.hkx_animation.transforms
+        return TRSTransformArray.from_qs_transforms(transforms).data.reshape(
+            (-1, self.hkx_animation.numberOfTransformTracks, 10)
+        )
+
+    def get_interleaved_array_in_armature_space(self, skeleton: Skeleton) -> np.ndarray:
+        """Array version of `get_interleaved_data_in_armature_space()`. See `get_interleaved_array()`."""
+        return self.local_array_to_armature_array(self.get_interleaved_array(), self.get_track_parent_indices(skeleton))
+
     def get_interleaved_data_in_armature_space(self, skeleton: Skeleton) -> list[list[TRSTransform]]:
         """Transform all interleaved frames (in local HKX bone space) to armature-space transforms.
 
         Preserves ordering of tracks, which should almost always match bone ordering, but does not necessarily need to.
         Does NOT modify this instance.
         """
-        if not self.is_interleaved:
-            raise TypeError(f"Animation type `{type(self.hkx_animation).__name__}` is not interleaved.")
-        if not self.interleaved_data:
-            self.load_interleaved_data()
+        return self.array_to_transforms(self.get_interleaved_array_in_armature_space(skeleton))
+
+    @staticmethod
+    def get_track_hierarchy_levels(track_parent_indices: tp.Sequence[int]) -> list[np.ndarray]:
+        """Group track indices by their depth in the 'track hierarchy' given by `track_parent_indices` (-1 for roots).
+
+        Tracks in each level only have parents in earlier levels, so levels can be processed in order, one at a time.
+        """
+        track_parent_indices = np.asarray(track_parent_indices, dtype=np.int64)
+        track_children = [[] for _ in range(len(track_parent_indices))]  # type: list[list[int]]
+        for track_index, parent_index in enumerate(track_parent_indices.tolist()):
+            if parent_index != -1:
+                track_children[parent_index].append(track_index)
+        levels = []
+        level = np.flatnonzero(track_parent_indices == -1)
+        while len(level) > 0:
+            levels.append(level)
+            level = np.array([child for parent in level for child in track_children[parent]], dtype=np.int64)
+        if sum(len(level) for level in levels) != len(track_parent_indices):
+            raise ValueError("Track parent indices contain a cycle.")
+        return levels
+
+    @classmethod
+    def local_array_to_armature_array(
+        cls, local_array: np.ndarray, track_parent_indices: tp.Sequence[int]
+    ) -> np.ndarray:
+        """Transform a `(..., track_count, 10)` array of local track transforms (e.g. for all frames) to armature space
+        using given 'track hierarchy' (-1 for root tracks).
+
+        Each level of the hierarchy is composed with its (already transformed) parents for all frames at once.
+        """
+        armature_array = np.array(local_array, dtype=np.float64)
+        armature_array[..., 3:7] = normalize_quaternions(armature_array[..., 3:7])
+        track_parent_indices = np.asarray(track_parent_indices, dtype=np.int64)
+        for level in cls.get_track_hierarchy_levels(track_parent_indices)[1:]:  # root local space IS armature space
+            armature_array[..., level, :] = compose_trs_arrays(
+                armature_array[..., track_parent_indices[level], :], armature_array[..., level, :]
+            )
+        return armature_array
 
-        track_child_indices = self.get_track_child_indices(skeleton)
-        root_track_indices = self.get_root_track_indices(skeleton)
-        return self.local_transforms_to_armature_transforms(
-            self.interleaved_data, track_child_indices, root_track_indices
+    @staticmethod
+    def armature_array_to_local_array(
+        armature_array: np.ndarray, track_parent_indices: tp.Sequence[int]
+    ) -> np.ndarray:
+        """Transform a `(..., track_count, 10)` array of armature-space track transforms to local track space using
+        given 'track hierarchy' (-1 for root tracks).
+
+        Requires no hierarchy traversal, as every non-root track is just pre-multiplied by the inverse of its parent's
+        (already known) armature-space transform.
+        """
+        armature_array = np.array(armature_array, dtype=np.float64)
+        armature_array[..., 3:7] = normalize_quaternions(armature_array[..., 3:7])
+        track_parent_indices = np.asarray(track_parent_indices, dtype=np.int64)
+        local_array = armature_array.copy()
+        child_tracks = np.flatnonzero(track_parent_indices != -1)
+        local_array[..., child_tracks, :] = compose_trs_arrays(
+            invert_trs_arrays(armature_array[..., track_parent_indices[child_tracks], :]),
+            armature_array[..., child_tracks, :],
         )
+        return local_array
 
     @staticmethod
+    def transforms_to_array(frames: list[list[TRSTransform]]) -> np.ndarray:
+        """Convert nested lists of `TRSTransform`s (frames, then tracks) to a `(frame_count, track_count, 10)` array."""
+        array = np.array([[t.ravel() for t in frame] for frame in frames], dtype=np.float64)
+        if array.size == 0:
+            return np.empty((len(frames), 0, 10))  # no frames or no tracks
+        return array.reshape((len(frames), -1, 10))
+
+    @staticmethod
+    def array_to_transforms(array: np.ndarray) -> list[list[TRSTransform]]:
+        """Convert a `(frame_count, track_count, 10)` array to nested lists of `TRSTransform`s (frames, then tracks)."""
+        return [
+            [TRSTransform(Vector3(row[0:3]), Quaternion(row[3:7]), Vector3(row[7:10])) for row in frame]
+            for frame in array.tolist()
+        ]
+
+    @classmethod
     def local_transforms_to_armature_transforms(
+        cls,
         local_space_frames: list[list[TRSTransform]],
         track_child_indices: list[list[int]],
         root_track_indices: list[int],
     ) -> list[list[TRSTransform]]:
         """Use given 'track hierarchy' to transform all frames from local space to armature space.
 
-        The list of root tracks is required to start the recursive transformations.
+        Tracks that are neither roots nor children of another track are also treated as roots. See
+        `local_array_to_armature_array()` for the array version used here.
         """
-        arma_space_frames = []  # type: list[list[TRSTransform]]
-
-        for frame_local_transforms in local_space_frames:
-
-            arma_space_track_transforms = [TRSTransform.identity() for _ in range(len(frame_local_transforms))]
-
-            def track_local_to_parent(track_index_: int, parent_transform: TRSTransform):
-                arma_space_track_transforms[track_index_] = parent_transform @ frame_local_transforms[track_index_]
-                # Recur on children, using this bone's just-computed armature-space transform.
-                for child_track_index in track_child_indices[track_index_]:
-                    track_local_to_parent(child_track_index, arma_space_track_transforms[track_index_])
-
-            for root_track_index in root_track_indices:
-                # Start recurring transformer on root tracks. (Their local space IS armature space.)
-                track_local_to_parent(root_track_index, TRSTransform.identity())
-
-            arma_space_frames.append(arma_space_track_transforms)
-
-        return arma_space_frames
+        track_parent_indices = [-1] * len(track_child_indices)
+        for track_index, child_indices in enumerate(track_child_indices):
+            for child_index in child_indices:
+                if child_index not in root_track_indices:
+                    track_parent_indices[child_index] = track_index
+        return cls.array_to_transforms(
+            cls.local_array_to_armature_array(cls.transforms_to_array(local_space_frames), track_parent_indices)
+        )
 
     def set_interleaved_data_from_armature_space(
         self, skeleton: Skeleton, armature_space_frames: list[list[TRSTransform]]
@@ -427,45 +535,25 @@ class AnimationContainer(tp.Generic[
         interleaved data of this animation."""
         if not self.is_interleaved:
             raise TypeError(f"Animation type `{type(self.hkx_animation).__name__}` is not interleaved.")
-        if not self.interleaved_data:
-            self.load_interleaved_data()
 
         track_parent_indices = self.get_track_parent_indices(skeleton)
         self.interleaved_data = self.armature_transforms_to_local_transforms(
             armature_space_frames, track_parent_indices
         )
 
-    @staticmethod
+    @classmethod
     def armature_transforms_to_local_transforms(
+        cls,
         armature_space_frames: list[list[TRSTransform]],
         track_parent_indices: list[int],
     ) -> list[list[TRSTransform]]:
-        """Use given 'track hierarchy' to transform all frames from armature space to each track's (bone's ) space."""
-        local_space_frames = []  # type: list[list[TRSTransform]]
-
-        for frame_armature_transforms in armature_space_frames:
+        """Use given 'track hierarchy' to transform all frames from armature space to each track's (bone's ) space.
 
-            local_space_track_transforms = []
-
-            # Converting back from complete armature space to local space is easy and requires no recursion, as we
-            # only need to pre-multiply by the inverse of the parent's armature space transform (already known).
-            parent_inverse_matrices = {}  # type: dict[int, TRSTransform]
-            for track_index, armature_transform in enumerate(frame_armature_transforms):
-                if track_parent_indices[track_index] == -1:
-                    # Root track, so local space is armature space.
-                    local_space_track_transforms.append(armature_transform)
-                else:
-                    # Non-root track, so local space is parent's local space.
-                    parent_index = track_parent_indices[track_index]
-                    if track_parent_indices[track_index] not in parent_inverse_matrices:
-                        parent_inverse_matrices[parent_index] = frame_armature_transforms[parent_index].inverse()
-                    inv_parent_armature_transform = parent_inverse_matrices[parent_index]
-                    local_space_transform = inv_parent_armature_transform @ armature_transform
-                    local_space_track_transforms.append(local_space_transform)
-
-            local_space_frames.append(local_space_track_transforms)
-
-        return local_space_frames
+        See `armature_array_to_local_array()` for the array version used here.
+        """
+        return cls.array_to_transforms(
+            cls.armature_array_to_local_array(cls.transforms_to_array(armature_space_frames), track_parent_indices)
+        )
 
     def load_data(self):
         """Load managed spline or interleaved data. Should be called after reading HKX file."""
@@ -478,7 +566,7 @@ class AnimationContainer(tp.Generic[
         """Save managed spline or interleaved data. Should be called before writing HKX file."""
         if self.is_spline and self.spline_data:
             self.save_spline_data()
-        elif self.is_interleaved and self.interleaved_data:
+        elif self.is_interleaved and self._interleaved_data:
             self.save_interleaved_data()
 
     def to_interleaved_container(self) -> tp.Self:
@@ -487,17 +575,19 @@ class AnimationContainer(tp.Generic[
         These interleaved animations are not suitable for game use, as they are very large, but this is a far more
         useful format for editing (e.g. with Soulstruct for Blender).
 
-        Re-compressing the animation (usually as spline, but as wavelet in Demon's Souls) is much more complicated and
-        is handled on a per-game basis with other methods. (It generally involves use of an external Havok executable.)
+        Re-compressing the animation as spline is done by `to_spline_container()`, or as wavelet (Demon's Souls only) by
+        `to_wavelet_container()`.
         """
         if self.is_interleaved:
             raise ValueError("Animation is already interleaved. If you want a copy, do that explicitly.")
 
-        # This base method can only handle spline animations.
+        if self.is_wavelet:
+            return self._wavelet_to_interleaved_container()
+
         if not self.is_spline:
             raise ValueError(
-                "This animation wrapper class can only convert spline-compressed animations to interleaved, not type: "
-                f"{type(self.hkx_animation).__name__}"
+                "This animation wrapper class can only convert spline-compressed or wavelet-compressed animations to "
+                f"interleaved, not type: {type(self.hkx_animation).__name__}"
             )
         if not self.spline_data:
             self.load_spline_data()
@@ -510,28 +600,205 @@ class AnimationContainer(tp.Generic[
                 f"Havok version {self.havok_module.get_version_string()}."
             )
 
-        interleaved_data = self.spline_data.to_interleaved_transforms(
+        # Decompress straight into `hkQsTransform` rows, without creating any `TRSTransform` (or any `hkQsTransform`
+        # within `hk.struct_arrays()`).
+        frame_array = self.spline_data.to_interleaved_array(
             self.hkx_animation.numFrames,
             self.hkx_animation.maxFramesPerBlock,
-        )
-
-        # Save interleaved data to concatenated list (for writing directly to new Havok instance).
+        ).reshape(-1, 10)
         qs_transform_type = self.havok_module.get_type_from_var(QS_TRANSFORM_T)
-        transforms = []
-        for frame in interleaved_data:
-            transforms += [qs_transform_type.from_trs_transform(t) for t in frame]
+        transforms = get_struct_array_or_list(qs_transform_type, TRSTransformArray(frame_array).to_qs_transform_rows())
 
         # All `hkaInterleavedUncompressedAnimation` instances have this conversion class method.
-        interleaved_animation = interleaved_anim_type.from_spline_animation(self.hkx_animation, transforms)
+        spline_animation = self.hkx_animation
+        interleaved_animation = interleaved_anim_type.from_spline_animation(spline_animation, transforms)
+
+        # Spline data is never copied. Interleaved `TRSTransform`s are only created if the copy's `interleaved_data` is
+        # used.
+        return self._copy_with_animation(interleaved_animation)
+
+    def _wavelet_to_interleaved_container(self) -> tp.Self:
+        """Decompress wavelet animation straight into `hkQsTransform` rows (see `WaveletCompressedAnimationData`)."""
+        interleaved_anim_type = self.havok_module.get_type_from_var(INTERLEAVED_ANIMATION_T)
+        wavelet_data = WaveletCompressedAnimationData.from_wavelet_animation(self.hkx_animation)
+        qs_transform_type = self.havok_module.get_type_from_var(QS_TRANSFORM_T)
+        frame_array = wavelet_data.to_interleaved_array().reshape(-1, 10)
+        transforms = get_struct_array_or_list(qs_transform_type, TRSTransformArray(frame_array).to_qs_transform_rows())
+
+        wavelet_animation = self.hkx_animation
+        interleaved_animation = interleaved_anim_type(
+            type=1,
+            duration=wavelet_animation.duration,
+            numberOfTransformTracks=wavelet_animation.numberOfTransformTracks,
+            numberOfFloatTracks=0,
+            extractedMotion=wavelet_animation.extractedMotion,
+            annotationTracks=wavelet_animation.annotationTracks,
+            transforms=transforms,
+            floats=[],
+        )
+        return self._copy_with_animation(interleaved_animation)
+
+    def to_wavelet_container(
+        self,
+        translation_tolerance: float = 0.001,
+        rotation_tolerance: float = 0.001,
+        scale_tolerance: float = 0.001,
+        block_size: int = 8,
+        quantization_bits: int = 12,
+    ) -> tp.Self:
+        """Get a (deep) copy of this interleaved animation that uses the wavelet-compressed format (Demon's Souls only).
+
+        Compression is done by `WaveletCompressedAnimationData.from_interleaved_array()`. Tolerances bound the error of
+        each decompressed component, and `quantization_bits` is increased where needed to stay within them. The default
+        block size and quantization bits match vanilla Demon's Souls animations.
+        """
+        if self.is_wavelet:
+            raise ValueError("Animation is already wavelet-compressed. If you want a copy, do that explicitly.")
+        if not self.is_interleaved:
+            raise ValueError(
+                "This animation wrapper class can only convert interleaved animations to wavelet-compressed, not type: "
+                f"{type(self.hkx_animation).__name__}"
+            )
+
+        try:
+            wavelet_anim_type = self.havok_module.get_type("hkaWaveletSkeletalAnimation")
+            q_format_type = self.havok_module.get_type("hkaWaveletSkeletalAnimationQuantizationFormat")
+        except TypeNotDefinedError:
+            raise TypeNotDefinedError(
+                f"No `hkaWaveletSkeletalAnimation` class exists for Havok version "
+                f"{self.havok_module.get_version_string()}."
+            )
 
-        interleaved_self = copy.deepcopy(self)
-        interleaved_self.hkx_binding.animation = interleaved_animation
-        interleaved_self.hkx_container.animations = [interleaved_animation]
-        interleaved_self.spline_data = None
-        interleaved_self.interleaved_data = interleaved_data
-        interleaved_self.save_data()
+        wavelet_data = WaveletCompressedAnimationData.from_interleaved_array(
+            self.get_interleaved_array(),
+            block_size=block_size,
+            bit_width=quantization_bits,
+            translation_tolerance=translation_tolerance,
+            rotation_tolerance=rotation_tolerance,
+            scale_tolerance=scale_tolerance,
+        )
+        data_buffer, indices = wavelet_data.pack()
+
+        interleaved_animation = self.hkx_animation
+        wavelet_animation = wavelet_anim_type(
+            # hkaSkeletalAnimation:
+            type=3,
+            duration=interleaved_animation.duration,
+            numberOfTransformTracks=interleaved_animation.numberOfTransformTracks,
+            numberOfFloatTracks=0,
+            extractedMotion=interleaved_animation.extractedMotion,
+            annotationTracks=interleaved_animation.annotationTracks,
+            # hkaWaveletSkeletalAnimation:
+            numberOfPoses=wavelet_data.frame_count,
+            blockSize=block_size,
+            qFormat=q_format_type(
+                maxBitWidth=quantization_bits,
+                preserved=0,
+                numD=wavelet_data.dynamic_dof_count,
+                offsetIdx=indices["offsetIdx"],
+                scaleIdx=indices["scaleIdx"],
+                bitWidthIdx=indices["bitWidthIdx"],
+            ),
+            staticMaskIdx=indices["staticMaskIdx"],
+            staticDOFsIdx=indices["staticDOFsIdx"],
+            blockIndexIdx=indices["blockIndexIdx"],
+            blockIndexSize=indices["blockIndexSize"],
+            quantizedDataIdx=indices["quantizedDataIdx"],
+            quantizedDataSize=indices["quantizedDataSize"],
+            dataBuffer=list(data_buffer),
+        )
+        return self._copy_with_animation(wavelet_animation)
+
+    def _copy_with_animation(self, animation: ANIMATION_T) -> tp.Self:
+        """Deep copy this container with `animation` in place of the current one. The current animation (and any
+        spline or interleaved data managed here) is swapped out before copying, so it is never copied."""
+        old_animation = self.hkx_animation
+        self.hkx_container.animations = [animation]
+        self.hkx_binding.animation = animation
+        spline_data, interleaved_data = self.spline_data, self._interleaved_data
+        self.spline_data = self._interleaved_data = None
+        try:
+            return copy.deepcopy(self)
+        finally:
+            self.hkx_container.animations = [old_animation]
+            self.hkx_binding.animation = old_animation
+            self.spline_data, self._interleaved_data = spline_data, interleaved_data
+
+    def to_spline_container(
+        self,
+        translation_tolerance: float = 0.001,
+        rotation_tolerance: float = 0.001,
+        scale_tolerance: float = 0.001,
+        max_frames_per_block: int = 256,
+    ) -> tp.Self:
+        """Get a (deep) copy of this interleaved animation that uses the spline-compressed format.
+
+        Compression is done by `SplineCompressedAnimationData.from_interleaved_transforms()`. The default tolerances
+        match those that Soulstruct used to pass to Havok's `CompressAnim.exe`, and the default block size matches
+        vanilla FromSoftware animations.
+        """
+        if self.is_spline:
+            raise ValueError("Animation is already spline-compressed. If you want a copy, do that explicitly.")
+        if not self.is_interleaved:
+            raise ValueError(
+                "This animation wrapper class can only convert interleaved animations to spline-compressed, not type: "
+                f"{type(self.hkx_animation).__name__}"
+            )
+        if self.interleaved_data is None:
+            self.load_interleaved_data()
+
+        try:
+            spline_anim_type = self.havok_module.get_type_from_var(SPLINE_ANIMATION_T)
+        except TypeNotDefinedError:
+            raise TypeNotDefinedError(
+                f"No `hkaSplineCompressedAnimation` class exists for "
+                f"Havok version {self.havok_module.get_version_string()}."
+            )
+
+        spline_data = SplineCompressedAnimationData.from_interleaved_transforms(
+            self.interleaved_data,
+            max_frames_per_block=max_frames_per_block,
+            translation_tolerance=translation_tolerance,
+            rotation_tolerance=rotation_tolerance,
+            scale_tolerance=scale_tolerance,
+        )
+        packed_blocks = spline_data.pack_blocks()
+        block_offsets = [sum(len(block) for block in packed_blocks[:i]) for i in range(len(packed_blocks))]
+
+        interleaved_animation = self.hkx_animation
+        frame_count = len(self.interleaved_data)
+        track_count = interleaved_animation.numberOfTransformTracks
+        frame_duration = interleaved_animation.duration / (frame_count - 1)
+        block_duration = (max_frames_per_block - 1) * frame_duration  # blocks share their first and last frames
+
+        spline_animation = spline_anim_type(
+            # hkaAnimation:
+            type=5 if self.havok_module == HavokModule.hk2010 else 3,  # enumeration changed between 2010 and 2014
+            duration=interleaved_animation.duration,
+            numberOfTransformTracks=track_count,
+            numberOfFloatTracks=0,
+            extractedMotion=interleaved_animation.extractedMotion,
+            annotationTracks=interleaved_animation.annotationTracks,
+            # hkaSplineCompressedAnimation:
+            numFrames=frame_count,
+            numBlocks=len(packed_blocks),
+            maxFramesPerBlock=max_frames_per_block,
+            maskAndQuantizationSize=4 * track_count,  # one `TrackHeader` per track (no float tracks)
+            blockDuration=float32(block_duration),
+            blockInverseDuration=float32(1.0 / block_duration),
+            frameDuration=float32(frame_duration),
+            blockOffsets=block_offsets,
+            floatBlockOffsets=[len(block) for block in packed_blocks],  # float tracks (unused) start after each block
+            transformOffsets=[],
+            floatOffsets=[],
+            data=list(b"".join(packed_blocks)),
+            endian=0,  # little-endian
+        )
 
-        return interleaved_self
+        # Large interleaved data is never copied.
+        spline_self = self._copy_with_animation(spline_animation)
+        spline_self.spline_data = spline_data
+        return spline_self
 
     @property
     def is_spline(self) -> bool:
@@ -558,4 +825,6 @@ class AnimationContainer(tp.Generic[
             return self.hkx_animation.numFrames
         elif self.is_interleaved:
             return len(self.hkx_animation.transforms) // self.hkx_animation.numberOfTransformTracks
-        raise TypeError("Cannot infer animation frame count from non-spline, non-interleaved animation type.")
+        elif self.is_wavelet:
+            return self.hkx_animation.numberOfPoses
+        raise TypeError("Cannot infer animation frame count from this animation type.")
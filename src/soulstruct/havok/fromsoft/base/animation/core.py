@@ -329,18 +329,32 @@ class BaseAnimationHKX(BaseWrappedHKX, abc.ABC):
         if self.animation_container.is_interleaved:
             raise ValueError("Animation is already interleaved.")
 
-        interleaved_self = copy.deepcopy(self)
         # This will complain if the current format is unsupported by this `AnimationContainer` class.
         interleaved_container = self.animation_container.to_interleaved_container()
-        interleaved_self.animation_container = interleaved_container
-        return interleaved_self
+        return self._copy_with_animation_container(interleaved_container)
 
-    def to_spline_hkx(self) -> tp.Self:
+    def to_spline_hkx(
+        self,
+        translation_tolerance: float = 0.001,
+        rotation_tolerance: float = 0.001,
+        scale_tolerance: float = 0.001,
+    ) -> tp.Self:
         """Get a spline-compressed version of this interleaved animation.
 
-        Implemented per subclass and generally involves a round trip to hk2010.
+        Compression is implemented by the `AnimationContainer` wrapper (see `to_spline_container()`).
         """
-        raise TypeError(f"{self.__class__.__name__} cannot be spline-compressed by Soulstruct.")
+        if not self.animation_container.is_interleaved:
+            raise TypeError("Can only convert interleaved animations to spline animations.")
+
+        # This will complain if spline compression is not supported by this Havok version.
+        spline_container = self.animation_container.to_spline_container(
+            translation_tolerance=translation_tolerance,
+            rotation_tolerance=rotation_tolerance,
+            scale_tolerance=scale_tolerance,
+        )
+        spline_self = self._copy_with_animation_container(spline_container)
+        _LOGGER.info(f"Spline-compressed interleaved animation ({len(spline_container.hkx_animation.data)} bytes).")
+        return spline_self
 
     def to_wavelet_hkx(self) -> tp.Self:
         """Get a wavelet-compressed version of this interleaved animation.
@@ -349,6 +363,19 @@ class BaseAnimationHKX(BaseWrappedHKX, abc.ABC):
         """
         raise TypeError(f"{self.__class__.__name__} cannot be wavelet-compressed by Soulstruct.")
 
+    def _copy_with_animation_container(self, animation_container: AnimationContainer) -> tp.Self:
+        """Deep copy this HKX with `animation_container` (and its `hkaAnimationContainer`) in place of the current one.
+
+        The current container is swapped out before copying, so its animation data is never copied.
+        """
+        root_variant = self.root.namedVariants[0]
+        old_variant, old_container = root_variant.variant, self.animation_container
+        root_variant.variant, self.animation_container = animation_container.hkx_container, animation_container
+        try:
+            return copy.deepcopy(self)
+        finally:
+            root_variant.variant, self.animation_container = old_variant, old_container
+
     def __repr__(self):
         if self.animation_container.is_spline:
             return f"{self.__class__.__name__}(<SplineCompressed>)"
@@ -41,8 +41,8 @@ class Bone(tp.Generic[SKELETON_T]):
 
     def get_reference_pose_in_arma_space(self) -> TRSTransform:
         """NOTE: If you need ALL bones in armature space, it is better to use:
-            `SkeletonHKX.get_all_reference_poses_in_arma_space()`
-        to avoid excessive, redundant `TRSTransform` creation and multiplication.
+            `Skeleton.get_arma_space_reference_poses()` (or `get_arma_space_reference_pose_array()`)
+        to avoid excessive, redundant `TRSTransform` creation and multiplication (and use their cached result).
         """
         transform = TRSTransform.identity()
         for bone in self.ascending_hierarchy:
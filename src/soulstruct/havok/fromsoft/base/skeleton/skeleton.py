@@ -7,8 +7,12 @@ import logging
 import typing as tp
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from soulstruct.havok.enums import HavokModule
-from soulstruct.havok.utilities.maths import Vector3, Vector4, TRSTransform
+from soulstruct.havok.utilities.maths import (
+    Vector3, Vector4, TRSTransform, TRSTransformArray, compose_trs_arrays, normalize_quaternions
+)
 
 from ..type_vars import SKELETON_T, BONE_T
 from .bone import Bone
@@ -26,57 +30,70 @@ class Skeleton(tp.Generic[SKELETON_T, BONE_T], abc.ABC):
     bones: list[Bone] = field(init=False)
     bones_by_name: None | dict[str, Bone] = field(init=False)  # only available if all names are unique
 
+    # Bone indices grouped by depth in the bone hierarchy (roots first). Every bone's parent is in an earlier level.
+    _hierarchy_levels: list[np.ndarray] = field(init=False, repr=False)
+    # Local reference pose rows that `_arma_reference_pose_array` was last computed from, to detect changes.
+    _cached_reference_pose_array: np.ndarray | None = field(init=False, repr=False, default=None)
+    _arma_reference_pose_array: np.ndarray | None = field(init=False, repr=False, default=None)
+
     def __post_init__(self):
         self.refresh_bones()
 
     def refresh_bones(self):
         """Rebuilds the `bones` list and `bones_by_name` dict from the `skeleton` object, using `Bone` wrappers rather
-        than the raw `hkaBone` types (so inter-bone references can be better used)."""
-
-        bones_by_index = {}  # type: dict[int, Bone]  # created depth-first and sorted at end
-        all_child_indices = {}
-        all_descending_hierarchy_indices = {}
+        than the raw `hkaBone` types (so inter-bone references can be better used).
+
+        Takes linear time: child lists are built from `parentIndices` in one pass, and bones are then created level by
+        level from the roots down, so every parent already exists when its children are created.
+        """
+        hka_bones = self.skeleton.bones
+        parent_indices = [int(i) for i in self.skeleton.parentIndices]
+        if len(parent_indices) != len(hka_bones):
+            raise ValueError(f"Skeleton has {len(hka_bones)} bones but {len(parent_indices)} parent indices.")
+
+        all_child_indices = [[] for _ in hka_bones]  # type: list[list[int]]
+        for index, parent_index in enumerate(parent_indices):
+            if parent_index != -1:
+                all_child_indices[parent_index].append(index)
+
+        bones = [None] * len(hka_bones)  # type: list[Bone | None]
+        levels = []
+        level = [i for i, parent_index in enumerate(parent_indices) if parent_index == -1]
+        while level:
+            levels.append(np.array(level, dtype=np.int64))
+            for index in level:
+                parent_index = parent_indices[index]
+                bones[index] = Bone(
+                    _skeleton=self.skeleton,
+                    index=index,
+                    name=hka_bones[index].name,
+                    parent=None if parent_index == -1 else bones[parent_index],  # created in previous level
+                    # Other reference tuples assigned below.
+                )
+            level = [child_index for index in level for child_index in all_child_indices[index]]
+        if any(bone is None for bone in bones):
+            raise ValueError("Skeleton `parentIndices` contain a cycle. Cannot build bone hierarchy.")
+        self.bones = bones
+        self._hierarchy_levels = levels
+        self._cached_reference_pose_array = self._arma_reference_pose_array = None
+
+        # Assign bone references (bypassing `frozen=True`), again from the roots down.
+        for level in levels:
+            for index in level.tolist():
+                bone = bones[index]
+                parent_hierarchy = () if bone.parent is None else bone.parent.descending_hierarchy
+                descending_hierarchy = parent_hierarchy + (bone,)
+                object.__setattr__(bone, "children", tuple(bones[i] for i in all_child_indices[index]))
+                object.__setattr__(bone, "descending_hierarchy", descending_hierarchy)
+                object.__setattr__(bone, "ascending_hierarchy", tuple(reversed(descending_hierarchy)))
 
         found_names = set()
         repeated_names = []
-
-        def _create_bone_wrapper(hka_bone: BONE_T, parent: None | Bone, parent_indices: list[int]):
-            index = self.skeleton.bones.index(hka_bone)
-            descending_indices = all_descending_hierarchy_indices[index] = parent_indices + [index]
-            child_indices = [i for i, parent_index in enumerate(self.skeleton.parentIndices) if parent_index == index]
-            all_child_indices[index] = child_indices
-            bone_wrapper = Bone(
-                _skeleton=self.skeleton,
-                index=index,
-                name=hka_bone.name,
-                parent=parent,  # reference definitely already created
-                # Other reference tuples assigned below.
-            )
-            bones_by_index[index] = bone_wrapper
-            if hka_bone.name in found_names:
-                repeated_names.append(hka_bone.name)
+        for bone in bones:
+            if bone.name in found_names:
+                repeated_names.append(bone.name)
             else:
-                found_names.add(hka_bone.name)
-
-            for child_index in child_indices:
-                _create_bone_wrapper(self.skeleton.bones[child_index], bone_wrapper, descending_indices)
-
-        root_hka_bones = [b for i, b in enumerate(self.skeleton.bones) if self.skeleton.parentIndices[i] == -1]
-
-        for root_hka_bone in root_hka_bones:
-            _create_bone_wrapper(root_hka_bone, None, [])
-
-        self.bones = [bones_by_index[i] for i in sorted(bones_by_index)]
-
-        # Assign bone references (bypassing `frozen=True`).
-        for bone in self.bones:
-            children = tuple(self.bones[i] for i in all_child_indices[bone.index])
-            descending_hierarchy = tuple(self.bones[i] for i in all_descending_hierarchy_indices[bone.index])
-            # TODO: why object.__setattr__?
-            object.__setattr__(bone, "children", children)
-            object.__setattr__(bone, "descending_hierarchy", descending_hierarchy)
-            object.__setattr__(bone, "ascending_hierarchy", tuple(reversed(descending_hierarchy)))
-
+                found_names.add(bone.name)
         if repeated_names:
             _LOGGER.warning(
                 f"Repeated bone names in this skeleton: {repeated_names}. `SkeletonHKX.bones_by_name` not available. "
@@ -85,6 +102,10 @@ class Skeleton(tp.Generic[SKELETON_T, BONE_T], abc.ABC):
         else:
             self.bones_by_name = {bone.name: bone for bone in self.bones}  # ordered by skeleton index
 
+    def get_parent_indices(self) -> list[int]:
+        """Get the parent index of each bone (-1 for root bones)."""
+        return [-1 if bone.parent is None else bone.parent.index for bone in self.bones]
+
     def get_root_bones(self) -> list[Bone]:
         """Get all root (i.e. parent-less) bones."""
         return [bone for bone in self.bones if bone.parent is None]
@@ -97,23 +118,37 @@ class Skeleton(tp.Generic[SKELETON_T, BONE_T], abc.ABC):
         """Get a dictionary mapping bone names to their reference poses."""
         return {bone.name: bone.get_reference_pose() for bone in self.bones}
 
+    def get_reference_pose_array(self) -> np.ndarray:
+        """Get an `(bone_count, 10)` array of local reference poses, as `TRSTransform.ravel()` rows."""
+        return TRSTransformArray.from_qs_transforms(self.skeleton.referencePose).data
+
+    def get_arma_space_reference_pose_array(self) -> np.ndarray:
+        """Get an `(bone_count, 10)` array of reference poses in armature space, as `TRSTransform.ravel()` rows.
+
+        The result is cached until `referencePose` changes (checked against a copy of its rows on each call) or the
+        bone hierarchy is rebuilt, and is returned as a read-only array. Copy it before modifying it.
+        """
+        local_array = self.get_reference_pose_array()
+        if (
+            self._arma_reference_pose_array is not None
+            and np.array_equal(local_array, self._cached_reference_pose_array)
+        ):
+            return self._arma_reference_pose_array
+
+        arma_array = local_array.copy()
+        arma_array[:, 3:7] = normalize_quaternions(arma_array[:, 3:7])
+        parent_indices = np.array(self.get_parent_indices(), dtype=np.int64)
+        for level in self._hierarchy_levels[1:]:  # root local space IS armature space
+            arma_array[level] = compose_trs_arrays(arma_array[parent_indices[level]], arma_array[level])
+        arma_array.flags.writeable = False
+        self._cached_reference_pose_array = local_array
+        self._arma_reference_pose_array = arma_array
+        return arma_array
+
     def get_arma_space_reference_poses(self) -> dict[str, TRSTransform]:
         """Get a dictionary mapping bone names to their reference poses in armature space."""
-
-        # We start with local reference poses, and compose parent poses from the top (root bones) down.
-        bone_arma_poses = self.get_reference_poses()
-
-        def local_to_parent(bone_: Bone, parent_ref_pose: TRSTransform):
-            bone_arma_poses[bone_.name] = parent_ref_pose @ bone_arma_poses[bone_.name]
-            # Recur on children, using this bone's just-computed armature-space reference pose.
-            for child_bone in bone_.children:
-                local_to_parent(child_bone, bone_arma_poses[bone_.name])
-
-        for root_bone in self.get_root_bones():
-            # Start recurring transformer on root bones. (Their local space IS armature space.)
-            local_to_parent(root_bone, TRSTransform.identity())
-
-        return bone_arma_poses
+        arma_transforms = TRSTransformArray(self.get_arma_space_reference_pose_array()).to_trs_transforms()
+        return {bone.name: transform for bone, transform in zip(self.bones, arma_transforms)}
 
     def scale_all_translations(self, scale_factor: float | Vector3 | Vector4):
         """Scale all bone translations in place by `scale_factor`."""
@@ -3,16 +3,16 @@ from __future__ import annotations
 __all__ = ["AnimationHKX", "SkeletonHKX", "ClothHKX", "RagdollHKX"]
 
 import logging
-import subprocess as sp
 import typing as tp
 
-from soulstruct.utilities.files import SOULSTRUCT_USER_DATA_PATH
-
 from soulstruct.havok.enums import HavokModule
 from soulstruct.havok.packfile.structs import PackfileHeaderInfo, PackFileVersion
-from soulstruct.havok.types.hk2010 import *
+from soulstruct.havok.types.hk2010 import (
+    VERSION, hkRootLevelContainer, hkaAnimation, hkaAnimationBinding, hkaAnimationContainer, hkaBone,
+    hkaDefaultAnimatedReferenceFrame, hkaInterleavedUncompressedAnimation, hkaSkeleton, hkaSkeletonMapper,
+    hkaSplineCompressedAnimation, hkpPhysicsData, hkpPhysicsSystem,
+)
 from soulstruct.havok.fromsoft.base import *
-from soulstruct.havok.utilities.files import SOULSTRUCT_HAVOK_PATH
 
 AnimationContainerType = AnimationContainer[
     hkaAnimationContainer, hkaAnimation, hkaAnimationBinding,
@@ -46,45 +46,6 @@ class AnimationHKX(BaseAnimationHKX):
         )
         return kwargs
 
-    def to_spline_hkx(self) -> AnimationHKX:
-        """Uses Horkrux's compiled converter to convert interleaved HKX to spline HKX.
-
-        Returns an entire new instance of this class.
-        """
-        if not self.animation_container.is_interleaved:
-            raise TypeError("Can only convert interleaved animations to spline animations.")
-
-        temp_interleaved_path = SOULSTRUCT_USER_DATA_PATH("__temp_interleaved__.hkx")
-        temp_spline_path = SOULSTRUCT_USER_DATA_PATH("__temp_spline__.hkx")
-
-        dcx_type = self.dcx_type
-        hkx2010 = self  # already 2010
-        try:
-            _LOGGER.debug("Writing 2010 file...")
-            hkx2010.write(temp_interleaved_path)
-            _LOGGER.debug("Calling `CompressAnim`...")
-            compress_anim_path = str(SOULSTRUCT_HAVOK_PATH("havok/resources/CompressAnim.exe"))
-            try:
-                sp.check_output(
-                    [compress_anim_path, str(temp_interleaved_path), str(temp_spline_path), "1", "0.001"],
-                    stderr=sp.STDOUT,
-                )
-            except sp.CalledProcessError as ex:
-                _LOGGER.error(
-                    f"Spline animation compression failed. Error in `CompressAnim.exe`: {ex.output.decode()}\n"
-                    f"Left temp interleaved HKX file for inspection: {temp_interleaved_path}"
-                )
-                raise RuntimeError from ex
-            temp_interleaved_path.unlink(missing_ok=True)
-            _LOGGER.debug("Reading 2010 spline-compressed animation...")
-            spline_2010 = self.__class__.from_path(temp_spline_path)
-            spline_2010.dcx_type = dcx_type
-        finally:
-            temp_spline_path.unlink(missing_ok=True)
-
-        _LOGGER.info("Successfully converted interleaved animation to hk2010 spline animation.")
-        return spline_2010
-
 
 class SkeletonHKX(BaseSkeletonHKX):
     HAVOK_MODULE: tp.ClassVar[HavokModule] = HavokModule.hk2010
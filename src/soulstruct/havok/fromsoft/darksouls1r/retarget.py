@@ -52,16 +52,8 @@ def retarget_animation(
     skeleton_a_arma_ref_pose = skeleton_a_hkx.skeleton.get_arma_space_reference_poses()
     skeleton_b_arma_ref_pose = skeleton_b_hkx.skeleton.get_arma_space_reference_poses()
 
-    # Get armature-space frames. Outer list is frames, inner list is bones.
-    arma_space_frames = container.get_interleaved_data_in_armature_space(skeleton_a_hkx.skeleton)
-
-    # Convert to NumPy (frames x bones x 10).
-    anim_data = np.array([
-        [
-            [*t.translation, *t.rotation, *t.scale]
-            for t in frame
-        ]
-        for frame in arma_space_frames])
+    # Get armature-space frames as a NumPy array (frames x bones x 10).
+    anim_data = container.get_interleaved_array_in_armature_space(skeleton_a_hkx.skeleton)
 
     # 2. RETARGETING.
 
@@ -21,10 +21,10 @@ class ANIBND(BaseANIBND):
     get_animation_container: tp.ClassVar[tp.Callable[[int | None], AnimationContainerType]]
 
     def convert_to_wavelet(self, anim_id: int = None):
-        """Convert to spline animation by a downgrade -> Horkrux SDK conversion -> upgrade process."""
+        """Convert interleaved animation to wavelet-compressed animation."""
         animation = self.animations_hkx[anim_id]
-        spline_anim = animation.to_spline_hkx()
-        self.animations_hkx[anim_id] = spline_anim
+        wavelet_anim = animation.to_wavelet_hkx()
+        self.animations_hkx[anim_id] = wavelet_anim
 
     @staticmethod
     def animation_id_to_entry_basename(animation_id: int) -> str:
@@ -2,21 +2,19 @@ from __future__ import annotations
 
 __all__ = ["AnimationHKX", "SkeletonHKX", "ClothHKX", "RagdollHKX"]
 
-import copy
 import logging
-import subprocess as sp
 import typing as tp
-from pathlib import Path
 
 import numpy as np
 
-from soulstruct.utilities.files import SOULSTRUCT_USER_DATA_PATH
-
 from soulstruct.havok.enums import HavokModule
 from soulstruct.havok.fromsoft.base import *
 from soulstruct.havok.packfile.structs import PackfileHeaderInfo, PackFileVersion
-from soulstruct.havok.types.hk550 import *
-from soulstruct.havok.utilities.files import SOULSTRUCT_HAVOK_PATH
+from soulstruct.havok.types.hk550 import (
+    VERSION, hkRootLevelContainer, hkRootLevelContainerNamedVariant, hkaAnimationBinding, hkaAnimationContainer,
+    hkaBone, hkaDefaultAnimatedReferenceFrame, hkaInterleavedSkeletalAnimation, hkaSkeletalAnimation, hkaSkeleton,
+    hkaSkeletonMapper, hkaSplineSkeletalAnimation, hkpPhysicsData, hkpPhysicsSystem, hkxScene,
+)
 from soulstruct.havok.utilities.maths import TRSTransform
 
 AnimationContainerType = AnimationContainer[
@@ -30,22 +28,9 @@ PhysicsDataType = PhysicsData[hkpPhysicsData, hkpPhysicsSystem]
 _LOGGER = logging.getLogger(__name__)
 
 
-def call_havok_wavelet_anim(input_path: Path | str, output_path: Path | str, to_wavelet: bool):
-    exe_path = SOULSTRUCT_HAVOK_PATH("havok/resources/HavokWaveletAnim.exe")
-    args = [str(exe_path), str(input_path), str(output_path), "-towavelet" if to_wavelet else "-fromwavelet"]
-    try:
-        sp.check_output(args, stderr=sp.STDOUT)
-    except sp.CalledProcessError as ex:
-        _LOGGER.error(
-            f"Wavelet animation conversion failed. Error in `HavokWaveletAnim.exe`: {ex.output.decode()}\n"
-            f"Left input HKX file for inspection: {input_path}"
-        )
-        raise RuntimeError from ex
-    # `output_path` should exist for reading by caller at this point.
-
-
 class AnimationHKX(BaseAnimationHKX):
-    """NOTE: Demon's Souls animations are wavelet-compressed, which is an annoying old format to deal with."""
+    """NOTE: Demon's Souls animations are wavelet-compressed, which is an annoying old format to deal with. See
+    `soulstruct.havok.wavelet_compression`."""
 
     HAVOK_MODULE: tp.ClassVar[HavokModule] = HavokModule.hk550
     root: hkRootLevelContainer = None
@@ -67,111 +52,34 @@ class AnimationHKX(BaseAnimationHKX):
         )
         return kwargs
 
-    def to_interleaved_hkx(self) -> tp.Self:
-        """Uses `HavokWaveletAnim` to convert wavelet-compressed to interleaved animation.
-
-        Cannot be done at the `AnimationContainer` level because we need to read/write whole valid HKX files during the
-        conversion process.
-
-        Steps:
-            - Write this wavelet-compressed HKX as a temp file, with `is_big_endian=False`.
-            - Call `HavokWaveletAnim` to convert it to interleaved format.
-            - Read the new interleaved HKX file.
-            - Restore old `is_big_endian` and set `reuse_padding_optimization = 1`.
-
-        TODO: Currently assuming that `reuse_padding_optimization` doesn't actually change how these files are read.
-         I haven't noticed any read/write errors; it's possible that it happens to not matter for these `hka` classes.
-        """
-        if self.animation_container.is_spline:
-            # Base method can handle splines (but Havok 550 doesn't have spline animations).
-            return super().to_interleaved_hkx()
-
-        if not self.animation_container.is_wavelet:
-            raise ValueError(
-                "Can only convert spline-compressed or wavelet-compressed animations to interleaved animations."
-            )
-
-        temp_wavelet_path = SOULSTRUCT_USER_DATA_PATH("__temp_wavelet__.hkx")
-        temp_interleaved_path = SOULSTRUCT_USER_DATA_PATH("__temp_interleaved__.hkx")
-
-        # C++ converter requires LE, but we save the current value to restore it later to the interleaved HKX.
-        old_is_big_endian = self.is_big_endian
-
-        # 1. Write little-endian wavelet-compressed file.
-        le_wavelet_hkx = copy.deepcopy(self)
-        le_wavelet_hkx.is_big_endian = False
-        le_wavelet_hkx.write(temp_wavelet_path)
-        _LOGGER.debug(f"Wrote temporary little-endian wavelet-compressed HKX file: {temp_wavelet_path}")
-
-        # 2. Call `HavokWaveletAnim` to convert to interleaved.
-        call_havok_wavelet_anim(temp_wavelet_path, temp_interleaved_path, to_wavelet=False)
-        _LOGGER.debug(f"Converted wavelet-compressed HKX to interleaved HKX: {temp_interleaved_path}")
-
-        # 3. Read new interleaved HKX file and enable fields.
-        interleaved_hkx = self.__class__.from_path(temp_interleaved_path)
-        interleaved_hkx.is_big_endian = old_is_big_endian
-        interleaved_hkx.packfile_header_info.reuse_padding_optimization = 1
-        _LOGGER.debug(f"Read new interleaved HKX file: {temp_interleaved_path}")
-
-        # Clean-up.
-        temp_wavelet_path.unlink(missing_ok=True)
-        temp_interleaved_path.unlink(missing_ok=True)
-
-        _LOGGER.info("Converted wavelet-compressed animation to interleaved.")
-
-        return interleaved_hkx
-
     def to_spline_hkx(self) -> AnimationHKX:
         """Zero need for this. If this is being ported between games, change Havok version first."""
         raise TypeError("Cannot convert Demon's Souls animations (Havok 5.5.0) to spline-compressed.")
 
-    def to_wavelet_hkx(self) -> tp.Self:
-        """Uses `HavokWaveletAnim` to convert wavelet-compressed to interleaved animation.
-
-        Cannot be done at the `AnimationContainer` level because we need to read/write whole valid HKX files during the
-        conversion process.
-
-        Steps:
-            - Write this wavelet-compressed HKX as a temp file, with `is_big_endian=False`.
-            - Call `HavokWaveletAnim` to convert it to interleaved.
-            - Read the new interleaved HKX file.
-            - Restore `is_big_endian` and set `reuse_padding_optimization = 1`.
+    def to_wavelet_hkx(
+        self,
+        translation_tolerance: float = 0.001,
+        rotation_tolerance: float = 0.001,
+        scale_tolerance: float = 0.001,
+    ) -> tp.Self:
+        """Get a wavelet-compressed version of this interleaved animation.
 
-        TODO: Currently assuming that `reuse_padding_optimization` doesn't actually change how these files are read.
-         I haven't noticed any read/write errors; it's possible that it happens to not matter for these `hka` classes.
+        Compression is implemented by the `AnimationContainer` wrapper (see `to_wavelet_container()`). Conversion back
+        to interleaved is handled by the base `to_interleaved_hkx()`.
         """
         if not self.animation_container.is_interleaved:
             raise ValueError("Can only convert interleaved animations to wavelet-compressed animations.")
 
-        temp_interleaved_path = SOULSTRUCT_USER_DATA_PATH("__temp_interleaved__.hkx")
-        temp_wavelet_path = SOULSTRUCT_USER_DATA_PATH("__temp_wavelet__.hkx")
-
-        # C++ converter requires LE, but we save the current value to restore it later to the interleaved HKX.
-        old_is_big_endian = self.is_big_endian
-
-        # 1. Write little-endian interleaved file. (Probably already little-endian, but we copy and set it anyway.)
-        le_interleaved_hkx = copy.deepcopy(self)
-        le_interleaved_hkx.is_big_endian = False
-        le_interleaved_hkx.write(temp_interleaved_path)
-        _LOGGER.debug(f"Wrote temporary little-endian interleaved HKX file: {temp_interleaved_path}")
-
-        # 2. Call `HavokWaveletAnim` to convert to wavelet-compressed.
-        call_havok_wavelet_anim(temp_interleaved_path, temp_wavelet_path, to_wavelet=True)
-        _LOGGER.debug(f"Converted interleaved HKX to wavelet-compressed HKX: {temp_wavelet_path}")
-
-        # 3. Read new wavelet-compressed HKX file and enable fields.
-        wavelet_hkx = self.__class__.from_path(temp_wavelet_path)
-        wavelet_hkx.is_big_endian = old_is_big_endian
-        wavelet_hkx.packfile_header_info.reuse_padding_optimization = 1
-        _LOGGER.debug(f"Read new wavelet-comprsesed HKX file: {temp_interleaved_path}")
-
-        # Clean-up.
-        temp_interleaved_path.unlink(missing_ok=True)
-        temp_wavelet_path.unlink(missing_ok=True)
-
-        _LOGGER.info("Converted interleaved animation to wavelet-compressed.")
-
-        return wavelet_hkx
+        wavelet_container = self.animation_container.to_wavelet_container(
+            translation_tolerance=translation_tolerance,
+            rotation_tolerance=rotation_tolerance,
+            scale_tolerance=scale_tolerance,
+        )
+        wavelet_self = self._copy_with_animation_container(wavelet_container)
+        _LOGGER.info(
+            f"Wavelet-compressed interleaved animation ({len(wavelet_container.hkx_animation.dataBuffer)} bytes)."
+        )
+        return wavelet_self
 
     @classmethod
     def from_minimal_data_interleaved(
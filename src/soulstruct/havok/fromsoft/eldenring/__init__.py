@@ -2,6 +2,9 @@ __all__ = [
     "AnimationHKX",
     "SkeletonHKX",
     "NavmeshHKX",
+    "NavmeshArrays",
+    "NavmeshEdgeFlag",
 ]
 
 from .file_types import AnimationHKX, SkeletonHKX, NavmeshHKX
+from .navmesh import NavmeshArrays, NavmeshEdgeFlag
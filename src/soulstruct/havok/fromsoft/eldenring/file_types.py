@@ -10,7 +10,6 @@ __all__ = [
 ]
 
 import logging
-import subprocess as sp
 import typing as tp
 
 import numpy as np
@@ -21,13 +20,18 @@ from soulstruct.havok.core import HavokFileFormat
 from soulstruct.havok.enums import HavokModule
 from soulstruct.havok.packfile.structs import PackFileVersion, PackfileHeaderInfo
 from soulstruct.havok.types import hk2010, hk2018
-from soulstruct.havok.types.hk2018 import *
-from soulstruct.havok.utilities.files import SOULSTRUCT_HAVOK_PATH
+from soulstruct.havok.types.hk2018 import (
+    VERSION, hk, hkRootLevelContainer, hkaAnimation, hkaAnimationBinding, hkaAnimationContainer, hkaBone,
+    hkaDefaultAnimatedReferenceFrame, hkaInterleavedUncompressedAnimation, hkaSkeleton, hkaSkeletonMapper,
+    hkaSplineCompressedAnimation, hkaiNavMesh,
+)
 from soulstruct.havok.utilities.hk_conversion import convert_hk
 from soulstruct.havok.utilities.mesh import Mesh
 from soulstruct.havok.fromsoft.base import *
 from soulstruct.havok.fromsoft.darksouls1ptde import AnimationHKX as AnimationHKX_PTDE
 
+from .navmesh import NavmeshArrays
+
 _LOGGER = logging.getLogger(__name__)
 
 AnimationContainerType = AnimationContainer[
@@ -43,54 +47,6 @@ class AnimationHKX(BaseAnimationHKX):
     root: hkRootLevelContainer = None
     animation_container: AnimationContainerType = None
 
-    def to_spline_hkx(self) -> AnimationHKX:
-        """Uses Horkrux's compiled converter to convert interleaved HKX to spline HKX.
-
-        Returns an entire new instance of this class.
-        """
-        if not self.animation_container.is_interleaved:
-            raise TypeError("Can only convert interleaved animations to spline animations.")
-
-        temp_interleaved_path = SOULSTRUCT_USER_DATA_PATH("__temp_interleaved__.hkx")
-        temp_spline_path = SOULSTRUCT_USER_DATA_PATH("__temp_spline__.hkx")
-
-        dcx_type = self.dcx_type
-        _LOGGER.debug("Downgrading to 2010...")
-        hkx2010 = self.to_2010_hkx()
-        try:
-            _LOGGER.debug("Writing 2010 file...")
-            hkx2010.write(temp_interleaved_path)
-            _LOGGER.debug("Calling `CompressAnim`...")
-            compress_anim_path = str(SOULSTRUCT_HAVOK_PATH("havok/resources/CompressAnim.exe"))
-            try:
-                sp.check_output(
-                    [compress_anim_path, str(temp_interleaved_path), str(temp_spline_path), "1", "0.001"],
-                    stderr=sp.STDOUT,
-                )
-            except sp.CalledProcessError as ex:
-                _LOGGER.error(
-                    f"Spline animation compression failed. Error in `CompressAnim.exe`: {ex.output.decode()}\n"
-                    f"Left temp interleaved HKX file for inspection: {temp_interleaved_path}"
-                )
-                raise RuntimeError from ex
-            temp_interleaved_path.unlink(missing_ok=True)
-            _LOGGER.debug("Reading 2010 spline-compressed animation...")
-            hkx2010_spline = AnimationHKX_PTDE.from_path(temp_spline_path)
-        finally:
-            temp_spline_path.unlink(missing_ok=True)
-
-        _LOGGER.debug("Upgrading to 2018...")
-        anim_2018 = self.__class__.from_2010_hkx(hkx2010_spline, dcx_type=dcx_type)
-
-        # Clean-up: restore hash overrides, change binding to refer to same animation, and change animation type.
-        anim_2018.hsh_overrides = self.hsh_overrides.copy()
-        for i, anim in enumerate(anim_2018.animation_container.hkx_container.animations):
-            anim_2018.animation_container.hkx_container.bindings[i].animation = anim
-            anim.type = 3  # spline-compressed in Havok 2018 (was 5 in Havok 2010)
-
-        _LOGGER.info("Successfully converted interleaved animation to hk2018 spline animation.")
-        return anim_2018
-
     def to_2010_hkx(self) -> AnimationHKX_PTDE:
         """Construct a 2010 Havok file (with packfile type) from this 2018 tagfile.
 
@@ -98,10 +54,8 @@ class AnimationHKX(BaseAnimationHKX):
 
         (I am adding these specific conversion functions as needed for Nightfall.)
         """
-        if self.animation_container.is_spline:
-            self.animation_container.save_spline_data()
-        elif self.animation_container.is_interleaved:
-            self.animation_container.save_interleaved_data()
+        # Only spline or interleaved data that has been loaded (and possibly modified) needs to be saved.
+        self.animation_container.save_data()
 
         def source_error_handler(source_obj: hk, name: str, __, ___):
             if name == "propertyBag":
@@ -178,8 +132,16 @@ class NavmeshHKX(BaseWrappedHKX):
 
     root: hkRootLevelContainer = None
 
+    def get_navmesh_arrays(self) -> NavmeshArrays:
+        """Get faces, edges, and vertices of the `hkaiNavMesh` variant as NumPy arrays."""
+        return NavmeshArrays.from_hkai_navmesh(self.get_variant(0, hkaiNavMesh))
+
+    def set_navmesh_arrays(self, navmesh_arrays: NavmeshArrays):
+        """Replace faces, edges, vertices, and AABB of the `hkaiNavMesh` variant with `navmesh_arrays`."""
+        navmesh_arrays.to_hkai_navmesh(self.get_variant(0, hkaiNavMesh))
+
     def get_simple_mesh(self, merge_dist: float = 0) -> Mesh:
-        """Return an Nx3 vertex array and a list of faces' vertex indices, of varying length, into that array.
+        """Return a `Mesh` of an Nx3 vertex array and faces' vertex indices, of varying length, into that array.
 
         Note that unlike older games, not all faces need be triangles, or even quads.
 
@@ -188,28 +150,18 @@ class NavmeshHKX(BaseWrappedHKX):
         """
         hkai_navmesh = self.get_variant(0, hkaiNavMesh)
 
-        if hkai_navmesh.vertices == [] or not hkai_navmesh.faces:
+        if len(hkai_navmesh.vertices) == 0 or len(hkai_navmesh.faces) == 0:
             _LOGGER.warning("Navmesh has no vertices and/or faces.")
             return Mesh(np.empty((0, 3)), [])
 
-        vertices = np.array(hkai_navmesh.vertices[:, :3])  # discard fourth column
-
-        faces = []
-        for face in hkai_navmesh.faces:
-            face_vert_indices = [
-                hkai_navmesh.edges[i].a
-                for i in range(face.startEdgeIndex, face.startEdgeIndex + face.numEdges)
-            ]
-            faces.append(face_vert_indices)
-
-        mesh = Mesh(vertices, faces)
+        mesh = NavmeshArrays.from_hkai_navmesh(hkai_navmesh).get_simple_mesh()
 
         if merge_dist > 0:
-            old_v_count, old_f_count = len(vertices), len(faces)
+            old_v_count, old_f_count = mesh.vertex_count, mesh.face_count
             mesh = mesh.merge_vertices_by_distance(merge_dist=merge_dist)
             _LOGGER.info(
                 f"Reduced mesh from {old_v_count} vertices and {old_f_count} faces to "
-                f"{len(vertices)} vertices and {len(faces)} faces."
+                f"{mesh.vertex_count} vertices and {mesh.face_count} faces."
             )
 
         return mesh
@@ -0,0 +1,273 @@
+"""NumPy array representation of Elden Ring `hkaiNavMesh` faces, edges, and vertices, for bulk navmesh analysis and
+construction without per-face or per-edge Python loops.
+
+Faces and edges are NumPy structured arrays whose fields and dtypes are taken directly from the `hkaiNavMesh::Face` and
+`hkaiNavMesh::Edge` member layouts in `hk2018` (e.g. `edges["oppositeEdge"]`). Flags are stored as their plain storage
+ints and half-precision members like `userEdgeCost` as their raw `hkHalf16.value` bits.
+"""
+from __future__ import annotations
+
+__all__ = [
+    "NAVMESH_FACE_DTYPE",
+    "NAVMESH_EDGE_DTYPE",
+    "INVALID_PACKED_KEY",
+    "NavmeshEdgeFlag",
+    "NavmeshArrays",
+]
+
+import typing as tp
+from dataclasses import dataclass
+from enum import IntFlag
+from operator import attrgetter
+
+import numpy as np
+
+from soulstruct.havok.enums import TagDataType
+from soulstruct.havok.types import hk2018
+from soulstruct.havok.types.hk2018 import hk, hkaiNavMesh, hkaiNavMeshEdge, hkaiNavMeshFace
+from soulstruct.havok.utilities.maths import Vector4
+from soulstruct.havok.utilities.mesh import Mesh
+
+# `hkaiPackedKey` value of edges/faces with no opposite.
+INVALID_PACKED_KEY = 0xFFFF_FFFF
+
+
+class NavmeshEdgeFlag(IntFlag):
+    """Bits of `hkaiNavMesh::Edge.flags` (`hkaiNavMesh::EdgeFlagBits`)."""
+    SILHOUETTE = 1
+    RETRIANGULATED = 2
+    ORIGINAL = 4
+    USER = 16
+    BLOCKED = 32
+    EXTERNAL_OPPOSITE = 64
+
+
+class _RecordLayout(tp.NamedTuple):
+    """Structured dtype of an `hk` class made only of primitive ints (including flags and aliases) and `hkHalf16`s, and
+    the attribute paths (e.g. 'userEdgeCost.value') that give each field's value from an instance.
+    """
+    hk_type: type[hk]
+    dtype: np.dtype
+    paths: tuple[str, ...]
+    half_fields: tuple[str, ...]
+
+    def to_records(self, elements: tp.Sequence[hk]) -> np.ndarray:
+        """Get a structured array of all `elements` (in one C-level pass over them)."""
+        return np.fromiter(map(attrgetter(*self.paths), elements), dtype=self.dtype, count=len(elements))
+
+    def from_records(self, records: np.ndarray) -> list[hk]:
+        """Create a new `hk_type` instance from each record."""
+        hk_type, names = self.hk_type, self.dtype.names
+        if not self.half_fields:
+            return [hk_type(**dict(zip(names, row))) for row in records.tolist()]
+        elements = []
+        for row in records.tolist():
+            kwargs = dict(zip(names, row))
+            for name in self.half_fields:
+                kwargs[name] = hk2018.hkHalf16(value=kwargs[name])
+            elements.append(hk_type(**kwargs))
+        return elements
+
+
+def _get_record_layout(hk_type: type[hk]) -> _RecordLayout:
+    names, formats, offsets, paths, half_fields = [], [], [], [], []
+    for member in hk_type.members:
+        member_type = member.type
+        path = member.py_name
+        if issubclass(member_type, hk2018.hkHalf16):
+            member_type = member_type.members[0].type  # `value`
+            path += ".value"
+            half_fields.append(member.py_name)
+        if member_type.get_tag_data_type() != TagDataType.Int:
+            raise TypeError(f"Member `{member.name}` of `{hk_type.__name__}` is not an int or `hkHalf16`.")
+        names.append(member.py_name)
+        formats.append(np.dtype("<" + TagDataType.get_int_fmt(member_type.tag_type_flags)[-1]))
+        offsets.append(member.offset)
+        paths.append(path)
+    dtype = np.dtype(dict(names=names, formats=formats, offsets=offsets, itemsize=hk_type.byte_size))
+    return _RecordLayout(hk_type, dtype, tuple(paths), tuple(half_fields))
+
+
+def _reshape_user_data(data: np.ndarray, count: int) -> np.ndarray:
+    """Reshape per-face or per-edge user `data` to `(count, striding)`. Striding is inferred only for 1D `data` (as it
+    cannot be inferred when `count == 0`).
+    """
+    data = np.asarray(data, dtype=np.int32)
+    if data.ndim == 2:
+        striding = data.shape[1]
+    else:
+        striding = data.size // count if count else 0
+    return data.reshape((count, striding))
+
+
+_FACE_LAYOUT = _get_record_layout(hkaiNavMeshFace)
+_EDGE_LAYOUT = _get_record_layout(hkaiNavMeshEdge)
+NAVMESH_FACE_DTYPE = _FACE_LAYOUT.dtype
+NAVMESH_EDGE_DTYPE = _EDGE_LAYOUT.dtype
+
+
+@dataclass(slots=True)
+class NavmeshArrays:
+    """Faces, edges, and vertices of an `hkaiNavMesh` (plus its per-face and per-edge user data) as NumPy arrays.
+
+    Face `i` uses edges `faces["startEdgeIndex"][i]` to `faces["startEdgeIndex"][i] + faces["numEdges"][i]`, and its
+    vertices are those edges' `a` vertices (in order). For edges between faces of the same navmesh, `oppositeEdge` and
+    `oppositeFace` are indices of the other face's reversed edge (`b` to `a`); unconnected edges have
+    `INVALID_PACKED_KEY`, and edges connected to other navmeshes have `NavmeshEdgeFlag.EXTERNAL_OPPOSITE` set.
+    """
+    vertices: np.ndarray  # (n, 4) `float32` array (fourth column is unused)
+    faces: np.ndarray  # `NAVMESH_FACE_DTYPE` array
+    edges: np.ndarray  # `NAVMESH_EDGE_DTYPE` array
+    face_data: np.ndarray  # (face_count, face_data_striding) `int32` array
+    edge_data: np.ndarray  # (edge_count, edge_data_striding) `int32` array
+
+    @classmethod
+    def from_hkai_navmesh(cls, navmesh: hkaiNavMesh) -> tp.Self:
+        """Read all arrays from `navmesh`."""
+        vertices = np.array(navmesh.vertices, dtype=np.float32).reshape((-1, 4))
+        faces = _FACE_LAYOUT.to_records(navmesh.faces)
+        edges = _EDGE_LAYOUT.to_records(navmesh.edges)
+        face_data = np.array(navmesh.faceData, dtype=np.int32).reshape((len(faces), navmesh.faceDataStriding))
+        edge_data = np.array(navmesh.edgeData, dtype=np.int32).reshape((len(edges), navmesh.edgeDataStriding))
+        return cls(vertices, faces, edges, face_data, edge_data)
+
+    @classmethod
+    def from_mesh(
+        cls,
+        vertices: np.ndarray,
+        face_indices: np.ndarray,
+        face_offsets: np.ndarray,
+        edge_flags: int | np.ndarray = 0,
+        face_data: np.ndarray = None,
+        edge_data: np.ndarray = None,
+    ) -> tp.Self:
+        """Build faces and edges (with opposite edge/face links) for polygonal faces, given as flat vertex indices and
+        `face_count + 1` offsets into them (like `Mesh.face_indices` and `Mesh.face_offsets`).
+
+        Each edge is linked to the edge of another face that has the same vertices in the opposite order, if any. Faces
+        should all have the same winding, and each edge should have at most one such opposite edge (otherwise, the
+        first one is used).
+        """
+        vertices = np.asarray(vertices, dtype=np.float32)
+        if vertices.shape[1] == 3:
+            vertices = np.hstack((vertices, np.zeros((len(vertices), 1), dtype=np.float32)))
+        face_indices = np.asarray(face_indices, dtype=np.int64)
+        face_offsets = np.asarray(face_offsets, dtype=np.int64)
+        face_sizes = np.diff(face_offsets)
+        if np.any(face_sizes < 3):
+            raise ValueError("All navmesh faces must have at least three vertices.")
+        face_count, edge_count = len(face_sizes), len(face_indices)
+
+        faces = np.zeros(face_count, dtype=NAVMESH_FACE_DTYPE)
+        faces["startEdgeIndex"] = face_offsets[:-1]
+        faces["startUserEdgeIndex"] = -1
+        faces["numEdges"] = face_sizes
+        faces["clusterIndex"] = -1
+
+        # Edge `i` goes from face vertex `i` to the next vertex of the same face (wrapping around to the first).
+        next_indices = np.arange(1, edge_count + 1)
+        next_indices[face_offsets[1:] - 1] = face_offsets[:-1]
+        edge_faces = np.repeat(np.arange(face_count), face_sizes)
+        edges = np.zeros(edge_count, dtype=NAVMESH_EDGE_DTYPE)
+        edges["a"] = face_indices
+        edges["b"] = face_indices[next_indices]
+        edges["flags"] = edge_flags
+
+        # Find opposite edges by looking up each reversed edge key `(b, a)` among sorted edge keys `(a, b)`.
+        vertex_count = len(vertices)
+        keys = face_indices * vertex_count + face_indices[next_indices]
+        reversed_keys = face_indices[next_indices] * vertex_count + face_indices
+        key_order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[key_order]
+        positions = np.minimum(np.searchsorted(sorted_keys, reversed_keys), max(edge_count - 1, 0))
+        # Degenerate edges (`a == b`) would match themselves.
+        has_opposite = (sorted_keys[positions] == reversed_keys) & (keys != reversed_keys)
+        opposite_edges = key_order[positions]
+        edges["oppositeEdge"] = np.where(has_opposite, opposite_edges, INVALID_PACKED_KEY)
+        edges["oppositeFace"] = np.where(has_opposite, edge_faces[opposite_edges], INVALID_PACKED_KEY)
+
+        if face_data is None:
+            face_data = np.zeros((face_count, 0), dtype=np.int32)
+        if edge_data is None:
+            edge_data = np.zeros((edge_count, 0), dtype=np.int32)
+        face_data = _reshape_user_data(face_data, face_count)
+        edge_data = _reshape_user_data(edge_data, edge_count)
+        return cls(vertices, faces, edges, face_data, edge_data)
+
+    @classmethod
+    def from_simple_mesh(cls, mesh: Mesh, edge_flags: int | np.ndarray = 0) -> tp.Self:
+        """Build faces and edges for all faces of `mesh`. See `from_mesh()`."""
+        return cls.from_mesh(mesh.vertices, mesh.face_indices, mesh.face_offsets, edge_flags=edge_flags)
+
+    @property
+    def face_count(self) -> int:
+        return len(self.faces)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.edges)
+
+    def get_face_offsets(self) -> np.ndarray:
+        """Get `face_count + 1` offsets of each face's vertices in `get_face_vertex_indices()`."""
+        face_offsets = np.zeros(len(self.faces) + 1, dtype=np.int64)
+        np.cumsum(self.faces["numEdges"], out=face_offsets[1:])
+        return face_offsets
+
+    def get_face_edge_indices(self) -> np.ndarray:
+        """Get flat indices of the edges of all faces, in face order."""
+        face_offsets = self.get_face_offsets()
+        face_starts = self.faces["startEdgeIndex"].astype(np.int64)
+        return np.arange(face_offsets[-1]) + np.repeat(face_starts - face_offsets[:-1], self.faces["numEdges"])
+
+    def get_face_vertex_indices(self) -> np.ndarray:
+        """Get flat vertex indices of all faces, in face order (i.e. the `a` vertex of each face edge)."""
+        return self.edges["a"][self.get_face_edge_indices()].astype(np.int64)
+
+    def get_edge_faces(self) -> np.ndarray:
+        """Get the index of the face that uses each edge (or -1 for edges not used by any face)."""
+        edge_faces = np.full(len(self.edges), -1, dtype=np.int64)
+        edge_faces[self.get_face_edge_indices()] = np.repeat(np.arange(len(self.faces)), self.faces["numEdges"])
+        return edge_faces
+
+    def get_simple_mesh(self) -> Mesh:
+        """Get a `Mesh` of all 3D vertices and faces."""
+        return Mesh.from_flat_faces(self.vertices[:, :3], self.get_face_vertex_indices(), self.get_face_offsets())
+
+    def get_aabb_min_max(self) -> tuple[np.ndarray, np.ndarray]:
+        """Get minimum and maximum 3D vertex coordinates."""
+        if not len(self.vertices):
+            return np.zeros(3, dtype=np.float32), np.zeros(3, dtype=np.float32)
+        return self.vertices[:, :3].min(axis=0), self.vertices[:, :3].max(axis=0)
+
+    def to_hkai_navmesh(self, navmesh: hkaiNavMesh = None, erosion_radius: float = 0.0) -> hkaiNavMesh:
+        """Write all arrays (and a new AABB) to `navmesh` in place and return it, or create a new `hkaiNavMesh`.
+
+        Other members of an existing `navmesh` (e.g. `streamingSets` for connections to other navmeshes) are kept.
+        """
+        aabb_min, aabb_max = self.get_aabb_min_max()
+        kwargs = dict(
+            faces=_FACE_LAYOUT.from_records(self.faces),
+            edges=_EDGE_LAYOUT.from_records(self.edges),
+            vertices=self.vertices.copy(),
+            faceData=self.face_data.ravel().tolist(),
+            edgeData=self.edge_data.ravel().tolist(),
+            faceDataStriding=self.face_data.shape[1],
+            edgeDataStriding=self.edge_data.shape[1],
+            aabb=hk2018.hkAabb(
+                min=Vector4((*aabb_min.tolist(), 0.0)),
+                max=Vector4((*aabb_max.tolist(), 0.0)),
+            ),
+        )
+        if navmesh is not None:
+            for name, value in kwargs.items():
+                setattr(navmesh, name, value)
+            return navmesh
+        return hkaiNavMesh(
+            propertyBag=hk2018.hkPropertyBag(),
+            streamingSets=[],
+            flags=0,
+            erosionRadius=erosion_radius,
+            userData=0,
+            clearanceCacheSeedingDataSet=None,
+            **kwargs,
+        )
@@ -14,18 +14,19 @@ __all__ = [
 ]
 
 import logging
-import subprocess as sp
 import typing as tp
 
 from soulstruct.dcx import DCXType
-from soulstruct.utilities.files import SOULSTRUCT_USER_DATA_PATH
 
 from soulstruct.havok.core import HavokFileFormat
 from soulstruct.havok.enums import HavokModule
 from soulstruct.havok.packfile.structs import PackFileVersion, PackfileHeaderInfo
 from soulstruct.havok.types import hk2010, hk2016
-from soulstruct.havok.types.hk2016 import *
-from soulstruct.havok.utilities.files import SOULSTRUCT_HAVOK_PATH
+from soulstruct.havok.types.hk2016 import (
+    VERSION, hk, hkRootLevelContainer, hkaAnimation, hkaAnimationBinding, hkaAnimationContainer, hkaBone,
+    hkaDefaultAnimatedReferenceFrame, hkaInterleavedUncompressedAnimation, hkaSkeleton, hkaSkeletonMapper,
+    hkaSplineCompressedAnimation, hkpPhysicsData, hkpPhysicsSystem,
+)
 from soulstruct.havok.utilities.hk_conversion import convert_hk
 from soulstruct.havok.fromsoft.base import *
 from soulstruct.havok.fromsoft.darksouls1ptde import AnimationHKX as AnimationHKX2010
@@ -46,54 +47,6 @@ class AnimationHKX(BaseAnimationHKX):
     root: hkRootLevelContainer = None
     animation_container: AnimationContainerType = None
 
-    def to_spline_hkx(self) -> AnimationHKX:
-        """Uses Horkrux's compiled converter to convert interleaved HKX to spline HKX.
-
-        Returns an entire new instance of this class.
-        """
-        if not self.animation_container.is_interleaved:
-            raise TypeError("Can only convert interleaved animations to spline animations.")
-
-        temp_interleaved_path = SOULSTRUCT_USER_DATA_PATH("__temp_interleaved__.hkx")
-        temp_spline_path = SOULSTRUCT_USER_DATA_PATH("__temp_spline__.hkx")
-
-        dcx_type = self.dcx_type
-        _LOGGER.debug("Downgrading to 2010...")
-        hkx2010 = self.to_2010_hkx()
-        try:
-            _LOGGER.debug("Writing 2010 file...")
-            hkx2010.write(temp_interleaved_path)
-            _LOGGER.debug("Calling `CompressAnim`...")
-            compress_anim_path = str(SOULSTRUCT_HAVOK_PATH("havok/resources/CompressAnim.exe"))
-            try:
-                sp.check_output(
-                    [compress_anim_path, str(temp_interleaved_path), str(temp_spline_path), "1", "0.001"],
-                    stderr=sp.STDOUT,
-                )
-            except sp.CalledProcessError as ex:
-                _LOGGER.error(
-                    f"Spline animation compression failed. Error in `CompressAnim.exe`: {ex.output.decode()}\n"
-                    f"Left temp interleaved HKX file for inspection: {temp_interleaved_path}"
-                )
-                raise RuntimeError from ex
-            temp_interleaved_path.unlink(missing_ok=True)
-            _LOGGER.debug("Reading 2010 spline-compressed animation...")
-            hkx2010_spline = AnimationHKX2010.from_path(temp_spline_path)
-        finally:
-            temp_spline_path.unlink(missing_ok=True)
-
-        _LOGGER.debug("Upgrading to 2015...")
-        anim_2015 = self.__class__.from_2010_hkx(hkx2010_spline, dcx_type=dcx_type)
-
-        # Clean-up: restore hash overrides, change binding to refer to same animation, and change animation type.
-        anim_2015.hsh_overrides = self.hsh_overrides.copy()
-        for i, anim in enumerate(anim_2015.animation_container.hkx_container.animations):
-            anim_2015.animation_container.hkx_container.bindings[i].animation = anim
-            anim.type = 3  # spline-compressed in Havok 2015 (was 5 in Havok 2010)
-
-        _LOGGER.info("Successfully converted interleaved animation to hk2016 spline animation.")
-        return anim_2015
-
     def to_2010_hkx(self) -> AnimationHKX2010:
         """Construct a 2010 Havok file (with packfile type) from this 2015 tagfile.
 
@@ -101,10 +54,8 @@ class AnimationHKX(BaseAnimationHKX):
 
         (I am adding these specific conversion functions as needed for Nightfall.)
         """
-        if self.animation_container.is_spline:
-            self.animation_container.save_spline_data()
-        elif self.animation_container.is_interleaved:
-            self.animation_container.save_interleaved_data()
+        # Only spline or interleaved data that has been loaded (and possibly modified) needs to be saved.
+        self.animation_container.save_data()
 
         def source_error_handler(_, name: str, value, dest_kwargs: dict[str, tp.Any]):
             if name == "refCount":
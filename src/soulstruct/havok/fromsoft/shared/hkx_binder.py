@@ -1,6 +1,8 @@
 """Wrapper for both the hi-res and lo-res HKXBHD binders in DSR.
 
-Only loads `MapCollisionModel` instances as they are requested, from either the `.hires` or `.lores` dict attributes.
+Only loads `MapCollisionModel` instances as they are requested, from either the `.hires` or `.lores` dict attributes,
+unless `load_all()` is called. Decoding all entries and re-encoding loaded models when writing can both be spread across
+`processes` worker processes.
 """
 from __future__ import annotations
 
@@ -12,6 +14,7 @@ __all__ = [
 import typing as tp
 
 from dataclasses import dataclass, field
+from multiprocessing import Pool
 from pathlib import Path
 
 from soulstruct.containers import Binder, BinderVersion, BinderVersion4Info, EntryNotFoundError
@@ -19,11 +22,32 @@ from soulstruct.dcx import DCXType
 from .map_collision import MapCollisionModel
 
 
+def _unpack_map_collision(data: bytes) -> MapCollisionModel:
+    return MapCollisionModel.from_bytes(data)
+
+
+def _pack_map_collision(hkx: MapCollisionModel) -> bytes:
+    return bytes(hkx)  # includes DCX compression
+
+
+def _map_in_pool(func: tp.Callable, items: list, processes: int) -> list:
+    """Apply `func` to each of `items` in a pool of `processes` worker processes, or in this process if `processes` is
+    one (or there are fewer than two items)."""
+    if processes > 1 and len(items) > 1:
+        with Pool(min(processes, len(items))) as pool:
+            return pool.map(func, items)
+    return [func(item) for item in items]
+
+
 class HKXBHD(Binder):
     """Wraps a single HKXBHD, either hi-res or lo-res. Only loads `MapCollisionModel` instances as they are requested by
     the `get_hkx()` method.
 
     Any loaded HKX instances in the `.hkxs` attribute will be saved to the Binder's entries when it is written.
+
+    If `processes` is greater than one, `load_all()` decodes entries and writing re-encodes loaded HKXs in a pool of that
+    many worker processes. `MapCollisionModel` is a compact array-based representation, so it is cheap to send between
+    processes.
     """
 
     # Override defaults.
@@ -34,14 +58,18 @@ class HKXBHD(Binder):
 
     map_stem: str = ""
     hkxs: dict[str, MapCollisionModel] = field(default_factory=dict)  # model stems only (e.g. 'h1000B1A10') -> `HKX`
+    processes: int = 1  # worker processes used to decode/encode HKX entries in bulk
+
+    def get_hkx(self, hkx_stem: str) -> MapCollisionModel:
+        """Get `MapCollisionModel` instance from this `HKXBHD`, which is only loaded from its entry the first time.
 
-    def get_hkx(self, hkx_stem: str):
-        """Load `MapCollisionModel` instance from this `HKXBHD` if it was loaded before, otherwise return `None`."""
+        Raises an `EntryNotFoundError` if it is not loaded and there is no entry for it.
+        """
         hkx_stem = hkx_stem.removesuffix(".dcx").removesuffix(".hkx")  # clean up suffixes
-        return self.hkxs.setdefault(
-            hkx_stem,
-            self.find_entry_by_name(f"{hkx_stem}.hkx.dcx").to_binary_file(MapCollisionModel)
-        )
+        if hkx_stem not in self.hkxs:
+            entry = self.find_entry_by_name(f"{hkx_stem}.hkx.dcx")
+            self.hkxs[hkx_stem] = entry.to_binary_file(MapCollisionModel)
+        return self.hkxs[hkx_stem]
 
     def set_hkx(self, hkx_stem: str, hkx: MapCollisionModel):
         """Explicitly set the `MapCollisionModel` instance for the given stem, e.g. to replace whatever is loaded."""
@@ -50,20 +78,32 @@ class HKXBHD(Binder):
         self.hkxs[hkx_stem] = hkx
 
     def load_all(self, overwrite=False):
-        """Load all HKX entries from this HKXBHD."""
+        """Load all HKX entries from this HKXBHD, in parallel if `processes > 1`.
+
+        Already-loaded HKXs are kept (and their entries not decoded again) unless `overwrite=True`.
+        """
+        entries = {}
         for entry in self.entries:
             if entry.name.endswith(".hkx.dcx"):
                 hkx_stem = entry.name[:-8]  # remove '.hkx.dcx'
                 if overwrite or hkx_stem not in self.hkxs:
-                    self.hkxs[hkx_stem] = entry.to_binary_file(MapCollisionModel)
+                    entries[hkx_stem] = entry
+
+        hkxs = _map_in_pool(
+            _unpack_map_collision, [entry.get_uncompressed_data() for entry in entries.values()], self.processes
+        )
+        for (hkx_stem, entry), hkx in zip(entries.items(), hkxs):
+            hkx.path = Path(entry.path)
+            self.hkxs[hkx_stem] = hkx
 
     def entry_autogen(self):
-        """Overwrite Binder entries from loaded `HKX` instances."""
-        for hkx_stem, hkx in self.hkxs.items():
-            hkx_stem = hkx_stem.removesuffix(".dcx").removesuffix(".hkx")
+        """Overwrite Binder entries from loaded `HKX` instances, which are encoded in parallel if `processes > 1`."""
+        hkx_stems = [hkx_stem.removesuffix(".dcx").removesuffix(".hkx") for hkx_stem in self.hkxs]
+        hkx_datas = _map_in_pool(_pack_map_collision, list(self.hkxs.values()), self.processes)
+        for hkx_stem, hkx_data in zip(hkx_stems, hkx_datas):
             self.set_default_entry(
                 self.get_hkx_entry_path(hkx_stem), new_id=len(self.entries), new_flags=0x2
-            ).set_from_binary_file(hkx)
+            ).set_uncompressed_data(hkx_data)
 
         # Sort all final entries.
         self.auto_enumerate_entries(sort_key=lambda e: e.name)
@@ -93,20 +133,35 @@ class BothResHKXBHD:
     path: Path | None = None
 
     @classmethod
-    def from_map_path(cls, map_path: Path | str) -> tp.Self:
-        """Will raise a `FileNotFoundError` if (half of) either Binder file is missing."""
+    def from_map_path(cls, map_path: Path | str, processes=1) -> tp.Self:
+        """Will raise a `FileNotFoundError` if (half of) either Binder file is missing.
+
+        `processes` is set on both binders (see `HKXBHD`).
+        """
         map_path = Path(map_path)
         hi_res_path = Path(map_path, f"h{map_path.name[1:]}.hkxbhd")
         lo_res_path = Path(map_path, f"l{map_path.name[1:]}.hkxbhd")
-        return cls(HKXBHD.from_path(hi_res_path), HKXBHD.from_path(lo_res_path), path=map_path)
+        return cls.from_both_paths(hi_res_path, lo_res_path, map_path, processes=processes)
 
     @classmethod
-    def from_both_paths(cls, hi_res_path: Path | str, lo_res_path: Path | str, map_path: Path | str = None) -> tp.Self:
-        """Will raise a `FileNotFoundError` if (half of) either Binder file is missing."""
+    def from_both_paths(
+        cls, hi_res_path: Path | str, lo_res_path: Path | str, map_path: Path | str = None, processes=1
+    ) -> tp.Self:
+        """Will raise a `FileNotFoundError` if (half of) either Binder file is missing.
+
+        `processes` is set on both binders (see `HKXBHD`).
+        """
         hi_res_path = Path(hi_res_path)
         lo_res_path = Path(lo_res_path)
         map_path = Path(map_path) if map_path else hi_res_path.parent
-        return cls(HKXBHD.from_path(hi_res_path), HKXBHD.from_path(lo_res_path), path=map_path)
+        both_res = cls(HKXBHD.from_path(hi_res_path), HKXBHD.from_path(lo_res_path), path=map_path)
+        both_res.hi_res.processes = both_res.lo_res.processes = processes
+        return both_res
+
+    def load_all(self, overwrite=False):
+        """Load all hi-res and lo-res HKX entries (see `HKXBHD.load_all()`)."""
+        self.hi_res.load_all(overwrite)
+        self.lo_res.load_all(overwrite)
 
     def get_hi_hkx(self, hkx_stem: str) -> MapCollisionModel:
         return self.hi_res.get_hkx(hkx_stem)
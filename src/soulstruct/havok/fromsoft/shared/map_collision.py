@@ -12,7 +12,6 @@ __all__ = [
     "MapCollisionModel",
 ]
 
-import io
 import logging
 import typing as tp
 from dataclasses import dataclass, field
@@ -29,8 +28,8 @@ from soulstruct.havok.types import hk550, hk2010, hk2015
 from soulstruct.havok.types.protocols.physics import *
 from soulstruct.havok.utilities.files import SOULSTRUCT_HAVOK_PATH
 from soulstruct.havok.utilities.maths import Vector4
-from soulstruct.havok.utilities.mopper import mopper
-from soulstruct.havok.utilities.wavefront import read_obj
+from soulstruct.havok.utilities.mopp import build_mopp_code
+from soulstruct.havok.utilities.wavefront import format_obj, read_obj
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -140,8 +139,7 @@ class MapCollisionModel(GameFile):
     gives each mesh a material ID that determines footstep sounds/VFX and other interactive properties.
 
     Each mesh has a special MOPP code that is generated by Havok to speed up collision detection. The MOPP code is
-    stored in the `hkpMoppBvTreeShape` shape and is regenerated here using a bundled executable I compiled from the
-    public Havok 2012 SDK, modified from a Niftools repo.
+    stored in the `hkpMoppBvTreeShape` shape and is regenerated here by `utilities.mopp.build_mopp_code()`.
 
     Note that the name of the map collision is also stored inside the shape data.
 
@@ -359,7 +357,7 @@ class MapCollisionModel(GameFile):
         child_shape.aabbHalfExtents = Vector4(half_extents)
         child_shape.aabbCenter = Vector4(center)
 
-        # Use Mopper executable to regenerate binary MOPP code.
+        # Regenerate binary MOPP code.
         self.regenerate_mopp_data(physics_system)
 
         return hkx
@@ -438,40 +436,24 @@ class MapCollisionModel(GameFile):
         return shape.code
 
     def regenerate_mopp_data(self, physics_system: PhysicsSystem):
-        """Use `mopper.exe` to build new MOPP code, including `code.info.offset` vector.
+        """Build new MOPP code from the mesh subparts of `physics_system`, including `code.info.offset` vector.
 
         Works for Demon's Souls, Dark Souls: PTDE, and Dark Souls: Remastered. Games after DS1 use `hkcd` classes
         rather than MOPP code and are currently impossible to build/export.
         """
         shape, _ = self.get_child_shape(physics_system)
-        meshstorage = shape.meshstorage
         mopp_code = self.get_mopp_code(physics_system)
 
-        mopper_input = [f"{len(meshstorage)}"]
-        for mesh in meshstorage:
-            if not mesh.indices16:
-                raise ValueError("Cannot regenerate MOPP code for mesh with no 16-bit vertex indices.")
-            mopper_input.append("")
-            mopper_input.append(f"{len(mesh.vertices)}")
-
-            # Format array of vertices as "x y z" lines (lines already joined).
-            v = io.StringIO()
-            np.savetxt(v, mesh.vertices[:, :3], fmt="%.6f")
-            mopper_input.append(v.getvalue())
-            mopper_input.append("")  # blank line
-
-            face_count = len(mesh.indices16) // 4
-            mopper_input.append(f"{face_count}")
-            for f in range(face_count):
-                # Write first three elements only.
-                i = f * 4
-                mopper_input.append(f"{mesh.indices16[i]} {mesh.indices16[i + 1]} {mesh.indices16[i + 2]}")
-
-        mopp = mopper(mopper_input, mode="-esm")
-        new_mopp_code = mopp["hkpMoppCode"]["data"]
-        new_offset = mopp["hkpMoppCode"]["offset"]
-        mopp_code.data = new_mopp_code
-        mopp_code.info.offset = Vector4(new_offset)
+        subparts = []
+        for mesh in shape.meshstorage:
+            vertex_indices, face_dtype = self.get_vertex_indices_and_dtype(mesh)
+            faces = np.array(vertex_indices, dtype=face_dtype).reshape((-1, 4))
+            subparts.append((mesh.vertices, faces))
+
+        # Havok 5.5.0 has no `numBitsForSubpartIndex` member, but always uses 12 bits.
+        data, offset = build_mopp_code(subparts, getattr(shape, "numBitsForSubpartIndex", 12))
+        mopp_code.data = list(data)
+        mopp_code.info.offset = offset
 
     def new_subpart_storage(self, mesh: MapCollisionModelMesh) -> StorageExtendedMeshShapeMeshSubpartStorage:
         """Create Havok 'subpart storage' class that stores the vertex positions and faces (vertex indices)."""
@@ -607,10 +589,14 @@ class MapCollisionModel(GameFile):
             material_indices = [0] * len(obj_meshes)
         hkx_name = hkx_name or Path(obj_path).stem.split(".")[0]
 
-        meshes = [
-            MapCollisionModelMesh(vertices, faces, material_index)
-            for (vertices, faces), material_index in zip(obj_meshes, material_indices)
-        ]
+        meshes = []
+        for (vertices, faces), material_index in zip(obj_meshes, material_indices):
+            # Add fourth column of zeroes to both, as in HKX.
+            hkx_vertices = np.zeros((len(vertices), 4), dtype=np.float32)
+            hkx_vertices[:, :3] = vertices
+            hkx_faces = np.zeros((len(faces), 4), dtype=np.uint16 if len(vertices) <= 0xFFFF else np.uint32)
+            hkx_faces[:, :3] = faces
+            meshes.append(MapCollisionModelMesh(hkx_vertices, hkx_faces, material_index))
 
         return cls(
             name=hkx_name,
@@ -624,23 +610,15 @@ class MapCollisionModel(GameFile):
         Inverts (negates) X axis by default, which should be reversed on import. Also note that vertices in OBJ files
         are 1-indexed by the face indices. Material indices are stored in header.
         """
-        obj_lines = [
-            f"# OBJ file generated by Soulstruct from HKX with name: {self.name}",
-            f"# Material indices: {', '.join(str(mesh.material_index) for mesh in self.meshes)}",
-        ]
-        global_v_i = 0
-
-        for i, mesh in enumerate(self.meshes):
-            obj_lines += ["", f"o {self.name} Subpart {i}"]
-            for vert in mesh.vertices:
-                obj_lines.append(f"v {-vert.x if invert_x else vert.x} {vert.y} {vert.z}")
-            obj_lines.append("s off")
-            face_offset = global_v_i + 1  # 1-indexed vertices
-            for face in mesh.faces:
-                obj_lines.append(f"f {face_offset + face[0]} {face_offset + face[1]} {face_offset + face[2]}")
-            global_v_i += len(mesh.vertices)
-
-        return "\n".join(obj_lines) + "\n"
+        return format_obj(
+            [(mesh.vertices, mesh.faces) for mesh in self.meshes],
+            names=[f"{self.name} Subpart {i}" for i in range(len(self.meshes))],
+            invert_x=invert_x,
+            header_lines=[
+                f"OBJ file generated by Soulstruct from HKX with name: {self.name}",
+                f"Material indices: {', '.join(str(mesh.material_index) for mesh in self.meshes)}",
+            ],
+        )
 
     def write_obj(self, obj_path: Path | str):
         """Write OBJ file to `obj_path`."""
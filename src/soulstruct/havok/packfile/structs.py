@@ -22,6 +22,7 @@ from dataclasses import dataclass, field
 from enum import IntEnum
 
 from soulstruct.havok.enums import HavokModule
+from soulstruct.havok.utilities.memory_reader import MemoryReader
 
 from soulstruct.utilities.binary import *
 from soulstruct.utilities.inspection import get_hex_repr
@@ -46,9 +47,10 @@ class PackFileBaseItem(abc.ABC):
 
     local_data_offset: int = -1
     item_byte_size: int = -1
-    raw_data: bytes = b""
+    raw_data: bytes | memoryview = b""  # view of source section data if unpacked from a `MemoryReader`
     byte_order: ByteOrder = ByteOrder.LittleEndian
     long_varints: bool = False
+    zero_copy: bool = False  # create item reader with `zero_copy` (see `MemoryReader`)
 
     # Maps source offsets to dest offsets inside same entry (arrays and strings).
     all_child_pointers: dict[int, int] = field(default_factory=dict)
@@ -62,7 +64,11 @@ class PackFileBaseItem(abc.ABC):
         """`section_reader` should be local for this section, NOT the whole HKX file."""
         self.local_data_offset = section_reader.position  # offset inside data section
         self.item_byte_size = data_size
-        self.raw_data = section_reader.read(data_size)  # parsed later
+        if isinstance(section_reader, MemoryReader):
+            self.raw_data = section_reader.read_view(data_size)  # parsed later
+            self.zero_copy = section_reader.zero_copy
+        else:
+            self.raw_data = section_reader.read(data_size)  # parsed later
         self.byte_order = byte_order
         self.long_varints = long_varints
 
@@ -79,7 +85,9 @@ class PackFileBaseItem(abc.ABC):
         """Create raw data reader. Raises `ValueError` if the reader was already created."""
         if self.reader is not None:
             raise ValueError(f"`{self.__class__.__name__}` reader was already created.")
-        self.reader = BinaryReader(self.raw_data, byte_order=self.byte_order, long_varints=self.long_varints)
+        self.reader = MemoryReader(
+            self.raw_data, byte_order=self.byte_order, long_varints=self.long_varints, zero_copy=self.zero_copy
+        )
 
     def start_writer(self):
         if self.writer is not None:
@@ -164,10 +172,10 @@ class PackFileTypeItem(PackFileBaseItem):
         """Quickly look up type name from raw data. Returns `None` if `child_pointers` is undefined/empty."""
         if not self.all_child_pointers:
             return None
-        return BinaryReader(self.raw_data).unpack_string(offset=self.all_child_pointers[0], encoding="utf-8")
+        return MemoryReader(self.raw_data).unpack_string(offset=self.all_child_pointers[0], encoding="utf-8")
 
     def get_byte_size(self) -> int:
-        return BinaryReader(self.raw_data).unpack_value("I", offset=8)
+        return MemoryReader(self.raw_data).unpack_value("I", offset=8)
 
     def get_referenced_type_item(self, offset: int) -> PackFileTypeItem | None:
         """Look for `self.item_pointers[offset]` and recover the pointed `PackFileTypeItem`."""
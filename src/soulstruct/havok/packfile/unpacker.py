@@ -12,13 +12,16 @@ from soulstruct.utilities.binary import BinaryReader, ByteOrder
 
 from soulstruct.havok.enums import HavokModule
 from soulstruct.havok.exceptions import VersionModuleError, TypeNotDefinedError
-from soulstruct.havok.types import hk550, hk2010, hk2014, hk2015, hk2016, hk2018
 from soulstruct.havok.types.hk import hk
 from soulstruct.havok.types.info import TypeInfo, get_py_name
+from soulstruct.havok.utilities.memory_reader import MemoryReader
 
 from .structs import *
 from .type_unpacker import PackFileTypeUnpacker
 
+if tp.TYPE_CHECKING:
+    from soulstruct.havok.types import hk550, hk2010, hk2014, hk2015, hk2016, hk2018
+
 _LOGGER = logging.getLogger(__name__)
 
 colorama.just_fix_windows_console()
@@ -27,18 +30,18 @@ X = colorama.Fore.RESET
 
 ROOT_TYPING = tp.Union[
     None,
-    hk550.hkRootLevelContainer,
-    hk2010.hkRootLevelContainer,
-    hk2014.hkRootLevelContainer,
-    hk2015.hkRootLevelContainer,
-    hk2016.hkRootLevelContainer,
-    hk2018.hkRootLevelContainer,
+    "hk550.hkRootLevelContainer",
+    "hk2010.hkRootLevelContainer",
+    "hk2014.hkRootLevelContainer",
+    "hk2015.hkRootLevelContainer",
+    "hk2016.hkRootLevelContainer",
+    "hk2018.hkRootLevelContainer",
 ]
 
 
 class SectionInfo(tp.NamedTuple):
     """Convenient container for information about a section."""
-    raw_data: bytes
+    raw_data: bytes | memoryview
     child_pointers: list[ChildPointerStruct]
     item_pointers: list[ItemPointerStruct]
     item_specs: list[ItemSpecStruct]
@@ -64,13 +67,16 @@ class PackFileUnpacker:
     class_hashes: dict[str, int] = field(default_factory=dict)  # maps class names to hashes
     data_items: list[PackFileDataItem] = field(default_factory=list)
     root: ROOT_TYPING = None
+    # Copied from the source `MemoryReader`, if any. Sections and items are always views of its data.
+    zero_copy: bool = False
 
-    def unpack(self, reader: BinaryReader, types_only=False):
+    def unpack(self, reader: BinaryReader, types_only=False, variants: tp.Container[str] = None):
 
         self.byte_order = reader.byte_order = ByteOrder.big_endian_bool(
             not reader.unpack_value("?", offset=0x11)
         )
         self.header = PackFileHeader.from_bytes(reader)
+        self.zero_copy = isinstance(reader, MemoryReader) and reader.zero_copy
 
         if self.header.version == PackFileVersion.Version0x04:
             _LOGGER.warning("Packfile version 0x04 is not officially supported for packfile read, but may work.")
@@ -113,7 +119,7 @@ class PackFileUnpacker:
                 )
 
         self.type_items = self.unpack_type_items(
-            BinaryReader(type_section_info.raw_data, byte_order=self.byte_order),
+            self.get_section_reader(type_section_info.raw_data),
             item_specs=type_section_info.item_specs,
             section_end_offset=type_section_info.end_offset
         )
@@ -165,7 +171,7 @@ class PackFileUnpacker:
             raise VersionModuleError(f"No Havok type module for version: {self.hk_version}")
 
         self.data_items = self.unpack_data_items(
-            BinaryReader(data_section_info.raw_data, byte_order=self.byte_order),
+            self.get_section_reader(data_section_info.raw_data),
             item_specs=data_section_info.item_specs,
             section_end_offset=data_section_info.end_offset,
         )
@@ -185,9 +191,12 @@ class PackFileUnpacker:
         if root_item.hk_type is not root_type:
             raise TypeError(f"First data item in HKX was not `hkRootLevelContainer`: {root_item.get_type_name()}")
         root_item.start_reader()
-        with hk.set_havok_module(self.havok_module):
+        with hk.set_havok_module(self.havok_module), hk.select_variants(variants):
             self.root = root_type.unpack_packfile(root_item)
 
+        if variants is not None:
+            return  # pointers of unselected variants are never used
+
         # Check for unused pointers.
         for item in self.data_items:
             if item.remaining_child_pointers:
@@ -203,6 +212,17 @@ class PackFileUnpacker:
                     print(f"    {R if k in item.remaining_item_pointers else X}{hex(k)} -> {v}{X}")
                 raise ValueError(f"Item `{item.get_type_name()}` has remaining item pointers. See red in printout.")
 
+    def detach_item_data(self):
+        """Copy item data that are views of the source `MemoryReader` data (see `get_section_reader()`) to `bytes`, and
+        discard their readers, so that the source can be released and this unpacker can be copied or pickled.
+
+        Any zero-copy arrays in `root` still view the source data.
+        """
+        for item in self.type_items + self.data_items:
+            if isinstance(item.raw_data, memoryview):
+                item.raw_data = item.raw_data.tobytes()
+                item.reader = None
+
     @staticmethod
     def localize_pointers(
         all_section_items: dict[int, list[PackFileTypeItem] | list[PackFileDataItem]],
@@ -259,7 +279,10 @@ class PackFileUnpacker:
 
         absolute_data_start = section.absolute_data_start
         section_data_end = section.child_pointers_offset
-        section_data = reader.unpack_bytes(length=section_data_end, offset=absolute_data_start, strip=False)
+        if isinstance(reader, MemoryReader):
+            section_data = reader.read_view(section_data_end, offset=absolute_data_start)
+        else:
+            section_data = reader.unpack_bytes(length=section_data_end, offset=absolute_data_start, strip=False)
         child_pointer_count = (section.item_pointers_offset - section.child_pointers_offset) // 8
         item_pointer_count = (section.item_specs_offset - section.item_pointers_offset) // 12
         item_spec_count = (section.exports_offset - section.item_specs_offset) // 12
@@ -286,12 +309,16 @@ class PackFileUnpacker:
 
         return SectionInfo(section_data, child_pointers, item_pointers, item_specs, section_data_end)
 
-    def unpack_class_names(self, class_name_data: bytes):
+    def get_section_reader(self, section_data: bytes | memoryview) -> MemoryReader:
+        """Reader over `section_data` without copying it. Item data are then also views of it (see `MemoryReader`)."""
+        return MemoryReader(section_data, byte_order=self.byte_order, zero_copy=self.zero_copy)
+
+    def unpack_class_names(self, class_name_data: bytes | memoryview):
         """Constructs dictionaries mapping offsets (within class name section) to HKX class names and signatures."""
         self.class_names = {}
         self.class_hashes = {}
 
-        class_name_reader = BinaryReader(class_name_data, byte_order=self.byte_order)
+        class_name_reader = self.get_section_reader(class_name_data)
         class_name_data_length = len(class_name_data)
 
         # Continue unpacking class names until end of reader or '\xFF' padding begins.
@@ -22,7 +22,6 @@ import math
 import struct
 from dataclasses import dataclass
 from enum import IntEnum
-from multiprocessing import Pool
 
 import numpy as np
 from soulstruct.utilities.binary import *
@@ -119,6 +118,30 @@ def write_uint40(writer: BinaryWriter, value: int):
     writer.append(packed_uint64[:5])  # drop last three bytes
 
 
+def unpack_three_comp_40_array(data: bytes) -> np.ndarray:
+    """Decode consecutive five-byte ThreeComp40 quaternions in `data` all at once, exactly as
+    `Quaternion.decode_ThreeComp40()` would decode each one. Returns a `(count, 4)` array of XYZW.
+    """
+    raw = np.zeros((len(data) // 5, 8), dtype=np.uint8)
+    raw[:, :5] = np.frombuffer(data, dtype=np.uint8).reshape(-1, 5)
+    c_vals = raw.view("<u8")[:, 0]
+
+    mask = (1 << 12) - 1
+    components = np.stack(
+        [(c_vals >> np.uint64(shift)) & np.uint64(mask) for shift in (0, 12, 24)], axis=1
+    ).astype(np.float64)
+    components = Quaternion.THREECOMP40_START + components * Quaternion.THREECOMP40_STEP
+    implicit_squared = 1.0 - components[:, 0] ** 2 - components[:, 1] ** 2 - components[:, 2] ** 2
+    implicit = np.sqrt(np.maximum(implicit_squared, 0.0))
+    implicit[((c_vals >> np.uint64(38)) & np.uint64(1)) > 0] *= -1.0
+    implicit_dimension = ((c_vals >> np.uint64(36)) & np.uint64(3)).astype(np.int64)
+
+    quaternions = np.empty((len(c_vals), 4))
+    quaternions[np.arange(len(c_vals)), implicit_dimension] = implicit
+    quaternions[np.arange(4) != implicit_dimension[:, None]] = components.ravel()
+    return quaternions
+
+
 def unpack_quantized_quaternion(
     reader: BinaryReader, rotation_quantization_type: RotationQuantizationType
 ) -> Quaternion:
@@ -210,16 +233,233 @@ def get_single_point_quaternion(
     return Quaternion(value)
 
 
+def get_spline_weights(
+    degree: int, knots: np.ndarray, control_point_counts: np.ndarray, frames: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized `find_knot_span()` and basis weights of `get_single_point_float()` for many curves and frames.
+
+    `knots` has shape `(curve_count, knot_count)`, with any shorter knot vectors padded with their last knot, and
+    `control_point_counts` gives the real control point count of each curve.
+
+    Returns knot spans of shape `(curve_count, frame_count)` and weights `n` of shape
+    `(curve_count, frame_count, degree + 1)`, where `n[..., i]` applies to control point `span - i`. Arithmetic is done
+    in the same order as the scalar functions, so results are identical.
+    """
+    knots = np.asarray(knots, dtype=np.float64)
+    frames = np.asarray(frames, dtype=np.float64)
+    curve_count, knot_count = knots.shape
+
+    # Last knot not after each frame (found for all curves in one search by offsetting each curve's knots and frames
+    # past the previous curve's), clamped to the valid span range.
+    offsets = np.arange(curve_count)[:, None] * (max(knots.max(initial=0.0), frames.max(initial=0.0)) + 1.0)
+    spans = np.searchsorted((knots + offsets).ravel(), frames + offsets, side="right")
+    spans -= np.arange(curve_count)[:, None] * knot_count + 1
+    spans = np.clip(spans, degree, np.asarray(control_point_counts)[:, None] - 1)
+
+    n = np.zeros((curve_count, frames.size, degree + 1))
+    n[..., 0] = 1.0
+    for i in range(1, degree + 1):
+        for j in range(i - 1, -1, -1):
+            left = np.take_along_axis(knots, spans - j, axis=1)
+            right = np.take_along_axis(knots, spans + i - j, axis=1)
+            a = (frames - left) / (right - left)
+            tmp = n[..., j] * a
+            n[..., j + 1] += n[..., j] - tmp
+            n[..., j] = tmp
+    return spans, n
+
+
+def get_basis_matrices(degree: int, knots: np.ndarray, frame_count: int) -> np.ndarray:
+    """Evaluate every B-spline basis function of each knot vector in `knots` (shape `(curve_count, knot_count)`) at
+    frames `0, 1, ..., frame_count - 1`.
+
+    Returns an array of shape `(curve_count, frame_count, control_point_count)`, such that the matrix product of one
+    curve's basis matrix and its control points gives exactly what `find_knot_span()` and `get_single_point_float()`
+    decompress at each frame.
+    """
+    curve_count, knot_count = knots.shape
+    control_point_count = knot_count - degree - 1
+    spans, n = get_spline_weights(
+        degree, knots, np.full(curve_count, control_point_count), np.arange(frame_count, dtype=np.float64)
+    )
+    basis = np.zeros((curve_count, frame_count, control_point_count))
+    for i in range(degree + 1):
+        np.put_along_axis(basis, (spans - i)[..., None], n[..., i, None], axis=2)
+    return basis
+
+
+def evaluate_spline_curves(
+    degree: int,
+    knots: list[list[int]],
+    control_points: list[np.ndarray],
+    frame_count: int,
+    float32_sum=False,
+) -> np.ndarray:
+    """Evaluate many splines of the same `degree` at frames `0, 1, ..., frame_count - 1` at once.
+
+    Each curve has its own knot vector and `(control_point_count, channels)` control point array. Returns an array of
+    shape `(curve_count, frame_count, channels)` (padded to the most channels of any curve).
+
+    Sums are accumulated in the same order as `get_single_point_float()`, or as `get_single_point_quaternion()` (in
+    32-bit floats) if `float32_sum=True`, so results are identical to evaluating each frame of each curve separately.
+    """
+    curve_count = len(knots)
+    knot_count = max(len(curve_knots) for curve_knots in knots)
+    padded_knots = np.array([curve_knots + curve_knots[-1:] * (knot_count - len(curve_knots)) for curve_knots in knots])
+    control_point_counts = np.array([len(curve_knots) - degree - 1 for curve_knots in knots])
+    padded_control_points = np.zeros(
+        (curve_count, max(len(c) for c in control_points), max(c.shape[1] for c in control_points))
+    )
+    for curve_index, curve_control_points in enumerate(control_points):
+        padded_control_points[curve_index, :len(curve_control_points), :curve_control_points.shape[1]] = (
+            curve_control_points
+        )
+
+    spans, n = get_spline_weights(degree, padded_knots, control_point_counts, np.arange(frame_count))
+    dtype = np.float32 if float32_sum else np.float64
+    values = np.zeros((curve_count, frame_count, padded_control_points.shape[2]), dtype=dtype)
+    for i in range(degree + 1):
+        term = np.take_along_axis(padded_control_points, (spans - i)[..., None], axis=1) * n[..., i, None]
+        values = (values + term).astype(dtype)
+    return values
+
+
+def fit_spline_curves(
+    values: np.ndarray,
+    channel_mask: np.ndarray,
+    tolerances: np.ndarray,
+    normalize: np.ndarray,
+    degree: int,
+) -> list[tuple[int, list[int], np.ndarray]]:
+    """Fit a clamped B-spline with integer knots to each curve in `values` (shape `(curve_count, frame_count, 4)`).
+
+    Every curve starts with no interior knots. Control points are found by least squares, and a new knot is inserted
+    in the middle of every knot span that contains a frame whose error exceeds that curve's tolerance (only checked in
+    channels enabled by `channel_mask`). This repeats until every curve is within tolerance or cannot take more knots.
+
+    Errors are measured with control points quantized exactly as they will be packed (Bits16 scalars, or ThreeComp40
+    rotations). Curves with `normalize` set (rotations) have their control points normalized to unit quaternions, and
+    the evaluated spline is also normalized before measuring errors, as the game does. Normalizing control points can
+    stop very fast rotations from ever fitting a higher-degree spline, so any curve that still exceeds its tolerance
+    with a knot on every frame is fitted again with degree 1, which interpolates every frame exactly. (Vanilla
+    animations also mix degrees 3 and 1.)
+
+    All curves with the same degree and number of knots are fitted together in one batched least-squares solve.
+
+    Returns a `(degree, knots, control_points)` tuple for each curve, where `control_points` has shape
+    `(control_point_count, 4)`.
+    """
+    curve_count, frame_count, _ = values.shape
+    last_frame = frame_count - 1
+
+    degrees = np.full(curve_count, min(degree, last_frame))
+    interior_knots = [np.zeros(0, dtype=np.int64) for _ in range(curve_count)]
+    fits = [None] * curve_count  # type: list[tuple[int, list[int], np.ndarray] | None]
+    pending = np.arange(curve_count)
+
+    while pending.size:
+        group_keys = np.array([(degrees[c], interior_knots[c].size) for c in pending])
+        next_pending = []
+        for group_degree, knot_count in np.unique(group_keys, axis=0).tolist():
+            group = pending[(group_keys == (group_degree, knot_count)).all(axis=1)]
+            start_knots, end_knots = [0] * (group_degree + 1), [last_frame] * (group_degree + 1)
+            knots = np.array([np.concatenate((start_knots, interior_knots[c], end_knots)) for c in group])
+            basis = get_basis_matrices(group_degree, knots, frame_count)  # (group, frames, control points)
+            targets = values[group]
+            control_points = np.linalg.pinv(basis) @ targets
+            group_normalize = normalize[group]
+            quantized = np.empty_like(control_points)
+            if group_normalize.any():
+                norms = np.linalg.norm(control_points[group_normalize], axis=2, keepdims=True)
+                control_points[group_normalize] /= np.maximum(norms, 1e-12)
+                quantized[group_normalize] = _quantize_three_comp_40(control_points[group_normalize])
+            if not group_normalize.all():
+                quantized[~group_normalize] = _quantize_bits_16(control_points[~group_normalize])
+            fitted = basis @ quantized
+            if group_normalize.any():
+                norms = np.linalg.norm(fitted[group_normalize], axis=2, keepdims=True)
+                fitted[group_normalize] /= np.maximum(norms, 1e-12)
+            errors = np.where(channel_mask[group][:, None, :], np.abs(fitted - targets), 0.0).max(axis=2)
+            bad_frames = errors > tolerances[group][:, None]
+
+            for g, c in enumerate(group):
+                if bad_frames[g].any():
+                    new_knots = _get_split_knots(interior_knots[c], np.flatnonzero(bad_frames[g]), last_frame)
+                    if new_knots.size:
+                        interior_knots[c] = np.union1d(interior_knots[c], new_knots)
+                        next_pending.append(c)
+                        continue
+                    if group_degree > 1:
+                        degrees[c] = 1
+                        interior_knots[c] = np.zeros(0, dtype=np.int64)
+                        next_pending.append(c)
+                        continue
+                # Within tolerance, or no knots left to insert.
+                fits[c] = (group_degree, knots[g].tolist(), control_points[g])
+        pending = np.array(next_pending, dtype=np.int64)
+
+    return fits
+
+
+def _quantize_bits_16(control_points: np.ndarray) -> np.ndarray:
+    """Round `(curve_count, control_point_count, channels)` scalar control points to 16 bits between the (32-bit)
+    minimum and maximum of each channel, as `TrackVector3.pack()` does."""
+    minimum = control_points.min(axis=1, keepdims=True).astype(np.float32).astype(np.float64)
+    maximum = control_points.max(axis=1, keepdims=True).astype(np.float32).astype(np.float64)
+    span = maximum - minimum
+    ratio = np.divide(control_points - minimum, span, out=np.zeros_like(control_points), where=span > 0.0)
+    return minimum + span * np.round(ratio * 65535) / 65535
+
+
+def _quantize_three_comp_40(control_points: np.ndarray) -> np.ndarray:
+    """Round unit quaternion control points of shape `(..., 4)` through `Quaternion.encode_ThreeComp40()` and
+    `Quaternion.decode_ThreeComp40()`."""
+    start, step = Quaternion.THREECOMP40_START, Quaternion.THREECOMP40_STEP
+    implicit_dimension = np.abs(control_points).argmax(axis=-1)[..., None]
+    implicit_sign = np.where(np.take_along_axis(control_points, implicit_dimension, axis=-1) < 0.0, -1.0, 1.0)
+    quantized = start + np.round((control_points - start) / step) * step
+    np.put_along_axis(quantized, implicit_dimension, 0.0, axis=-1)
+    implicit = np.sqrt(np.maximum(1.0 - np.sum(quantized ** 2, axis=-1, keepdims=True), 0.0))
+    np.put_along_axis(quantized, implicit_dimension, implicit_sign * implicit, axis=-1)
+    return quantized
+
+
+def _get_split_knots(interior_knots: np.ndarray, bad_frames: np.ndarray, last_frame: int) -> np.ndarray:
+    """Get the integer midpoints of all knot spans that start or end at, or contain, any of `bad_frames`.
+
+    If those spans are all too short to split, every remaining integer frame is returned instead, so the next fit
+    interpolates all frames.
+    """
+    breakpoints = np.concatenate(([0], interior_knots, [last_frame]))
+    span_count = breakpoints.size - 1
+    spans = np.concatenate((
+        np.searchsorted(breakpoints, bad_frames, side="right") - 1,
+        np.searchsorted(breakpoints, bad_frames, side="left") - 1,
+    ))
+    spans = np.unique(np.clip(spans, 0, span_count - 1))
+    starts, stops = breakpoints[spans], breakpoints[spans + 1]
+    splittable = stops - starts >= 2
+    if splittable.any():
+        return (starts[splittable] + stops[splittable]) // 2
+    return np.setdiff1d(np.arange(1, last_frame), interior_knots)
+
+
 class SplineHeader:
     """Holds information shared by all three axes of a translation/scale vector, or one rotation."""
 
     degree: int  # usually 3, i.e. fourth-order, i.e. cubic spline
     knots: list[int]
 
-    def __init__(self, reader: BinaryReader):
+    def __init__(self, degree: int, knots: list[int]):
+        self.degree = degree
+        self.knots = knots
+
+    @classmethod
+    def from_reader(cls, reader: BinaryReader) -> SplineHeader:
         control_point_count = reader.unpack_value("h") + 1  # packed count seems to exclude a control point
-        self.degree = reader.unpack_value("B")
-        self.knots = [reader.unpack_value("B") for _ in range(control_point_count + self.degree + 1)]
+        degree = reader.unpack_value("B")
+        knots = [reader.unpack_value("B") for _ in range(control_point_count + degree + 1)]
+        return cls(degree, knots)
 
     def pack(self, big_endian=False) -> bytes:
         fmt = f"{'>' if big_endian else '<'}HB{len(self.knots)}B"
@@ -272,7 +512,7 @@ class TrackVector3:
         cls, reader: BinaryReader, track_flags: int, scalar_quantization_type: ScalarQuantizationType, default: float
     ) -> TrackVector3:
         if track_flags & (TrackFlags.SplineX | TrackFlags.SplineY | TrackFlags.SplineZ):
-            spline_header = SplineHeader(reader)
+            spline_header = SplineHeader.from_reader(reader)
             reader.align(4)
         else:
             spline_header = None
@@ -294,15 +534,14 @@ class TrackVector3:
                 setattr(track_vector, axis, default)  # generally 0.0 (translation) or 1.0 (scale)
 
         if spline_header:
-            for c in range(spline_header.control_point_count):
-                for axis, spline_flag in zip(
-                    ("x", "y", "z"),
-                    (TrackFlags.SplineX, TrackFlags.SplineY, TrackFlags.SplineZ),
-                ):
-                    if track_flags & spline_flag:
-                        spline = getattr(track_vector, axis)  # type: SplineFloat
-                        q_float = track_vector.unpack_quantized_float(reader, *quantized_bounds[axis])
-                        spline.append(q_float)
+            # Control points are interleaved by axis. Read all of them at once.
+            spline_axes = [axis for axis in "xyz" if quantized_bounds[axis] is not None]
+            ratios = track_vector.unpack_quantized_ratios(
+                reader, spline_header.control_point_count * len(spline_axes)
+            ).reshape(-1, len(spline_axes))
+            for i, axis in enumerate(spline_axes):
+                minimum, maximum = quantized_bounds[axis]
+                getattr(track_vector, axis).extend((minimum + (maximum - minimum) * ratios[:, i]).tolist())
 
         return track_vector
 
@@ -458,6 +697,14 @@ class TrackVector3:
             ratio = quantized / 65535.0
         return minimum + (maximum - minimum) * ratio
 
+    def unpack_quantized_ratios(self, reader: BinaryReader, count: int) -> np.ndarray:
+        """Read `count` quantized floats at once as ratios between their minimum and maximum."""
+        if self.scalar_quantization_type == ScalarQuantizationType.Bits8:
+            return np.frombuffer(reader.read(count), dtype=np.uint8) / 255.0
+        elif self.scalar_quantization_type == ScalarQuantizationType.Bits16:
+            return np.frombuffer(reader.read(2 * count), dtype=f"{reader.byte_order}u2") / 65535.0
+        return np.full(count, -1.0)
+
     def pack_quantized_float(
         self, writer: BinaryWriter, q_float: float, minimum: float, maximum: float,
     ):
@@ -494,20 +741,20 @@ class TrackQuaternion:
 
         quantized_size = rotation_quantization_type.get_rotation_byte_count()
         if track_flags & (TrackFlags.SplineX | TrackFlags.SplineY | TrackFlags.SplineZ | TrackFlags.SplineW):
-            header = SplineHeader(reader)
+            header = SplineHeader.from_reader(reader)
             reader.align(rotation_quantization_type.get_rotation_align())
-            with reader.temp_offset(reader.position):
-                raw_value = [reader.read(quantized_size) for _ in range(header.control_point_count)]
-
-            # TODO: Surely this can be more efficient!
-            #  - Read `count` quantized quaternions at once (e.g. 10 * 5 bytes = 50 bytes for ThreeComp40).
-            #  - Split every, e.g., 5 bytes and pad out to eight (`np.int64`).
-            #  - Unpack into a 'compressed array'.
-            #  - Run decompression algorithm ONCE, vectorized, on the compressed array.
-            value = SplineQuaternion(
-                unpack_quantized_quaternion(reader, rotation_quantization_type)
-                for _ in range(header.control_point_count)
-            )
+            if rotation_quantization_type == RotationQuantizationType.ThreeComp40:
+                # Decode all control points at once.
+                data = reader.read(quantized_size * header.control_point_count)
+                raw_value = [data[i:i + quantized_size] for i in range(0, len(data), quantized_size)]
+                value = SplineQuaternion(Quaternion(xyzw) for xyzw in unpack_three_comp_40_array(data))
+            else:
+                with reader.temp_offset(reader.position):
+                    raw_value = [reader.read(quantized_size) for _ in range(header.control_point_count)]
+                value = SplineQuaternion(
+                    unpack_quantized_quaternion(reader, rotation_quantization_type)
+                    for _ in range(header.control_point_count)
+                )
         elif track_flags & (TrackFlags.StaticX | TrackFlags.StaticY | TrackFlags.StaticZ | TrackFlags.StaticW):
             header = None
             raw_value = reader.peek(quantized_size)
@@ -820,6 +1067,58 @@ class SplineCompressedAnimationData:
 
             self.blocks.append(transform_tracks)
 
+    @classmethod
+    def from_interleaved_transforms(
+        cls,
+        frame_transforms: np.ndarray | list[list[TRSTransform]],
+        max_frames_per_block: int = 256,
+        degree: int = 3,
+        translation_tolerance: float = 0.001,
+        rotation_tolerance: float = 0.001,
+        scale_tolerance: float = 0.001,
+        big_endian=False,
+    ) -> SplineCompressedAnimationData:
+        """Spline-compress interleaved (uncompressed) animation frames, replacing Havok's `CompressAnim.exe`.
+
+        `frame_transforms` is either a list of lists (frames, then tracks) of `TRSTransform` instances, as returned by
+        `to_interleaved_transforms()`, or an array of shape `(frame_count, track_count, 10)` (translation XYZ, rotation
+        XYZW, scale XYZ) or `(frame_count, track_count, 12)` (`hkQsTransform` rows, with unused W components).
+
+        Each block of frames is compressed separately. Translation and scale axes, and whole rotations, are stored as
+        static (or default) values where they stay within tolerance of a constant; otherwise, all such components of all
+        tracks are fitted with B-splines (see `fit_spline_curves()`). Scalars are quantized to 16 bits and rotations to
+        ThreeComp40, as in vanilla FromSoftware animations.
+        """
+        transform_array = _get_transform_array(frame_transforms)
+        frame_count = transform_array.shape[0]
+        if frame_count < 2:
+            raise ValueError(f"Cannot spline-compress an animation with fewer than two frames ({frame_count}).")
+        if not 2 <= max_frames_per_block <= 256:
+            raise ValueError(
+                f"`max_frames_per_block` must be between 2 and 256 (knots are bytes), not {max_frames_per_block}."
+            )
+        if not 1 <= degree <= 4:
+            raise ValueError(f"Spline `degree` must be between 1 and 4, not {degree}.")
+
+        # Consecutive blocks share a frame (see `to_interleaved_transforms()`).
+        block_stride = max_frames_per_block - 1
+        block_count = math.ceil((frame_count - 1) / block_stride)
+
+        self = cls.__new__(cls)
+        self.big_endian = big_endian
+        self.blocks = [
+            _compress_block(
+                transform_array[b * block_stride:b * block_stride + max_frames_per_block],
+                degree,
+                translation_tolerance,
+                rotation_tolerance,
+                scale_tolerance,
+            )
+            for b in range(block_count)
+        ]
+        self.raw_data = self.pack()[0]
+        return self
+
     def pack(self) -> tuple[list[int], int, int]:
         """Pack spline-compressed animation data to binary data, then return it as a list of integers for assignment
         to the `data` member of a `hkaSplineCompressedAnimation` object, along with the final transform track count and
@@ -832,17 +1131,24 @@ class SplineCompressedAnimationData:
         spline flag is present (unlike translation/scale vectors), this has absolutely no effect on the packed data,
         which is still byte-perfect.
         """
+        packed_blocks = self.pack_blocks()
+        data = list(b"".join(packed_blocks))
+        return data, len(packed_blocks), len(self.blocks[0])
+
+    def pack_blocks(self) -> list[bytes]:
+        """Pack each block separately. The length of each packed block (already padded to 16 bytes) gives the
+        `blockOffsets` and `floatBlockOffsets` members of a `hkaSplineCompressedAnimation` object."""
         if not self.blocks:
             raise ValueError("Cannot pack empty spline-compressed animation data.")
 
-        writer = BinaryWriter(byte_order=ByteOrder.big_endian_bool(self.big_endian))
-        block_count = len(self.blocks)
         transform_track_count = len(self.blocks[0])
         for block in self.blocks:
             if len(block) != transform_track_count:
                 raise ValueError("Animation data blocks do not have equal numbers of transform tracks.")
 
+        packed_blocks = []
         for block in self.blocks:
+            writer = BinaryWriter(byte_order=ByteOrder.big_endian_bool(self.big_endian))
             for track in block:
                 # Null track (permitted by this class) has a default header and no other data.
                 # Represents zero translation, identity rotation, and identity scale.
@@ -863,17 +1169,16 @@ class SplineCompressedAnimationData:
                 writer.pad_align(4)
                 writer.append(track.scale.pack(default=1.0, big_endian=self.big_endian))
             writer.pad_align(16)
+            packed_blocks.append(bytes(writer))
 
-        data = list(bytes(writer))
+        return packed_blocks
 
-        return data, block_count, transform_track_count
+    def to_interleaved_array(self, frame_count: int, max_frames_per_block: int) -> np.ndarray:
+        """Decompresses the spline data of all tracks at all frames at once.
 
-    def to_interleaved_transforms(self, frame_count: int, max_frames_per_block: int) -> list[list[TRSTransform]]:
-        """Decompresses the spline data by computing the `TRSTransform` at each frame from any splines.
-
-        Returns a list of lists (blocks) of `TRSTransform` instances sorted into sub-lists by frame. Each list holds
-        all the `TRSTransforms` (generally one per bone) for that frame, as mapped by an `hkaAnimationBinding` instance
-        in the HKX file.
+        Returns a `(frame_count, track_count, 10)` float32 array, where each row is a translation XYZ, rotation XYZW,
+        and scale XYZ. Each block's knot vectors are turned into basis weights once, and all splines of each degree are
+        evaluated together, with exactly the same results as `SplineTransformTrack.get_trs_transform_at_frame()`.
         """
         # TODO: Track count should be passed in, rather than continuing to assume one block only (or could add all
         #  blocks together).
@@ -882,55 +1187,41 @@ class SplineCompressedAnimationData:
             if len(block) != transform_track_count:
                 _LOGGER.warning("Animation data blocks do not have equal transform track counts.")
 
-        frame_transforms = [[] for _ in range(frame_count)]  # type: list[list[TRSTransform]]
-
-        for frame_index in range(frame_count):
-            block_index, frame = divmod(frame_index, max_frames_per_block)
-            frame = float(frame)
+        frame_array = np.empty((frame_count, transform_track_count, 10), dtype=np.float32)
 
-            block = self.blocks[block_index]
+        # Consecutive blocks share a frame: the last frame of each block is the first frame of the next one. Any frames
+        # beyond the last block are taken from the end of its splines.
+        block_stride = max_frames_per_block - 1
+        for block_index, block in enumerate(self.blocks):
+            start = block_index * block_stride
+            if start >= frame_count:
+                break
+            stop = frame_count if block_index == len(self.blocks) - 1 else min(start + block_stride, frame_count)
+            frame_array[start:stop] = _evaluate_block(block, stop - start)
 
-            for transform_track_index in range(transform_track_count):
-                track = block[transform_track_index]
-                frame_transforms[frame_index].append(track.get_trs_transform_at_frame(frame))
+        # NOTE: Previously, this code always set the final interleaved frame to an interpolated value between that frame
+        # and the first frame, presumably to ensure seamless looping - but this was extremely misguided, as few
+        # animations are intended to actually be seamless, and any tiny decompression errors should be smoothed over by
+        # the game's natural interpolation anyway.
 
-                # NOTE: Previously, this code always set the final interleaved frame to an interpolated value between
-                # that frame and the first frame, presumably to ensure seamless looping - but this was extremely
-                # misguided, as few animations are intended to actually be seamless, and any tiny decompression errors
-                # should be smoothed over by the game's natural interpolation anyway.
-                # Code:
-                #   current_frame_transform = track.get_trs_transform_at_frame(float(math.floor(frame)))
-                #   first_frame_transform = self.blocks[0][transform_track_index].get_trs_transform_at_frame(frame=0.0)
-                #   frame_transforms[frame_index].append(
-                #       TRSTransform.lerp(current_frame_transform, first_frame_transform, t=0.5)
-                #   )
+        return frame_array
 
-        return frame_transforms
-
-    def to_interleaved_transforms_mp(self, frame_count: int, max_frames_per_block: int) -> list[list[TRSTransform]]:
-        transform_track_count = len(self.blocks[0])
-
-        # Break the frame indices into chunks for parallel processing.
-        num_workers = 8  # Set the number of worker processes
-        chunk_size = frame_count // num_workers
-        frame_chunks = [list(range(i * chunk_size, (i + 1) * chunk_size)) for i in range(num_workers)]
-
-        # TODO: Way, way slower.
-
-        # Initialize a multiprocessing pool and distribute the work.
-        with Pool(num_workers) as p:
-            results = p.starmap(
-                compute_frame_transforms,
-                [
-                    (frame_count, chunk, self.blocks, max_frames_per_block, transform_track_count)
-                    for chunk in frame_chunks
-                ]
-            )
+    def to_interleaved_transforms(self, frame_count: int, max_frames_per_block: int) -> list[list[TRSTransform]]:
+        """Decompresses the spline data by computing the `TRSTransform` at each frame from any splines.
 
-        # Flatten the results back into a single list of lists.
-        frame_transforms = [frame for result in results for frame in result]
+        Returns a list of lists (blocks) of `TRSTransform` instances sorted into sub-lists by frame. Each list holds
+        all the `TRSTransforms` (generally one per bone) for that frame, as mapped by an `hkaAnimationBinding` instance
+        in the HKX file.
 
-        return frame_transforms
+        Use `to_interleaved_array()` instead if you do not need `TRSTransform` instances, which are slow to create.
+        """
+        return [
+            [
+                TRSTransform(Vector3(row[0:3]), Quaternion(row[3:7]), Vector3(row[7:10]))
+                for row in frame_rows
+            ]
+            for frame_rows in self.to_interleaved_array(frame_count, max_frames_per_block).tolist()
+        ]
 
     def apply_transform_to_all_track_translations(self, transform: TRSTransform):
         """Apply `transform` to the translation data of each track.
@@ -978,23 +1269,168 @@ class SplineCompressedAnimationData:
         return s
 
 
-def compute_frame_transforms(frame_count, frame_indices, blocks, max_frames_per_block, transform_track_count):
-    frame_transforms = []
-    for frame_index in frame_indices:
-        frame = float((frame_index % frame_count) % max_frames_per_block)
-        block_index = int((frame_index % frame_count) / max_frames_per_block)
-        block = blocks[block_index]
-
-        frame_transform = []
-        for transform_track_index in range(transform_track_count):
-            track = block[transform_track_index]
-            if frame >= frame_count - 1:
-                current_frame_transform = track.get_trs_transform_at_frame(float(math.floor(frame)))
-                first_frame_transform = blocks[0][transform_track_index].get_trs_transform_at_frame(frame=0.0)
-                frame_transform.append(
-                    TRSTransform.lerp(current_frame_transform, first_frame_transform, t=0.5)
+def _get_transform_array(frame_transforms: np.ndarray | list[list[TRSTransform]]) -> np.ndarray:
+    """Get a `(frame_count, track_count, 10)` float64 array of translation, rotation, and scale components."""
+    if isinstance(frame_transforms, np.ndarray):
+        transform_array = frame_transforms.astype(np.float64)
+    else:
+        transform_array = np.array(
+            [[[*t.translation, *t.rotation.data, *t.scale] for t in frame] for frame in frame_transforms],
+            dtype=np.float64,
+        )
+    if transform_array.ndim != 3 or transform_array.shape[2] not in {10, 12}:
+        raise ValueError(
+            f"Frame transforms must have shape `(frame_count, track_count, 10 or 12)`, not {transform_array.shape}."
+        )
+    if transform_array.shape[2] == 12:  # drop W of `hkQsTransform` translation and scale
+        transform_array = transform_array[..., [0, 1, 2, 4, 5, 6, 7, 8, 9, 10]]
+    return transform_array
+
+
+def _get_static_vectors(
+    vectors: np.ndarray, tolerance: float, default: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Find axes of `vectors` (shape `(track_count, frame_count, 3)`) that are constant within `tolerance`.
+
+    Returns a `(track_count, 3)` mask of static axes and their static values, which snap to `default` when possible.
+    """
+    low, high = vectors.min(axis=1), vectors.max(axis=1)
+    is_static = (high - low) / 2 <= tolerance
+    is_default = np.abs(vectors - default).max(axis=1) <= tolerance
+    static_values = np.where(is_default, default, (low + high) / 2)
+    return is_static, static_values
+
+
+def _compress_block(
+    block: np.ndarray, degree: int, translation_tolerance: float, rotation_tolerance: float, scale_tolerance: float
+) -> list[SplineTransformTrack]:
+    """Compress one block of frames (shape `(frame_count, track_count, 10)`) into spline tracks."""
+    frame_count, track_count, _ = block.shape
+    translations = block[..., 0:3].transpose(1, 0, 2)
+    rotations = block[..., 3:7].transpose(1, 0, 2).copy()
+    rotations /= np.maximum(np.linalg.norm(rotations, axis=2, keepdims=True), 1e-12)
+    scales = block[..., 7:10].transpose(1, 0, 2)
+
+    # Flip rotations into the same hemisphere as the previous frame so that splines take the short way around.
+    dots = np.sum(rotations[:, 1:] * rotations[:, :-1], axis=2)
+    rotations[:, 1:] *= np.cumprod(np.where(dots < 0.0, -1.0, 1.0), axis=1)[..., None]
+
+    translation_static, translation_values = _get_static_vectors(translations, translation_tolerance, 0.0)
+    scale_static, scale_values = _get_static_vectors(scales, scale_tolerance, 1.0)
+    mean_rotations = rotations.mean(axis=1)
+    mean_rotations /= np.maximum(np.linalg.norm(mean_rotations, axis=1, keepdims=True), 1e-12)
+    rotation_static = (
+        np.abs(rotations - _quantize_three_comp_40(mean_rotations)[:, None, :]).max(axis=(1, 2)) <= rotation_tolerance
+    )
+    identity = np.array([0.0, 0.0, 0.0, 1.0])
+    rotation_identity = np.minimum(
+        np.abs(rotations - identity).max(axis=(1, 2)), np.abs(rotations + identity).max(axis=(1, 2))
+    ) <= rotation_tolerance
+
+    # Gather every non-static translation, rotation, and scale of every track (padded to four channels) for fitting.
+    curve_values, curve_masks, curve_tolerances, curve_normalize, curve_keys = [], [], [], [], []
+    for t in range(track_count):
+        for key, values, axis_mask, tolerance in (
+            ("translation", translations[t], ~translation_static[t], translation_tolerance),
+            ("rotation", rotations[t], np.full(4, not rotation_static[t]), rotation_tolerance),
+            ("scale", scales[t], ~scale_static[t], scale_tolerance),
+        ):
+            if not axis_mask.any():
+                continue
+            padded_values = np.zeros((frame_count, 4))
+            padded_values[:, :values.shape[1]] = values
+            curve_values.append(padded_values)
+            curve_masks.append(np.pad(axis_mask, (0, 4 - axis_mask.size)))
+            curve_tolerances.append(tolerance)
+            curve_normalize.append(key == "rotation")
+            curve_keys.append((t, key))
+
+    fits = {}
+    if curve_values:
+        curve_fits = fit_spline_curves(
+            np.array(curve_values),
+            np.array(curve_masks),
+            np.array(curve_tolerances),
+            np.array(curve_normalize),
+            degree,
+        )
+        fits = dict(zip(curve_keys, curve_fits))
+
+    tracks = []
+    for t in range(track_count):
+        translation = _get_track_vector(fits.get((t, "translation")), translation_static[t], translation_values[t])
+        scale = _get_track_vector(fits.get((t, "scale")), scale_static[t], scale_values[t])
+        if (t, "rotation") in fits:
+            rotation_degree, knots, control_points = fits[t, "rotation"]
+            rotation = TrackQuaternion(
+                SplineQuaternion(Quaternion(cp) for cp in control_points), SplineHeader(rotation_degree, knots)
+            )
+        elif rotation_identity[t]:
+            rotation = TrackQuaternion(Quaternion.identity())
+        else:
+            rotation = TrackQuaternion(Quaternion(mean_rotations[t]))
+        tracks.append(SplineTransformTrack(translation, rotation, scale))
+    return tracks
+
+
+def _get_track_vector(
+    fit: tuple[int, list[int], np.ndarray] | None, is_static: np.ndarray, static_values: np.ndarray
+) -> TrackVector3:
+    if fit is None:
+        return TrackVector3(*(float(v) for v in static_values))
+    degree, knots, control_points = fit
+    axis_values = [
+        float(static_values[i]) if is_static[i] else SplineFloat(control_points[:, i].tolist())
+        for i in range(3)
+    ]
+    return TrackVector3(*axis_values, spline_header=SplineHeader(degree, knots))
+
+
+def _evaluate_block(block: list[SplineTransformTrack], frame_count: int) -> np.ndarray:
+    """Evaluate all tracks of one block at frames `0, 1, ..., frame_count - 1`. See `to_interleaved_array()`."""
+    values = np.zeros((frame_count, len(block), 10))
+    values[:, :, 6] = 1.0  # identity rotation
+    values[:, :, 7:10] = 1.0  # unit scale
+
+    # Maps spline degree to lists of `(track_index, columns, knots, control_points)`.
+    scalar_splines = {}  # type: dict[int, list[tuple[int, list[int], list[int], np.ndarray]]]
+    rotation_splines = {}  # type: dict[int, list[tuple[int, list[int], list[int], np.ndarray]]]
+
+    for track_index, track in enumerate(block):
+        if track is None:
+            continue
+        for track_vector, first_column in ((track.translation, 0), (track.scale, 7)):
+            columns = []
+            control_points = []
+            for axis_index, axis_value in enumerate((track_vector.x, track_vector.y, track_vector.z)):
+                if isinstance(axis_value, SplineFloat):
+                    columns.append(first_column + axis_index)
+                    control_points.append(axis_value)
+                else:
+                    values[:, track_index, first_column + axis_index] = axis_value
+            if columns:
+                header = track_vector.spline_header
+                scalar_splines.setdefault(header.degree, []).append(
+                    (track_index, columns, header.knots, np.array(control_points, dtype=np.float64).T)
                 )
-            else:
-                frame_transform.append(track.get_trs_transform_at_frame(frame))
-        frame_transforms.append(frame_transform)
-    return frame_transforms
+        if isinstance(track.rotation.value, SplineQuaternion):
+            header = track.rotation.spline_header
+            rotation_splines.setdefault(header.degree, []).append(
+                (track_index, [3, 4, 5, 6], header.knots, np.array([q.data for q in track.rotation.value]))
+            )
+        else:
+            values[:, track_index, 3:7] = track.rotation.value.data
+
+    for splines, float32_sum in ((scalar_splines, False), (rotation_splines, True)):
+        for degree, degree_splines in splines.items():
+            spline_values = evaluate_spline_curves(
+                degree,
+                [knots for _, _, knots, _ in degree_splines],
+                [control_points for _, _, _, control_points in degree_splines],
+                frame_count,
+                float32_sum=float32_sum,
+            )
+            for (track_index, columns, _, _), curve_values in zip(degree_splines, spline_values):
+                values[:, track_index, columns] = curve_values[:, :len(columns)]
+
+    return values.astype(np.float32)
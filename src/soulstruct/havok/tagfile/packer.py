@@ -66,8 +66,9 @@ class TagFilePacker:
         type_info_gen = TypeInfoGenerator(self.havok_module.get_submodule(), long_varints)
         self.type_info_dict = type_info_gen.generate_type_info_dict(self.items[1:])
         type_py_names = [""] + list(self.type_info_dict.keys())
+        type_py_indices = {type_py_name: i for i, type_py_name in enumerate(type_py_names)}
         for type_info in self.type_info_dict.values():
-            type_info.indexify(type_py_names)
+            type_info.indexify(type_py_indices)
 
         if _DEBUG_TYPES:
             lines = []
@@ -116,7 +117,7 @@ class TagFilePacker:
         existing_items = {}
 
         # Dummy pointer item for root (`hkRootLevelContainer`).
-        root_item = TagFileItem(hk_type=self.hkx.root.__class__, is_ptr=True, length=1)
+        root_item = TagFileItem(hk_type=self.hkx.root.__class__, index=1, is_ptr=True, length=1)
         self.items.append(root_item)  # index 1, due to `None` at index 0
         root_item.writer = BinaryWriter()
         root_item.value = self.hkx.root
@@ -220,19 +221,17 @@ class TagFilePacker:
                 # This pointer section is simply not used.
                 writer.pad(8 * (len(self.type_info_dict) + 1))
 
-            type_names = []
-            member_names = []
+            # Ordered names (dictionary values are indices into the TSTR/FSTR string lists).
+            type_names = {}  # type: dict[str, int]
+            member_names = {}  # type: dict[str, int]
             for type_info in self.type_info_dict.values():
-                if type_info.name not in type_names:
-                    type_names.append(type_info.name)
+                type_names.setdefault(type_info.name, len(type_names))
 
                 for template in type_info.templates:
-                    if template.name not in type_names:
-                        type_names.append(template.name)
+                    type_names.setdefault(template.name, len(type_names))
 
                 for member in type_info.members:
-                    if member.name not in member_names:
-                        member_names.append(member.name)
+                    member_names.setdefault(member.name, len(member_names))
 
             with self.pack_section(writer, "TSTR"):
                 writer.append(("\0".join(type_names) + "\0").encode("utf-8"))
@@ -240,10 +239,10 @@ class TagFilePacker:
             with self.pack_section(writer, "TNAM"):
                 self.pack_var_int(writer, len(self.type_info_dict) + 1)
                 for type_info in self.type_info_dict.values():
-                    self.pack_var_int(writer, type_names.index(type_info.name))
+                    self.pack_var_int(writer, type_names[type_info.name])
                     self.pack_var_int(writer, len(type_info.templates))
                     for template in type_info.templates:
-                        self.pack_var_int(writer, type_names.index(template.name))
+                        self.pack_var_int(writer, type_names[template.name])
                         self.pack_var_int(writer, template.value)
 
             with self.pack_section(writer, "FSTR"):
@@ -299,7 +298,7 @@ class TagFilePacker:
                         self.pack_var_int(writer, len(type_info.members))
 
                         for member in type_info.members:
-                            self.pack_var_int(writer, member_names.index(member.name))
+                            self.pack_var_int(writer, member_names[member.name])
                             self.pack_var_int(writer, member.flags)
                             self.pack_var_int(writer, member.offset)
                             self.pack_var_int(writer, member.type_index)
@@ -353,7 +352,8 @@ class TagFilePacker:
 
     def pack_index_section(self, writer: BinaryWriter, data_start_offset: int):
 
-        type_names = [""] + list(self.type_info_dict.keys())
+        # Maps type Python names to 1-indices.
+        type_indices = {type_py_name: i for i, type_py_name in enumerate(self.type_info_dict.keys(), start=1)}
 
         with self.pack_section(writer, "INDX", flag=False):
 
@@ -363,7 +363,7 @@ class TagFilePacker:
                 writer.pad(12)
 
                 for i, item in enumerate(self.items[1:]):  # skip null item
-                    type_index = type_names.index(item.get_item_hk_data_type().__name__)
+                    type_index = type_indices[item.get_item_hk_data_type().__name__]
                     type_index_with_ptr = type_index | (0x10000000 if item.is_ptr else 0x20000000)
                     item_relative_offset = item.absolute_offset - data_start_offset
                     item_length = item.length
@@ -372,7 +372,7 @@ class TagFilePacker:
                     writer.pack("<I", item_length)
 
             with self.pack_section(writer, "PTCH"):
-                patches_indices = [(type_names.index(name), offsets) for name, offsets in self._patches.items()]
+                patches_indices = [(type_indices[name], offsets) for name, offsets in self._patches.items()]
                 patches_indices.sort(key=lambda x: x[0])
                 for type_index, offsets in patches_indices:
                     offsets = list(set(offsets))
@@ -43,6 +43,7 @@ class TagFileItem:
     """
 
     hk_type: HK_TYPE | None  # may be a pointer or array
+    index: int = 0  # position in the one-indexed tagfile item list (zero is reserved for null)
     absolute_offset: int = 0
     length: int = 1
     is_ptr: bool = False  # true for `hk` instance pointers, false for everything else (arrays, strings)
@@ -0,0 +1,315 @@
+"""Fast single-pass parsing of tagfile `TYPE` sections into a columnar `TagTypeTable`.
+
+The `TYPE` section is read as one buffer. Its string tables (`TSTR` and `FSTR`) are split with one `bytes.split()` each,
+and its type name (`TNAM`) and body (`TBOD`) sections, which are nothing but variable-sized integers, are each decoded
+into a flat list of ints by `decode_var_ints()` (using a 256-entry lookup table of the possible first bytes) before
+their structure is read from those lists. `TypeInfo` objects are only created from the table by `get_type_infos()`.
+"""
+from __future__ import annotations
+
+__all__ = [
+    "decode_var_int",
+    "decode_var_ints",
+    "split_string_table",
+    "iter_sections",
+    "TagTypeTable",
+]
+
+import struct
+import typing as tp
+from dataclasses import dataclass, field
+
+from soulstruct.havok.enums import TagFormatFlags
+from soulstruct.havok.types.info import TemplateInfo, MemberInfo, InterfaceInfo, TypeInfo
+
+
+def _get_var_int_code(first_byte: int) -> tuple[int, int, str]:
+    """Get `(byte_count, value_mask, byte_order)` of a varint from its first byte (`byte_count == 0` if invalid).
+
+    Matches `TagFileUnpacker.unpack_var_int()`, including its little-endian 32-bit and 64-bit forms and the special
+    `0b11000011` marker (observed in Elden Ring) that ignores its own low bits.
+    """
+    if first_byte & 0b1000_0000 == 0:
+        return 1, 0b0111_1111, "big"
+    if first_byte == 0b1100_0011:
+        return 3, 0xFFFF, "big"
+    marker = first_byte >> 3
+    if 0b10000 <= marker < 0b11000:
+        return 2, 0x3FFF, "big"
+    if 0b11000 <= marker < 0b11100:
+        return 3, 0x1F_FFFF, "big"
+    if marker == 0b11100:
+        return 4, 0x07FF_FFFF, "little"
+    if marker == 0b11101:
+        return 5, 0x07_FFFF_FFFF, "big"
+    if marker == 0b11110:
+        return 8, 0x07FF_FFFF_FFFF_FFFF, "little"
+    return 0, 0, "big"
+
+
+_VAR_INT_CODES = [_get_var_int_code(b) for b in range(256)]
+
+
+def decode_var_int(data: bytes, offset: int) -> tuple[int, int]:
+    """Decode the varint at `offset` in `data`. Returns the value and the offset after it."""
+    first_byte = data[offset]
+    if first_byte < 0x80:
+        return first_byte, offset + 1
+    size, mask, byte_order = _VAR_INT_CODES[first_byte]
+    if size == 0:
+        raise ValueError(f"Unrecognized marker byte for Havok variable int: {format(first_byte, '#010b')}")
+    return int.from_bytes(data[offset:offset + size], byte_order) & mask, offset + size
+
+
+def decode_var_ints(data: bytes, start: int = 0, end: int = None) -> list[int]:
+    """Decode all consecutive varints in `data[start:end]` in one pass."""
+    if end is None:
+        end = len(data)
+    codes = _VAR_INT_CODES
+    values = []
+    append = values.append
+    offset = start
+    while offset < end:
+        first_byte = data[offset]
+        if first_byte < 0x80:
+            append(first_byte)
+            offset += 1
+            continue
+        size, mask, byte_order = codes[first_byte]
+        if size == 0:
+            raise ValueError(f"Unrecognized marker byte for Havok variable int: {format(first_byte, '#010b')}")
+        append(int.from_bytes(data[offset:offset + size], byte_order) & mask)
+        offset += size
+    if offset != end:
+        raise ValueError(f"Last varint of section overran its end offset {end} (to {offset}).")
+    return values
+
+
+def split_string_table(data: bytes, start: int, end: int) -> list[str]:
+    """Split a null-separated `TSTR` or `FSTR` string table (ignoring trailing whitespace and nulls)."""
+    return data[start:end].rstrip().rstrip(b"\0").decode("utf-8").split("\0")
+
+
+def iter_sections(data: bytes, start: int, end: int) -> tp.Iterator[tuple[str, int, int]]:
+    """Yield the `(magic, data_start, data_end)` of each tagfile section between `start` and `end` in `data`."""
+    offset = start
+    while offset < end:
+        size = int.from_bytes(data[offset:offset + 4], "big") & 0x3FFFFFFF  # includes 8-byte header
+        if size < 8:
+            raise ValueError(f"Invalid tagfile section size at offset {offset}: {size}")
+        yield data[offset + 4:offset + 8].decode("utf-8"), offset + 8, offset + size
+        offset += size
+
+
+@dataclass(slots=True)
+class TagTypeTable:
+    """Columns of all type information in a tagfile `TYPE` section, indexed by (one-based) file type index.
+
+    Index 0 is the null type. Optional values that are absent from the file are `None`. Templates, members, and
+    interfaces of type `i` are at `[starts[i]:starts[i + 1]]` in their own columns.
+    """
+
+    names: list[str] = field(default_factory=lambda: [""])
+    template_starts: list[int] = field(default_factory=lambda: [0, 0])
+    template_names: list[str] = field(default_factory=list)
+    template_values: list[int] = field(default_factory=list)  # type index for 't' templates
+
+    # From type body section. Types may be defined in any order.
+    parent_indices: list[int] = field(default_factory=list)
+    tag_format_flags: list[int | None] = field(default_factory=list)
+    tag_type_flags: list[int | None] = field(default_factory=list)
+    pointer_indices: list[int | None] = field(default_factory=list)
+    versions: list[int | None] = field(default_factory=list)
+    byte_sizes: list[int | None] = field(default_factory=list)
+    alignments: list[int | None] = field(default_factory=list)
+    abstract_values: list[int | None] = field(default_factory=list)
+    member_ranges: list[range] = field(default_factory=list)
+    member_names: list[str] = field(default_factory=list)
+    member_flags: list[int] = field(default_factory=list)
+    member_offsets: list[int] = field(default_factory=list)
+    member_type_indices: list[int] = field(default_factory=list)
+    interface_ranges: list[range | None] = field(default_factory=list)
+    interface_type_indices: list[int] = field(default_factory=list)
+    interface_flags: list[int] = field(default_factory=list)
+
+    # From optional `THSH` section. Maps type indices to hashes. `None` if the section is absent.
+    hashes: dict[int, int] | None = None
+
+    @property
+    def type_count(self) -> int:
+        """Number of types, including the null type at index 0."""
+        return len(self.names)
+
+    @classmethod
+    def unpack(cls, data: bytes, start: int = 0, end: int = None) -> TagTypeTable:
+        """Parse the subsections of a `TYPE` section whose content (after its own header) is `data[start:end]`."""
+        if end is None:
+            end = len(data)
+        sections = {magic: (section_start, section_end) for magic, section_start, section_end in iter_sections(
+            data, start, end
+        )}
+        try:
+            type_names = split_string_table(data, *sections["TSTR"])
+            type_name_ints = decode_var_ints(data, *sections.get("TNAM") or sections["TNA1"])
+            member_names = split_string_table(data, *sections["FSTR"])
+            body_ints = decode_var_ints(data, *sections.get("TBOD") or sections["TBDY"])
+        except KeyError as ex:
+            raise ValueError(f"Tagfile `TYPE` section is missing subsection {ex}.")
+
+        table = cls()
+        table.unpack_type_names(type_name_ints, type_names)
+        table.unpack_type_bodies(body_ints, member_names)
+        if "THSH" in sections:
+            table.unpack_type_hashes(data, *sections["THSH"])
+        return table
+
+    def unpack_type_names(self, ints: list[int], type_names: list[str]):
+        """Unpack names and templates of all types from `TNAM` ints."""
+        type_count, i = ints[0], 1
+        self.names = names = [""]
+        self.template_starts = template_starts = [0, 0]
+        self.template_names = template_names = []
+        self.template_values = template_values = []
+        for _ in range(type_count - 1):
+            names.append(type_names[ints[i]])
+            template_count = ints[i + 1]
+            i += 2
+            for _ in range(template_count):
+                template_names.append(type_names[ints[i]])
+                template_values.append(ints[i + 1])
+                i += 2
+            template_starts.append(len(template_names))
+
+        for column in (
+            "tag_format_flags", "tag_type_flags", "pointer_indices", "versions", "byte_sizes", "alignments",
+            "abstract_values", "interface_ranges",
+        ):
+            setattr(self, column, [None] * type_count)
+        self.parent_indices = [0] * type_count
+        self.member_ranges = [range(0)] * type_count
+
+    def unpack_type_bodies(self, ints: list[int], member_names: list[str]):
+        """Unpack all type bodies from `TBOD` ints. Must be called after `unpack_type_names()`."""
+        i = 0
+        int_count = len(ints)
+        tag_type_flags = 0  # a `Pointer` type without a `SubType` (never observed) uses the last type flags read
+        while i < int_count:
+            type_index = ints[i]
+            i += 1
+            if type_index == 0:
+                continue  # null type
+            self.parent_indices[type_index] = ints[i]
+            self.tag_format_flags[type_index] = tag_format_flags = ints[i + 1]
+            i += 2
+
+            if tag_format_flags & TagFormatFlags.SubType:
+                self.tag_type_flags[type_index] = tag_type_flags = ints[i]
+                i += 1
+            if tag_format_flags & TagFormatFlags.Pointer and tag_type_flags & 0b0000_1111 >= 6:
+                self.pointer_indices[type_index] = ints[i]
+                i += 1
+            if tag_format_flags & TagFormatFlags.Version:
+                self.versions[type_index] = ints[i]
+                i += 1
+            if tag_format_flags & TagFormatFlags.ByteSize:
+                self.byte_sizes[type_index] = ints[i]
+                self.alignments[type_index] = ints[i + 1]
+                i += 2
+            if tag_format_flags & TagFormatFlags.AbstractValue:
+                self.abstract_values[type_index] = ints[i]
+                i += 1
+
+            if tag_format_flags & TagFormatFlags.Members:
+                member_count = ints[i]
+                i += 1
+                member_start = len(self.member_names)
+                for _ in range(member_count):
+                    member_name_index, member_flags, member_offset, member_type_index = ints[i:i + 4]
+                    i += 4
+                    if member_flags < 32:
+                        raise ValueError(f"Member flags were less than 32, which isn't possible.")
+                    self.member_names.append(member_names[member_name_index])
+                    self.member_flags.append(member_flags)
+                    self.member_offsets.append(member_offset)
+                    self.member_type_indices.append(member_type_index)
+                self.member_ranges[type_index] = range(member_start, len(self.member_names))
+
+            if tag_format_flags & TagFormatFlags.Interfaces:
+                interface_count = ints[i]
+                i += 1
+                interface_start = len(self.interface_type_indices)
+                self.interface_type_indices += ints[i:i + 2 * interface_count:2]
+                self.interface_flags += ints[i + 1:i + 2 * interface_count:2]
+                i += 2 * interface_count
+                self.interface_ranges[type_index] = range(interface_start, len(self.interface_type_indices))
+
+            if tag_format_flags & TagFormatFlags.Unknown:
+                raise ValueError(
+                    f"Havok type '{self.names[type_index]}' has flag `0b1000_0000`, which is unknown and not supported."
+                )
+
+        if i != int_count:
+            raise ValueError("Last type body in `TBOD` section is incomplete.")
+
+    def unpack_type_hashes(self, data: bytes, start: int, end: int):
+        """Unpack `THSH` section (varint count, then pairs of varint type index and little-endian `uint32` hash)."""
+        self.hashes = {}
+        hash_count, offset = decode_var_int(data, start)
+        for _ in range(hash_count):
+            type_index, offset = decode_var_int(data, offset)
+            self.hashes[type_index] = struct.unpack_from("<I", data, offset)[0]
+            offset += 4
+        if offset > end:
+            raise ValueError("`THSH` section is incomplete.")
+
+    def get_type_infos(self) -> list[TypeInfo | None]:
+        """Create cross-referenced `TypeInfo` objects for all types (with `None` at null index 0)."""
+        type_infos = [None] + [TypeInfo(name=name) for name in self.names[1:]]  # type: list[TypeInfo | None]
+        hashes = self.hashes or {}
+
+        for type_index in range(1, len(type_infos)):
+            type_info = type_infos[type_index]
+            type_info.templates = [
+                TemplateInfo(
+                    self.template_names[j],
+                    value := self.template_values[j],
+                    type_info=type_infos[value] if self.template_names[j].startswith("t") else None,
+                )
+                for j in range(self.template_starts[type_index], self.template_starts[type_index + 1])
+            ]
+            if (tag_format_flags := self.tag_format_flags[type_index]) is None:
+                continue  # type has no body
+            if (parent_index := self.parent_indices[type_index]) > 0:
+                type_info.parent_type_info = type_infos[parent_index]
+            type_info.tag_format_flags = tag_format_flags
+            type_info.tag_type_flags = self.tag_type_flags[type_index]
+            if (pointer_index := self.pointer_indices[type_index]) is not None:
+                type_info.pointer_type_index = pointer_index
+                type_info.pointer_type_info = type_infos[pointer_index]
+            type_info.version = self.versions[type_index]
+            type_info.byte_size = self.byte_sizes[type_index]
+            type_info.alignment = self.alignments[type_index]
+            type_info.abstract_value = self.abstract_values[type_index]
+            type_info.members = [
+                MemberInfo(
+                    name=self.member_names[j],
+                    flags=self.member_flags[j],
+                    offset=self.member_offsets[j],
+                    type_index=(member_type_index := self.member_type_indices[j]),
+                    type_info=type_infos[member_type_index],
+                    type_py_name=type_infos[member_type_index].py_name,
+                )
+                for j in self.member_ranges[type_index]
+            ]
+            if (interface_range := self.interface_ranges[type_index]) is not None:
+                type_info.interfaces = [
+                    InterfaceInfo(
+                        type_index=(interface_type_index := self.interface_type_indices[j]),
+                        flags=self.interface_flags[j],
+                        type_info=type_infos[interface_type_index],
+                    )
+                    for j in interface_range
+                ]
+            type_info.hsh = hashes.get(type_index)
+
+        return type_infos
@@ -3,6 +3,7 @@ from __future__ import annotations
 __all__ = ["MissingCompendiumError", "TagFileUnpacker"]
 
 import logging
+import struct
 import typing as tp
 from contextlib import contextmanager
 from dataclasses import dataclass, field
@@ -15,7 +16,9 @@ from soulstruct.havok.enums import TagFormatFlags, HavokModule
 from soulstruct.havok.exceptions import HavokTypeError, VersionModuleError, TypeNotDefinedError, TypeMatchError
 from soulstruct.havok.types.hk import hk
 from soulstruct.havok.types.info import *
+from soulstruct.havok.types.type_index import write_type_index
 from .structs import *
+from .type_table import TagTypeTable
 
 if tp.TYPE_CHECKING:
     from soulstruct.havok.core import HKX
@@ -33,9 +36,13 @@ _DEBUG_TYPES = False  # Type order has been confirmed as valid several times!
 _DEBUG_HASH = False
 
 
-def _debug_type_print(*args, **kwargs):
-    if _DEBUG_TYPES:
-        print(*args, **kwargs)
+# Resolved type infos and hash overrides of the most recent distinct `TYPE` sections (including their headers) unpacked
+# in this process with a given Havok module, which are reused by files with byte-identical `TYPE` sections. The oldest
+# section is forgotten when there are more than `_MAX_RESOLVED_TYPE_SECTIONS`.
+_RESOLVED_TYPE_SECTIONS = {}  # type: dict[tuple[HavokModule, bytes], tuple[list[TypeInfo], dict[str, int | None]]]
+_MAX_RESOLVED_TYPE_SECTIONS = 64
+# Python classes that have already matched type infos with a given Havok type hash. (Unhashed types are always checked.)
+_MATCHED_TYPE_HASHES = set()  # type: set[tuple[type[hk], int]]
 
 
 class MissingCompendiumError(Exception):
@@ -55,8 +62,17 @@ class TagFileUnpacker:
     compendium_ids: list[bytes] = field(default_factory=list)
     hsh_overrides: dict[str, int | None] = field(default_factory=dict)
     hk_version: str = ""  # "YYYYVVvv" string
-
-    def unpack(self, reader: BinaryReader, compendium: tp.Optional[HKX] = None, types_only=False):
+    # For compendium files, the Havok module whose Python classes have been attached to `hk_type_infos` by the first
+    # file unpacked with this compendium.
+    resolved_havok_module: HavokModule | None = None
+
+    def unpack(
+        self,
+        reader: BinaryReader,
+        compendium: tp.Optional[HKX] = None,
+        types_only=False,
+        variants: tp.Container[str] = None,
+    ):
 
         # TODO: Detect `byte_order` and set `reader`. (Currently always little-endian.)
 
@@ -81,73 +97,34 @@ class TagFileUnpacker:
                     data_start_offset = reader.position
                     # Skipping over data section for now. We just record the offset to use later.
 
-                self.hk_type_infos = self.unpack_type_section(reader, compendium=compendium)
-
-                if not types_only:
-
-                    # Attach Python classes to each non-generic `TypeInfo`.
-
-                    modules_to_create = []  # type: list[tuple[TypeInfo, str, str]]
-                    clashing_modules = []  # type: list[tuple[Exception, TypeInfo, str]]
+                type_section_offset = reader.position
+                type_section_size = reader.unpack_value(">I") & 0x3FFFFFFF  # includes section header
+                reader.seek(type_section_offset)
+                type_section = reader.read(type_section_size)
+                type_section_key = (self.havok_module, type_section)
+                is_resolved = type_section[4:8] == b"TYPE" and type_section_key in _RESOLVED_TYPE_SECTIONS
+                if is_resolved:
+                    # Identical to a type section already unpacked and resolved (e.g. in a similar animation file).
+                    self.hk_type_infos, hsh_overrides = _RESOLVED_TYPE_SECTIONS[type_section_key]
+                    self.hsh_overrides = hsh_overrides.copy()
+                else:
+                    reader.seek(type_section_offset)
+                    self.hk_type_infos = self.unpack_type_section(reader, compendium=compendium)
 
-                    module_core = self.havok_module.get_submodule().core
-                    module_names = list(vars(module_core))  # key names of typed `core` module
+                if not types_only and not is_resolved:
 
-                    for type_info in self.hk_type_infos[1:]:
-                        if type_info.name in type_info.GENERIC_TYPE_NAMES:
-                            continue
-                        try:
-                            havok_py_type = self.havok_module.get_type(type_info.py_name)  # type: type[hk]
-                        except AttributeError:
-                            # Missing Python definition. Create a (possibly rough) Python definition to print.
-                            type_module_def, init_import = type_info.get_new_type_module_and_import(module_names)
-                            modules_to_create.append((type_info, type_module_def, init_import))
-                        else:
-                            try:
-                                type_info.check_py_class_match(havok_py_type)
-                            except TypeMatchError as ex:
-                                type_module_def, _ = type_info.get_new_type_module_and_import(module_names)
-                                clashing_modules.append((ex, type_info, type_module_def))
-                            else:
-                                type_info.py_class = havok_py_type
-                                full_py_name = type_info.get_full_py_name()
-                                if full_py_name in self.hsh_overrides:
-                                    # We do not store the hash if it matches our Python default.
-                                    if havok_py_type.get_hsh() == self.hsh_overrides[full_py_name]:
-                                        self.hsh_overrides.pop(full_py_name)
-
-                    if modules_to_create:
-
-                        init_imports = []
-                        types_path = Path(__file__).parent / f"../types/hk{self.hk_version[:4]}"
-
-                        for type_info, type_module_def, init_import in modules_to_create:
-                            new_file = types_path / f"{type_info.py_name}.py"
-                            new_file.write_text(type_module_def)
-                            _LOGGER.info(f"# Wrote new type file: {new_file.resolve()}")
-                            init_imports.append(type_info.py_name)
-
-                        print(f"\nImport lines to add to `types.hk{self.hk_version[:4]}.__init__.py`:")
-                        for line in sorted(init_imports):
-                            print(f"from .{line} import {line}")
-                        # Don't raise exception until type match errors have been reported below.
-
-                    if clashing_modules:
-                        for error, type_info, type_module_def in clashing_modules:
-                            _LOGGER.error(error)
-                            print(f"\n# {type_info.py_name} NEW MODULE:\n\n" + type_module_def)
-                        raise HavokTypeError(
-                            f"{len(clashing_modules)} Havok type match errors occurred. New module strings that match "
-                            f"the type info in this Havok file have been printed above."
-                        )
-
-                    if modules_to_create:
-                        raise TypeNotDefinedError(
-                            f"Unknown Havok types in file. New type modules created, but may need their imports "
-                            f"fixed. Types:"
-                            f"{[info.name for info, _, _ in modules_to_create]}"
-                        )
+                    if compendium is not None and self.hk_type_infos is compendium.unpacker.hk_type_infos:
+                        if compendium.unpacker.resolved_havok_module != self.havok_module:
+                            self.resolve_py_classes()
+                            # Shared compendium type infos do not need to be checked again by other files.
+                            compendium.unpacker.resolved_havok_module = self.havok_module
+                    else:
+                        self.resolve_py_classes()
+                        if len(_RESOLVED_TYPE_SECTIONS) >= _MAX_RESOLVED_TYPE_SECTIONS:
+                            del _RESOLVED_TYPE_SECTIONS[next(iter(_RESOLVED_TYPE_SECTIONS))]  # oldest
+                        _RESOLVED_TYPE_SECTIONS[type_section_key] = (self.hk_type_infos, self.hsh_overrides.copy())
 
+                if not types_only:
                     self.items = self.unpack_index_section(reader, data_start_offset)
 
             elif root_magic == "TCM0":
@@ -171,11 +148,86 @@ class TagFileUnpacker:
             if root_item.length != 1:
                 raise ValueError(f"HKX root item has a length other than 1: {root_item.length}")
 
-            with hk.set_havok_module(self.havok_module):
-                # This call will recursively unpack all items.
+            with hk.set_havok_module(self.havok_module), hk.select_variants(variants):
+                # This call will recursively unpack all items (of selected variants).
                 self.root = root_item.hk_type.unpack_tagfile(reader, root_item.absolute_offset, self.items)
             root_item.value = self.root
 
+    @staticmethod
+    def clear_type_section_cache():
+        """Forget all resolved `TYPE` sections reused by tagfiles with identical type sections."""
+        _RESOLVED_TYPE_SECTIONS.clear()
+
+    def resolve_py_classes(self):
+        """Attach Python classes from `havok_module` to each non-generic `TypeInfo` in `hk_type_infos`.
+
+        Writes new type modules for any missing types and prints new module definitions for any types that do not match
+        their Python classes, then raises an exception for either problem.
+        """
+        modules_to_create = []  # type: list[tuple[TypeInfo, str]]
+        clashing_modules = []  # type: list[tuple[Exception, TypeInfo, str]]
+
+        module_core = self.havok_module.get_submodule().core
+        module_names = list(vars(module_core))  # key names of typed `core` module
+
+        for type_info in self.hk_type_infos[1:]:
+            if type_info.name in type_info.GENERIC_TYPE_NAMES:
+                continue
+            try:
+                havok_py_type = self.havok_module.get_type(type_info.py_name)  # type: type[hk]
+            except AttributeError:
+                # Missing Python definition. Create a (possibly rough) Python definition to print.
+                type_module_def, _ = type_info.get_new_type_module_and_import(module_names)
+                modules_to_create.append((type_info, type_module_def))
+            else:
+                type_hash_key = (havok_py_type, type_info.hsh)
+                if type_info.hsh is None or type_hash_key not in _MATCHED_TYPE_HASHES:
+                    try:
+                        type_info.check_py_class_match(havok_py_type)
+                    except TypeMatchError as ex:
+                        type_module_def, _ = type_info.get_new_type_module_and_import(module_names)
+                        clashing_modules.append((ex, type_info, type_module_def))
+                        continue
+                    if type_info.hsh is not None:
+                        _MATCHED_TYPE_HASHES.add(type_hash_key)
+                type_info.py_class = havok_py_type
+                full_py_name = type_info.get_full_py_name()
+                if full_py_name in self.hsh_overrides:
+                    # We do not store the hash if it matches our Python default.
+                    if havok_py_type.get_hsh() == self.hsh_overrides[full_py_name]:
+                        self.hsh_overrides.pop(full_py_name)
+
+        if modules_to_create:
+
+            version_name = f"hk{self.hk_version[:4]}"
+            types_path = Path(__file__).parent / f"../types/{version_name}"
+
+            for type_info, type_module_def in modules_to_create:
+                new_file = types_path / f"{type_info.py_name}.py"
+                new_file.write_text(type_module_def)
+                _LOGGER.info(f"# Wrote new type file: {new_file.resolve()}")
+
+            # New modules are only found through the type index (on next import).
+            write_type_index(version_name)
+            _LOGGER.info(f"# Updated type index of `types.{version_name}`.")
+            # Don't raise exception until type match errors have been reported below.
+
+        if clashing_modules:
+            for error, type_info, type_module_def in clashing_modules:
+                _LOGGER.error(error)
+                print(f"\n# {type_info.py_name} NEW MODULE:\n\n" + type_module_def)
+            raise HavokTypeError(
+                f"{len(clashing_modules)} Havok type match errors occurred. New module strings that match "
+                f"the type info in this Havok file have been printed above."
+            )
+
+        if modules_to_create:
+            raise TypeNotDefinedError(
+                f"Unknown Havok types in file. New type modules created and added to the type index, but may need "
+                f"their imports fixed (and Python restarted to use them). Types:"
+                f"{[info.name for info, _ in modules_to_create]}"
+            )
+
     def unpack_type_section(self, reader: BinaryReader, compendium: tp.Optional[HKX] = None) -> list[TypeInfo]:
         """Unpack `HKXType` instances from binary data (for TYPE files) or copy list already read from compendium
         HKX (for TCRF files).
@@ -184,7 +236,7 @@ class TagFileUnpacker:
         separating them from 2014 files.
         """
 
-        with self.unpack_section(reader, "TYPE", "TCRF") as (_, type_magic):
+        with self.unpack_section(reader, "TYPE", "TCRF") as (type_section_size, type_magic):
 
             if type_magic == "TCRF":
                 # Load types from compendium and return.
@@ -199,186 +251,40 @@ class TagFileUnpacker:
             if compendium is not None:
                 _LOGGER.warning("Compendium HKX was passed to `TYPE` HKX tagfile and will be ignored.")
 
-            if self.peek_section(reader, "TPTR"):
-                with self.unpack_section(reader, "TPTR"):
-                    pass
-
-            with self.unpack_section(reader, "TSTR") as (tstr_size, _):
-                type_names = reader.unpack_string(length=tstr_size, encoding="utf-8").split("\0")
-
-            with self.unpack_section(reader, "TNAM", "TNA1"):
-                file_type_count = self.unpack_var_int(reader)
-
-                # This is where `TagTypeInfo` instances are first created, with `name` and `templates` only.
-                # More data is added below in the "TBOD" section, and cross-references are resolved at the end.
-                # Note that we don't look for the Python class until the body is defined, so we can present more
-                # detailed information in the event that we can't find a type and have to raise an exception.
-                file_hk_types = [None]  # type: list[None | TypeInfo]  # padded to preserve one-indexing
-                for _ in range(file_type_count - 1):
-                    type_name_index = self.unpack_var_int(reader)
-                    template_count = self.unpack_var_int(reader)
-                    type_name = type_names[type_name_index]
-                    type_info = TypeInfo(name=type_name)
-                    type_info.templates = []
-                    for _ in range(template_count):
-                        template_name_index = self.unpack_var_int(reader)
-                        template_name = type_names[template_name_index]
-                        template_value = self.unpack_var_int(reader)  # could be a type index ('t') or value ('v')
-                        type_info.templates.append(TemplateInfo(template_name, template_value))
-                    file_hk_types.append(type_info)
-
-                # Assign template types.
-                for type_info in file_hk_types[1:]:
-                    for template in type_info.templates:
-                        if template.is_type:
-                            template.type_info = file_hk_types[template.value]
-
-            with self.unpack_section(reader, "FSTR") as (fstr_size, _):
-                member_names = reader.unpack_string(length=fstr_size, encoding="utf-8").split("\0")
-
-            with self.unpack_section(reader, "TBOD", "TBDY") as (body_section_size, _):  # doesn't matter which magic
-                body_section_end = reader.position + body_section_size
-                while reader.position < body_section_end:
-
-                    _debug_type_print("TYPE:")
-                    type_index = self.unpack_var_int(reader)
-                    _debug_type_print(f"    Type index: {type_index}")
-
-                    if type_index == 0:
-                        continue  # null type
-                    type_info = file_hk_types[type_index]
-
-                    _debug_type_print(f"        --> Real name: `{type_info.name}`")
-                    parent_type_index = self.unpack_var_int(reader)
-                    if parent_type_index > 0:
-                        _debug_type_print(
-                            f"    Parent type: {parent_type_index} ({file_hk_types[parent_type_index].name})"
-                        )
-                    else:
-                        _debug_type_print("    Parent type: None")
-                    tag_format_flags = self.unpack_var_int(reader)
-                    _debug_type_print(f"    Tag format flags: {tag_format_flags}")
-
-                    if parent_type_index > 0:
-                        type_info.parent_type_info = file_hk_types[parent_type_index]
-                    type_info.tag_format_flags = tag_format_flags
-
-                    if tag_format_flags & TagFormatFlags.SubType:
-                        type_info.tag_type_flags = tag_type_flags = self.unpack_var_int(reader)
-                        _debug_type_print(f"    Tag type flags: {tag_type_flags}")
-
-                    if tag_format_flags & TagFormatFlags.Pointer and tag_type_flags & 0b0000_1111 >= 6:
-                        type_info.pointer_type_index = self.unpack_var_int(reader)
-                        if type_info.pointer_type_index > 0:
-                            _debug_type_print(
-                                f"    Pointer type: {type_info.pointer_type_index} "
-                                f"({file_hk_types[type_info.pointer_type_index].name})"
-                            )
-                        else:
-                            _debug_type_print("    Pointer type: None")
-                        type_info.pointer_type_info = file_hk_types[type_info.pointer_type_index]
-
-                    if tag_format_flags & TagFormatFlags.Version:
-                        type_info.version = self.unpack_var_int(reader)
-                        _debug_type_print(f"    Version: {type_info.version}")
-
-                    if tag_format_flags & TagFormatFlags.ByteSize:
-                        type_info.byte_size = self.unpack_var_int(reader)
-                        _debug_type_print(f"    Byte size: {type_info.byte_size}")
-                        type_info.alignment = self.unpack_var_int(reader)
-                        _debug_type_print(f"    Alignment: {type_info.alignment}")
-
-                    if tag_format_flags & TagFormatFlags.AbstractValue:
-                        type_info.abstract_value = self.unpack_var_int(reader)
-                        _debug_type_print(f"    Abstract value: {type_info.abstract_value}")
-
-                    if tag_format_flags & TagFormatFlags.Members:
-                        type_info.members = []
-                        member_count = self.unpack_var_int(reader)
-                        _debug_type_print(f"    Member count: {member_count}")
-                        for _ in range(member_count):
-                            member_name_index = self.unpack_var_int(reader)
-                            member_name = member_names[member_name_index]
-                            _debug_type_print(f"      Member name index: {member_name_index} ({member_name})")
-                            member_flags = self.unpack_var_int(reader)
-                            _debug_type_print(f"        Flags: {member_flags}")
-                            if member_flags < 32:
-                                raise ValueError(f"Member flags were less than 32, which isn't possible.")
-                            member_offset = self.unpack_var_int(reader)
-                            _debug_type_print(f"        Offset: {member_offset}")
-                            member_type_index = self.unpack_var_int(reader)
-                            member_type_info = file_hk_types[member_type_index]
-                            _debug_type_print(f"        Type index: {member_type_index} ({member_type_info.name})")
-                            type_info.members.append(
-                                MemberInfo(
-                                    name=member_name,
-                                    flags=member_flags,
-                                    offset=member_offset,
-                                    type_index=member_type_index,
-                                    type_info=file_hk_types[member_type_index],
-                                )
-                            )
-
-                    if tag_format_flags & TagFormatFlags.Interfaces:
-                        interface_count = self.unpack_var_int(reader)
-                        _debug_type_print(f"Interface count: {interface_count}")
-                        type_info.interfaces = [
-                            InterfaceInfo(
-                                type_index=(interface_type_index := self.unpack_var_int(reader)),
-                                flags=self.unpack_var_int(reader),
-                                type_info=file_hk_types[interface_type_index],
-                            )
-                            for _ in range(interface_count)
-                        ]
-
-                    if tag_format_flags & TagFormatFlags.Unknown:
-                        raise ValueError(
-                            f"Havok type '{type_info.name}' has flag `0b1000_0000`, which is unknown and not supported."
-                        )
-
-                if _DEBUG_TYPES:
-                    lines = []
-                    for i, hk_type in enumerate(file_hk_types[1:]):
-                        line = f"{i + 1}: {hk_type.py_name}"
-                        while hk_type.pointer_type_info:
-                            hk_type = hk_type.pointer_type_info
-                            line += f"[{hk_type.py_name}]"
-                        lines.append(line)
-                    types = "\n    ".join(lines)
-                    print(f"{YELLOW}Final unpacked type list:\n    {types}{RESET}")
-
-            if self.peek_section(reader, "THSH"):
-                unhashed_types = file_hk_types[1:]
-                with self.unpack_section(reader, "THSH"):
-                    hashed = []
-                    if _DEBUG_HASH:
-                        print(f"{MAGENTA}Unpacked hashes:{RESET}")
-                    for _ in range(self.unpack_var_int(reader)):
-                        type_index = self.unpack_var_int(reader)
-                        type_info = file_hk_types[type_index]
-                        full_py_name = type_info.get_full_py_name()
-                        self.hsh_overrides[full_py_name] = type_info.hsh = reader.unpack_value("<I")
-                        if _DEBUG_HASH:
-                            print(f"    {MAGENTA}`{full_py_name}`: {type_info.hsh}{RESET}")
-                        hashed.append((type_info.hsh, full_py_name))
-                        unhashed_types.remove(type_info)
+            # All subsections (TPTR, TSTR, TNAM, FSTR, TBOD, THSH, TPAD) are parsed from one buffer.
+            type_table = TagTypeTable.unpack(bytes(reader.read(type_section_size)))
+            file_hk_types = type_table.get_type_infos()
+
+            if _DEBUG_TYPES:
+                lines = []
+                for i, hk_type in enumerate(file_hk_types[1:]):
+                    line = f"{i + 1}: {hk_type.py_name}"
+                    while hk_type.pointer_type_info:
+                        hk_type = hk_type.pointer_type_info
+                        line += f"[{hk_type.py_name}]"
+                    lines.append(line)
+                types = "\n    ".join(lines)
+                print(f"{YELLOW}Final unpacked type list:\n    {types}{RESET}")
+
+            if type_table.hashes is not None:
+                hashed = []
+                if _DEBUG_HASH:
+                    print(f"{MAGENTA}Unpacked hashes:{RESET}")
+                for type_index, hsh in type_table.hashes.items():
+                    full_py_name = file_hk_types[type_index].get_full_py_name()
+                    self.hsh_overrides[full_py_name] = hsh
                     if _DEBUG_HASH:
-                        print(f"{MAGENTA}Unpacked hashes (sorted):{RESET}")
-                        for type_hsh, type_name in sorted(hashed):
-                            print(f"    {MAGENTA}`{type_name}`: {type_hsh}{RESET}")
-                for type_info in unhashed_types:
-                    # Types that did not explicitly get a hash receive `None` override.
-                    # Types that DID get a hash, but it was the expected hash, will be removed from the overrides.
-                    self.hsh_overrides[type_info.get_full_py_name()] = None
-
-            if self.peek_section(reader, "THSH"):
-                with self.unpack_section(reader, "TPAD"):
-                    pass
-
-        # Assign member types.
-        for t in file_hk_types[1:]:
-            for m in t.members:
-                m.deindexify(file_hk_types)
+                        print(f"    {MAGENTA}`{full_py_name}`: {hsh}{RESET}")
+                    hashed.append((hsh, full_py_name))
+                if _DEBUG_HASH:
+                    print(f"{MAGENTA}Unpacked hashes (sorted):{RESET}")
+                    for type_hsh, type_name in sorted(hashed):
+                        print(f"    {MAGENTA}`{type_name}`: {type_hsh}{RESET}")
+                for type_index, type_info in enumerate(file_hk_types[1:], start=1):
+                    if type_index not in type_table.hashes:
+                        # Types that did not explicitly get a hash receive `None` override.
+                        # Types that DID get a hash, but it was the expected hash, will be removed from the overrides.
+                        self.hsh_overrides[type_info.get_full_py_name()] = None
 
         return file_hk_types
 
@@ -390,9 +296,8 @@ class TagFileUnpacker:
         with self.unpack_section(reader, "INDX"):
 
             with self.unpack_section(reader, "ITEM") as (item_section_size, _):
-                item_section_end = reader.position + item_section_size
-                while reader.position < item_section_end:
-                    item_info, relative_item_offset, length = reader.unpack("<III")
+                item_section_size -= item_section_size % 12
+                for item_info, relative_item_offset, length in struct.iter_unpack("<III", reader.read(item_section_size)):
 
                     if item_info == 0:
                         # Null item.
@@ -407,6 +312,7 @@ class TagFileUnpacker:
                     # print(f"Unpacking item {len(items)}: type index {type_index} ({item_hk_type_info.name})")
                     item = TagFileItem(
                         hk_type=item_hk_type_info.py_class,
+                        index=len(items),
                         absolute_offset=data_start_offset + relative_item_offset,
                         length=length,
                         is_ptr=is_ptr,
@@ -788,19 +788,23 @@ class hkStruct_(hkBasePointer):
     """
     length = 0
     is_generic = False
+    # Optional type (e.g. `Vector4`) that unpacked tuples are passed to before being returned.
+    value_type = None
 
     @classmethod
-    def unpack_tagfile(cls, reader: BinaryReader, offset: int, items: list[TagFileItem] = None) -> tuple:
+    def unpack_tagfile(cls, reader: BinaryReader, offset: int, items: list[TagFileItem] = None) -> tp.Any:
         reader.seek(offset)
         if debug.DEBUG_PRINT_UNPACK:
             debug.increment_debug_indent()
         value = tagfile.unpack_struct(cls.get_data_type(), reader, items, cls.length)
         if debug.DEBUG_PRINT_UNPACK:
             debug.decrement_debug_indent()
+        if cls.value_type is not None:
+            return cls.value_type(value)
         return value
 
     @classmethod
-    def unpack_packfile(cls, item: PackFileDataItem, offset: int = None) -> tuple:
+    def unpack_packfile(cls, item: PackFileDataItem, offset: int = None) -> tp.Any:
         if offset is not None:
             item.reader.seek(offset)
         if debug.DEBUG_PRINT_UNPACK:
@@ -808,6 +812,8 @@ class hkStruct_(hkBasePointer):
         value = packfile.unpack_struct(cls.get_data_type(), item, length=cls.length)
         if debug.DEBUG_PRINT_UNPACK:
             debug.decrement_debug_indent()
+        if cls.value_type is not None:
+            return cls.value_type(value)
         return value
 
     @classmethod
@@ -25,8 +25,10 @@ from soulstruct.havok.packfile.structs import PackItemCreationQueues
 from soulstruct.havok.tagfile.structs import TagItemCreationQueues, TagFileItem
 from soulstruct.havok.types.info import *
 from soulstruct.havok.utilities.maths import Quaternion, Vector4
+from soulstruct.havok.utilities.memory_reader import read_array_buffer
 
 from . import packfile, tagfile, debug
+from .struct_array import StructArray, get_float_row_layout
 
 
 if tp.TYPE_CHECKING:
@@ -101,6 +103,15 @@ class hk:
     # Set before unpacking root and removed afterward, as `hkRootLevelContainerNamedVariant` objects need to dynamically
     # retrieve type names from our Python modules.
     _HAVOK_MODULE: tp.ClassVar[HavokModule | None] = None
+    # If enabled (see `numpy_primitive_arrays()`), arrays of primitive types are unpacked as typed NumPy arrays (or a
+    # `bytearray` for unsigned bytes) rather than Python lists.
+    _NUMPY_PRIMITIVE_ARRAYS: tp.ClassVar[bool] = False
+    # If enabled (see `struct_arrays()`), arrays of fixed-layout float types like `hkQsTransform` are unpacked as lazy
+    # `StructArray`s rather than Python lists.
+    _STRUCT_ARRAYS: tp.ClassVar[bool] = False
+    # If set (see `select_variants()`), only named variants with these `className` values are unpacked from the root
+    # container. Other variants are left as `None` and none of their data is read.
+    _VARIANT_NAMES: tp.ClassVar[tp.Container[str] | None] = None
 
     alignment: tp.ClassVar[int] = 0
     byte_size: tp.ClassVar[int] = 0
@@ -223,6 +234,53 @@ class hk:
         finally:
             hk._HAVOK_MODULE = None
 
+    @staticmethod
+    @contextmanager
+    def numpy_primitive_arrays(enabled=True):
+        """Unpack arrays of primitive types as NumPy arrays (with the file's byte order) or, for `hkUint8`-like types, a
+        `bytearray`, rather than Python lists, within this context.
+
+        This is much faster and lighter for large arrays like `hkaSplineCompressedAnimation.data`. Either representation
+        (or a plain list) can always be packed.
+        """
+        previous = hk._NUMPY_PRIMITIVE_ARRAYS
+        hk._NUMPY_PRIMITIVE_ARRAYS = enabled
+        try:
+            yield
+        finally:
+            hk._NUMPY_PRIMITIVE_ARRAYS = previous
+
+    @staticmethod
+    @contextmanager
+    def struct_arrays(enabled=True):
+        """Unpack arrays of fixed-layout float types like `hkQsTransform` and `hkMatrix4` as lazy, list-like
+        `StructArray`s backed by one NumPy array, rather than lists of elements, within this context.
+
+        Elements are only created when indexed, which is much faster and lighter for large arrays like
+        `hkaInterleavedUncompressedAnimation.transforms`. Either representation can always be packed.
+        """
+        previous = hk._STRUCT_ARRAYS
+        hk._STRUCT_ARRAYS = enabled
+        try:
+            yield
+        finally:
+            hk._STRUCT_ARRAYS = previous
+
+    @staticmethod
+    @contextmanager
+    def select_variants(variant_names: tp.Container[str] | None):
+        """Only unpack root container named variants whose `className` is in `variant_names` within this context.
+
+        Unselected variants are unpacked with `variant = None`, so the HKX can be inspected much faster (e.g. to get
+        only the `hkaSkeleton` from a ragdoll file) but should not be written. Does nothing if `variant_names` is `None`.
+        """
+        previous = hk._VARIANT_NAMES
+        hk._VARIANT_NAMES = variant_names
+        try:
+            yield
+        finally:
+            hk._VARIANT_NAMES = previous
+
     @classmethod
     def get_module_type(cls, type_name: str) -> type[hk]:
         if cls._HAVOK_MODULE is None:
@@ -257,7 +315,7 @@ class hk:
                     "Cannot unpack `hkRootLevelContainerNamedVariant` without wrapping unpack call with "
                     "`hk.set_havok_module()` context manager."
                 )
-            return tagfile.unpack_named_variant(cls, reader, items, hk._HAVOK_MODULE)
+            return tagfile.unpack_named_variant(cls, reader, items, hk._HAVOK_MODULE, hk._VARIANT_NAMES)
 
         tag_data_type = cls.get_tag_data_type()
         if tag_data_type == TagDataType.Invalid:
@@ -306,7 +364,7 @@ class hk:
                     "Cannot unpack `hkRootLevelContainerNamedVariant` without wrapping unpack call with "
                     "`hk.set_havok_module()` context manager."
                 )
-            return packfile.unpack_named_variant(cls, item, hk._HAVOK_MODULE)
+            return packfile.unpack_named_variant(cls, item, hk._HAVOK_MODULE, hk._VARIANT_NAMES)
 
         tag_data_type = cls.get_tag_data_type()
         if tag_data_type == TagDataType.Invalid:
@@ -439,7 +497,17 @@ class hk:
         an override to every single primitive subclass.
 
         Overridden by classes with more complicated (but primitive) array formats, e.g. NumPy arrays of vector rows.
+
+        Arrays of fixed-layout float types like `hkQsTransform` and `hkMatrix4` are read in one go, and returned as a
+        lazy `StructArray` (see that class) within `hk.struct_arrays()` or as a list of elements otherwise.
         """
+        if get_float_row_layout(cls) is not None:
+            struct_array = StructArray.unpack(cls, reader, length, offset)
+            return struct_array if hk._STRUCT_ARRAYS else list(struct_array)
+
+        if hk._NUMPY_PRIMITIVE_ARRAYS:
+            return cls.unpack_numpy_primitive_array(reader, length, offset)
+
         match cls.get_tag_data_type():
             case TagDataType.Invalid:
                 # Cannot unpack opaque type (and there shouldn't be anything to unpack in the file).
@@ -456,6 +524,38 @@ class hk:
 
         return None  # not a primitive array
 
+    @classmethod
+    def get_primitive_dtype(cls, byte_order: str) -> np.dtype | None:
+        """Get NumPy dtype of a single bool/int/32-bit float of this type, or `None` if this is not such a type."""
+        tag_data_type = cls.get_tag_data_type()
+        if tag_data_type in {TagDataType.Bool, TagDataType.Int}:
+            return np.dtype(byte_order + TagDataType.get_int_fmt(cls.tag_type_flags)[-1])
+        if cls.tag_type_flags == TagDataType.FloatAndFloat32:
+            return np.dtype(byte_order + "f")
+        return None
+
+    @classmethod
+    def unpack_numpy_primitive_array(
+        cls, reader: BinaryReader, length: int, offset: int = None
+    ) -> list | np.ndarray | bytearray | None:
+        """Version of `unpack_primitive_array()` that reads the whole array buffer in one go.
+
+        Unsigned bytes are returned as a `bytearray`, and other ints and floats as a NumPy array (of the reader's byte
+        order) over the read buffer. Bools are returned as a `bool` NumPy array. If `reader` is a zero-copy
+        `MemoryReader`, arrays (including unsigned bytes, as `uint8`) are views of its data rather than copies.
+        """
+        if cls.get_tag_data_type() == TagDataType.Invalid:
+            return [None] * length
+        dtype = cls.get_primitive_dtype(reader.byte_order)
+        if dtype is None:
+            return None  # not a primitive array
+        data = read_array_buffer(reader, length * dtype.itemsize, offset)
+        if cls.get_tag_data_type() == TagDataType.Bool:
+            return np.frombuffer(data, dtype=dtype) > 0
+        if dtype.char == "B" and isinstance(data, bytearray):
+            return data
+        return np.frombuffer(data, dtype=dtype)
+
     @classmethod
     def try_pack_primitive_array(cls, writer: BinaryWriter, value: list | np.ndarray) -> bool:
         """Try to pack an array of primitive types in one call.
@@ -483,9 +583,15 @@ class hk:
                 # Sequence of 4-float vectors/iterables is permitted. We handle it by converting it to a NumPy array,
                 # then flattening it, which validates dimensionality at the same time.
                 value = np.array(value, dtype=np.float32).flatten()
-            writer.pack(f"{len(value)}f", *value)
+            writer.append(np.asarray(value).astype(writer.byte_order + "f", copy=False).tobytes())
             return True
 
+        if isinstance(value, (bytes, bytearray, memoryview, np.ndarray)) and cls._try_pack_buffer(writer, value):
+            return True
+
+        if StructArray.try_pack(cls, writer, value):
+            return True  # fixed-layout float type like `hkQsTransform`
+
         # `value` must be a flat sequence of bools/ints/floats at this point.
 
         match cls.get_tag_data_type():
@@ -505,6 +611,33 @@ class hk:
 
         return False
 
+    @classmethod
+    def _try_pack_buffer(cls, writer: BinaryWriter, value: bytes | bytearray | memoryview | np.ndarray) -> bool:
+        """Pack a byte buffer or flat NumPy array of this primitive type directly, if its data type is compatible.
+
+        Only conversions that `struct` would also make are done here (e.g. `float64` to `float32`, or changing byte
+        order). Anything else (e.g. `int64` values for an `hkUint16` array) returns `False` so the caller can pack each
+        element and get the usual `struct` range checks.
+        """
+        dtype = cls.get_primitive_dtype(writer.byte_order)
+        if dtype is None:
+            return False
+        if not isinstance(value, np.ndarray):
+            if dtype.char != "B":
+                return False
+            writer.append(bytes(value))
+            return True
+        if cls.get_tag_data_type() == TagDataType.Bool:
+            if value.dtype != np.bool_:
+                return False
+        elif dtype.kind == "f":
+            if value.dtype.kind != "f":
+                return False
+        elif value.dtype.kind != dtype.kind or value.dtype.itemsize != dtype.itemsize:
+            return False
+        writer.append(value.astype(dtype, copy=False).tobytes())
+        return True
+
     @classmethod
     def get_type_info(cls, long_varints: bool) -> TypeInfo:
         """Construct a `TypeInfo` with all information except references to other `TypeInfo`s, which is done later."""
@@ -651,6 +784,11 @@ class hk:
 
             if member_value is None or isinstance(member_value, (bool, int, float, str)):
                 lines.append(f"    {member.name} = {repr(member_value)},")
+            elif isinstance(member_value, (bytes, bytearray, memoryview)):
+                if 0 < max_primitive_sequence_size < len(member_value):
+                    lines.append(f"    {member.name} = <{len(member_value)}-bytes>,")
+                else:
+                    lines.append(f"    {member.name} = {repr(member_value)},")
             elif isinstance(member_value, np.ndarray):
                 if 0 < max_primitive_sequence_size < max(member_value.shape):
                     lines.append(f"    {member.name} = <{member_value.shape}-array>,")
@@ -685,7 +823,7 @@ class hk:
                         instances_shown.add(id(member_value))
                     else:
                         lines.append(f"    {member.name} = {member_str},")
-            elif isinstance(member_value, list):
+            elif isinstance(member_value, (list, StructArray)):
                 if not member_value:
                     lines.append(f"    {member.name} = [],")
                 elif isinstance(member_value[0], hk):
@@ -1,20 +1,28 @@
+import typing as tp
+
+from soulstruct.havok.types.type_index import set_lazy_type_module
 from .core import *
-from ._hka import *
-from ._hkp import *
-from ._hkx import *
+from ._type_index import TYPE_MODULES
+
+if tp.TYPE_CHECKING:
+    from ._hka import *
+    from ._hkp import *
+    from ._hkx import *
 
-from .CustomMeshParameter import CustomMeshParameter
-from .CustomParamStorageExtendedMeshShape import CustomParamStorageExtendedMeshShape
+    from .CustomMeshParameter import CustomMeshParameter
+    from .CustomParamStorageExtendedMeshShape import CustomParamStorageExtendedMeshShape
 
-from .hkAabb import hkAabb
-from .hkLocalFrame import hkLocalFrame
-from .hkMoppBvTreeShapeBase import hkMoppBvTreeShapeBase
-from .hkMotionState import hkMotionState
-from .hkMultiThreadCheck import hkMultiThreadCheck
-from .hkRootLevelContainer import hkRootLevelContainer
-from .hkRootLevelContainerNamedVariant import hkRootLevelContainerNamedVariant
-from .hkSweptTransform import hkSweptTransform
-from .hkWorldMemoryAvailableWatchDog import hkWorldMemoryAvailableWatchDog
+    from .hkAabb import hkAabb
+    from .hkLocalFrame import hkLocalFrame
+    from .hkMoppBvTreeShapeBase import hkMoppBvTreeShapeBase
+    from .hkMotionState import hkMotionState
+    from .hkMultiThreadCheck import hkMultiThreadCheck
+    from .hkRootLevelContainer import hkRootLevelContainer
+    from .hkRootLevelContainerNamedVariant import hkRootLevelContainerNamedVariant
+    from .hkSweptTransform import hkSweptTransform
+    from .hkWorldMemoryAvailableWatchDog import hkWorldMemoryAvailableWatchDog
 
 
 VERSION = "hk_2010.2.0-r1"
+
+set_lazy_type_module(__name__, TYPE_MODULES)
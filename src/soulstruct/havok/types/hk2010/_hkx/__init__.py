@@ -1,18 +1,21 @@
-from .hkxAttribute import hkxAttribute
-from .hkxAttributeGroup import hkxAttributeGroup
-from .hkxAttributeHolder import hkxAttributeHolder
-from .hkxIndexBuffer import hkxIndexBuffer
-from .hkxIndexBufferIndexType import hkxIndexBufferIndexType
-from .hkxMaterial import hkxMaterial
-from .hkxMaterialProperty import hkxMaterialProperty
-from .hkxMaterialTextureStage import hkxMaterialTextureStage
-from .hkxMaterialTextureStageTextureType import hkxMaterialTextureStageTextureType
-from .hkxMesh import hkxMesh
-from .hkxMeshSection import hkxMeshSection
-from .hkxMeshUserChannelInfo import hkxMeshUserChannelInfo
-from .hkxVertexBuffer import hkxVertexBuffer
-from .hkxVertexBufferVertexData import hkxVertexBufferVertexData
-from .hkxVertexDescription import hkxVertexDescription
-from .hkxVertexDescriptionElementDecl import hkxVertexDescriptionElementDecl
-from .hkxVertexDescriptionElementDeclDataType import hkxVertexDescriptionElementDeclDataType
-from .hkxVertexDescriptionElementDeclDataUsage import hkxVertexDescriptionElementDeclDataUsage
+import typing as tp
+
+if tp.TYPE_CHECKING:
+    from .hkxAttribute import hkxAttribute
+    from .hkxAttributeGroup import hkxAttributeGroup
+    from .hkxAttributeHolder import hkxAttributeHolder
+    from .hkxIndexBuffer import hkxIndexBuffer
+    from .hkxIndexBufferIndexType import hkxIndexBufferIndexType
+    from .hkxMaterial import hkxMaterial
+    from .hkxMaterialProperty import hkxMaterialProperty
+    from .hkxMaterialTextureStage import hkxMaterialTextureStage
+    from .hkxMaterialTextureStageTextureType import hkxMaterialTextureStageTextureType
+    from .hkxMesh import hkxMesh
+    from .hkxMeshSection import hkxMeshSection
+    from .hkxMeshUserChannelInfo import hkxMeshUserChannelInfo
+    from .hkxVertexBuffer import hkxVertexBuffer
+    from .hkxVertexBufferVertexData import hkxVertexBufferVertexData
+    from .hkxVertexDescription import hkxVertexDescription
+    from .hkxVertexDescriptionElementDecl import hkxVertexDescriptionElementDecl
+    from .hkxVertexDescriptionElementDeclDataType import hkxVertexDescriptionElementDeclDataType
+    from .hkxVertexDescriptionElementDeclDataUsage import hkxVertexDescriptionElementDeclDataUsage
@@ -0,0 +1,139 @@
+"""Generated by `soulstruct.havok.types.type_index.write_type_index("hk2010")`. Do not edit."""
+
+TYPE_MODULES = {
+    "CustomMeshParameter": "CustomMeshParameter",
+    "CustomParamStorageExtendedMeshShape": "CustomParamStorageExtendedMeshShape",
+    "hkaAnimatedReferenceFrame": "_hka.hkaAnimatedReferenceFrame",
+    "hkaAnimation": "_hka.hkaAnimation",
+    "hkaAnimationAnimationType": "_hka.hkaAnimationAnimationType",
+    "hkaAnimationBinding": "_hka.hkaAnimationBinding",
+    "hkaAnimationBindingBlendHint": "_hka.hkaAnimationBindingBlendHint",
+    "hkaAnimationContainer": "_hka.hkaAnimationContainer",
+    "hkaAnnotationTrack": "_hka.hkaAnnotationTrack",
+    "hkaAnnotationTrackAnnotation": "_hka.hkaAnnotationTrackAnnotation",
+    "hkaBone": "_hka.hkaBone",
+    "hkaBoneAttachment": "_hka.hkaBoneAttachment",
+    "hkaDefaultAnimatedReferenceFrame": "_hka.hkaDefaultAnimatedReferenceFrame",
+    "hkaInterleavedUncompressedAnimation": "_hka.hkaInterleavedUncompressedAnimation",
+    "hkaMeshBinding": "_hka.hkaMeshBinding",
+    "hkaMeshBindingMapping": "_hka.hkaMeshBindingMapping",
+    "hkaRagdollInstance": "_hka.hkaRagdollInstance",
+    "hkaSkeleton": "_hka.hkaSkeleton",
+    "hkaSkeletonLocalFrameOnBone": "_hka.hkaSkeletonLocalFrameOnBone",
+    "hkaSkeletonMapper": "_hka.hkaSkeletonMapper",
+    "hkaSkeletonMapperData": "_hka.hkaSkeletonMapperData",
+    "hkaSkeletonMapperDataChainMapping": "_hka.hkaSkeletonMapperDataChainMapping",
+    "hkaSkeletonMapperDataMappingType": "_hka.hkaSkeletonMapperDataMappingType",
+    "hkaSkeletonMapperDataSimpleMapping": "_hka.hkaSkeletonMapperDataSimpleMapping",
+    "hkaSplineCompressedAnimation": "_hka.hkaSplineCompressedAnimation",
+    "hkpAction": "_hkp.hkpAction",
+    "hkpAngFrictionConstraintAtom": "_hkp.hkpAngFrictionConstraintAtom",
+    "hkpBallSocketConstraintAtom": "_hkp.hkpBallSocketConstraintAtom",
+    "hkpBallSocketConstraintAtomSolvingMethod": "_hkp.hkpBallSocketConstraintAtomSolvingMethod",
+    "hkpBroadPhaseHandle": "_hkp.hkpBroadPhaseHandle",
+    "hkpBvTreeShape": "_hkp.hkpBvTreeShape",
+    "hkpBvTreeShapeBvTreeType": "_hkp.hkpBvTreeShapeBvTreeType",
+    "hkpCapsuleShape": "_hkp.hkpCapsuleShape",
+    "hkpCdBody": "_hkp.hkpCdBody",
+    "hkpCollidable": "_hkp.hkpCollidable",
+    "hkpCollidableBoundingVolumeData": "_hkp.hkpCollidableBoundingVolumeData",
+    "hkpCollisionFilter": "_hkp.hkpCollisionFilter",
+    "hkpCollisionFilterhkpFilterType": "_hkp.hkpCollisionFilterhkpFilterType",
+    "hkpConeLimitConstraintAtom": "_hkp.hkpConeLimitConstraintAtom",
+    "hkpConeLimitConstraintAtomMeasurementMode": "_hkp.hkpConeLimitConstraintAtomMeasurementMode",
+    "hkpConstraintAtom": "_hkp.hkpConstraintAtom",
+    "hkpConstraintAtomAtomType": "_hkp.hkpConstraintAtomAtomType",
+    "hkpConstraintData": "_hkp.hkpConstraintData",
+    "hkpConstraintInstance": "_hkp.hkpConstraintInstance",
+    "hkpConstraintInstanceConstraintPriority": "_hkp.hkpConstraintInstanceConstraintPriority",
+    "hkpConstraintInstanceOnDestructionRemapInfo": "_hkp.hkpConstraintInstanceOnDestructionRemapInfo",
+    "hkpConstraintInstanceSmallArraySerializeOverrideType": "_hkp.hkpConstraintInstanceSmallArraySerializeOverrideType",
+    "hkpConstraintMotor": "_hkp.hkpConstraintMotor",
+    "hkpConstraintMotorMotorType": "_hkp.hkpConstraintMotorMotorType",
+    "hkpConvexListFilter": "_hkp.hkpConvexListFilter",
+    "hkpConvexShape": "_hkp.hkpConvexShape",
+    "hkpEntity": "_hkp.hkpEntity",
+    "hkpEntityExtendedListeners": "_hkp.hkpEntityExtendedListeners",
+    "hkpEntitySmallArraySerializeOverrideType": "_hkp.hkpEntitySmallArraySerializeOverrideType",
+    "hkpEntitySpuCollisionCallback": "_hkp.hkpEntitySpuCollisionCallback",
+    "hkpExtendedMeshShape": "_hkp.hkpExtendedMeshShape",
+    "hkpExtendedMeshShapeIndexStridingType": "_hkp.hkpExtendedMeshShapeIndexStridingType",
+    "hkpExtendedMeshShapeShapesSubpart": "_hkp.hkpExtendedMeshShapeShapesSubpart",
+    "hkpExtendedMeshShapeSubpart": "_hkp.hkpExtendedMeshShapeSubpart",
+    "hkpExtendedMeshShapeTrianglesSubpart": "_hkp.hkpExtendedMeshShapeTrianglesSubpart",
+    "hkpKeyframedRigidMotion": "_hkp.hkpKeyframedRigidMotion",
+    "hkpLimitedForceConstraintMotor": "_hkp.hkpLimitedForceConstraintMotor",
+    "hkpLinkedCollidable": "_hkp.hkpLinkedCollidable",
+    "hkpMaterial": "_hkp.hkpMaterial",
+    "hkpMaterialResponseType": "_hkp.hkpMaterialResponseType",
+    "hkpMaxSizeMotion": "_hkp.hkpMaxSizeMotion",
+    "hkpMeshMaterial": "_hkp.hkpMeshMaterial",
+    "hkpModifierConstraintAtom": "_hkp.hkpModifierConstraintAtom",
+    "hkpMoppBvTreeShape": "_hkp.hkpMoppBvTreeShape",
+    "hkpMoppCode": "_hkp.hkpMoppCode",
+    "hkpMoppCodeBuildType": "_hkp.hkpMoppCodeBuildType",
+    "hkpMoppCodeCodeInfo": "_hkp.hkpMoppCodeCodeInfo",
+    "hkpMotion": "_hkp.hkpMotion",
+    "hkpMotionMotionType": "_hkp.hkpMotionMotionType",
+    "hkpNamedMeshMaterial": "_hkp.hkpNamedMeshMaterial",
+    "hkpPhantom": "_hkp.hkpPhantom",
+    "hkpPhysicsData": "_hkp.hkpPhysicsData",
+    "hkpPhysicsSystem": "_hkp.hkpPhysicsSystem",
+    "hkpPositionConstraintMotor": "_hkp.hkpPositionConstraintMotor",
+    "hkpProperty": "_hkp.hkpProperty",
+    "hkpPropertyValue": "_hkp.hkpPropertyValue",
+    "hkpRagdollConstraintData": "_hkp.hkpRagdollConstraintData",
+    "hkpRagdollConstraintDataAtoms": "_hkp.hkpRagdollConstraintDataAtoms",
+    "hkpRagdollMotorConstraintAtom": "_hkp.hkpRagdollMotorConstraintAtom",
+    "hkpRigidBody": "_hkp.hkpRigidBody",
+    "hkpSetLocalTransformsConstraintAtom": "_hkp.hkpSetLocalTransformsConstraintAtom",
+    "hkpSetupStabilizationAtom": "_hkp.hkpSetupStabilizationAtom",
+    "hkpShape": "_hkp.hkpShape",
+    "hkpShapeCollection": "_hkp.hkpShapeCollection",
+    "hkpShapeCollectionCollectionType": "_hkp.hkpShapeCollectionCollectionType",
+    "hkpShapeCollectionFilter": "_hkp.hkpShapeCollectionFilter",
+    "hkpShapeContainer": "_hkp.hkpShapeContainer",
+    "hkpShapeShapeType": "_hkp.hkpShapeShapeType",
+    "hkpSingleShapeContainer": "_hkp.hkpSingleShapeContainer",
+    "hkpSphereRepShape": "_hkp.hkpSphereRepShape",
+    "hkpStorageExtendedMeshShape": "_hkp.hkpStorageExtendedMeshShape",
+    "hkpStorageExtendedMeshShapeMaterial": "_hkp.hkpStorageExtendedMeshShapeMaterial",
+    "hkpStorageExtendedMeshShapeMeshSubpartStorage": "_hkp.hkpStorageExtendedMeshShapeMeshSubpartStorage",
+    "hkpStorageExtendedMeshShapeShapeSubpartStorage": "_hkp.hkpStorageExtendedMeshShapeShapeSubpartStorage",
+    "hkpTwistLimitConstraintAtom": "_hkp.hkpTwistLimitConstraintAtom",
+    "hkpTypedBroadPhaseHandle": "_hkp.hkpTypedBroadPhaseHandle",
+    "hkpWeldingUtilityWeldingType": "_hkp.hkpWeldingUtilityWeldingType",
+    "hkpWorldCinfo": "_hkp.hkpWorldCinfo",
+    "hkpWorldCinfoBroadPhaseBorderBehaviour": "_hkp.hkpWorldCinfoBroadPhaseBorderBehaviour",
+    "hkpWorldCinfoContactPointGeneration": "_hkp.hkpWorldCinfoContactPointGeneration",
+    "hkpWorldCinfoSimulationType": "_hkp.hkpWorldCinfoSimulationType",
+    "hkpWorldCinfoTreeUpdateType": "_hkp.hkpWorldCinfoTreeUpdateType",
+    "hkpWorldObject": "_hkp.hkpWorldObject",
+    "hkxAttribute": "_hkx.hkxAttribute",
+    "hkxAttributeGroup": "_hkx.hkxAttributeGroup",
+    "hkxAttributeHolder": "_hkx.hkxAttributeHolder",
+    "hkxIndexBuffer": "_hkx.hkxIndexBuffer",
+    "hkxIndexBufferIndexType": "_hkx.hkxIndexBufferIndexType",
+    "hkxMaterial": "_hkx.hkxMaterial",
+    "hkxMaterialProperty": "_hkx.hkxMaterialProperty",
+    "hkxMaterialTextureStage": "_hkx.hkxMaterialTextureStage",
+    "hkxMaterialTextureStageTextureType": "_hkx.hkxMaterialTextureStageTextureType",
+    "hkxMesh": "_hkx.hkxMesh",
+    "hkxMeshSection": "_hkx.hkxMeshSection",
+    "hkxMeshUserChannelInfo": "_hkx.hkxMeshUserChannelInfo",
+    "hkxVertexBuffer": "_hkx.hkxVertexBuffer",
+    "hkxVertexBufferVertexData": "_hkx.hkxVertexBufferVertexData",
+    "hkxVertexDescription": "_hkx.hkxVertexDescription",
+    "hkxVertexDescriptionElementDecl": "_hkx.hkxVertexDescriptionElementDecl",
+    "hkxVertexDescriptionElementDeclDataType": "_hkx.hkxVertexDescriptionElementDeclDataType",
+    "hkxVertexDescriptionElementDeclDataUsage": "_hkx.hkxVertexDescriptionElementDeclDataUsage",
+    "hkAabb": "hkAabb",
+    "hkLocalFrame": "hkLocalFrame",
+    "hkMoppBvTreeShapeBase": "hkMoppBvTreeShapeBase",
+    "hkMotionState": "hkMotionState",
+    "hkMultiThreadCheck": "hkMultiThreadCheck",
+    "hkRootLevelContainer": "hkRootLevelContainer",
+    "hkRootLevelContainerNamedVariant": "hkRootLevelContainerNamedVariant",
+    "hkSweptTransform": "hkSweptTransform",
+    "hkWorldMemoryAvailableWatchDog": "hkWorldMemoryAvailableWatchDog",
+}
@@ -1,34 +1,42 @@
+import typing as tp
+
+from soulstruct.havok.types.type_index import set_lazy_type_module
 from .core import *
-from ._hka import *
-from ._hkcd import *
-from ._hknp import *
-from ._hkp import *
-from ._hkx import *
+from ._type_index import TYPE_MODULES
+
+if tp.TYPE_CHECKING:
+    from ._hka import *
+    from ._hkcd import *
+    from ._hknp import *
+    from ._hkp import *
+    from ._hkx import *
 
-# FromSoftware custom types (note new 'fsnp' prefix).
-from .fsnpCustomParamCompressedMeshShape import fsnpCustomParamCompressedMeshShape
-from .fsnpCustomMeshParameter import fsnpCustomMeshParameter
-from .fsnpCustomMeshParameterPrimitiveData import fsnpCustomMeshParameterPrimitiveData
-from .fsnpCustomMeshParameterTriangleData import fsnpCustomMeshParameterTriangleData
+    # FromSoftware custom types (note new 'fsnp' prefix).
+    from .fsnpCustomParamCompressedMeshShape import fsnpCustomParamCompressedMeshShape
+    from .fsnpCustomMeshParameter import fsnpCustomMeshParameter
+    from .fsnpCustomMeshParameterPrimitiveData import fsnpCustomMeshParameterPrimitiveData
+    from .fsnpCustomMeshParameterTriangleData import fsnpCustomMeshParameterTriangleData
 
-from .hkAabb import hkAabb
-from .hkBitField import hkBitField
-from .hkBitFieldBase import hkBitFieldBase
-from .hkBitFieldStorage import hkBitFieldStorage
-from .hkCompressedMassProperties import hkCompressedMassProperties
-from .hkFreeListArrayhknpMaterialhknpMaterialId8hknpMaterialFreeListArrayOperations import (
-    hkFreeListArrayhknpMaterialhknpMaterialId8hknpMaterialFreeListArrayOperations
-)
-from .hkFreeListArrayhknpMotionPropertieshknpMotionPropertiesId8hknpMotionPropertiesFreeListArrayOperations import (
-    hkFreeListArrayhknpMotionPropertieshknpMotionPropertiesId8hknpMotionPropertiesFreeListArrayOperations
-)
-from .hkLocalFrame import hkLocalFrame
-from .hkMeshBoneIndexMapping import hkMeshBoneIndexMapping
-from .hkMotionState import hkMotionState
-from .hkRefCountedProperties import hkRefCountedProperties
-from .hkRefCountedPropertiesEntry import hkRefCountedPropertiesEntry
-from .hkRootLevelContainer import hkRootLevelContainer
-from .hkRootLevelContainerNamedVariant import hkRootLevelContainerNamedVariant
+    from .hkAabb import hkAabb
+    from .hkBitField import hkBitField
+    from .hkBitFieldBase import hkBitFieldBase
+    from .hkBitFieldStorage import hkBitFieldStorage
+    from .hkCompressedMassProperties import hkCompressedMassProperties
+    from .hkFreeListArrayhknpMaterialhknpMaterialId8hknpMaterialFreeListArrayOperations import (
+        hkFreeListArrayhknpMaterialhknpMaterialId8hknpMaterialFreeListArrayOperations
+    )
+    from .hkFreeListArrayhknpMotionPropertieshknpMotionPropertiesId8hknpMotionPropertiesFreeListArrayOperations import (
+        hkFreeListArrayhknpMotionPropertieshknpMotionPropertiesId8hknpMotionPropertiesFreeListArrayOperations
+    )
+    from .hkLocalFrame import hkLocalFrame
+    from .hkMeshBoneIndexMapping import hkMeshBoneIndexMapping
+    from .hkMotionState import hkMotionState
+    from .hkRefCountedProperties import hkRefCountedProperties
+    from .hkRefCountedPropertiesEntry import hkRefCountedPropertiesEntry
+    from .hkRootLevelContainer import hkRootLevelContainer
+    from .hkRootLevelContainerNamedVariant import hkRootLevelContainerNamedVariant
 
 
 VERSION = "hk_2014.1.0-r1"
+
+set_lazy_type_module(__name__, TYPE_MODULES)
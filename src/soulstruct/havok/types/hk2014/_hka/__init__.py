@@ -1,25 +1,28 @@
-from .hkaAnimatedReferenceFrame import hkaAnimatedReferenceFrame
-from .hkaAnimatedReferenceFramehkaReferenceFrameTypeEnum import hkaAnimatedReferenceFramehkaReferenceFrameTypeEnum
-from .hkaAnimation import hkaAnimation
-from .hkaAnimationAnimationType import hkaAnimationAnimationType
-from .hkaAnimationBinding import hkaAnimationBinding
-from .hkaAnimationBindingBlendHint import hkaAnimationBindingBlendHint
-from .hkaAnimationContainer import hkaAnimationContainer
-from .hkaAnnotationTrack import hkaAnnotationTrack
-from .hkaAnnotationTrackAnnotation import hkaAnnotationTrackAnnotation
-from .hkaBone import hkaBone
-from .hkaBoneAttachment import hkaBoneAttachment
-from .hkaDefaultAnimatedReferenceFrame import hkaDefaultAnimatedReferenceFrame
-from .hkaInterleavedUncompressedAnimation import hkaInterleavedUncompressedAnimation
-from .hkaMeshBinding import hkaMeshBinding
-from .hkaMeshBindingMapping import hkaMeshBindingMapping
-from .hkaSkeleton import hkaSkeleton
-from .hkaSkeletonLocalFrameOnBone import hkaSkeletonLocalFrameOnBone
-from .hkaSkeletonMapper import hkaSkeletonMapper
-from .hkaSkeletonMapperData import hkaSkeletonMapperData
-from .hkaSkeletonMapperDataChainMapping import hkaSkeletonMapperDataChainMapping
-from .hkaSkeletonMapperDataMappingType import hkaSkeletonMapperDataMappingType
-from .hkaSkeletonMapperDataPartitionMappingRange import hkaSkeletonMapperDataPartitionMappingRange
-from .hkaSkeletonMapperDataSimpleMapping import hkaSkeletonMapperDataSimpleMapping
-from .hkaSkeletonPartition import hkaSkeletonPartition
-from .hkaSplineCompressedAnimation import hkaSplineCompressedAnimation
+import typing as tp
+
+if tp.TYPE_CHECKING:
+    from .hkaAnimatedReferenceFrame import hkaAnimatedReferenceFrame
+    from .hkaAnimatedReferenceFramehkaReferenceFrameTypeEnum import hkaAnimatedReferenceFramehkaReferenceFrameTypeEnum
+    from .hkaAnimation import hkaAnimation
+    from .hkaAnimationAnimationType import hkaAnimationAnimationType
+    from .hkaAnimationBinding import hkaAnimationBinding
+    from .hkaAnimationBindingBlendHint import hkaAnimationBindingBlendHint
+    from .hkaAnimationContainer import hkaAnimationContainer
+    from .hkaAnnotationTrack import hkaAnnotationTrack
+    from .hkaAnnotationTrackAnnotation import hkaAnnotationTrackAnnotation
+    from .hkaBone import hkaBone
+    from .hkaBoneAttachment import hkaBoneAttachment
+    from .hkaDefaultAnimatedReferenceFrame import hkaDefaultAnimatedReferenceFrame
+    from .hkaInterleavedUncompressedAnimation import hkaInterleavedUncompressedAnimation
+    from .hkaMeshBinding import hkaMeshBinding
+    from .hkaMeshBindingMapping import hkaMeshBindingMapping
+    from .hkaSkeleton import hkaSkeleton
+    from .hkaSkeletonLocalFrameOnBone import hkaSkeletonLocalFrameOnBone
+    from .hkaSkeletonMapper import hkaSkeletonMapper
+    from .hkaSkeletonMapperData import hkaSkeletonMapperData
+    from .hkaSkeletonMapperDataChainMapping import hkaSkeletonMapperDataChainMapping
+    from .hkaSkeletonMapperDataMappingType import hkaSkeletonMapperDataMappingType
+    from .hkaSkeletonMapperDataPartitionMappingRange import hkaSkeletonMapperDataPartitionMappingRange
+    from .hkaSkeletonMapperDataSimpleMapping import hkaSkeletonMapperDataSimpleMapping
+    from .hkaSkeletonPartition import hkaSkeletonPartition
+    from .hkaSplineCompressedAnimation import hkaSplineCompressedAnimation
@@ -1,27 +1,34 @@
-from .hkcdFourAabb import hkcdFourAabb
-from .hkcdSimdTree import hkcdSimdTree
-from .hkcdSimdTreeNode import hkcdSimdTreeNode
-from .hkcdStaticMeshTreeBase import hkcdStaticMeshTreeBase
-from .hkcdStaticMeshTreeBasePrimitive import hkcdStaticMeshTreeBasePrimitive
-from .hkcdStaticMeshTreeBasePrimitiveDataRunBasehknpCompressedMeshShapeTreeDataRunData import (
-    hkcdStaticMeshTreeBasePrimitiveDataRunBasehknpCompressedMeshShapeTreeDataRunData
-)
-from .hkcdStaticMeshTreeBaseSection import hkcdStaticMeshTreeBaseSection
-from .hkcdStaticMeshTreeBaseSectionDataRuns import hkcdStaticMeshTreeBaseSectionDataRuns
-from .hkcdStaticMeshTreeBaseSectionPrimitives import hkcdStaticMeshTreeBaseSectionPrimitives
-from .hkcdStaticMeshTreeBaseSectionSharedVertices import hkcdStaticMeshTreeBaseSectionSharedVertices
-from .hkcdStaticMesh__hknpCompressedMeshShapeTreeDataRun import (
-    hkcdStaticMeshTreehkcdStaticMeshTreeCommonConfigunsignedintunsignedlonglong1121hknpCompressedMeshShapeTreeDataRun
-)
-from .hkcdStaticTreeCodec3Axis import hkcdStaticTreeCodec3Axis
-from .hkcdStaticTreeCodec3Axis4 import hkcdStaticTreeCodec3Axis4
-from .hkcdStaticTreeCodec3Axis5 import hkcdStaticTreeCodec3Axis5
-from .hkcdStaticTreeCodec3Axis6 import hkcdStaticTreeCodec3Axis6
-from .hkcdStaticTreeDynamicStorage import hkcdStaticTreeDynamicStorage
-from .hkcdStaticTreeDynamicStorage4 import hkcdStaticTreeDynamicStorage4
-from .hkcdStaticTreeDynamicStorage5 import hkcdStaticTreeDynamicStorage5
-from .hkcdStaticTreeDynamicStoragehkcdStaticTreeCodec3Axis4 import hkcdStaticTreeDynamicStoragehkcdStaticTreeCodec3Axis4
-from .hkcdStaticTreeDynamicStoragehkcdStaticTreeCodec3Axis5 import hkcdStaticTreeDynamicStoragehkcdStaticTreeCodec3Axis5
-from .hkcdStaticTreeTree import hkcdStaticTreeTree
-from .hkcdStaticTreeTreehkcdStaticTreeDynamicStorage4 import hkcdStaticTreeTreehkcdStaticTreeDynamicStorage4
-from .hkcdStaticTreeTreehkcdStaticTreeDynamicStorage5 import hkcdStaticTreeTreehkcdStaticTreeDynamicStorage5
+import typing as tp
+
+if tp.TYPE_CHECKING:
+    from .hkcdFourAabb import hkcdFourAabb
+    from .hkcdSimdTree import hkcdSimdTree
+    from .hkcdSimdTreeNode import hkcdSimdTreeNode
+    from .hkcdStaticMeshTreeBase import hkcdStaticMeshTreeBase
+    from .hkcdStaticMeshTreeBasePrimitive import hkcdStaticMeshTreeBasePrimitive
+    from .hkcdStaticMeshTreeBasePrimitiveDataRunBasehknpCompressedMeshShapeTreeDataRunData import (
+        hkcdStaticMeshTreeBasePrimitiveDataRunBasehknpCompressedMeshShapeTreeDataRunData
+    )
+    from .hkcdStaticMeshTreeBaseSection import hkcdStaticMeshTreeBaseSection
+    from .hkcdStaticMeshTreeBaseSectionDataRuns import hkcdStaticMeshTreeBaseSectionDataRuns
+    from .hkcdStaticMeshTreeBaseSectionPrimitives import hkcdStaticMeshTreeBaseSectionPrimitives
+    from .hkcdStaticMeshTreeBaseSectionSharedVertices import hkcdStaticMeshTreeBaseSectionSharedVertices
+    from .hkcdStaticMesh__hknpCompressedMeshShapeTreeDataRun import (
+        hkcdStaticMeshTreehkcdStaticMeshTreeCommonConfigunsignedintunsignedlonglong1121hknpCompressedMeshShapeTreeDataRun
+    )
+    from .hkcdStaticTreeCodec3Axis import hkcdStaticTreeCodec3Axis
+    from .hkcdStaticTreeCodec3Axis4 import hkcdStaticTreeCodec3Axis4
+    from .hkcdStaticTreeCodec3Axis5 import hkcdStaticTreeCodec3Axis5
+    from .hkcdStaticTreeCodec3Axis6 import hkcdStaticTreeCodec3Axis6
+    from .hkcdStaticTreeDynamicStorage import hkcdStaticTreeDynamicStorage
+    from .hkcdStaticTreeDynamicStorage4 import hkcdStaticTreeDynamicStorage4
+    from .hkcdStaticTreeDynamicStorage5 import hkcdStaticTreeDynamicStorage5
+    from .hkcdStaticTreeDynamicStoragehkcdStaticTreeCodec3Axis4 import (
+        hkcdStaticTreeDynamicStoragehkcdStaticTreeCodec3Axis4
+    )
+    from .hkcdStaticTreeDynamicStoragehkcdStaticTreeCodec3Axis5 import (
+        hkcdStaticTreeDynamicStoragehkcdStaticTreeCodec3Axis5
+    )
+    from .hkcdStaticTreeTree import hkcdStaticTreeTree
+    from .hkcdStaticTreeTreehkcdStaticTreeDynamicStorage4 import hkcdStaticTreeTreehkcdStaticTreeDynamicStorage4
+    from .hkcdStaticTreeTreehkcdStaticTreeDynamicStorage5 import hkcdStaticTreeTreehkcdStaticTreeDynamicStorage5
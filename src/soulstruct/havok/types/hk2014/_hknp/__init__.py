@@ -1,42 +1,45 @@
-from .hknpBodyCinfo import hknpBodyCinfo
-from .hknpBodyQuality import hknpBodyQuality
-from .hknpBodyQualityLibrary import hknpBodyQualityLibrary
-from .hknpBroadPhaseConfig import hknpBroadPhaseConfig
-from .hknpCapsuleShape import hknpCapsuleShape
-from .hknpCollisionFilter import hknpCollisionFilter
-from .hknpCollisionFilterType import hknpCollisionFilterType
-from .hknpCompositeShape import hknpCompositeShape
-from .hknpCompressedMeshShape import hknpCompressedMeshShape
-from .hknpCompressedMeshShapeData import hknpCompressedMeshShapeData
-from .hknpCompressedMeshShapeTree import hknpCompressedMeshShapeTree
-from .hknpCompressedMeshShapeTreeDataRun import hknpCompressedMeshShapeTreeDataRun
-from .hknpCompressedMeshShapeTreeDataRunData import hknpCompressedMeshShapeTreeDataRunData
-from .hknpConstraintCinfo import hknpConstraintCinfo
-from .hknpConvexPolytopeShape import hknpConvexPolytopeShape
-from .hknpConvexPolytopeShapeFace import hknpConvexPolytopeShapeFace
-from .hknpConvexShape import hknpConvexShape
-from .hknpExternMeshShape import hknpExternMeshShape
-from .hknpExternMeshShapeData import hknpExternMeshShapeData
-from .hknpExternMeshShapeGeometry import hknpExternMeshShapeGeometry
-from .hknpMaterial import hknpMaterial
-from .hknpMaterialCombinePolicy import hknpMaterialCombinePolicy
-from .hknpMaterialLibrary import hknpMaterialLibrary
-from .hknpMaterialMassChangerCategory import hknpMaterialMassChangerCategory
-from .hknpMaterialTriggerType import hknpMaterialTriggerType
-from .hknpMotionCinfo import hknpMotionCinfo
-from .hknpMotionProperties import hknpMotionProperties
-from .hknpMotionPropertiesLibrary import hknpMotionPropertiesLibrary
-from .hknpPhysicsSceneData import hknpPhysicsSceneData
-from .hknpPhysicsSystemData import hknpPhysicsSystemData
-from .hknpRagdollData import hknpRagdollData
-from .hknpRefWorldCinfo import hknpRefWorldCinfo
-from .hknpShape import hknpShape
-from .hknpShapeEnum import hknpShapeEnum
-from .hknpShapeMassProperties import hknpShapeMassProperties
-from .hknpShapeTagCodec import hknpShapeTagCodec
-from .hknpShapeTagCodecType import hknpShapeTagCodecType
-from .hknpSparseCompactMap import hknpSparseCompactMap
-from .hknpSurfaceVelocity import hknpSurfaceVelocity
-from .hknpWorldCinfo import hknpWorldCinfo
-from .hknpWorldCinfoLeavingBroadPhaseBehavior import hknpWorldCinfoLeavingBroadPhaseBehavior
-from .hknpWorldCinfoSimulationType import hknpWorldCinfoSimulationType
+import typing as tp
+
+if tp.TYPE_CHECKING:
+    from .hknpBodyCinfo import hknpBodyCinfo
+    from .hknpBodyQuality import hknpBodyQuality
+    from .hknpBodyQualityLibrary import hknpBodyQualityLibrary
+    from .hknpBroadPhaseConfig import hknpBroadPhaseConfig
+    from .hknpCapsuleShape import hknpCapsuleShape
+    from .hknpCollisionFilter import hknpCollisionFilter
+    from .hknpCollisionFilterType import hknpCollisionFilterType
+    from .hknpCompositeShape import hknpCompositeShape
+    from .hknpCompressedMeshShape import hknpCompressedMeshShape
+    from .hknpCompressedMeshShapeData import hknpCompressedMeshShapeData
+    from .hknpCompressedMeshShapeTree import hknpCompressedMeshShapeTree
+    from .hknpCompressedMeshShapeTreeDataRun import hknpCompressedMeshShapeTreeDataRun
+    from .hknpCompressedMeshShapeTreeDataRunData import hknpCompressedMeshShapeTreeDataRunData
+    from .hknpConstraintCinfo import hknpConstraintCinfo
+    from .hknpConvexPolytopeShape import hknpConvexPolytopeShape
+    from .hknpConvexPolytopeShapeFace import hknpConvexPolytopeShapeFace
+    from .hknpConvexShape import hknpConvexShape
+    from .hknpExternMeshShape import hknpExternMeshShape
+    from .hknpExternMeshShapeData import hknpExternMeshShapeData
+    from .hknpExternMeshShapeGeometry import hknpExternMeshShapeGeometry
+    from .hknpMaterial import hknpMaterial
+    from .hknpMaterialCombinePolicy import hknpMaterialCombinePolicy
+    from .hknpMaterialLibrary import hknpMaterialLibrary
+    from .hknpMaterialMassChangerCategory import hknpMaterialMassChangerCategory
+    from .hknpMaterialTriggerType import hknpMaterialTriggerType
+    from .hknpMotionCinfo import hknpMotionCinfo
+    from .hknpMotionProperties import hknpMotionProperties
+    from .hknpMotionPropertiesLibrary import hknpMotionPropertiesLibrary
+    from .hknpPhysicsSceneData import hknpPhysicsSceneData
+    from .hknpPhysicsSystemData import hknpPhysicsSystemData
+    from .hknpRagdollData import hknpRagdollData
+    from .hknpRefWorldCinfo import hknpRefWorldCinfo
+    from .hknpShape import hknpShape
+    from .hknpShapeEnum import hknpShapeEnum
+    from .hknpShapeMassProperties import hknpShapeMassProperties
+    from .hknpShapeTagCodec import hknpShapeTagCodec
+    from .hknpShapeTagCodecType import hknpShapeTagCodecType
+    from .hknpSparseCompactMap import hknpSparseCompactMap
+    from .hknpSurfaceVelocity import hknpSurfaceVelocity
+    from .hknpWorldCinfo import hknpWorldCinfo
+    from .hknpWorldCinfoLeavingBroadPhaseBehavior import hknpWorldCinfoLeavingBroadPhaseBehavior
+    from .hknpWorldCinfoSimulationType import hknpWorldCinfoSimulationType
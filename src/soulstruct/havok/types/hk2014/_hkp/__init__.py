@@ -1,30 +1,33 @@
-from .hkp3dAngConstraintAtom import hkp3dAngConstraintAtom
-from .hkp2dAngConstraintAtom import hkp2dAngConstraintAtom
-from .hkpAngFrictionConstraintAtom import hkpAngFrictionConstraintAtom
-from .hkpAngLimitConstraintAtom import hkpAngLimitConstraintAtom
-from .hkpAngMotorConstraintAtom import hkpAngMotorConstraintAtom
-from .hkpBallSocketConstraintAtom import hkpBallSocketConstraintAtom
-from .hkpBallSocketConstraintAtomSolvingMethod import hkpBallSocketConstraintAtomSolvingMethod
-from .hkpConeLimitConstraintAtom import hkpConeLimitConstraintAtom
-from .hkpConeLimitConstraintAtomMeasurementMode import hkpConeLimitConstraintAtomMeasurementMode
-from .hkpConstraintAtom import hkpConstraintAtom
-from .hkpConstraintAtomAtomType import hkpConstraintAtomAtomType
-from .hkpConstraintData import hkpConstraintData
-from .hkpConstraintMotor import hkpConstraintMotor
-from .hkpConstraintMotorMotorType import hkpConstraintMotorMotorType
-from .hkpFixedConstraintData import hkpFixedConstraintData
-from .hkpFixedConstraintDataAtoms import hkpFixedConstraintDataAtoms
-from .hkpKeyframedRigidMotion import hkpKeyframedRigidMotion
-from .hkpLimitedForceConstraintMotor import hkpLimitedForceConstraintMotor
-from .hkpLimitedHingeConstraintData import hkpLimitedHingeConstraintData
-from .hkpLimitedHingeConstraintDataAtoms import hkpLimitedHingeConstraintDataAtoms
-from .hkpMaxSizeMotion import hkpMaxSizeMotion
-from .hkpMotion import hkpMotion
-from .hkpMotionMotionType import hkpMotionMotionType
-from .hkpPositionConstraintMotor import hkpPositionConstraintMotor
-from .hkpRagdollConstraintData import hkpRagdollConstraintData
-from .hkpRagdollConstraintDataAtoms import hkpRagdollConstraintDataAtoms
-from .hkpRagdollMotorConstraintAtom import hkpRagdollMotorConstraintAtom
-from .hkpSetLocalTransformsConstraintAtom import hkpSetLocalTransformsConstraintAtom
-from .hkpSetupStabilizationAtom import hkpSetupStabilizationAtom
-from .hkpTwistLimitConstraintAtom import hkpTwistLimitConstraintAtom
+import typing as tp
+
+if tp.TYPE_CHECKING:
+    from .hkp3dAngConstraintAtom import hkp3dAngConstraintAtom
+    from .hkp2dAngConstraintAtom import hkp2dAngConstraintAtom
+    from .hkpAngFrictionConstraintAtom import hkpAngFrictionConstraintAtom
+    from .hkpAngLimitConstraintAtom import hkpAngLimitConstraintAtom
+    from .hkpAngMotorConstraintAtom import hkpAngMotorConstraintAtom
+    from .hkpBallSocketConstraintAtom import hkpBallSocketConstraintAtom
+    from .hkpBallSocketConstraintAtomSolvingMethod import hkpBallSocketConstraintAtomSolvingMethod
+    from .hkpConeLimitConstraintAtom import hkpConeLimitConstraintAtom
+    from .hkpConeLimitConstraintAtomMeasurementMode import hkpConeLimitConstraintAtomMeasurementMode
+    from .hkpConstraintAtom import hkpConstraintAtom
+    from .hkpConstraintAtomAtomType import hkpConstraintAtomAtomType
+    from .hkpConstraintData import hkpConstraintData
+    from .hkpConstraintMotor import hkpConstraintMotor
+    from .hkpConstraintMotorMotorType import hkpConstraintMotorMotorType
+    from .hkpFixedConstraintData import hkpFixedConstraintData
+    from .hkpFixedConstraintDataAtoms import hkpFixedConstraintDataAtoms
+    from .hkpKeyframedRigidMotion import hkpKeyframedRigidMotion
+    from .hkpLimitedForceConstraintMotor import hkpLimitedForceConstraintMotor
+    from .hkpLimitedHingeConstraintData import hkpLimitedHingeConstraintData
+    from .hkpLimitedHingeConstraintDataAtoms import hkpLimitedHingeConstraintDataAtoms
+    from .hkpMaxSizeMotion import hkpMaxSizeMotion
+    from .hkpMotion import hkpMotion
+    from .hkpMotionMotionType import hkpMotionMotionType
+    from .hkpPositionConstraintMotor import hkpPositionConstraintMotor
+    from .hkpRagdollConstraintData import hkpRagdollConstraintData
+    from .hkpRagdollConstraintDataAtoms import hkpRagdollConstraintDataAtoms
+    from .hkpRagdollMotorConstraintAtom import hkpRagdollMotorConstraintAtom
+    from .hkpSetLocalTransformsConstraintAtom import hkpSetLocalTransformsConstraintAtom
+    from .hkpSetupStabilizationAtom import hkpSetupStabilizationAtom
+    from .hkpTwistLimitConstraintAtom import hkpTwistLimitConstraintAtom
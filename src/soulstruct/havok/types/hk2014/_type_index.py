@@ -0,0 +1,165 @@
+"""Generated by `soulstruct.havok.types.type_index.write_type_index("hk2014")`. Do not edit."""
+
+TYPE_MODULES = {
+    "hkaAnimatedReferenceFrame": "_hka.hkaAnimatedReferenceFrame",
+    "hkaAnimatedReferenceFramehkaReferenceFrameTypeEnum": "_hka.hkaAnimatedReferenceFramehkaReferenceFrameTypeEnum",
+    "hkaAnimation": "_hka.hkaAnimation",
+    "hkaAnimationAnimationType": "_hka.hkaAnimationAnimationType",
+    "hkaAnimationBinding": "_hka.hkaAnimationBinding",
+    "hkaAnimationBindingBlendHint": "_hka.hkaAnimationBindingBlendHint",
+    "hkaAnimationContainer": "_hka.hkaAnimationContainer",
+    "hkaAnnotationTrack": "_hka.hkaAnnotationTrack",
+    "hkaAnnotationTrackAnnotation": "_hka.hkaAnnotationTrackAnnotation",
+    "hkaBone": "_hka.hkaBone",
+    "hkaBoneAttachment": "_hka.hkaBoneAttachment",
+    "hkaDefaultAnimatedReferenceFrame": "_hka.hkaDefaultAnimatedReferenceFrame",
+    "hkaInterleavedUncompressedAnimation": "_hka.hkaInterleavedUncompressedAnimation",
+    "hkaMeshBinding": "_hka.hkaMeshBinding",
+    "hkaMeshBindingMapping": "_hka.hkaMeshBindingMapping",
+    "hkaSkeleton": "_hka.hkaSkeleton",
+    "hkaSkeletonLocalFrameOnBone": "_hka.hkaSkeletonLocalFrameOnBone",
+    "hkaSkeletonMapper": "_hka.hkaSkeletonMapper",
+    "hkaSkeletonMapperData": "_hka.hkaSkeletonMapperData",
+    "hkaSkeletonMapperDataChainMapping": "_hka.hkaSkeletonMapperDataChainMapping",
+    "hkaSkeletonMapperDataMappingType": "_hka.hkaSkeletonMapperDataMappingType",
+    "hkaSkeletonMapperDataPartitionMappingRange": "_hka.hkaSkeletonMapperDataPartitionMappingRange",
+    "hkaSkeletonMapperDataSimpleMapping": "_hka.hkaSkeletonMapperDataSimpleMapping",
+    "hkaSkeletonPartition": "_hka.hkaSkeletonPartition",
+    "hkaSplineCompressedAnimation": "_hka.hkaSplineCompressedAnimation",
+    "hkcdFourAabb": "_hkcd.hkcdFourAabb",
+    "hkcdSimdTree": "_hkcd.hkcdSimdTree",
+    "hkcdSimdTreeNode": "_hkcd.hkcdSimdTreeNode",
+    "hkcdStaticMeshTreeBase": "_hkcd.hkcdStaticMeshTreeBase",
+    "hkcdStaticMeshTreeBasePrimitive": "_hkcd.hkcdStaticMeshTreeBasePrimitive",
+    "hkcdStaticMeshTreeBasePrimitiveDataRunBasehknpCompressedMeshShapeTreeDataRunData": "_hkcd.hkcdStaticMeshTreeBasePrimitiveDataRunBasehknpCompressedMeshShapeTreeDataRunData",
+    "hkcdStaticMeshTreeBaseSection": "_hkcd.hkcdStaticMeshTreeBaseSection",
+    "hkcdStaticMeshTreeBaseSectionDataRuns": "_hkcd.hkcdStaticMeshTreeBaseSectionDataRuns",
+    "hkcdStaticMeshTreeBaseSectionPrimitives": "_hkcd.hkcdStaticMeshTreeBaseSectionPrimitives",
+    "hkcdStaticMeshTreeBaseSectionSharedVertices": "_hkcd.hkcdStaticMeshTreeBaseSectionSharedVertices",
+    "hkcdStaticMeshTreehkcdStaticMeshTreeCommonConfigunsignedintunsignedlonglong1121hknpCompressedMeshShapeTreeDataRun": "_hkcd.hkcdStaticMesh__hknpCompressedMeshShapeTreeDataRun",
+    "hkcdStaticTreeCodec3Axis": "_hkcd.hkcdStaticTreeCodec3Axis",
+    "hkcdStaticTreeCodec3Axis4": "_hkcd.hkcdStaticTreeCodec3Axis4",
+    "hkcdStaticTreeCodec3Axis5": "_hkcd.hkcdStaticTreeCodec3Axis5",
+    "hkcdStaticTreeCodec3Axis6": "_hkcd.hkcdStaticTreeCodec3Axis6",
+    "hkcdStaticTreeDynamicStorage": "_hkcd.hkcdStaticTreeDynamicStorage",
+    "hkcdStaticTreeDynamicStorage4": "_hkcd.hkcdStaticTreeDynamicStorage4",
+    "hkcdStaticTreeDynamicStorage5": "_hkcd.hkcdStaticTreeDynamicStorage5",
+    "hkcdStaticTreeDynamicStoragehkcdStaticTreeCodec3Axis4": "_hkcd.hkcdStaticTreeDynamicStoragehkcdStaticTreeCodec3Axis4",
+    "hkcdStaticTreeDynamicStoragehkcdStaticTreeCodec3Axis5": "_hkcd.hkcdStaticTreeDynamicStoragehkcdStaticTreeCodec3Axis5",
+    "hkcdStaticTreeTree": "_hkcd.hkcdStaticTreeTree",
+    "hkcdStaticTreeTreehkcdStaticTreeDynamicStorage4": "_hkcd.hkcdStaticTreeTreehkcdStaticTreeDynamicStorage4",
+    "hkcdStaticTreeTreehkcdStaticTreeDynamicStorage5": "_hkcd.hkcdStaticTreeTreehkcdStaticTreeDynamicStorage5",
+    "hknpBodyCinfo": "_hknp.hknpBodyCinfo",
+    "hknpBodyQuality": "_hknp.hknpBodyQuality",
+    "hknpBodyQualityLibrary": "_hknp.hknpBodyQualityLibrary",
+    "hknpBroadPhaseConfig": "_hknp.hknpBroadPhaseConfig",
+    "hknpCapsuleShape": "_hknp.hknpCapsuleShape",
+    "hknpCollisionFilter": "_hknp.hknpCollisionFilter",
+    "hknpCollisionFilterType": "_hknp.hknpCollisionFilterType",
+    "hknpCompositeShape": "_hknp.hknpCompositeShape",
+    "hknpCompressedMeshShape": "_hknp.hknpCompressedMeshShape",
+    "hknpCompressedMeshShapeData": "_hknp.hknpCompressedMeshShapeData",
+    "hknpCompressedMeshShapeTree": "_hknp.hknpCompressedMeshShapeTree",
+    "hknpCompressedMeshShapeTreeDataRun": "_hknp.hknpCompressedMeshShapeTreeDataRun",
+    "hknpCompressedMeshShapeTreeDataRunData": "_hknp.hknpCompressedMeshShapeTreeDataRunData",
+    "hknpConstraintCinfo": "_hknp.hknpConstraintCinfo",
+    "hknpConvexPolytopeShape": "_hknp.hknpConvexPolytopeShape",
+    "hknpConvexPolytopeShapeFace": "_hknp.hknpConvexPolytopeShapeFace",
+    "hknpConvexShape": "_hknp.hknpConvexShape",
+    "hknpExternMeshShape": "_hknp.hknpExternMeshShape",
+    "hknpExternMeshShapeData": "_hknp.hknpExternMeshShapeData",
+    "hknpExternMeshShapeGeometry": "_hknp.hknpExternMeshShapeGeometry",
+    "hknpMaterial": "_hknp.hknpMaterial",
+    "hknpMaterialCombinePolicy": "_hknp.hknpMaterialCombinePolicy",
+    "hknpMaterialLibrary": "_hknp.hknpMaterialLibrary",
+    "hknpMaterialMassChangerCategory": "_hknp.hknpMaterialMassChangerCategory",
+    "hknpMaterialTriggerType": "_hknp.hknpMaterialTriggerType",
+    "hknpMotionCinfo": "_hknp.hknpMotionCinfo",
+    "hknpMotionProperties": "_hknp.hknpMotionProperties",
+    "hknpMotionPropertiesLibrary": "_hknp.hknpMotionPropertiesLibrary",
+    "hknpPhysicsSceneData": "_hknp.hknpPhysicsSceneData",
+    "hknpPhysicsSystemData": "_hknp.hknpPhysicsSystemData",
+    "hknpRagdollData": "_hknp.hknpRagdollData",
+    "hknpRefWorldCinfo": "_hknp.hknpRefWorldCinfo",
+    "hknpShape": "_hknp.hknpShape",
+    "hknpShapeEnum": "_hknp.hknpShapeEnum",
+    "hknpShapeMassProperties": "_hknp.hknpShapeMassProperties",
+    "hknpShapeTagCodec": "_hknp.hknpShapeTagCodec",
+    "hknpShapeTagCodecType": "_hknp.hknpShapeTagCodecType",
+    "hknpSparseCompactMap": "_hknp.hknpSparseCompactMap",
+    "hknpSurfaceVelocity": "_hknp.hknpSurfaceVelocity",
+    "hknpWorldCinfo": "_hknp.hknpWorldCinfo",
+    "hknpWorldCinfoLeavingBroadPhaseBehavior": "_hknp.hknpWorldCinfoLeavingBroadPhaseBehavior",
+    "hknpWorldCinfoSimulationType": "_hknp.hknpWorldCinfoSimulationType",
+    "hkp2dAngConstraintAtom": "_hkp.hkp2dAngConstraintAtom",
+    "hkp3dAngConstraintAtom": "_hkp.hkp3dAngConstraintAtom",
+    "hkpAngFrictionConstraintAtom": "_hkp.hkpAngFrictionConstraintAtom",
+    "hkpAngLimitConstraintAtom": "_hkp.hkpAngLimitConstraintAtom",
+    "hkpAngMotorConstraintAtom": "_hkp.hkpAngMotorConstraintAtom",
+    "hkpBallSocketConstraintAtom": "_hkp.hkpBallSocketConstraintAtom",
+    "hkpBallSocketConstraintAtomSolvingMethod": "_hkp.hkpBallSocketConstraintAtomSolvingMethod",
+    "hkpConeLimitConstraintAtom": "_hkp.hkpConeLimitConstraintAtom",
+    "hkpConeLimitConstraintAtomMeasurementMode": "_hkp.hkpConeLimitConstraintAtomMeasurementMode",
+    "hkpConstraintAtom": "_hkp.hkpConstraintAtom",
+    "hkpConstraintAtomAtomType": "_hkp.hkpConstraintAtomAtomType",
+    "hkpConstraintData": "_hkp.hkpConstraintData",
+    "hkpConstraintMotor": "_hkp.hkpConstraintMotor",
+    "hkpConstraintMotorMotorType": "_hkp.hkpConstraintMotorMotorType",
+    "hkpFixedConstraintData": "_hkp.hkpFixedConstraintData",
+    "hkpFixedConstraintDataAtoms": "_hkp.hkpFixedConstraintDataAtoms",
+    "hkpKeyframedRigidMotion": "_hkp.hkpKeyframedRigidMotion",
+    "hkpLimitedForceConstraintMotor": "_hkp.hkpLimitedForceConstraintMotor",
+    "hkpLimitedHingeConstraintData": "_hkp.hkpLimitedHingeConstraintData",
+    "hkpLimitedHingeConstraintDataAtoms": "_hkp.hkpLimitedHingeConstraintDataAtoms",
+    "hkpMaxSizeMotion": "_hkp.hkpMaxSizeMotion",
+    "hkpMotion": "_hkp.hkpMotion",
+    "hkpMotionMotionType": "_hkp.hkpMotionMotionType",
+    "hkpPositionConstraintMotor": "_hkp.hkpPositionConstraintMotor",
+    "hkpRagdollConstraintData": "_hkp.hkpRagdollConstraintData",
+    "hkpRagdollConstraintDataAtoms": "_hkp.hkpRagdollConstraintDataAtoms",
+    "hkpRagdollMotorConstraintAtom": "_hkp.hkpRagdollMotorConstraintAtom",
+    "hkpSetLocalTransformsConstraintAtom": "_hkp.hkpSetLocalTransformsConstraintAtom",
+    "hkpSetupStabilizationAtom": "_hkp.hkpSetupStabilizationAtom",
+    "hkpTwistLimitConstraintAtom": "_hkp.hkpTwistLimitConstraintAtom",
+    "hkxAttribute": "_hkx.hkxAttribute",
+    "hkxAttributeGroup": "_hkx.hkxAttributeGroup",
+    "hkxAttributeHolder": "_hkx.hkxAttributeHolder",
+    "hkxIndexBuffer": "_hkx.hkxIndexBuffer",
+    "hkxIndexBufferIndexType": "_hkx.hkxIndexBufferIndexType",
+    "hkxMaterial": "_hkx.hkxMaterial",
+    "hkxMaterialProperty": "_hkx.hkxMaterialProperty",
+    "hkxMaterialTextureStage": "_hkx.hkxMaterialTextureStage",
+    "hkxMaterialTextureStageTextureType": "_hkx.hkxMaterialTextureStageTextureType",
+    "hkxMaterialTransparency": "_hkx.hkxMaterialTransparency",
+    "hkxMaterialUVMappingAlgorithm": "_hkx.hkxMaterialUVMappingAlgorithm",
+    "hkxMesh": "_hkx.hkxMesh",
+    "hkxMeshSection": "_hkx.hkxMeshSection",
+    "hkxMeshUserChannelInfo": "_hkx.hkxMeshUserChannelInfo",
+    "hkxVertexAnimation": "_hkx.hkxVertexAnimation",
+    "hkxVertexAnimationUsageMap": "_hkx.hkxVertexAnimationUsageMap",
+    "hkxVertexAnimationUsageMapDataUsage": "_hkx.hkxVertexAnimationUsageMapDataUsage",
+    "hkxVertexBuffer": "_hkx.hkxVertexBuffer",
+    "hkxVertexBufferVertexData": "_hkx.hkxVertexBufferVertexData",
+    "hkxVertexDescription": "_hkx.hkxVertexDescription",
+    "hkxVertexDescriptionElementDecl": "_hkx.hkxVertexDescriptionElementDecl",
+    "hkxVertexDescriptionElementDeclDataType": "_hkx.hkxVertexDescriptionElementDeclDataType",
+    "hkxVertexDescriptionElementDeclDataUsage": "_hkx.hkxVertexDescriptionElementDeclDataUsage",
+    "fsnpCustomMeshParameter": "fsnpCustomMeshParameter",
+    "fsnpCustomMeshParameterPrimitiveData": "fsnpCustomMeshParameterPrimitiveData",
+    "fsnpCustomMeshParameterTriangleData": "fsnpCustomMeshParameterTriangleData",
+    "fsnpCustomParamCompressedMeshShape": "fsnpCustomParamCompressedMeshShape",
+    "hkAabb": "hkAabb",
+    "hkBitField": "hkBitField",
+    "hkBitFieldBase": "hkBitFieldBase",
+    "hkBitFieldStorage": "hkBitFieldStorage",
+    "hkCompressedMassProperties": "hkCompressedMassProperties",
+    "hkFreeListArrayhknpMaterialhknpMaterialId8hknpMaterialFreeListArrayOperations": "hkFreeListArrayhknpMaterialhknpMaterialId8hknpMaterialFreeListArrayOperations",
+    "hkFreeListArrayhknpMotionPropertieshknpMotionPropertiesId8hknpMotionPropertiesFreeListArrayOperations": "hkFreeListArrayhknpMotionPropertieshknpMotionPropertiesId8hknpMotionPropertiesFreeListArrayOperations",
+    "hkLocalFrame": "hkLocalFrame",
+    "hkMeshBoneIndexMapping": "hkMeshBoneIndexMapping",
+    "hkMotionState": "hkMotionState",
+    "hkRefCountedProperties": "hkRefCountedProperties",
+    "hkRefCountedPropertiesEntry": "hkRefCountedPropertiesEntry",
+    "hkRootLevelContainer": "hkRootLevelContainer",
+    "hkRootLevelContainerNamedVariant": "hkRootLevelContainerNamedVariant",
+}
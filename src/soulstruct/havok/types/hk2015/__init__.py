@@ -1,28 +1,36 @@
+import typing as tp
+
+from soulstruct.havok.types.type_index import set_lazy_type_module
 from .core import *
-from ._hka import *
-from ._hkcd import *
-from ._hknp import *
-from ._hkp import *
-from ._hkx import *
+from ._type_index import TYPE_MODULES
+
+if tp.TYPE_CHECKING:
+    from ._hka import *
+    from ._hkcd import *
+    from ._hknp import *
+    from ._hkp import *
+    from ._hkx import *
 
-from .CustomMeshParameter import CustomMeshParameter
-from .CustomParamStorageExtendedMeshShape import CustomParamStorageExtendedMeshShape
+    from .CustomMeshParameter import CustomMeshParameter
+    from .CustomParamStorageExtendedMeshShape import CustomParamStorageExtendedMeshShape
 
-from .hkAabb import hkAabb
-from .hkGeometry import hkGeometry
-from .hkGeometryTriangle import hkGeometryTriangle
-from .hkLocalFrame import hkLocalFrame
-from .hkMeshBoneIndexMapping import hkMeshBoneIndexMapping
-from .hkMoppBvTreeShapeBase import hkMoppBvTreeShapeBase
-from .hkMotionState import hkMotionState
-from .hkMultiThreadCheck import hkMultiThreadCheck
-from .hkRefCountedProperties import hkRefCountedProperties
-from .hkRefCountedPropertiesEntry import hkRefCountedPropertiesEntry
-from .hkRootLevelContainer import hkRootLevelContainer
-from .hkRootLevelContainerNamedVariant import hkRootLevelContainerNamedVariant
-from .hkSimpleProperty import hkSimpleProperty
-from .hkSimplePropertyValue import hkSimplePropertyValue
-from .hkWorldMemoryAvailableWatchDog import hkWorldMemoryAvailableWatchDog
+    from .hkAabb import hkAabb
+    from .hkGeometry import hkGeometry
+    from .hkGeometryTriangle import hkGeometryTriangle
+    from .hkLocalFrame import hkLocalFrame
+    from .hkMeshBoneIndexMapping import hkMeshBoneIndexMapping
+    from .hkMoppBvTreeShapeBase import hkMoppBvTreeShapeBase
+    from .hkMotionState import hkMotionState
+    from .hkMultiThreadCheck import hkMultiThreadCheck
+    from .hkRefCountedProperties import hkRefCountedProperties
+    from .hkRefCountedPropertiesEntry import hkRefCountedPropertiesEntry
+    from .hkRootLevelContainer import hkRootLevelContainer
+    from .hkRootLevelContainerNamedVariant import hkRootLevelContainerNamedVariant
+    from .hkSimpleProperty import hkSimpleProperty
+    from .hkSimplePropertyValue import hkSimplePropertyValue
+    from .hkWorldMemoryAvailableWatchDog import hkWorldMemoryAvailableWatchDog
 
 
 VERSION = "20150100"
+
+set_lazy_type_module(__name__, TYPE_MODULES)
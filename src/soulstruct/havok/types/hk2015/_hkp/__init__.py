@@ -1,111 +1,116 @@
-from .hkp2dAngConstraintAtom import hkp2dAngConstraintAtom
-from .hkpAction import hkpAction
-from .hkpAngFrictionConstraintAtom import hkpAngFrictionConstraintAtom
-from .hkpAngMotorConstraintAtom import hkpAngMotorConstraintAtom
-from .hkpAngLimitConstraintAtom import hkpAngLimitConstraintAtom
-from .hkpBallAndSocketConstraintData import hkpBallAndSocketConstraintData
-from .hkpBallAndSocketConstraintDataAtoms import hkpBallAndSocketConstraintDataAtoms
-from .hkpBallSocketChainData import hkpBallSocketChainData
-from .hkpBallSocketConstraintAtom import hkpBallSocketConstraintAtom
-from .hkpBallSocketChainDataConstraintInfo import hkpBallSocketChainDataConstraintInfo
-from .hkpBoxShape import hkpBoxShape
-from .hkpBreakableConstraintData import hkpBreakableConstraintData
-from .hkpBridgeAtoms import hkpBridgeAtoms
-from .hkpBridgeConstraintAtom import hkpBridgeConstraintAtom
-from .hkpBroadPhaseHandle import hkpBroadPhaseHandle
-from .hkpBvTreeShape import hkpBvTreeShape
-from .hkpBvTreeShapeBvTreeType import hkpBvTreeShapeBvTreeType
-from .hkpCapsuleShape import hkpCapsuleShape
-from .hkpCdBody import hkpCdBody
-from .hkpCollidable import hkpCollidable
-from .hkpCollidableBoundingVolumeData import hkpCollidableBoundingVolumeData
-from .hkpCollidableCollidableFilter import hkpCollidableCollidableFilter
-from .hkpCollisionFilter import hkpCollisionFilter
-from .hkpCollisionFilterhkpFilterType import hkpCollisionFilterhkpFilterType
-from .hkpConeLimitConstraintAtom import hkpConeLimitConstraintAtom
-from .hkpConeLimitConstraintAtomMeasurementMode import hkpConeLimitConstraintAtomMeasurementMode
-from .hkpConstraintAtom import hkpConstraintAtom
-from .hkpConstraintAtomAtomType import hkpConstraintAtomAtomType
-from .hkpConstraintAtomSolvingMethod import hkpConstraintAtomSolvingMethod
-from .hkpConstraintChainData import hkpConstraintChainData
-from .hkpConstraintChainInstance import hkpConstraintChainInstance
-from .hkpConstraintChainInstanceAction import hkpConstraintChainInstanceAction
-from .hkpConstraintData import hkpConstraintData
-from .hkpConstraintInstance import hkpConstraintInstance
-from .hkpConstraintInstanceConstraintPriority import hkpConstraintInstanceConstraintPriority
-from .hkpConstraintInstanceOnDestructionRemapInfo import hkpConstraintInstanceOnDestructionRemapInfo
-from .hkpConstraintInstanceSmallArraySerializeOverrideType import hkpConstraintInstanceSmallArraySerializeOverrideType
-from .hkpConstraintMotor import hkpConstraintMotor
-from .hkpConstraintMotorMotorType import hkpConstraintMotorMotorType
-from .hkpConvexListFilter import hkpConvexListFilter
-from .hkpConvexShape import hkpConvexShape
-from .hkpConvexTransformShape import hkpConvexTransformShape
-from .hkpConvexTransformShapeBase import hkpConvexTransformShapeBase
-from .hkpConvexTranslateShape import hkpConvexTranslateShape
-from .hkpConvexVerticesConnectivity import hkpConvexVerticesConnectivity
-from .hkpConvexVerticesShape import hkpConvexVerticesShape
-from .hkpCylinderShape import hkpCylinderShape
-from .hkpEntity import hkpEntity
-from .hkpEntityExtendedListeners import hkpEntityExtendedListeners
-from .hkpEntitySmallArraySerializeOverrideType import hkpEntitySmallArraySerializeOverrideType
-from .hkpEntitySpuCollisionCallback import hkpEntitySpuCollisionCallback
-from .hkpExtendedMeshShape import hkpExtendedMeshShape
-from .hkpExtendedMeshShapeIndexStridingType import hkpExtendedMeshShapeIndexStridingType
-from .hkpExtendedMeshShapeShapesSubpart import hkpExtendedMeshShapeShapesSubpart
-from .hkpExtendedMeshShapeSubpart import hkpExtendedMeshShapeSubpart
-from .hkpExtendedMeshShapeTrianglesSubpart import hkpExtendedMeshShapeTrianglesSubpart
-from .hkpHingeConstraintData import hkpHingeConstraintData
-from .hkpHingeConstraintDataAtoms import hkpHingeConstraintDataAtoms
-from .hkpKeyframedRigidMotion import hkpKeyframedRigidMotion
-from .hkpLimitedForceConstraintMotor import hkpLimitedForceConstraintMotor
-from .hkpLimitedHingeConstraintData import hkpLimitedHingeConstraintData
-from .hkpLimitedHingeConstraintDataAtoms import hkpLimitedHingeConstraintDataAtoms
-from .hkpLinkedCollidable import hkpLinkedCollidable
-from .hkpMaterial import hkpMaterial
-from .hkpMaterialResponseType import hkpMaterialResponseType
-from .hkpMaxSizeMotion import hkpMaxSizeMotion
-from .hkpMeshMaterial import hkpMeshMaterial
-from .hkpModifierConstraintAtom import hkpModifierConstraintAtom
-from .hkpMoppBvTreeShape import hkpMoppBvTreeShape
-from .hkpMoppCode import hkpMoppCode
-from .hkpMoppCodeBuildType import hkpMoppCodeBuildType
-from .hkpMoppCodeCodeInfo import hkpMoppCodeCodeInfo
-from .hkpMotion import hkpMotion
-from .hkpMotionMotionType import hkpMotionMotionType
-from .hkpNamedMeshMaterial import hkpNamedMeshMaterial
-from .hkpPhantom import hkpPhantom
-from .hkpPhysicsData import hkpPhysicsData
-from .hkpPhysicsSystem import hkpPhysicsSystem
-from .hkpPositionConstraintMotor import hkpPositionConstraintMotor
-from .hkpRagdollConstraintData import hkpRagdollConstraintData
-from .hkpRagdollConstraintDataAtoms import hkpRagdollConstraintDataAtoms
-from .hkpRagdollMotorConstraintAtom import hkpRagdollMotorConstraintAtom
-from .hkpRayCollidableFilter import hkpRayCollidableFilter
-from .hkpRayShapeCollectionFilter import hkpRayShapeCollectionFilter
-from .hkpRigidBody import hkpRigidBody
-from .hkpSetLocalTransformsConstraintAtom import hkpSetLocalTransformsConstraintAtom
-from .hkpSetLocalTranslationsConstraintAtom import hkpSetLocalTranslationsConstraintAtom
-from .hkpSetupStabilizationAtom import hkpSetupStabilizationAtom
-from .hkpShape import hkpShape
-from .hkpShapeBase import hkpShapeBase
-from .hkpShapeCollection import hkpShapeCollection
-from .hkpShapeCollectionCollectionType import hkpShapeCollectionCollectionType
-from .hkpShapeCollectionFilter import hkpShapeCollectionFilter
-from .hkpShapeContainer import hkpShapeContainer
-from .hkpSingleShapeContainer import hkpSingleShapeContainer
-from .hkpSphereRepShape import hkpSphereRepShape
-from .hkpSphereShape import hkpSphereShape
-from .hkpStorageExtendedMeshShape import hkpStorageExtendedMeshShape
-from .hkpStorageExtendedMeshShapeMaterial import hkpStorageExtendedMeshShapeMaterial
-from .hkpStorageExtendedMeshShapeMeshSubpartStorage import hkpStorageExtendedMeshShapeMeshSubpartStorage
-from .hkpStorageExtendedMeshShapeShapeSubpartStorage import hkpStorageExtendedMeshShapeShapeSubpartStorage
-from .hkpTwistLimitConstraintAtom import hkpTwistLimitConstraintAtom
-from .hkpTypedBroadPhaseHandle import hkpTypedBroadPhaseHandle
-from .hkpWeldingUtilityWeldingType import hkpWeldingUtilityWeldingType
-from .hkpWorldCinfo import hkpWorldCinfo
-from .hkpWorldCinfoBroadPhaseBorderBehaviour import hkpWorldCinfoBroadPhaseBorderBehaviour
-from .hkpWorldCinfoBroadPhaseType import hkpWorldCinfoBroadPhaseType
-from .hkpWorldCinfoContactPointGeneration import hkpWorldCinfoContactPointGeneration
-from .hkpWorldCinfoSimulationType import hkpWorldCinfoSimulationType
-from .hkpWorldObject import hkpWorldObject
-from .hkpWrappedConstraintData import hkpWrappedConstraintData
+import typing as tp
+
+if tp.TYPE_CHECKING:
+    from .hkp2dAngConstraintAtom import hkp2dAngConstraintAtom
+    from .hkpAction import hkpAction
+    from .hkpAngFrictionConstraintAtom import hkpAngFrictionConstraintAtom
+    from .hkpAngMotorConstraintAtom import hkpAngMotorConstraintAtom
+    from .hkpAngLimitConstraintAtom import hkpAngLimitConstraintAtom
+    from .hkpBallAndSocketConstraintData import hkpBallAndSocketConstraintData
+    from .hkpBallAndSocketConstraintDataAtoms import hkpBallAndSocketConstraintDataAtoms
+    from .hkpBallSocketChainData import hkpBallSocketChainData
+    from .hkpBallSocketConstraintAtom import hkpBallSocketConstraintAtom
+    from .hkpBallSocketChainDataConstraintInfo import hkpBallSocketChainDataConstraintInfo
+    from .hkpBoxShape import hkpBoxShape
+    from .hkpBreakableConstraintData import hkpBreakableConstraintData
+    from .hkpBridgeAtoms import hkpBridgeAtoms
+    from .hkpBridgeConstraintAtom import hkpBridgeConstraintAtom
+    from .hkpBroadPhaseHandle import hkpBroadPhaseHandle
+    from .hkpBvTreeShape import hkpBvTreeShape
+    from .hkpBvTreeShapeBvTreeType import hkpBvTreeShapeBvTreeType
+    from .hkpCapsuleShape import hkpCapsuleShape
+    from .hkpCdBody import hkpCdBody
+    from .hkpCollidable import hkpCollidable
+    from .hkpCollidableBoundingVolumeData import hkpCollidableBoundingVolumeData
+    from .hkpCollidableCollidableFilter import hkpCollidableCollidableFilter
+    from .hkpCollisionFilter import hkpCollisionFilter
+    from .hkpCollisionFilterhkpFilterType import hkpCollisionFilterhkpFilterType
+    from .hkpConeLimitConstraintAtom import hkpConeLimitConstraintAtom
+    from .hkpConeLimitConstraintAtomMeasurementMode import hkpConeLimitConstraintAtomMeasurementMode
+    from .hkpConstraintAtom import hkpConstraintAtom
+    from .hkpConstraintAtomAtomType import hkpConstraintAtomAtomType
+    from .hkpConstraintAtomSolvingMethod import hkpConstraintAtomSolvingMethod
+    from .hkpConstraintChainData import hkpConstraintChainData
+    from .hkpConstraintChainInstance import hkpConstraintChainInstance
+    from .hkpConstraintChainInstanceAction import hkpConstraintChainInstanceAction
+    from .hkpConstraintData import hkpConstraintData
+    from .hkpConstraintInstance import hkpConstraintInstance
+    from .hkpConstraintInstanceConstraintPriority import hkpConstraintInstanceConstraintPriority
+    from .hkpConstraintInstanceOnDestructionRemapInfo import hkpConstraintInstanceOnDestructionRemapInfo
+    from .hkpConstraintInstanceSmallArraySerializeOverrideType import (
+        hkpConstraintInstanceSmallArraySerializeOverrideType
+    )
+    from .hkpConstraintMotor import hkpConstraintMotor
+    from .hkpConstraintMotorMotorType import hkpConstraintMotorMotorType
+    from .hkpConvexListFilter import hkpConvexListFilter
+    from .hkpConvexShape import hkpConvexShape
+    from .hkpConvexTransformShape import hkpConvexTransformShape
+    from .hkpConvexTransformShapeBase import hkpConvexTransformShapeBase
+    from .hkpConvexTranslateShape import hkpConvexTranslateShape
+    from .hkpConvexVerticesConnectivity import hkpConvexVerticesConnectivity
+    from .hkpConvexVerticesShape import hkpConvexVerticesShape
+    from .hkpCylinderShape import hkpCylinderShape
+    from .hkpEntity import hkpEntity
+    from .hkpEntityExtendedListeners import hkpEntityExtendedListeners
+    from .hkpEntitySmallArraySerializeOverrideType import hkpEntitySmallArraySerializeOverrideType
+    from .hkpEntitySpuCollisionCallback import hkpEntitySpuCollisionCallback
+    from .hkpExtendedMeshShape import hkpExtendedMeshShape
+    from .hkpExtendedMeshShapeIndexStridingType import hkpExtendedMeshShapeIndexStridingType
+    from .hkpExtendedMeshShapeShapesSubpart import hkpExtendedMeshShapeShapesSubpart
+    from .hkpExtendedMeshShapeSubpart import hkpExtendedMeshShapeSubpart
+    from .hkpExtendedMeshShapeTrianglesSubpart import hkpExtendedMeshShapeTrianglesSubpart
+    from .hkpHingeConstraintData import hkpHingeConstraintData
+    from .hkpHingeConstraintDataAtoms import hkpHingeConstraintDataAtoms
+    from .hkpKeyframedRigidMotion import hkpKeyframedRigidMotion
+    from .hkpLimitedForceConstraintMotor import hkpLimitedForceConstraintMotor
+    from .hkpLimitedHingeConstraintData import hkpLimitedHingeConstraintData
+    from .hkpLimitedHingeConstraintDataAtoms import hkpLimitedHingeConstraintDataAtoms
+    from .hkpLinkedCollidable import hkpLinkedCollidable
+    from .hkpMaterial import hkpMaterial
+    from .hkpMaterialResponseType import hkpMaterialResponseType
+    from .hkpMaxSizeMotion import hkpMaxSizeMotion
+    from .hkpMeshMaterial import hkpMeshMaterial
+    from .hkpModifierConstraintAtom import hkpModifierConstraintAtom
+    from .hkpMoppBvTreeShape import hkpMoppBvTreeShape
+    from .hkpMoppCode import hkpMoppCode
+    from .hkpMoppCodeBuildType import hkpMoppCodeBuildType
+    from .hkpMoppCodeCodeInfo import hkpMoppCodeCodeInfo
+    from .hkpMotion import hkpMotion
+    from .hkpMotionMotionType import hkpMotionMotionType
+    from .hkpNamedMeshMaterial import hkpNamedMeshMaterial
+    from .hkpPhantom import hkpPhantom
+    from .hkpPhysicsData import hkpPhysicsData
+    from .hkpPhysicsSystem import hkpPhysicsSystem
+    from .hkpPositionConstraintMotor import hkpPositionConstraintMotor
+    from .hkpRagdollConstraintData import hkpRagdollConstraintData
+    from .hkpRagdollConstraintDataAtoms import hkpRagdollConstraintDataAtoms
+    from .hkpRagdollMotorConstraintAtom import hkpRagdollMotorConstraintAtom
+    from .hkpRayCollidableFilter import hkpRayCollidableFilter
+    from .hkpRayShapeCollectionFilter import hkpRayShapeCollectionFilter
+    from .hkpRigidBody import hkpRigidBody
+    from .hkpSetLocalTransformsConstraintAtom import hkpSetLocalTransformsConstraintAtom
+    from .hkpSetLocalTranslationsConstraintAtom import hkpSetLocalTranslationsConstraintAtom
+    from .hkpSetupStabilizationAtom import hkpSetupStabilizationAtom
+    from .hkpShape import hkpShape
+    from .hkpShapeBase import hkpShapeBase
+    from .hkpShapeCollection import hkpShapeCollection
+    from .hkpShapeCollectionCollectionType import hkpShapeCollectionCollectionType
+    from .hkpShapeCollectionFilter import hkpShapeCollectionFilter
+    from .hkpShapeContainer import hkpShapeContainer
+    from .hkpSingleShapeContainer import hkpSingleShapeContainer
+    from .hkpSphereRepShape import hkpSphereRepShape
+    from .hkpSphereShape import hkpSphereShape
+    from .hkpStorageExtendedMeshShape import hkpStorageExtendedMeshShape
+    from .hkpStorageExtendedMeshShapeMaterial import hkpStorageExtendedMeshShapeMaterial
+    from .hkpStorageExtendedMeshShapeMeshSubpartStorage import hkpStorageExtendedMeshShapeMeshSubpartStorage
+    from .hkpStorageExtendedMeshShapeShapeSubpartStorage import hkpStorageExtendedMeshShapeShapeSubpartStorage
+    from .hkpTwistLimitConstraintAtom import hkpTwistLimitConstraintAtom
+    from .hkpTypedBroadPhaseHandle import hkpTypedBroadPhaseHandle
+    from .hkpWeldingUtilityWeldingType import hkpWeldingUtilityWeldingType
+    from .hkpWorldCinfo import hkpWorldCinfo
+    from .hkpWorldCinfoBroadPhaseBorderBehaviour import hkpWorldCinfoBroadPhaseBorderBehaviour
+    from .hkpWorldCinfoBroadPhaseType import hkpWorldCinfoBroadPhaseType
+    from .hkpWorldCinfoContactPointGeneration import hkpWorldCinfoContactPointGeneration
+    from .hkpWorldCinfoSimulationType import hkpWorldCinfoSimulationType
+    from .hkpWorldObject import hkpWorldObject
+    from .hkpWrappedConstraintData import hkpWrappedConstraintData
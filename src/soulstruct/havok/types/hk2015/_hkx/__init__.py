@@ -1,22 +1,25 @@
-from .hkxAttribute import hkxAttribute
-from .hkxAttributeGroup import hkxAttributeGroup
-from .hkxAttributeHolder import hkxAttributeHolder
-from .hkxIndexBuffer import hkxIndexBuffer
-from .hkxIndexBufferIndexType import hkxIndexBufferIndexType
-from .hkxMaterial import hkxMaterial
-from .hkxMaterialProperty import hkxMaterialProperty
-from .hkxMaterialTextureStage import hkxMaterialTextureStage
-from .hkxMaterialTextureType import hkxMaterialTextureType
-from .hkxMaterialTransparency import hkxMaterialTransparency
-from .hkxMaterialUVMappingAlgorithm import hkxMaterialUVMappingAlgorithm
-from .hkxMesh import hkxMesh
-from .hkxMeshSection import hkxMeshSection
-from .hkxMeshUserChannelInfo import hkxMeshUserChannelInfo
-from .hkxVertexAnimation import hkxVertexAnimation
-from .hkxVertexAnimationUsageMap import hkxVertexAnimationUsageMap
-from .hkxVertexBuffer import hkxVertexBuffer
-from .hkxVertexBufferVertexData import hkxVertexBufferVertexData
-from .hkxVertexDescription import hkxVertexDescription
-from .hkxVertexDescriptionDataType import hkxVertexDescriptionDataType
-from .hkxVertexDescriptionDataUsage import hkxVertexDescriptionDataUsage
-from .hkxVertexDescriptionElementDecl import hkxVertexDescriptionElementDecl
+import typing as tp
+
+if tp.TYPE_CHECKING:
+    from .hkxAttribute import hkxAttribute
+    from .hkxAttributeGroup import hkxAttributeGroup
+    from .hkxAttributeHolder import hkxAttributeHolder
+    from .hkxIndexBuffer import hkxIndexBuffer
+    from .hkxIndexBufferIndexType import hkxIndexBufferIndexType
+    from .hkxMaterial import hkxMaterial
+    from .hkxMaterialProperty import hkxMaterialProperty
+    from .hkxMaterialTextureStage import hkxMaterialTextureStage
+    from .hkxMaterialTextureType import hkxMaterialTextureType
+    from .hkxMaterialTransparency import hkxMaterialTransparency
+    from .hkxMaterialUVMappingAlgorithm import hkxMaterialUVMappingAlgorithm
+    from .hkxMesh import hkxMesh
+    from .hkxMeshSection import hkxMeshSection
+    from .hkxMeshUserChannelInfo import hkxMeshUserChannelInfo
+    from .hkxVertexAnimation import hkxVertexAnimation
+    from .hkxVertexAnimationUsageMap import hkxVertexAnimationUsageMap
+    from .hkxVertexBuffer import hkxVertexBuffer
+    from .hkxVertexBufferVertexData import hkxVertexBufferVertexData
+    from .hkxVertexDescription import hkxVertexDescription
+    from .hkxVertexDescriptionDataType import hkxVertexDescriptionDataType
+    from .hkxVertexDescriptionDataUsage import hkxVertexDescriptionDataUsage
+    from .hkxVertexDescriptionElementDecl import hkxVertexDescriptionElementDecl
@@ -0,0 +1,201 @@
+"""Generated by `soulstruct.havok.types.type_index.write_type_index("hk2015")`. Do not edit."""
+
+TYPE_MODULES = {
+    "CustomMeshParameter": "CustomMeshParameter",
+    "CustomParamStorageExtendedMeshShape": "CustomParamStorageExtendedMeshShape",
+    "hkaAnimatedReferenceFrame": "_hka.hkaAnimatedReferenceFrame",
+    "hkaAnimatedReferenceFramehkaReferenceFrameTypeEnum": "_hka.hkaAnimatedReferenceFramehkaReferenceFrameTypeEnum",
+    "hkaAnimation": "_hka.hkaAnimation",
+    "hkaAnimationAnimationType": "_hka.hkaAnimationAnimationType",
+    "hkaAnimationBinding": "_hka.hkaAnimationBinding",
+    "hkaAnimationBindingBlendHint": "_hka.hkaAnimationBindingBlendHint",
+    "hkaAnimationContainer": "_hka.hkaAnimationContainer",
+    "hkaAnnotationTrack": "_hka.hkaAnnotationTrack",
+    "hkaAnnotationTrackAnnotation": "_hka.hkaAnnotationTrackAnnotation",
+    "hkaBone": "_hka.hkaBone",
+    "hkaBoneAttachment": "_hka.hkaBoneAttachment",
+    "hkaDefaultAnimatedReferenceFrame": "_hka.hkaDefaultAnimatedReferenceFrame",
+    "hkaInterleavedUncompressedAnimation": "_hka.hkaInterleavedUncompressedAnimation",
+    "hkaMeshBinding": "_hka.hkaMeshBinding",
+    "hkaMeshBindingMapping": "_hka.hkaMeshBindingMapping",
+    "hkaRagdollInstance": "_hka.hkaRagdollInstance",
+    "hkaSkeleton": "_hka.hkaSkeleton",
+    "hkaSkeletonLocalFrameOnBone": "_hka.hkaSkeletonLocalFrameOnBone",
+    "hkaSkeletonMapper": "_hka.hkaSkeletonMapper",
+    "hkaSkeletonMapperData": "_hka.hkaSkeletonMapperData",
+    "hkaSkeletonMapperDataChainMapping": "_hka.hkaSkeletonMapperDataChainMapping",
+    "hkaSkeletonMapperDataMappingType": "_hka.hkaSkeletonMapperDataMappingType",
+    "hkaSkeletonMapperDataPartitionMappingRange": "_hka.hkaSkeletonMapperDataPartitionMappingRange",
+    "hkaSkeletonMapperDataSimpleMapping": "_hka.hkaSkeletonMapperDataSimpleMapping",
+    "hkaSkeletonPartition": "_hka.hkaSkeletonPartition",
+    "hkaSplineCompressedAnimation": "_hka.hkaSplineCompressedAnimation",
+    "hkcdFourAabb": "_hkcd.hkcdFourAabb",
+    "hkcdShape": "_hkcd.hkcdShape",
+    "hkcdShapeDispatchTypeShapeDispatchTypeEnum": "_hkcd.hkcdShapeDispatchTypeShapeDispatchTypeEnum",
+    "hkcdShapeInfoCodecTypeShapeInfoCodecTypeEnum": "_hkcd.hkcdShapeInfoCodecTypeShapeInfoCodecTypeEnum",
+    "hkcdShapeTypeShapeTypeEnum": "_hkcd.hkcdShapeTypeShapeTypeEnum",
+    "hkcdSimdTree": "_hkcd.hkcdSimdTree",
+    "hkcdSimdTreeNode": "_hkcd.hkcdSimdTreeNode",
+    "hkcdStaticTreeCodec3Axis": "_hkcd.hkcdStaticTreeCodec3Axis",
+    "hkcdStaticTreeCodec3Axis6": "_hkcd.hkcdStaticTreeCodec3Axis6",
+    "hkcdStaticTreeDynamicStorage": "_hkcd.hkcdStaticTreeDynamicStorage",
+    "hkcdStaticTreeTree": "_hkcd.hkcdStaticTreeTree",
+    "hknpCollisionDispatchTypeEnum": "_hknp.hknpCollisionDispatchTypeEnum",
+    "hknpCompositeShape": "_hknp.hknpCompositeShape",
+    "hknpDefaultExternMeshShapeGeometry": "_hknp.hknpDefaultExternMeshShapeGeometry",
+    "hknpExternMeshShape": "_hknp.hknpExternMeshShape",
+    "hknpExternMeshShapeData": "_hknp.hknpExternMeshShapeData",
+    "hknpExternMeshShapeGeometry": "_hknp.hknpExternMeshShapeGeometry",
+    "hknpShape": "_hknp.hknpShape",
+    "hknpShapeFlagsEnum": "_hknp.hknpShapeFlagsEnum",
+    "hknpShapeTypeEnum": "_hknp.hknpShapeTypeEnum",
+    "hknpSparseCompactMap": "_hknp.hknpSparseCompactMap",
+    "hkp2dAngConstraintAtom": "_hkp.hkp2dAngConstraintAtom",
+    "hkpAction": "_hkp.hkpAction",
+    "hkpAngFrictionConstraintAtom": "_hkp.hkpAngFrictionConstraintAtom",
+    "hkpAngLimitConstraintAtom": "_hkp.hkpAngLimitConstraintAtom",
+    "hkpAngMotorConstraintAtom": "_hkp.hkpAngMotorConstraintAtom",
+    "hkpBallAndSocketConstraintData": "_hkp.hkpBallAndSocketConstraintData",
+    "hkpBallAndSocketConstraintDataAtoms": "_hkp.hkpBallAndSocketConstraintDataAtoms",
+    "hkpBallSocketChainData": "_hkp.hkpBallSocketChainData",
+    "hkpBallSocketChainDataConstraintInfo": "_hkp.hkpBallSocketChainDataConstraintInfo",
+    "hkpBallSocketConstraintAtom": "_hkp.hkpBallSocketConstraintAtom",
+    "hkpBoxShape": "_hkp.hkpBoxShape",
+    "hkpBreakableConstraintData": "_hkp.hkpBreakableConstraintData",
+    "hkpBridgeAtoms": "_hkp.hkpBridgeAtoms",
+    "hkpBridgeConstraintAtom": "_hkp.hkpBridgeConstraintAtom",
+    "hkpBroadPhaseHandle": "_hkp.hkpBroadPhaseHandle",
+    "hkpBvTreeShape": "_hkp.hkpBvTreeShape",
+    "hkpBvTreeShapeBvTreeType": "_hkp.hkpBvTreeShapeBvTreeType",
+    "hkpCapsuleShape": "_hkp.hkpCapsuleShape",
+    "hkpCdBody": "_hkp.hkpCdBody",
+    "hkpCollidable": "_hkp.hkpCollidable",
+    "hkpCollidableBoundingVolumeData": "_hkp.hkpCollidableBoundingVolumeData",
+    "hkpCollidableCollidableFilter": "_hkp.hkpCollidableCollidableFilter",
+    "hkpCollisionFilter": "_hkp.hkpCollisionFilter",
+    "hkpCollisionFilterhkpFilterType": "_hkp.hkpCollisionFilterhkpFilterType",
+    "hkpConeLimitConstraintAtom": "_hkp.hkpConeLimitConstraintAtom",
+    "hkpConeLimitConstraintAtomMeasurementMode": "_hkp.hkpConeLimitConstraintAtomMeasurementMode",
+    "hkpConstraintAtom": "_hkp.hkpConstraintAtom",
+    "hkpConstraintAtomAtomType": "_hkp.hkpConstraintAtomAtomType",
+    "hkpConstraintAtomSolvingMethod": "_hkp.hkpConstraintAtomSolvingMethod",
+    "hkpConstraintChainData": "_hkp.hkpConstraintChainData",
+    "hkpConstraintChainInstance": "_hkp.hkpConstraintChainInstance",
+    "hkpConstraintChainInstanceAction": "_hkp.hkpConstraintChainInstanceAction",
+    "hkpConstraintData": "_hkp.hkpConstraintData",
+    "hkpConstraintInstance": "_hkp.hkpConstraintInstance",
+    "hkpConstraintInstanceConstraintPriority": "_hkp.hkpConstraintInstanceConstraintPriority",
+    "hkpConstraintInstanceOnDestructionRemapInfo": "_hkp.hkpConstraintInstanceOnDestructionRemapInfo",
+    "hkpConstraintInstanceSmallArraySerializeOverrideType": "_hkp.hkpConstraintInstanceSmallArraySerializeOverrideType",
+    "hkpConstraintMotor": "_hkp.hkpConstraintMotor",
+    "hkpConstraintMotorMotorType": "_hkp.hkpConstraintMotorMotorType",
+    "hkpConvexListFilter": "_hkp.hkpConvexListFilter",
+    "hkpConvexShape": "_hkp.hkpConvexShape",
+    "hkpConvexTransformShape": "_hkp.hkpConvexTransformShape",
+    "hkpConvexTransformShapeBase": "_hkp.hkpConvexTransformShapeBase",
+    "hkpConvexTranslateShape": "_hkp.hkpConvexTranslateShape",
+    "hkpConvexVerticesConnectivity": "_hkp.hkpConvexVerticesConnectivity",
+    "hkpConvexVerticesShape": "_hkp.hkpConvexVerticesShape",
+    "hkpCylinderShape": "_hkp.hkpCylinderShape",
+    "hkpEntity": "_hkp.hkpEntity",
+    "hkpEntityExtendedListeners": "_hkp.hkpEntityExtendedListeners",
+    "hkpEntitySmallArraySerializeOverrideType": "_hkp.hkpEntitySmallArraySerializeOverrideType",
+    "hkpEntitySpuCollisionCallback": "_hkp.hkpEntitySpuCollisionCallback",
+    "hkpExtendedMeshShape": "_hkp.hkpExtendedMeshShape",
+    "hkpExtendedMeshShapeIndexStridingType": "_hkp.hkpExtendedMeshShapeIndexStridingType",
+    "hkpExtendedMeshShapeShapesSubpart": "_hkp.hkpExtendedMeshShapeShapesSubpart",
+    "hkpExtendedMeshShapeSubpart": "_hkp.hkpExtendedMeshShapeSubpart",
+    "hkpExtendedMeshShapeTrianglesSubpart": "_hkp.hkpExtendedMeshShapeTrianglesSubpart",
+    "hkpHingeConstraintData": "_hkp.hkpHingeConstraintData",
+    "hkpHingeConstraintDataAtoms": "_hkp.hkpHingeConstraintDataAtoms",
+    "hkpKeyframedRigidMotion": "_hkp.hkpKeyframedRigidMotion",
+    "hkpLimitedForceConstraintMotor": "_hkp.hkpLimitedForceConstraintMotor",
+    "hkpLimitedHingeConstraintData": "_hkp.hkpLimitedHingeConstraintData",
+    "hkpLimitedHingeConstraintDataAtoms": "_hkp.hkpLimitedHingeConstraintDataAtoms",
+    "hkpLinkedCollidable": "_hkp.hkpLinkedCollidable",
+    "hkpMaterial": "_hkp.hkpMaterial",
+    "hkpMaterialResponseType": "_hkp.hkpMaterialResponseType",
+    "hkpMaxSizeMotion": "_hkp.hkpMaxSizeMotion",
+    "hkpMeshMaterial": "_hkp.hkpMeshMaterial",
+    "hkpModifierConstraintAtom": "_hkp.hkpModifierConstraintAtom",
+    "hkpMoppBvTreeShape": "_hkp.hkpMoppBvTreeShape",
+    "hkpMoppCode": "_hkp.hkpMoppCode",
+    "hkpMoppCodeBuildType": "_hkp.hkpMoppCodeBuildType",
+    "hkpMoppCodeCodeInfo": "_hkp.hkpMoppCodeCodeInfo",
+    "hkpMotion": "_hkp.hkpMotion",
+    "hkpMotionMotionType": "_hkp.hkpMotionMotionType",
+    "hkpNamedMeshMaterial": "_hkp.hkpNamedMeshMaterial",
+    "hkpPhantom": "_hkp.hkpPhantom",
+    "hkpPhysicsData": "_hkp.hkpPhysicsData",
+    "hkpPhysicsSystem": "_hkp.hkpPhysicsSystem",
+    "hkpPositionConstraintMotor": "_hkp.hkpPositionConstraintMotor",
+    "hkpRagdollConstraintData": "_hkp.hkpRagdollConstraintData",
+    "hkpRagdollConstraintDataAtoms": "_hkp.hkpRagdollConstraintDataAtoms",
+    "hkpRagdollMotorConstraintAtom": "_hkp.hkpRagdollMotorConstraintAtom",
+    "hkpRayCollidableFilter": "_hkp.hkpRayCollidableFilter",
+    "hkpRayShapeCollectionFilter": "_hkp.hkpRayShapeCollectionFilter",
+    "hkpRigidBody": "_hkp.hkpRigidBody",
+    "hkpSetLocalTransformsConstraintAtom": "_hkp.hkpSetLocalTransformsConstraintAtom",
+    "hkpSetLocalTranslationsConstraintAtom": "_hkp.hkpSetLocalTranslationsConstraintAtom",
+    "hkpSetupStabilizationAtom": "_hkp.hkpSetupStabilizationAtom",
+    "hkpShape": "_hkp.hkpShape",
+    "hkpShapeBase": "_hkp.hkpShapeBase",
+    "hkpShapeCollection": "_hkp.hkpShapeCollection",
+    "hkpShapeCollectionCollectionType": "_hkp.hkpShapeCollectionCollectionType",
+    "hkpShapeCollectionFilter": "_hkp.hkpShapeCollectionFilter",
+    "hkpShapeContainer": "_hkp.hkpShapeContainer",
+    "hkpSingleShapeContainer": "_hkp.hkpSingleShapeContainer",
+    "hkpSphereRepShape": "_hkp.hkpSphereRepShape",
+    "hkpSphereShape": "_hkp.hkpSphereShape",
+    "hkpStorageExtendedMeshShape": "_hkp.hkpStorageExtendedMeshShape",
+    "hkpStorageExtendedMeshShapeMaterial": "_hkp.hkpStorageExtendedMeshShapeMaterial",
+    "hkpStorageExtendedMeshShapeMeshSubpartStorage": "_hkp.hkpStorageExtendedMeshShapeMeshSubpartStorage",
+    "hkpStorageExtendedMeshShapeShapeSubpartStorage": "_hkp.hkpStorageExtendedMeshShapeShapeSubpartStorage",
+    "hkpTwistLimitConstraintAtom": "_hkp.hkpTwistLimitConstraintAtom",
+    "hkpTypedBroadPhaseHandle": "_hkp.hkpTypedBroadPhaseHandle",
+    "hkpWeldingUtilityWeldingType": "_hkp.hkpWeldingUtilityWeldingType",
+    "hkpWorldCinfo": "_hkp.hkpWorldCinfo",
+    "hkpWorldCinfoBroadPhaseBorderBehaviour": "_hkp.hkpWorldCinfoBroadPhaseBorderBehaviour",
+    "hkpWorldCinfoBroadPhaseType": "_hkp.hkpWorldCinfoBroadPhaseType",
+    "hkpWorldCinfoContactPointGeneration": "_hkp.hkpWorldCinfoContactPointGeneration",
+    "hkpWorldCinfoSimulationType": "_hkp.hkpWorldCinfoSimulationType",
+    "hkpWorldObject": "_hkp.hkpWorldObject",
+    "hkpWrappedConstraintData": "_hkp.hkpWrappedConstraintData",
+    "hkxAttribute": "_hkx.hkxAttribute",
+    "hkxAttributeGroup": "_hkx.hkxAttributeGroup",
+    "hkxAttributeHolder": "_hkx.hkxAttributeHolder",
+    "hkxIndexBuffer": "_hkx.hkxIndexBuffer",
+    "hkxIndexBufferIndexType": "_hkx.hkxIndexBufferIndexType",
+    "hkxMaterial": "_hkx.hkxMaterial",
+    "hkxMaterialProperty": "_hkx.hkxMaterialProperty",
+    "hkxMaterialTextureStage": "_hkx.hkxMaterialTextureStage",
+    "hkxMaterialTextureType": "_hkx.hkxMaterialTextureType",
+    "hkxMaterialTransparency": "_hkx.hkxMaterialTransparency",
+    "hkxMaterialUVMappingAlgorithm": "_hkx.hkxMaterialUVMappingAlgorithm",
+    "hkxMesh": "_hkx.hkxMesh",
+    "hkxMeshSection": "_hkx.hkxMeshSection",
+    "hkxMeshUserChannelInfo": "_hkx.hkxMeshUserChannelInfo",
+    "hkxVertexAnimation": "_hkx.hkxVertexAnimation",
+    "hkxVertexAnimationUsageMap": "_hkx.hkxVertexAnimationUsageMap",
+    "hkxVertexBuffer": "_hkx.hkxVertexBuffer",
+    "hkxVertexBufferVertexData": "_hkx.hkxVertexBufferVertexData",
+    "hkxVertexDescription": "_hkx.hkxVertexDescription",
+    "hkxVertexDescriptionDataType": "_hkx.hkxVertexDescriptionDataType",
+    "hkxVertexDescriptionDataUsage": "_hkx.hkxVertexDescriptionDataUsage",
+    "hkxVertexDescriptionElementDecl": "_hkx.hkxVertexDescriptionElementDecl",
+    "hkAabb": "hkAabb",
+    "hkGeometry": "hkGeometry",
+    "hkGeometryTriangle": "hkGeometryTriangle",
+    "hkLocalFrame": "hkLocalFrame",
+    "hkMeshBoneIndexMapping": "hkMeshBoneIndexMapping",
+    "hkMoppBvTreeShapeBase": "hkMoppBvTreeShapeBase",
+    "hkMotionState": "hkMotionState",
+    "hkMultiThreadCheck": "hkMultiThreadCheck",
+    "hkRefCountedProperties": "hkRefCountedProperties",
+    "hkRefCountedPropertiesEntry": "hkRefCountedPropertiesEntry",
+    "hkRootLevelContainer": "hkRootLevelContainer",
+    "hkRootLevelContainerNamedVariant": "hkRootLevelContainerNamedVariant",
+    "hkSimpleProperty": "hkSimpleProperty",
+    "hkSimplePropertyValue": "hkSimplePropertyValue",
+    "hkWorldMemoryAvailableWatchDog": "hkWorldMemoryAvailableWatchDog",
+}
@@ -1,11 +1,14 @@
-from .hkcdFourAabb import hkcdFourAabb
-from .hkcdShape import hkcdShape
-from .hkcdShapeDispatchTypeShapeDispatchTypeEnum import hkcdShapeDispatchTypeShapeDispatchTypeEnum
-from .hkcdShapeInfoCodecTypeShapeInfoCodecTypeEnum import hkcdShapeInfoCodecTypeShapeInfoCodecTypeEnum
-from .hkcdShapeTypeShapeTypeEnum import hkcdShapeTypeShapeTypeEnum
-from .hkcdSimdTree import hkcdSimdTree
-from .hkcdSimdTreeNode import hkcdSimdTreeNode
-from .hkcdStaticTreeCodec3Axis import hkcdStaticTreeCodec3Axis
-from .hkcdStaticTreeCodec3Axis6 import hkcdStaticTreeCodec3Axis6
-from .hkcdStaticTreeDynamicStorage import hkcdStaticTreeDynamicStorage
-from .hkcdStaticTreeTree import hkcdStaticTreeTree
+import typing as tp
+
+if tp.TYPE_CHECKING:
+    from .hkcdFourAabb import hkcdFourAabb
+    from .hkcdShape import hkcdShape
+    from .hkcdShapeDispatchTypeShapeDispatchTypeEnum import hkcdShapeDispatchTypeShapeDispatchTypeEnum
+    from .hkcdShapeInfoCodecTypeShapeInfoCodecTypeEnum import hkcdShapeInfoCodecTypeShapeInfoCodecTypeEnum
+    from .hkcdShapeTypeShapeTypeEnum import hkcdShapeTypeShapeTypeEnum
+    from .hkcdSimdTree import hkcdSimdTree
+    from .hkcdSimdTreeNode import hkcdSimdTreeNode
+    from .hkcdStaticTreeCodec3Axis import hkcdStaticTreeCodec3Axis
+    from .hkcdStaticTreeCodec3Axis6 import hkcdStaticTreeCodec3Axis6
+    from .hkcdStaticTreeDynamicStorage import hkcdStaticTreeDynamicStorage
+    from .hkcdStaticTreeTree import hkcdStaticTreeTree
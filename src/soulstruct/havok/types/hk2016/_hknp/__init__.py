@@ -1,10 +1,13 @@
-from .hknpCollisionDispatchTypeEnum import hknpCollisionDispatchTypeEnum
-from .hknpCompositeShape import hknpCompositeShape
-from .hknpDefaultExternMeshShapeGeometry import hknpDefaultExternMeshShapeGeometry
-from .hknpExternMeshShape import hknpExternMeshShape
-from .hknpExternMeshShapeData import hknpExternMeshShapeData
-from .hknpExternMeshShapeGeometry import hknpExternMeshShapeGeometry
-from .hknpShape import hknpShape
-from .hknpShapeFlagsEnum import hknpShapeFlagsEnum
-from .hknpShapeTypeEnum import hknpShapeTypeEnum
-from .hknpSparseCompactMap import hknpSparseCompactMap
+import typing as tp
+
+if tp.TYPE_CHECKING:
+    from .hknpCollisionDispatchTypeEnum import hknpCollisionDispatchTypeEnum
+    from .hknpCompositeShape import hknpCompositeShape
+    from .hknpDefaultExternMeshShapeGeometry import hknpDefaultExternMeshShapeGeometry
+    from .hknpExternMeshShape import hknpExternMeshShape
+    from .hknpExternMeshShapeData import hknpExternMeshShapeData
+    from .hknpExternMeshShapeGeometry import hknpExternMeshShapeGeometry
+    from .hknpShape import hknpShape
+    from .hknpShapeFlagsEnum import hknpShapeFlagsEnum
+    from .hknpShapeTypeEnum import hknpShapeTypeEnum
+    from .hknpSparseCompactMap import hknpSparseCompactMap
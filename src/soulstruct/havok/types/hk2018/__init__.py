@@ -1,44 +1,52 @@
+import typing as tp
+
+from soulstruct.havok.types.type_index import set_lazy_type_module
 from .core import *
-from ._hcl import *
-from ._hka import *
-from ._hkai import *
-from ._hkb import *
-from ._hknp import *
-from ._hkp import *
-from ._hkx import *
+from ._type_index import TYPE_MODULES
+
+if tp.TYPE_CHECKING:
+    from ._hcl import *
+    from ._hka import *
+    from ._hkai import *
+    from ._hkb import *
+    from ._hknp import *
+    from ._hkp import *
+    from ._hkx import *
 
-from .CustomLookAtTwistModifier import CustomLookAtTwistModifier
-from .CustomLookAtTwistModifierMultiRotationAxisType import CustomLookAtTwistModifierMultiRotationAxisType
-from .CustomLookAtTwistModifierTwistParam import CustomLookAtTwistModifierTwistParam
-from .CustomLookAtTwistModifierSetAngleMethod import CustomLookAtTwistModifierSetAngleMethod
-from .CustomLookAtTwistModifierGainState import CustomLookAtTwistModifierGainState
-from .CustomManualSelectorGenerator import CustomManualSelectorGenerator
-from .CustomManualSelectorGeneratorOffsetType import CustomManualSelectorGeneratorOffsetType
-from .CustomManualSelectorGeneratorAnimeEndEventType import CustomManualSelectorGeneratorAnimeEndEventType
-from .CustomManualSelectorGeneratorChangeTypeOfSelectedIndexAfterActivate import (
-    CustomManualSelectorGeneratorChangeTypeOfSelectedIndexAfterActivate
-)
-from .CustomManualSelectorGeneratorReplanningAI import CustomManualSelectorGeneratorReplanningAI
-from .CustomManualSelectorGeneratorRideSync import CustomManualSelectorGeneratorRideSync
-from .CustomPreDeleteIndexSelector import CustomPreDeleteIndexSelector
-from .CustomTransitionEffect import CustomTransitionEffect
+    from .CustomLookAtTwistModifier import CustomLookAtTwistModifier
+    from .CustomLookAtTwistModifierMultiRotationAxisType import CustomLookAtTwistModifierMultiRotationAxisType
+    from .CustomLookAtTwistModifierTwistParam import CustomLookAtTwistModifierTwistParam
+    from .CustomLookAtTwistModifierSetAngleMethod import CustomLookAtTwistModifierSetAngleMethod
+    from .CustomLookAtTwistModifierGainState import CustomLookAtTwistModifierGainState
+    from .CustomManualSelectorGenerator import CustomManualSelectorGenerator
+    from .CustomManualSelectorGeneratorOffsetType import CustomManualSelectorGeneratorOffsetType
+    from .CustomManualSelectorGeneratorAnimeEndEventType import CustomManualSelectorGeneratorAnimeEndEventType
+    from .CustomManualSelectorGeneratorChangeTypeOfSelectedIndexAfterActivate import (
+        CustomManualSelectorGeneratorChangeTypeOfSelectedIndexAfterActivate
+    )
+    from .CustomManualSelectorGeneratorReplanningAI import CustomManualSelectorGeneratorReplanningAI
+    from .CustomManualSelectorGeneratorRideSync import CustomManualSelectorGeneratorRideSync
+    from .CustomPreDeleteIndexSelector import CustomPreDeleteIndexSelector
+    from .CustomTransitionEffect import CustomTransitionEffect
 
-from .hkAabb import hkAabb
-from .hkAssetRefPtr import hkAssetRefPtr
-from .hkBitField import hkBitField
-from .hkBitFieldBase import hkBitFieldBase
-from .hkBitFieldStorage import hkBitFieldStorage
-from .hkCompressedMassProperties import hkCompressedMassProperties
-from .hkDefaultPropertyBag import hkDefaultPropertyBag
-from .hkHandle import hkHandle
-from .hkLocalFrame import hkLocalFrame
-from .hkMeshBoneIndexMapping import hkMeshBoneIndexMapping
-from .hkPackedVector3 import hkPackedVector3
-from .hkPropertyFlagsEnum import hkPropertyFlagsEnum
-from .hkRefCountedProperties import hkRefCountedProperties
-from .hkRefCountedPropertiesEntry import hkRefCountedPropertiesEntry
-from .hkRootLevelContainer import hkRootLevelContainer
-from .hkRootLevelContainerNamedVariant import hkRootLevelContainerNamedVariant
+    from .hkAabb import hkAabb
+    from .hkAssetRefPtr import hkAssetRefPtr
+    from .hkBitField import hkBitField
+    from .hkBitFieldBase import hkBitFieldBase
+    from .hkBitFieldStorage import hkBitFieldStorage
+    from .hkCompressedMassProperties import hkCompressedMassProperties
+    from .hkDefaultPropertyBag import hkDefaultPropertyBag
+    from .hkHandle import hkHandle
+    from .hkLocalFrame import hkLocalFrame
+    from .hkMeshBoneIndexMapping import hkMeshBoneIndexMapping
+    from .hkPackedVector3 import hkPackedVector3
+    from .hkPropertyFlagsEnum import hkPropertyFlagsEnum
+    from .hkRefCountedProperties import hkRefCountedProperties
+    from .hkRefCountedPropertiesEntry import hkRefCountedPropertiesEntry
+    from .hkRootLevelContainer import hkRootLevelContainer
+    from .hkRootLevelContainerNamedVariant import hkRootLevelContainerNamedVariant
 
 
 VERSION = "20180100"
+
+set_lazy_type_module(__name__, TYPE_MODULES)
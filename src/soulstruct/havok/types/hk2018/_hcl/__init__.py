@@ -1,108 +1,117 @@
-from .hclAction import hclAction
-from .hclBendStiffnessConstraintSet import hclBendStiffnessConstraintSet
-from .hclBendStiffnessConstraintSetLink import hclBendStiffnessConstraintSetLink
-from .hclBlendSomeVerticesOperatorBlendWeightType import hclBlendSomeVerticesOperatorBlendWeightType
-from .hclBoneSpaceDeformer import hclBoneSpaceDeformer
-from .hclBoneSpaceDeformerFourBlendEntryBlock import hclBoneSpaceDeformerFourBlendEntryBlock
-from .hclBoneSpaceDeformerLocalBlockP import hclBoneSpaceDeformerLocalBlockP
-from .hclBoneSpaceDeformerLocalBlockUnpackedP import hclBoneSpaceDeformerLocalBlockUnpackedP
-from .hclBoneSpaceDeformerOneBlendEntryBlock import hclBoneSpaceDeformerOneBlendEntryBlock
-from .hclBoneSpaceDeformerThreeBlendEntryBlock import hclBoneSpaceDeformerThreeBlendEntryBlock
-from .hclBoneSpaceDeformerTwoBlendEntryBlock import hclBoneSpaceDeformerTwoBlendEntryBlock
-from .hclBoneSpaceMeshMeshDeformOperator import hclBoneSpaceMeshMeshDeformOperator
-from .hclBoneSpaceMeshMeshDeformOperatorScaleNormalBehaviour import hclBoneSpaceMeshMeshDeformOperatorScaleNormalBehaviour
-from .hclBoneSpaceMeshMeshDeformPOperator import hclBoneSpaceMeshMeshDeformPOperator
-from .hclBufferDefinition import hclBufferDefinition
-from .hclBufferLayout import hclBufferLayout
-from .hclBufferLayoutBufferElement import hclBufferLayoutBufferElement
-from .hclBufferLayoutSlot import hclBufferLayoutSlot
-from .hclBufferLayoutSlotFlags import hclBufferLayoutSlotFlags
-from .hclBufferLayoutTriangleFormat import hclBufferLayoutTriangleFormat
-from .hclBufferUsage import hclBufferUsage
-from .hclCapsuleShape import hclCapsuleShape
-from .hclClothContainer import hclClothContainer
-from .hclClothData import hclClothData
-from .hclClothDataPlatform import hclClothDataPlatform
-from .hclClothState import hclClothState
-from .hclClothStateBufferAccess import hclClothStateBufferAccess
-from .hclClothStateTransformSetAccess import hclClothStateTransformSetAccess
-from .hclCollidable import hclCollidable
-from .hclConstraintSet import hclConstraintSet
-from .hclCopyVerticesOperator import hclCopyVerticesOperator
-from .hclGatherAllVerticesOperator import hclGatherAllVerticesOperator
-from .hclInputConvertOperator import hclInputConvertOperator
-from .hclLocalRangeConstraintSet import hclLocalRangeConstraintSet
-from .hclLocalRangeConstraintSetLocalConstraint import hclLocalRangeConstraintSetLocalConstraint
-from .hclLocalRangeConstraintSetShapeType import hclLocalRangeConstraintSetShapeType
-from .hclMoveParticlesOperator import hclMoveParticlesOperator
-from .hclMoveParticlesOperatorVertexParticlePair import hclMoveParticlesOperatorVertexParticlePair
-from .hclObjectSpaceDeformer import hclObjectSpaceDeformer
-from .hclObjectSpaceDeformerEightBlendEntryBlock import hclObjectSpaceDeformerEightBlendEntryBlock
-from .hclObjectSpaceDeformerFiveBlendEntryBlock import hclObjectSpaceDeformerFiveBlendEntryBlock
-from .hclObjectSpaceDeformerFourBlendEntryBlock import hclObjectSpaceDeformerFourBlendEntryBlock
-from .hclObjectSpaceDeformerLocalBlockP import hclObjectSpaceDeformerLocalBlockP
-from .hclObjectSpaceDeformerLocalBlockPN import hclObjectSpaceDeformerLocalBlockPN
-from .hclObjectSpaceDeformerLocalBlockPNT import hclObjectSpaceDeformerLocalBlockPNT
-from .hclObjectSpaceDeformerLocalBlockUnpackedP import hclObjectSpaceDeformerLocalBlockUnpackedP
-from .hclObjectSpaceDeformerLocalBlockUnpackedPN import hclObjectSpaceDeformerLocalBlockUnpackedPN
-from .hclObjectSpaceDeformerLocalBlockUnpackedPNT import hclObjectSpaceDeformerLocalBlockUnpackedPNT
-from .hclObjectSpaceDeformerOneBlendEntryBlock import hclObjectSpaceDeformerOneBlendEntryBlock
-from .hclObjectSpaceDeformerSevenBlendEntryBlock import hclObjectSpaceDeformerSevenBlendEntryBlock
-from .hclObjectSpaceDeformerSixBlendEntryBlock import hclObjectSpaceDeformerSixBlendEntryBlock
-from .hclObjectSpaceDeformerThreeBlendEntryBlock import hclObjectSpaceDeformerThreeBlendEntryBlock
-from .hclObjectSpaceDeformerTwoBlendEntryBlock import hclObjectSpaceDeformerTwoBlendEntryBlock
-from .hclObjectSpaceMeshMeshDeformOperator import hclObjectSpaceMeshMeshDeformOperator
-from .hclObjectSpaceMeshMeshDeformOperatorScaleNormalBehaviour import hclObjectSpaceMeshMeshDeformOperatorScaleNormalBehaviour
-from .hclObjectSpaceMeshMeshDeformPOperator import hclObjectSpaceMeshMeshDeformPOperator
-from .hclObjectSpaceSkinOperator import hclObjectSpaceSkinOperator
-from .hclObjectSpaceSkinPNOperator import hclObjectSpaceSkinPNOperator
-from .hclObjectSpaceSkinPNTOperator import hclObjectSpaceSkinPNTOperator
-from .hclOperator import hclOperator
-from .hclOutputConvertOperator import hclOutputConvertOperator
-from .hclRuntimeConversionInfo import hclRuntimeConversionInfo
-from .hclRuntimeConversionInfoElementConversion import hclRuntimeConversionInfoElementConversion
-from .hclRuntimeConversionInfoSlotConversion import hclRuntimeConversionInfoSlotConversion
-from .hclRuntimeConversionInfoVectorConversion import hclRuntimeConversionInfoVectorConversion
-from .hclScratchBufferDefinition import hclScratchBufferDefinition
-from .hclShadowBufferDefinition import hclShadowBufferDefinition
-from .hclShape import hclShape
-from .hclSimClothData import hclSimClothData
-from .hclSimClothDataCollidablePinchingData import hclSimClothDataCollidablePinchingData
-from .hclSimClothDataCollidableTransformMap import hclSimClothDataCollidableTransformMap
-from .hclSimClothDataLandscapeCollisionData import hclSimClothDataLandscapeCollisionData
-from .hclSimClothDataOverridableSimulationInfo import hclSimClothDataOverridableSimulationInfo
-from .hclSimClothDataParticleData import hclSimClothDataParticleData
-from .hclSimClothDataTransferMotionData import hclSimClothDataTransferMotionData
-from .hclSimClothPose import hclSimClothPose
-from .hclSimpleMeshBoneDeformOperator import hclSimpleMeshBoneDeformOperator
-from .hclSimpleMeshBoneDeformOperatorTriangleBonePair import hclSimpleMeshBoneDeformOperatorTriangleBonePair
-from .hclSimulateOperator import hclSimulateOperator
-from .hclSimulateOperatorConfig import hclSimulateOperatorConfig
-from .hclStandardLinkConstraintSet import hclStandardLinkConstraintSet
-from .hclStandardLinkConstraintSetLink import hclStandardLinkConstraintSetLink
-from .hclStateDependencyGraph import hclStateDependencyGraph
-from .hclStateDependencyGraphBranch import hclStateDependencyGraphBranch
-from .hclStateTransition import hclStateTransition
-from .hclStateTransitionBlendOpTransitionData import hclStateTransitionBlendOpTransitionData
-from .hclStateTransitionSimClothTransitionData import hclStateTransitionSimClothTransitionData
-from .hclStateTransitionStateTransitionData import hclStateTransitionStateTransitionData
-from .hclStateTransitionTransitionType import hclStateTransitionTransitionType
-from .hclStretchLinkConstraintSet import hclStretchLinkConstraintSet
-from .hclStretchLinkConstraintSetLink import hclStretchLinkConstraintSetLink
-from .hclTaperedCapsuleShape import hclTaperedCapsuleShape
-from .hclTransformSetDefinition import hclTransformSetDefinition
-from .hclTransformSetUsage import hclTransformSetUsage
-from .hclTransformSetUsageTransformTracker import hclTransformSetUsageTransformTracker
-from .hclTransitionConstraintSet import hclTransitionConstraintSet
-from .hclTransitionConstraintSetPerParticle import hclTransitionConstraintSetPerParticle
-from .hclUpdateAllVertexFramesOperator import hclUpdateAllVertexFramesOperator
-from .hclVirtualCollisionPointsData import hclVirtualCollisionPointsData
-from .hclVirtualCollisionPointsDataBarycentricDictionaryEntry import hclVirtualCollisionPointsDataBarycentricDictionaryEntry
-from .hclVirtualCollisionPointsDataBarycentricPair import hclVirtualCollisionPointsDataBarycentricPair
-from .hclVirtualCollisionPointsDataBlock import hclVirtualCollisionPointsDataBlock
-from .hclVirtualCollisionPointsDataEdgeFan import hclVirtualCollisionPointsDataEdgeFan
-from .hclVirtualCollisionPointsDataEdgeFanLandscape import hclVirtualCollisionPointsDataEdgeFanLandscape
-from .hclVirtualCollisionPointsDataEdgeFanSection import hclVirtualCollisionPointsDataEdgeFanSection
-from .hclVirtualCollisionPointsDataTriangleFan import hclVirtualCollisionPointsDataTriangleFan
-from .hclVirtualCollisionPointsDataTriangleFanLandscape import hclVirtualCollisionPointsDataTriangleFanLandscape
-from .hclVirtualCollisionPointsDataTriangleFanSection import hclVirtualCollisionPointsDataTriangleFanSection
+import typing as tp
+
+if tp.TYPE_CHECKING:
+    from .hclAction import hclAction
+    from .hclBendStiffnessConstraintSet import hclBendStiffnessConstraintSet
+    from .hclBendStiffnessConstraintSetLink import hclBendStiffnessConstraintSetLink
+    from .hclBlendSomeVerticesOperatorBlendWeightType import hclBlendSomeVerticesOperatorBlendWeightType
+    from .hclBoneSpaceDeformer import hclBoneSpaceDeformer
+    from .hclBoneSpaceDeformerFourBlendEntryBlock import hclBoneSpaceDeformerFourBlendEntryBlock
+    from .hclBoneSpaceDeformerLocalBlockP import hclBoneSpaceDeformerLocalBlockP
+    from .hclBoneSpaceDeformerLocalBlockUnpackedP import hclBoneSpaceDeformerLocalBlockUnpackedP
+    from .hclBoneSpaceDeformerOneBlendEntryBlock import hclBoneSpaceDeformerOneBlendEntryBlock
+    from .hclBoneSpaceDeformerThreeBlendEntryBlock import hclBoneSpaceDeformerThreeBlendEntryBlock
+    from .hclBoneSpaceDeformerTwoBlendEntryBlock import hclBoneSpaceDeformerTwoBlendEntryBlock
+    from .hclBoneSpaceMeshMeshDeformOperator import hclBoneSpaceMeshMeshDeformOperator
+    from .hclBoneSpaceMeshMeshDeformOperatorScaleNormalBehaviour import (
+        hclBoneSpaceMeshMeshDeformOperatorScaleNormalBehaviour
+    )
+    from .hclBoneSpaceMeshMeshDeformPOperator import hclBoneSpaceMeshMeshDeformPOperator
+    from .hclBufferDefinition import hclBufferDefinition
+    from .hclBufferLayout import hclBufferLayout
+    from .hclBufferLayoutBufferElement import hclBufferLayoutBufferElement
+    from .hclBufferLayoutSlot import hclBufferLayoutSlot
+    from .hclBufferLayoutSlotFlags import hclBufferLayoutSlotFlags
+    from .hclBufferLayoutTriangleFormat import hclBufferLayoutTriangleFormat
+    from .hclBufferUsage import hclBufferUsage
+    from .hclCapsuleShape import hclCapsuleShape
+    from .hclClothContainer import hclClothContainer
+    from .hclClothData import hclClothData
+    from .hclClothDataPlatform import hclClothDataPlatform
+    from .hclClothState import hclClothState
+    from .hclClothStateBufferAccess import hclClothStateBufferAccess
+    from .hclClothStateTransformSetAccess import hclClothStateTransformSetAccess
+    from .hclCollidable import hclCollidable
+    from .hclConstraintSet import hclConstraintSet
+    from .hclCopyVerticesOperator import hclCopyVerticesOperator
+    from .hclGatherAllVerticesOperator import hclGatherAllVerticesOperator
+    from .hclInputConvertOperator import hclInputConvertOperator
+    from .hclLocalRangeConstraintSet import hclLocalRangeConstraintSet
+    from .hclLocalRangeConstraintSetLocalConstraint import hclLocalRangeConstraintSetLocalConstraint
+    from .hclLocalRangeConstraintSetShapeType import hclLocalRangeConstraintSetShapeType
+    from .hclMoveParticlesOperator import hclMoveParticlesOperator
+    from .hclMoveParticlesOperatorVertexParticlePair import hclMoveParticlesOperatorVertexParticlePair
+    from .hclObjectSpaceDeformer import hclObjectSpaceDeformer
+    from .hclObjectSpaceDeformerEightBlendEntryBlock import hclObjectSpaceDeformerEightBlendEntryBlock
+    from .hclObjectSpaceDeformerFiveBlendEntryBlock import hclObjectSpaceDeformerFiveBlendEntryBlock
+    from .hclObjectSpaceDeformerFourBlendEntryBlock import hclObjectSpaceDeformerFourBlendEntryBlock
+    from .hclObjectSpaceDeformerLocalBlockP import hclObjectSpaceDeformerLocalBlockP
+    from .hclObjectSpaceDeformerLocalBlockPN import hclObjectSpaceDeformerLocalBlockPN
+    from .hclObjectSpaceDeformerLocalBlockPNT import hclObjectSpaceDeformerLocalBlockPNT
+    from .hclObjectSpaceDeformerLocalBlockUnpackedP import hclObjectSpaceDeformerLocalBlockUnpackedP
+    from .hclObjectSpaceDeformerLocalBlockUnpackedPN import hclObjectSpaceDeformerLocalBlockUnpackedPN
+    from .hclObjectSpaceDeformerLocalBlockUnpackedPNT import hclObjectSpaceDeformerLocalBlockUnpackedPNT
+    from .hclObjectSpaceDeformerOneBlendEntryBlock import hclObjectSpaceDeformerOneBlendEntryBlock
+    from .hclObjectSpaceDeformerSevenBlendEntryBlock import hclObjectSpaceDeformerSevenBlendEntryBlock
+    from .hclObjectSpaceDeformerSixBlendEntryBlock import hclObjectSpaceDeformerSixBlendEntryBlock
+    from .hclObjectSpaceDeformerThreeBlendEntryBlock import hclObjectSpaceDeformerThreeBlendEntryBlock
+    from .hclObjectSpaceDeformerTwoBlendEntryBlock import hclObjectSpaceDeformerTwoBlendEntryBlock
+    from .hclObjectSpaceMeshMeshDeformOperator import hclObjectSpaceMeshMeshDeformOperator
+    from .hclObjectSpaceMeshMeshDeformOperatorScaleNormalBehaviour import (
+        hclObjectSpaceMeshMeshDeformOperatorScaleNormalBehaviour
+    )
+    from .hclObjectSpaceMeshMeshDeformPOperator import hclObjectSpaceMeshMeshDeformPOperator
+    from .hclObjectSpaceSkinOperator import hclObjectSpaceSkinOperator
+    from .hclObjectSpaceSkinPNOperator import hclObjectSpaceSkinPNOperator
+    from .hclObjectSpaceSkinPNTOperator import hclObjectSpaceSkinPNTOperator
+    from .hclOperator import hclOperator
+    from .hclOutputConvertOperator import hclOutputConvertOperator
+    from .hclRuntimeConversionInfo import hclRuntimeConversionInfo
+    from .hclRuntimeConversionInfoElementConversion import hclRuntimeConversionInfoElementConversion
+    from .hclRuntimeConversionInfoSlotConversion import hclRuntimeConversionInfoSlotConversion
+    from .hclRuntimeConversionInfoVectorConversion import hclRuntimeConversionInfoVectorConversion
+    from .hclScratchBufferDefinition import hclScratchBufferDefinition
+    from .hclShadowBufferDefinition import hclShadowBufferDefinition
+    from .hclShape import hclShape
+    from .hclSimClothData import hclSimClothData
+    from .hclSimClothDataCollidablePinchingData import hclSimClothDataCollidablePinchingData
+    from .hclSimClothDataCollidableTransformMap import hclSimClothDataCollidableTransformMap
+    from .hclSimClothDataLandscapeCollisionData import hclSimClothDataLandscapeCollisionData
+    from .hclSimClothDataOverridableSimulationInfo import hclSimClothDataOverridableSimulationInfo
+    from .hclSimClothDataParticleData import hclSimClothDataParticleData
+    from .hclSimClothDataTransferMotionData import hclSimClothDataTransferMotionData
+    from .hclSimClothPose import hclSimClothPose
+    from .hclSimpleMeshBoneDeformOperator import hclSimpleMeshBoneDeformOperator
+    from .hclSimpleMeshBoneDeformOperatorTriangleBonePair import hclSimpleMeshBoneDeformOperatorTriangleBonePair
+    from .hclSimulateOperator import hclSimulateOperator
+    from .hclSimulateOperatorConfig import hclSimulateOperatorConfig
+    from .hclStandardLinkConstraintSet import hclStandardLinkConstraintSet
+    from .hclStandardLinkConstraintSetLink import hclStandardLinkConstraintSetLink
+    from .hclStateDependencyGraph import hclStateDependencyGraph
+    from .hclStateDependencyGraphBranch import hclStateDependencyGraphBranch
+    from .hclStateTransition import hclStateTransition
+    from .hclStateTransitionBlendOpTransitionData import hclStateTransitionBlendOpTransitionData
+    from .hclStateTransitionSimClothTransitionData import hclStateTransitionSimClothTransitionData
+    from .hclStateTransitionStateTransitionData import hclStateTransitionStateTransitionData
+    from .hclStateTransitionTransitionType import hclStateTransitionTransitionType
+    from .hclStretchLinkConstraintSet import hclStretchLinkConstraintSet
+    from .hclStretchLinkConstraintSetLink import hclStretchLinkConstraintSetLink
+    from .hclTaperedCapsuleShape import hclTaperedCapsuleShape
+    from .hclTransformSetDefinition import hclTransformSetDefinition
+    from .hclTransformSetUsage import hclTransformSetUsage
+    from .hclTransformSetUsageTransformTracker import hclTransformSetUsageTransformTracker
+    from .hclTransitionConstraintSet import hclTransitionConstraintSet
+    from .hclTransitionConstraintSetPerParticle import hclTransitionConstraintSetPerParticle
+    from .hclUpdateAllVertexFramesOperator import hclUpdateAllVertexFramesOperator
+    from .hclVirtualCollisionPointsData import hclVirtualCollisionPointsData
+    from .hclVirtualCollisionPointsDataBarycentricDictionaryEntry import (
+        hclVirtualCollisionPointsDataBarycentricDictionaryEntry
+    )
+    from .hclVirtualCollisionPointsDataBarycentricPair import hclVirtualCollisionPointsDataBarycentricPair
+    from .hclVirtualCollisionPointsDataBlock import hclVirtualCollisionPointsDataBlock
+    from .hclVirtualCollisionPointsDataEdgeFan import hclVirtualCollisionPointsDataEdgeFan
+    from .hclVirtualCollisionPointsDataEdgeFanLandscape import hclVirtualCollisionPointsDataEdgeFanLandscape
+    from .hclVirtualCollisionPointsDataEdgeFanSection import hclVirtualCollisionPointsDataEdgeFanSection
+    from .hclVirtualCollisionPointsDataTriangleFan import hclVirtualCollisionPointsDataTriangleFan
+    from .hclVirtualCollisionPointsDataTriangleFanLandscape import hclVirtualCollisionPointsDataTriangleFanLandscape
+    from .hclVirtualCollisionPointsDataTriangleFanSection import hclVirtualCollisionPointsDataTriangleFanSection
@@ -1,24 +1,27 @@
-from .hkaiAnnotatedStreamingSet import hkaiAnnotatedStreamingSet
-from .hkaiAnnotatedStreamingSetSide import hkaiAnnotatedStreamingSetSide
-from .hkaiFaceEdgeIndexPair import hkaiFaceEdgeIndexPair
-from .hkaiIndex import hkaiIndex
-from .hkaiNavMesh import hkaiNavMesh
-from .hkaiNavMeshFace import hkaiNavMeshFace
-from .hkaiNavMeshEdge import hkaiNavMeshEdge
-from .hkaiNavMeshClearanceCache import hkaiNavMeshClearanceCache
-from .hkaiNavMeshClearanceCacheMcpDataInteger import hkaiNavMeshClearanceCacheMcpDataInteger
-from .hkaiNavMeshClearanceCacheSeedingCacheData import hkaiNavMeshClearanceCacheSeedingCacheData
-from .hkaiNavMeshClearanceCacheSeedingCacheDataSet import hkaiNavMeshClearanceCacheSeedingCacheDataSet
-from .hkaiNavMeshEdgeFlagBits import hkaiNavMeshEdgeFlagBits
-from .hkaiNavMeshQueryMediator import hkaiNavMeshQueryMediator
-from .hkaiPackedKey_ import hkaiPackedKey_
-from .hkaiStaticTreeNavMeshQueryMediator import hkaiStaticTreeNavMeshQueryMediator
-from .hkaiStreamingSet import hkaiStreamingSet
-from .hkaiStreamingSetNavMeshConnection import hkaiStreamingSetNavMeshConnection
-from .hkaiStreamingSetGraphConnection import hkaiStreamingSetGraphConnection
-from .hkaiStreamingSetVolumeConnection import hkaiStreamingSetVolumeConnection
-from .hkaiUserEdgeSetupArray import hkaiUserEdgeSetupArray
-from .hkaiUserEdgeUtilsUserEdgeSetup import hkaiUserEdgeUtilsUserEdgeSetup
-from .hkaiUserEdgeUtilsObb import hkaiUserEdgeUtilsObb
-from .hkaiUserEdgeUtilsUserEdgeDirection import hkaiUserEdgeUtilsUserEdgeDirection
-from .hkaiUserEdgeUtilsUserEdgeSetupSpace import hkaiUserEdgeUtilsUserEdgeSetupSpace
+import typing as tp
+
+if tp.TYPE_CHECKING:
+    from .hkaiAnnotatedStreamingSet import hkaiAnnotatedStreamingSet
+    from .hkaiAnnotatedStreamingSetSide import hkaiAnnotatedStreamingSetSide
+    from .hkaiFaceEdgeIndexPair import hkaiFaceEdgeIndexPair
+    from .hkaiIndex import hkaiIndex
+    from .hkaiNavMesh import hkaiNavMesh
+    from .hkaiNavMeshFace import hkaiNavMeshFace
+    from .hkaiNavMeshEdge import hkaiNavMeshEdge
+    from .hkaiNavMeshClearanceCache import hkaiNavMeshClearanceCache
+    from .hkaiNavMeshClearanceCacheMcpDataInteger import hkaiNavMeshClearanceCacheMcpDataInteger
+    from .hkaiNavMeshClearanceCacheSeedingCacheData import hkaiNavMeshClearanceCacheSeedingCacheData
+    from .hkaiNavMeshClearanceCacheSeedingCacheDataSet import hkaiNavMeshClearanceCacheSeedingCacheDataSet
+    from .hkaiNavMeshEdgeFlagBits import hkaiNavMeshEdgeFlagBits
+    from .hkaiNavMeshQueryMediator import hkaiNavMeshQueryMediator
+    from .hkaiPackedKey_ import hkaiPackedKey_
+    from .hkaiStaticTreeNavMeshQueryMediator import hkaiStaticTreeNavMeshQueryMediator
+    from .hkaiStreamingSet import hkaiStreamingSet
+    from .hkaiStreamingSetNavMeshConnection import hkaiStreamingSetNavMeshConnection
+    from .hkaiStreamingSetGraphConnection import hkaiStreamingSetGraphConnection
+    from .hkaiStreamingSetVolumeConnection import hkaiStreamingSetVolumeConnection
+    from .hkaiUserEdgeSetupArray import hkaiUserEdgeSetupArray
+    from .hkaiUserEdgeUtilsUserEdgeSetup import hkaiUserEdgeUtilsUserEdgeSetup
+    from .hkaiUserEdgeUtilsObb import hkaiUserEdgeUtilsObb
+    from .hkaiUserEdgeUtilsUserEdgeDirection import hkaiUserEdgeUtilsUserEdgeDirection
+    from .hkaiUserEdgeUtilsUserEdgeSetupSpace import hkaiUserEdgeUtilsUserEdgeSetupSpace
@@ -1,73 +1,78 @@
-from .hkbProjectData import hkbProjectData
-from .hkbProjectStringData import hkbProjectStringData
-from .hkbTransitionEffectEventMode import hkbTransitionEffectEventMode
-from .hkbBehaviorGraph import hkbBehaviorGraph
-from .hkbGenerator import hkbGenerator
-from .hkbNode import hkbNode
-from .hkbGeneratorPartitionInfo import hkbGeneratorPartitionInfo
-from .hkbBehaviorGraphVariableMode import hkbBehaviorGraphVariableMode
-from .hkbBehaviorGraphData import hkbBehaviorGraphData
-from .hkbBindable import hkbBindable
-from .hkbVerifiable import hkbVerifiable
-from .hkbNodeCloneState import hkbNodeCloneState
-from .hkbNodeType import hkbNodeType
-from .hkbVariableInfo import hkbVariableInfo
-from .hkbEventInfo import hkbEventInfo
-from .hkbVariableBounds import hkbVariableBounds
-from .hkbVariableValueSet import hkbVariableValueSet
-from .hkbBehaviorGraphStringData import hkbBehaviorGraphStringData
-from .hkbVariableBindingSet import hkbVariableBindingSet
-from .hkbRoleAttribute import hkbRoleAttribute
-from .hkbVariableValue import hkbVariableValue
-from .hkbVariableInfoVariableType import hkbVariableInfoVariableType
-from .hkbEventInfoFlags import hkbEventInfoFlags
-from .hkbVariableBindingSetBinding import hkbVariableBindingSetBinding
-from .hkbRoleAttributeRole import hkbRoleAttributeRole
-from .hkbRoleAttributeRoleFlags import hkbRoleAttributeRoleFlags
-from .hkbVariableBindingSetBindingBindingType import hkbVariableBindingSetBindingBindingType
-from .hkbVariableBindingSetBindingInternalBindingFlags import hkbVariableBindingSetBindingInternalBindingFlags
-from .hkbStateMachine import hkbStateMachine
-from .hkbEvent import hkbEvent
-from .hkbEventBase import hkbEventBase
-from .hkbCustomIdSelector import hkbCustomIdSelector
-from .hkbStateMachineStartStateMode import hkbStateMachineStartStateMode
-from .hkbStateMachineStateMachineSelfTransitionMode import hkbStateMachineStateMachineSelfTransitionMode
-from .hkbStateMachineTransitionInfoArray import hkbStateMachineTransitionInfoArray
-from .hkbStateMachineStateInfo import hkbStateMachineStateInfo
-from .hkbEventPayload import hkbEventPayload
-from .hkbStateMachineTransitionInfo import hkbStateMachineTransitionInfo
-from .hkbStateMachineEventPropertyArray import hkbStateMachineEventPropertyArray
-from .hkbStateMachineTimeInterval import hkbStateMachineTimeInterval
-from .hkbStateListener import hkbStateListener
-from .hkbTransitionEffect import hkbTransitionEffect
-from .hkbCondition import hkbCondition
-from .hkbStateMachineTransitionInfoTransitionFlags import hkbStateMachineTransitionInfoTransitionFlags
-from .hkbEventProperty import hkbEventProperty
-from .hkbTransitionEffectSelfTransitionMode import hkbTransitionEffectSelfTransitionMode
-from .hkbBlendingTransitionEffect import hkbBlendingTransitionEffect
-from .hkbBlendingTransitionEffectFlagBits import hkbBlendingTransitionEffectFlagBits
-from .hkbBlendingTransitionEffectEndMode import hkbBlendingTransitionEffectEndMode
-from .hkbBlendCurveUtilsBlendCurve import hkbBlendCurveUtilsBlendCurve
-from .hkbScriptGenerator import hkbScriptGenerator
-from .hkbModifierGenerator import hkbModifierGenerator
-from .hkbModifier import hkbModifier
-from .hkbModifierList import hkbModifierList
-from .hkbBlenderGenerator import hkbBlenderGenerator
-from .hkbBlenderGeneratorChild import hkbBlenderGeneratorChild
-from .hkbBoneWeightArray import hkbBoneWeightArray
-from .hkbKeyframeBonesModifier import hkbKeyframeBonesModifier
-from .hkbKeyframeBonesModifierKeyframeInfo import hkbKeyframeBonesModifierKeyframeInfo
-from .hkbBoneIndexArray import hkbBoneIndexArray
-from .hkbLayerGenerator import hkbLayerGenerator
-from .hkbLayerGeneratorLayerFlagBits import hkbLayerGeneratorLayerFlagBits
-from .hkbLayer import hkbLayer
-from .hkbEventDrivenBlendingObject import hkbEventDrivenBlendingObject
-from .hkbEventDrivenBlendingObjectInternalState import hkbEventDrivenBlendingObjectInternalState
-from .hkbEventDrivenBlendingObjectInternalStateFadingState import hkbEventDrivenBlendingObjectInternalStateFadingState
-from .hkbManualSelectorGenerator import hkbManualSelectorGenerator
-from .hkbClipGenerator import hkbClipGenerator
-from .hkbClipTriggerArray import hkbClipTriggerArray
-from .hkbClipGeneratorPlaybackMode import hkbClipGeneratorPlaybackMode
-from .hkbClipTrigger import hkbClipTrigger
-from .hkbReferencePoseGenerator import hkbReferencePoseGenerator
-from .hkbHoldFromBlendingTransitionEffect import hkbHoldFromBlendingTransitionEffect
+import typing as tp
+
+if tp.TYPE_CHECKING:
+    from .hkbProjectData import hkbProjectData
+    from .hkbProjectStringData import hkbProjectStringData
+    from .hkbTransitionEffectEventMode import hkbTransitionEffectEventMode
+    from .hkbBehaviorGraph import hkbBehaviorGraph
+    from .hkbGenerator import hkbGenerator
+    from .hkbNode import hkbNode
+    from .hkbGeneratorPartitionInfo import hkbGeneratorPartitionInfo
+    from .hkbBehaviorGraphVariableMode import hkbBehaviorGraphVariableMode
+    from .hkbBehaviorGraphData import hkbBehaviorGraphData
+    from .hkbBindable import hkbBindable
+    from .hkbVerifiable import hkbVerifiable
+    from .hkbNodeCloneState import hkbNodeCloneState
+    from .hkbNodeType import hkbNodeType
+    from .hkbVariableInfo import hkbVariableInfo
+    from .hkbEventInfo import hkbEventInfo
+    from .hkbVariableBounds import hkbVariableBounds
+    from .hkbVariableValueSet import hkbVariableValueSet
+    from .hkbBehaviorGraphStringData import hkbBehaviorGraphStringData
+    from .hkbVariableBindingSet import hkbVariableBindingSet
+    from .hkbRoleAttribute import hkbRoleAttribute
+    from .hkbVariableValue import hkbVariableValue
+    from .hkbVariableInfoVariableType import hkbVariableInfoVariableType
+    from .hkbEventInfoFlags import hkbEventInfoFlags
+    from .hkbVariableBindingSetBinding import hkbVariableBindingSetBinding
+    from .hkbRoleAttributeRole import hkbRoleAttributeRole
+    from .hkbRoleAttributeRoleFlags import hkbRoleAttributeRoleFlags
+    from .hkbVariableBindingSetBindingBindingType import hkbVariableBindingSetBindingBindingType
+    from .hkbVariableBindingSetBindingInternalBindingFlags import hkbVariableBindingSetBindingInternalBindingFlags
+    from .hkbStateMachine import hkbStateMachine
+    from .hkbEvent import hkbEvent
+    from .hkbEventBase import hkbEventBase
+    from .hkbCustomIdSelector import hkbCustomIdSelector
+    from .hkbStateMachineStartStateMode import hkbStateMachineStartStateMode
+    from .hkbStateMachineStateMachineSelfTransitionMode import hkbStateMachineStateMachineSelfTransitionMode
+    from .hkbStateMachineTransitionInfoArray import hkbStateMachineTransitionInfoArray
+    from .hkbStateMachineStateInfo import hkbStateMachineStateInfo
+    from .hkbEventPayload import hkbEventPayload
+    from .hkbStateMachineTransitionInfo import hkbStateMachineTransitionInfo
+    from .hkbStateMachineEventPropertyArray import hkbStateMachineEventPropertyArray
+    from .hkbStateMachineTimeInterval import hkbStateMachineTimeInterval
+    from .hkbStateListener import hkbStateListener
+    from .hkbTransitionEffect import hkbTransitionEffect
+    from .hkbCondition import hkbCondition
+    from .hkbStateMachineTransitionInfoTransitionFlags import hkbStateMachineTransitionInfoTransitionFlags
+    from .hkbEventProperty import hkbEventProperty
+    from .hkbTransitionEffectSelfTransitionMode import hkbTransitionEffectSelfTransitionMode
+    from .hkbBlendingTransitionEffect import hkbBlendingTransitionEffect
+    from .hkbBlendingTransitionEffectFlagBits import hkbBlendingTransitionEffectFlagBits
+    from .hkbBlendingTransitionEffectEndMode import hkbBlendingTransitionEffectEndMode
+    from .hkbBlendCurveUtilsBlendCurve import hkbBlendCurveUtilsBlendCurve
+    from .hkbScriptGenerator import hkbScriptGenerator
+    from .hkbModifierGenerator import hkbModifierGenerator
+    from .hkbModifier import hkbModifier
+    from .hkbModifierList import hkbModifierList
+    from .hkbBlenderGenerator import hkbBlenderGenerator
+    from .hkbBlenderGeneratorChild import hkbBlenderGeneratorChild
+    from .hkbBoneWeightArray import hkbBoneWeightArray
+    from .hkbKeyframeBonesModifier import hkbKeyframeBonesModifier
+    from .hkbKeyframeBonesModifierKeyframeInfo import hkbKeyframeBonesModifierKeyframeInfo
+    from .hkbBoneIndexArray import hkbBoneIndexArray
+    from .hkbLayerGenerator import hkbLayerGenerator
+    from .hkbLayerGeneratorLayerFlagBits import hkbLayerGeneratorLayerFlagBits
+    from .hkbLayer import hkbLayer
+    from .hkbEventDrivenBlendingObject import hkbEventDrivenBlendingObject
+    from .hkbEventDrivenBlendingObjectInternalState import hkbEventDrivenBlendingObjectInternalState
+    from .hkbEventDrivenBlendingObjectInternalStateFadingState import (
+        hkbEventDrivenBlendingObjectInternalStateFadingState
+    )
+    from .hkbManualSelectorGenerator import hkbManualSelectorGenerator
+    from .hkbClipGenerator import hkbClipGenerator
+    from .hkbClipTriggerArray import hkbClipTriggerArray
+    from .hkbClipGeneratorPlaybackMode import hkbClipGeneratorPlaybackMode
+    from .hkbClipTrigger import hkbClipTrigger
+    from .hkbReferencePoseGenerator import hkbReferencePoseGenerator
+    from .hkbHoldFromBlendingTransitionEffect import hkbHoldFromBlendingTransitionEffect
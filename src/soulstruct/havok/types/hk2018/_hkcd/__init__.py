@@ -1,8 +1,11 @@
-from .hkcdStaticAabbTree import hkcdStaticAabbTree
-from .hkcdStaticAabbTreeImpl import hkcdStaticAabbTreeImpl
-from .hkcdStaticTreeAabb6BytesTree import hkcdStaticTreeAabb6BytesTree
-from .hkcdStaticTreeAabbTree import hkcdStaticTreeAabbTree
-from .hkcdStaticTreeAabbTreeBase import hkcdStaticTreeAabbTreeBase
-from .hkcdCompressedAabbCodecsAabb6BytesCodec import hkcdCompressedAabbCodecsAabb6BytesCodec
-from .hkcdCompressedAabbCodecsCompressedAabbCodec import hkcdCompressedAabbCodecsCompressedAabbCodec
-from .hkcdCompressedAabbCodecsAabbCodecBase import hkcdCompressedAabbCodecsAabbCodecBase
+import typing as tp
+
+if tp.TYPE_CHECKING:
+    from .hkcdStaticAabbTree import hkcdStaticAabbTree
+    from .hkcdStaticAabbTreeImpl import hkcdStaticAabbTreeImpl
+    from .hkcdStaticTreeAabb6BytesTree import hkcdStaticTreeAabb6BytesTree
+    from .hkcdStaticTreeAabbTree import hkcdStaticTreeAabbTree
+    from .hkcdStaticTreeAabbTreeBase import hkcdStaticTreeAabbTreeBase
+    from .hkcdCompressedAabbCodecsAabb6BytesCodec import hkcdCompressedAabbCodecsAabb6BytesCodec
+    from .hkcdCompressedAabbCodecsCompressedAabbCodec import hkcdCompressedAabbCodecsCompressedAabbCodec
+    from .hkcdCompressedAabbCodecsAabbCodecBase import hkcdCompressedAabbCodecsAabbCodecBase
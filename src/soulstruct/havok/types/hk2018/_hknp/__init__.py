@@ -1,51 +1,54 @@
-from .hknpBodyCinfo import hknpBodyCinfo
-from .hknpBodyId import hknpBodyId
-from .hknpBodyIntegrator import hknpBodyIntegrator
-from .hknpBodyQuality import hknpBodyQuality
-from .hknpBodyQualityFlagsEnum import hknpBodyQualityFlagsEnum
-from .hknpBodyQualityLibrary import hknpBodyQualityLibrary
-from .hknpBroadPhaseConfig import hknpBroadPhaseConfig
-from .hknpCapsuleShape import hknpCapsuleShape
-from .hknpCollisionDispatchTypeEnum import hknpCollisionDispatchTypeEnum
-from .hknpCollisionFilter import hknpCollisionFilter
-from .hknpCollisionFilterType import hknpCollisionFilterType
-from .hknpConstraintCinfo import hknpConstraintCinfo
-from .hknpConstraintFlagsEnum import hknpConstraintFlagsEnum
-from .hknpConstraintGroupId import hknpConstraintGroupId
-from .hknpConstraintId import hknpConstraintId
-from .hknpConvexPolytopeShape import hknpConvexPolytopeShape
-from .hknpConvexPolytopeShapeConnectivity import hknpConvexPolytopeShapeConnectivity
-from .hknpConvexPolytopeShapeConnectivityEdge import hknpConvexPolytopeShapeConnectivityEdge
-from .hknpConvexPolytopeShapeFace import hknpConvexPolytopeShapeFace
-from .hknpConvexShape import hknpConvexShape
-from .hknpDragProperties import hknpDragProperties
-from .hknpLodManagerCinfo import hknpLodManagerCinfo
-from .hknpManifoldTypeEnum import hknpManifoldTypeEnum
-from .hknpMassDistribution import hknpMassDistribution
-from .hknpMaterial import hknpMaterial
-from .hknpMaterialCombinePolicy import hknpMaterialCombinePolicy
-from .hknpMaterialLibrary import hknpMaterialLibrary
-from .hknpMaterialMassChangerCategory import hknpMaterialMassChangerCategory
-from .hknpMaterialTriggerType import hknpMaterialTriggerType
-from .hknpMotionProperties import hknpMotionProperties
-from .hknpMotionPropertiesDeactivationSettings import hknpMotionPropertiesDeactivationSettings
-from .hknpMotionPropertiesFullCastSettings import hknpMotionPropertiesFullCastSettings
-from .hknpMotionPropertiesLibrary import hknpMotionPropertiesLibrary
-from .hknpMotionRangeBreachPolicyEnum import hknpMotionRangeBreachPolicyEnum
-from .hknpPhysicsSceneData import hknpPhysicsSceneData
-from .hknpPhysicsSystemData import hknpPhysicsSystemData
-from .hknpPhysicsSystemDatabodyCinfoWithAttachment import hknpPhysicsSystemDatabodyCinfoWithAttachment
-from .hknpRagdollData import hknpRagdollData
-from .hknpRefDragProperties import hknpRefDragProperties
-from .hknpRefMassDistribution import hknpRefMassDistribution
-from .hknpRefWorldCinfo import hknpRefWorldCinfo
-from .hknpShape import hknpShape
-from .hknpShapeFlagsEnum import hknpShapeFlagsEnum
-from .hknpShapeMassProperties import hknpShapeMassProperties
-from .hknpShapeTagCodec import hknpShapeTagCodec
-from .hknpShapeTagCodecHints import hknpShapeTagCodecHints
-from .hknpShapeTagCodecType import hknpShapeTagCodecType
-from .hknpShapeTypeEnum import hknpShapeTypeEnum
-from .hknpSurfaceVelocity import hknpSurfaceVelocity
-from .hknpWeldingConfig import hknpWeldingConfig
-from .hknpWorldCinfo import hknpWorldCinfo
+import typing as tp
+
+if tp.TYPE_CHECKING:
+    from .hknpBodyCinfo import hknpBodyCinfo
+    from .hknpBodyId import hknpBodyId
+    from .hknpBodyIntegrator import hknpBodyIntegrator
+    from .hknpBodyQuality import hknpBodyQuality
+    from .hknpBodyQualityFlagsEnum import hknpBodyQualityFlagsEnum
+    from .hknpBodyQualityLibrary import hknpBodyQualityLibrary
+    from .hknpBroadPhaseConfig import hknpBroadPhaseConfig
+    from .hknpCapsuleShape import hknpCapsuleShape
+    from .hknpCollisionDispatchTypeEnum import hknpCollisionDispatchTypeEnum
+    from .hknpCollisionFilter import hknpCollisionFilter
+    from .hknpCollisionFilterType import hknpCollisionFilterType
+    from .hknpConstraintCinfo import hknpConstraintCinfo
+    from .hknpConstraintFlagsEnum import hknpConstraintFlagsEnum
+    from .hknpConstraintGroupId import hknpConstraintGroupId
+    from .hknpConstraintId import hknpConstraintId
+    from .hknpConvexPolytopeShape import hknpConvexPolytopeShape
+    from .hknpConvexPolytopeShapeConnectivity import hknpConvexPolytopeShapeConnectivity
+    from .hknpConvexPolytopeShapeConnectivityEdge import hknpConvexPolytopeShapeConnectivityEdge
+    from .hknpConvexPolytopeShapeFace import hknpConvexPolytopeShapeFace
+    from .hknpConvexShape import hknpConvexShape
+    from .hknpDragProperties import hknpDragProperties
+    from .hknpLodManagerCinfo import hknpLodManagerCinfo
+    from .hknpManifoldTypeEnum import hknpManifoldTypeEnum
+    from .hknpMassDistribution import hknpMassDistribution
+    from .hknpMaterial import hknpMaterial
+    from .hknpMaterialCombinePolicy import hknpMaterialCombinePolicy
+    from .hknpMaterialLibrary import hknpMaterialLibrary
+    from .hknpMaterialMassChangerCategory import hknpMaterialMassChangerCategory
+    from .hknpMaterialTriggerType import hknpMaterialTriggerType
+    from .hknpMotionProperties import hknpMotionProperties
+    from .hknpMotionPropertiesDeactivationSettings import hknpMotionPropertiesDeactivationSettings
+    from .hknpMotionPropertiesFullCastSettings import hknpMotionPropertiesFullCastSettings
+    from .hknpMotionPropertiesLibrary import hknpMotionPropertiesLibrary
+    from .hknpMotionRangeBreachPolicyEnum import hknpMotionRangeBreachPolicyEnum
+    from .hknpPhysicsSceneData import hknpPhysicsSceneData
+    from .hknpPhysicsSystemData import hknpPhysicsSystemData
+    from .hknpPhysicsSystemDatabodyCinfoWithAttachment import hknpPhysicsSystemDatabodyCinfoWithAttachment
+    from .hknpRagdollData import hknpRagdollData
+    from .hknpRefDragProperties import hknpRefDragProperties
+    from .hknpRefMassDistribution import hknpRefMassDistribution
+    from .hknpRefWorldCinfo import hknpRefWorldCinfo
+    from .hknpShape import hknpShape
+    from .hknpShapeFlagsEnum import hknpShapeFlagsEnum
+    from .hknpShapeMassProperties import hknpShapeMassProperties
+    from .hknpShapeTagCodec import hknpShapeTagCodec
+    from .hknpShapeTagCodecHints import hknpShapeTagCodecHints
+    from .hknpShapeTagCodecType import hknpShapeTagCodecType
+    from .hknpShapeTypeEnum import hknpShapeTypeEnum
+    from .hknpSurfaceVelocity import hknpSurfaceVelocity
+    from .hknpWeldingConfig import hknpWeldingConfig
+    from .hknpWorldCinfo import hknpWorldCinfo
@@ -1,23 +1,26 @@
-from .hkp2dAngConstraintAtom import hkp2dAngConstraintAtom
-from .hkpAngFrictionConstraintAtom import hkpAngFrictionConstraintAtom
-from .hkpAngLimitConstraintAtom import hkpAngLimitConstraintAtom
-from .hkpAngMotorConstraintAtom import hkpAngMotorConstraintAtom
-from .hkpBallSocketConstraintAtom import hkpBallSocketConstraintAtom
-from .hkpConeLimitConstraintAtom import hkpConeLimitConstraintAtom
-from .hkpConeLimitConstraintAtomMeasurementMode import hkpConeLimitConstraintAtomMeasurementMode
-from .hkpConstraintAtom import hkpConstraintAtom
-from .hkpConstraintAtomAtomType import hkpConstraintAtomAtomType
-from .hkpConstraintAtomSolvingMethod import hkpConstraintAtomSolvingMethod
-from .hkpConstraintData import hkpConstraintData
-from .hkpConstraintMotor import hkpConstraintMotor
-from .hkpConstraintMotorMotorType import hkpConstraintMotorMotorType
-from .hkpLimitedForceConstraintMotor import hkpLimitedForceConstraintMotor
-from .hkpLimitedHingeConstraintData import hkpLimitedHingeConstraintData
-from .hkpLimitedHingeConstraintDataAtoms import hkpLimitedHingeConstraintDataAtoms
-from .hkpPositionConstraintMotor import hkpPositionConstraintMotor
-from .hkpRagdollConstraintData import hkpRagdollConstraintData
-from .hkpRagdollConstraintDataAtoms import hkpRagdollConstraintDataAtoms
-from .hkpRagdollMotorConstraintAtom import hkpRagdollMotorConstraintAtom
-from .hkpSetLocalTransformsConstraintAtom import hkpSetLocalTransformsConstraintAtom
-from .hkpSetupStabilizationAtom import hkpSetupStabilizationAtom
-from .hkpTwistLimitConstraintAtom import hkpTwistLimitConstraintAtom
+import typing as tp
+
+if tp.TYPE_CHECKING:
+    from .hkp2dAngConstraintAtom import hkp2dAngConstraintAtom
+    from .hkpAngFrictionConstraintAtom import hkpAngFrictionConstraintAtom
+    from .hkpAngLimitConstraintAtom import hkpAngLimitConstraintAtom
+    from .hkpAngMotorConstraintAtom import hkpAngMotorConstraintAtom
+    from .hkpBallSocketConstraintAtom import hkpBallSocketConstraintAtom
+    from .hkpConeLimitConstraintAtom import hkpConeLimitConstraintAtom
+    from .hkpConeLimitConstraintAtomMeasurementMode import hkpConeLimitConstraintAtomMeasurementMode
+    from .hkpConstraintAtom import hkpConstraintAtom
+    from .hkpConstraintAtomAtomType import hkpConstraintAtomAtomType
+    from .hkpConstraintAtomSolvingMethod import hkpConstraintAtomSolvingMethod
+    from .hkpConstraintData import hkpConstraintData
+    from .hkpConstraintMotor import hkpConstraintMotor
+    from .hkpConstraintMotorMotorType import hkpConstraintMotorMotorType
+    from .hkpLimitedForceConstraintMotor import hkpLimitedForceConstraintMotor
+    from .hkpLimitedHingeConstraintData import hkpLimitedHingeConstraintData
+    from .hkpLimitedHingeConstraintDataAtoms import hkpLimitedHingeConstraintDataAtoms
+    from .hkpPositionConstraintMotor import hkpPositionConstraintMotor
+    from .hkpRagdollConstraintData import hkpRagdollConstraintData
+    from .hkpRagdollConstraintDataAtoms import hkpRagdollConstraintDataAtoms
+    from .hkpRagdollMotorConstraintAtom import hkpRagdollMotorConstraintAtom
+    from .hkpSetLocalTransformsConstraintAtom import hkpSetLocalTransformsConstraintAtom
+    from .hkpSetupStabilizationAtom import hkpSetupStabilizationAtom
+    from .hkpTwistLimitConstraintAtom import hkpTwistLimitConstraintAtom
@@ -0,0 +1,367 @@
+"""Generated by `soulstruct.havok.types.type_index.write_type_index("hk2018")`. Do not edit."""
+
+TYPE_MODULES = {
+    "CustomLookAtTwistModifier": "CustomLookAtTwistModifier",
+    "CustomLookAtTwistModifierGainState": "CustomLookAtTwistModifierGainState",
+    "CustomLookAtTwistModifierMultiRotationAxisType": "CustomLookAtTwistModifierMultiRotationAxisType",
+    "CustomLookAtTwistModifierSetAngleMethod": "CustomLookAtTwistModifierSetAngleMethod",
+    "CustomLookAtTwistModifierTwistParam": "CustomLookAtTwistModifierTwistParam",
+    "CustomManualSelectorGenerator": "CustomManualSelectorGenerator",
+    "CustomManualSelectorGeneratorAnimeEndEventType": "CustomManualSelectorGeneratorAnimeEndEventType",
+    "CustomManualSelectorGeneratorChangeTypeOfSelectedIndexAfterActivate": "CustomManualSelectorGeneratorChangeTypeOfSelectedIndexAfterActivate",
+    "CustomManualSelectorGeneratorOffsetType": "CustomManualSelectorGeneratorOffsetType",
+    "CustomManualSelectorGeneratorReplanningAI": "CustomManualSelectorGeneratorReplanningAI",
+    "CustomManualSelectorGeneratorRideSync": "CustomManualSelectorGeneratorRideSync",
+    "CustomPreDeleteIndexSelector": "CustomPreDeleteIndexSelector",
+    "CustomTransitionEffect": "CustomTransitionEffect",
+    "hclAction": "_hcl.hclAction",
+    "hclBendStiffnessConstraintSet": "_hcl.hclBendStiffnessConstraintSet",
+    "hclBendStiffnessConstraintSetLink": "_hcl.hclBendStiffnessConstraintSetLink",
+    "hclBlendSomeVerticesOperatorBlendWeightType": "_hcl.hclBlendSomeVerticesOperatorBlendWeightType",
+    "hclBoneSpaceDeformer": "_hcl.hclBoneSpaceDeformer",
+    "hclBoneSpaceDeformerFourBlendEntryBlock": "_hcl.hclBoneSpaceDeformerFourBlendEntryBlock",
+    "hclBoneSpaceDeformerLocalBlockP": "_hcl.hclBoneSpaceDeformerLocalBlockP",
+    "hclBoneSpaceDeformerLocalBlockUnpackedP": "_hcl.hclBoneSpaceDeformerLocalBlockUnpackedP",
+    "hclBoneSpaceDeformerOneBlendEntryBlock": "_hcl.hclBoneSpaceDeformerOneBlendEntryBlock",
+    "hclBoneSpaceDeformerThreeBlendEntryBlock": "_hcl.hclBoneSpaceDeformerThreeBlendEntryBlock",
+    "hclBoneSpaceDeformerTwoBlendEntryBlock": "_hcl.hclBoneSpaceDeformerTwoBlendEntryBlock",
+    "hclBoneSpaceMeshMeshDeformOperator": "_hcl.hclBoneSpaceMeshMeshDeformOperator",
+    "hclBoneSpaceMeshMeshDeformOperatorScaleNormalBehaviour": "_hcl.hclBoneSpaceMeshMeshDeformOperatorScaleNormalBehaviour",
+    "hclBoneSpaceMeshMeshDeformPOperator": "_hcl.hclBoneSpaceMeshMeshDeformPOperator",
+    "hclBufferDefinition": "_hcl.hclBufferDefinition",
+    "hclBufferLayout": "_hcl.hclBufferLayout",
+    "hclBufferLayoutBufferElement": "_hcl.hclBufferLayoutBufferElement",
+    "hclBufferLayoutSlot": "_hcl.hclBufferLayoutSlot",
+    "hclBufferLayoutSlotFlags": "_hcl.hclBufferLayoutSlotFlags",
+    "hclBufferLayoutTriangleFormat": "_hcl.hclBufferLayoutTriangleFormat",
+    "hclBufferUsage": "_hcl.hclBufferUsage",
+    "hclCapsuleShape": "_hcl.hclCapsuleShape",
+    "hclClothContainer": "_hcl.hclClothContainer",
+    "hclClothData": "_hcl.hclClothData",
+    "hclClothDataPlatform": "_hcl.hclClothDataPlatform",
+    "hclClothState": "_hcl.hclClothState",
+    "hclClothStateBufferAccess": "_hcl.hclClothStateBufferAccess",
+    "hclClothStateTransformSetAccess": "_hcl.hclClothStateTransformSetAccess",
+    "hclCollidable": "_hcl.hclCollidable",
+    "hclConstraintSet": "_hcl.hclConstraintSet",
+    "hclCopyVerticesOperator": "_hcl.hclCopyVerticesOperator",
+    "hclGatherAllVerticesOperator": "_hcl.hclGatherAllVerticesOperator",
+    "hclInputConvertOperator": "_hcl.hclInputConvertOperator",
+    "hclLocalRangeConstraintSet": "_hcl.hclLocalRangeConstraintSet",
+    "hclLocalRangeConstraintSetLocalConstraint": "_hcl.hclLocalRangeConstraintSetLocalConstraint",
+    "hclLocalRangeConstraintSetShapeType": "_hcl.hclLocalRangeConstraintSetShapeType",
+    "hclMoveParticlesOperator": "_hcl.hclMoveParticlesOperator",
+    "hclMoveParticlesOperatorVertexParticlePair": "_hcl.hclMoveParticlesOperatorVertexParticlePair",
+    "hclObjectSpaceDeformer": "_hcl.hclObjectSpaceDeformer",
+    "hclObjectSpaceDeformerEightBlendEntryBlock": "_hcl.hclObjectSpaceDeformerEightBlendEntryBlock",
+    "hclObjectSpaceDeformerFiveBlendEntryBlock": "_hcl.hclObjectSpaceDeformerFiveBlendEntryBlock",
+    "hclObjectSpaceDeformerFourBlendEntryBlock": "_hcl.hclObjectSpaceDeformerFourBlendEntryBlock",
+    "hclObjectSpaceDeformerLocalBlockP": "_hcl.hclObjectSpaceDeformerLocalBlockP",
+    "hclObjectSpaceDeformerLocalBlockPN": "_hcl.hclObjectSpaceDeformerLocalBlockPN",
+    "hclObjectSpaceDeformerLocalBlockPNT": "_hcl.hclObjectSpaceDeformerLocalBlockPNT",
+    "hclObjectSpaceDeformerLocalBlockUnpackedP": "_hcl.hclObjectSpaceDeformerLocalBlockUnpackedP",
+    "hclObjectSpaceDeformerLocalBlockUnpackedPN": "_hcl.hclObjectSpaceDeformerLocalBlockUnpackedPN",
+    "hclObjectSpaceDeformerLocalBlockUnpackedPNT": "_hcl.hclObjectSpaceDeformerLocalBlockUnpackedPNT",
+    "hclObjectSpaceDeformerOneBlendEntryBlock": "_hcl.hclObjectSpaceDeformerOneBlendEntryBlock",
+    "hclObjectSpaceDeformerSevenBlendEntryBlock": "_hcl.hclObjectSpaceDeformerSevenBlendEntryBlock",
+    "hclObjectSpaceDeformerSixBlendEntryBlock": "_hcl.hclObjectSpaceDeformerSixBlendEntryBlock",
+    "hclObjectSpaceDeformerThreeBlendEntryBlock": "_hcl.hclObjectSpaceDeformerThreeBlendEntryBlock",
+    "hclObjectSpaceDeformerTwoBlendEntryBlock": "_hcl.hclObjectSpaceDeformerTwoBlendEntryBlock",
+    "hclObjectSpaceMeshMeshDeformOperator": "_hcl.hclObjectSpaceMeshMeshDeformOperator",
+    "hclObjectSpaceMeshMeshDeformOperatorScaleNormalBehaviour": "_hcl.hclObjectSpaceMeshMeshDeformOperatorScaleNormalBehaviour",
+    "hclObjectSpaceMeshMeshDeformPOperator": "_hcl.hclObjectSpaceMeshMeshDeformPOperator",
+    "hclObjectSpaceSkinOperator": "_hcl.hclObjectSpaceSkinOperator",
+    "hclObjectSpaceSkinPNOperator": "_hcl.hclObjectSpaceSkinPNOperator",
+    "hclObjectSpaceSkinPNTOperator": "_hcl.hclObjectSpaceSkinPNTOperator",
+    "hclOperator": "_hcl.hclOperator",
+    "hclOutputConvertOperator": "_hcl.hclOutputConvertOperator",
+    "hclRuntimeConversionInfo": "_hcl.hclRuntimeConversionInfo",
+    "hclRuntimeConversionInfoElementConversion": "_hcl.hclRuntimeConversionInfoElementConversion",
+    "hclRuntimeConversionInfoSlotConversion": "_hcl.hclRuntimeConversionInfoSlotConversion",
+    "hclRuntimeConversionInfoVectorConversion": "_hcl.hclRuntimeConversionInfoVectorConversion",
+    "hclScratchBufferDefinition": "_hcl.hclScratchBufferDefinition",
+    "hclShadowBufferDefinition": "_hcl.hclShadowBufferDefinition",
+    "hclShape": "_hcl.hclShape",
+    "hclSimClothData": "_hcl.hclSimClothData",
+    "hclSimClothDataCollidablePinchingData": "_hcl.hclSimClothDataCollidablePinchingData",
+    "hclSimClothDataCollidableTransformMap": "_hcl.hclSimClothDataCollidableTransformMap",
+    "hclSimClothDataLandscapeCollisionData": "_hcl.hclSimClothDataLandscapeCollisionData",
+    "hclSimClothDataOverridableSimulationInfo": "_hcl.hclSimClothDataOverridableSimulationInfo",
+    "hclSimClothDataParticleData": "_hcl.hclSimClothDataParticleData",
+    "hclSimClothDataTransferMotionData": "_hcl.hclSimClothDataTransferMotionData",
+    "hclSimClothPose": "_hcl.hclSimClothPose",
+    "hclSimpleMeshBoneDeformOperator": "_hcl.hclSimpleMeshBoneDeformOperator",
+    "hclSimpleMeshBoneDeformOperatorTriangleBonePair": "_hcl.hclSimpleMeshBoneDeformOperatorTriangleBonePair",
+    "hclSimulateOperator": "_hcl.hclSimulateOperator",
+    "hclSimulateOperatorConfig": "_hcl.hclSimulateOperatorConfig",
+    "hclStandardLinkConstraintSet": "_hcl.hclStandardLinkConstraintSet",
+    "hclStandardLinkConstraintSetLink": "_hcl.hclStandardLinkConstraintSetLink",
+    "hclStateDependencyGraph": "_hcl.hclStateDependencyGraph",
+    "hclStateDependencyGraphBranch": "_hcl.hclStateDependencyGraphBranch",
+    "hclStateTransition": "_hcl.hclStateTransition",
+    "hclStateTransitionBlendOpTransitionData": "_hcl.hclStateTransitionBlendOpTransitionData",
+    "hclStateTransitionSimClothTransitionData": "_hcl.hclStateTransitionSimClothTransitionData",
+    "hclStateTransitionStateTransitionData": "_hcl.hclStateTransitionStateTransitionData",
+    "hclStateTransitionTransitionType": "_hcl.hclStateTransitionTransitionType",
+    "hclStretchLinkConstraintSet": "_hcl.hclStretchLinkConstraintSet",
+    "hclStretchLinkConstraintSetLink": "_hcl.hclStretchLinkConstraintSetLink",
+    "hclTaperedCapsuleShape": "_hcl.hclTaperedCapsuleShape",
+    "hclTransformSetDefinition": "_hcl.hclTransformSetDefinition",
+    "hclTransformSetUsage": "_hcl.hclTransformSetUsage",
+    "hclTransformSetUsageTransformTracker": "_hcl.hclTransformSetUsageTransformTracker",
+    "hclTransitionConstraintSet": "_hcl.hclTransitionConstraintSet",
+    "hclTransitionConstraintSetPerParticle": "_hcl.hclTransitionConstraintSetPerParticle",
+    "hclUpdateAllVertexFramesOperator": "_hcl.hclUpdateAllVertexFramesOperator",
+    "hclVirtualCollisionPointsData": "_hcl.hclVirtualCollisionPointsData",
+    "hclVirtualCollisionPointsDataBarycentricDictionaryEntry": "_hcl.hclVirtualCollisionPointsDataBarycentricDictionaryEntry",
+    "hclVirtualCollisionPointsDataBarycentricPair": "_hcl.hclVirtualCollisionPointsDataBarycentricPair",
+    "hclVirtualCollisionPointsDataBlock": "_hcl.hclVirtualCollisionPointsDataBlock",
+    "hclVirtualCollisionPointsDataEdgeFan": "_hcl.hclVirtualCollisionPointsDataEdgeFan",
+    "hclVirtualCollisionPointsDataEdgeFanLandscape": "_hcl.hclVirtualCollisionPointsDataEdgeFanLandscape",
+    "hclVirtualCollisionPointsDataEdgeFanSection": "_hcl.hclVirtualCollisionPointsDataEdgeFanSection",
+    "hclVirtualCollisionPointsDataTriangleFan": "_hcl.hclVirtualCollisionPointsDataTriangleFan",
+    "hclVirtualCollisionPointsDataTriangleFanLandscape": "_hcl.hclVirtualCollisionPointsDataTriangleFanLandscape",
+    "hclVirtualCollisionPointsDataTriangleFanSection": "_hcl.hclVirtualCollisionPointsDataTriangleFanSection",
+    "hkaAnimatedReferenceFrame": "_hka.hkaAnimatedReferenceFrame",
+    "hkaAnimatedReferenceFramehkaReferenceFrameTypeEnum": "_hka.hkaAnimatedReferenceFramehkaReferenceFrameTypeEnum",
+    "hkaAnimation": "_hka.hkaAnimation",
+    "hkaAnimationAnimationType": "_hka.hkaAnimationAnimationType",
+    "hkaAnimationBinding": "_hka.hkaAnimationBinding",
+    "hkaAnimationBindingBlendHint": "_hka.hkaAnimationBindingBlendHint",
+    "hkaAnimationContainer": "_hka.hkaAnimationContainer",
+    "hkaAnnotationTrack": "_hka.hkaAnnotationTrack",
+    "hkaAnnotationTrackAnnotation": "_hka.hkaAnnotationTrackAnnotation",
+    "hkaBone": "_hka.hkaBone",
+    "hkaBoneAttachment": "_hka.hkaBoneAttachment",
+    "hkaDefaultAnimatedReferenceFrame": "_hka.hkaDefaultAnimatedReferenceFrame",
+    "hkaInterleavedUncompressedAnimation": "_hka.hkaInterleavedUncompressedAnimation",
+    "hkaMeshBinding": "_hka.hkaMeshBinding",
+    "hkaMeshBindingMapping": "_hka.hkaMeshBindingMapping",
+    "hkaSkeleton": "_hka.hkaSkeleton",
+    "hkaSkeletonLocalFrameOnBone": "_hka.hkaSkeletonLocalFrameOnBone",
+    "hkaSkeletonMapper": "_hka.hkaSkeletonMapper",
+    "hkaSkeletonMapperData": "_hka.hkaSkeletonMapperData",
+    "hkaSkeletonMapperDataChainMapping": "_hka.hkaSkeletonMapperDataChainMapping",
+    "hkaSkeletonMapperDataMappingType": "_hka.hkaSkeletonMapperDataMappingType",
+    "hkaSkeletonMapperDataPartitionMappingRange": "_hka.hkaSkeletonMapperDataPartitionMappingRange",
+    "hkaSkeletonMapperDataSimpleMapping": "_hka.hkaSkeletonMapperDataSimpleMapping",
+    "hkaSkeletonPartition": "_hka.hkaSkeletonPartition",
+    "hkaSplineCompressedAnimation": "_hka.hkaSplineCompressedAnimation",
+    "hkaiAnnotatedStreamingSet": "_hkai.hkaiAnnotatedStreamingSet",
+    "hkaiAnnotatedStreamingSetSide": "_hkai.hkaiAnnotatedStreamingSetSide",
+    "hkaiFaceEdgeIndexPair": "_hkai.hkaiFaceEdgeIndexPair",
+    "hkaiIndex": "_hkai.hkaiIndex",
+    "hkaiNavMesh": "_hkai.hkaiNavMesh",
+    "hkaiNavMeshClearanceCache": "_hkai.hkaiNavMeshClearanceCache",
+    "hkaiNavMeshClearanceCacheMcpDataInteger": "_hkai.hkaiNavMeshClearanceCacheMcpDataInteger",
+    "hkaiNavMeshClearanceCacheSeedingCacheData": "_hkai.hkaiNavMeshClearanceCacheSeedingCacheData",
+    "hkaiNavMeshClearanceCacheSeedingCacheDataSet": "_hkai.hkaiNavMeshClearanceCacheSeedingCacheDataSet",
+    "hkaiNavMeshEdge": "_hkai.hkaiNavMeshEdge",
+    "hkaiNavMeshEdgeFlagBits": "_hkai.hkaiNavMeshEdgeFlagBits",
+    "hkaiNavMeshFace": "_hkai.hkaiNavMeshFace",
+    "hkaiNavMeshQueryMediator": "_hkai.hkaiNavMeshQueryMediator",
+    "hkaiPackedKey_": "_hkai.hkaiPackedKey_",
+    "hkaiStaticTreeNavMeshQueryMediator": "_hkai.hkaiStaticTreeNavMeshQueryMediator",
+    "hkaiStreamingSet": "_hkai.hkaiStreamingSet",
+    "hkaiStreamingSetGraphConnection": "_hkai.hkaiStreamingSetGraphConnection",
+    "hkaiStreamingSetNavMeshConnection": "_hkai.hkaiStreamingSetNavMeshConnection",
+    "hkaiStreamingSetVolumeConnection": "_hkai.hkaiStreamingSetVolumeConnection",
+    "hkaiUserEdgeSetupArray": "_hkai.hkaiUserEdgeSetupArray",
+    "hkaiUserEdgeUtilsObb": "_hkai.hkaiUserEdgeUtilsObb",
+    "hkaiUserEdgeUtilsUserEdgeDirection": "_hkai.hkaiUserEdgeUtilsUserEdgeDirection",
+    "hkaiUserEdgeUtilsUserEdgeSetup": "_hkai.hkaiUserEdgeUtilsUserEdgeSetup",
+    "hkaiUserEdgeUtilsUserEdgeSetupSpace": "_hkai.hkaiUserEdgeUtilsUserEdgeSetupSpace",
+    "hkbBehaviorGraph": "_hkb.hkbBehaviorGraph",
+    "hkbBehaviorGraphData": "_hkb.hkbBehaviorGraphData",
+    "hkbBehaviorGraphStringData": "_hkb.hkbBehaviorGraphStringData",
+    "hkbBehaviorGraphVariableMode": "_hkb.hkbBehaviorGraphVariableMode",
+    "hkbBindable": "_hkb.hkbBindable",
+    "hkbBlendCurveUtilsBlendCurve": "_hkb.hkbBlendCurveUtilsBlendCurve",
+    "hkbBlenderGenerator": "_hkb.hkbBlenderGenerator",
+    "hkbBlenderGeneratorChild": "_hkb.hkbBlenderGeneratorChild",
+    "hkbBlendingTransitionEffect": "_hkb.hkbBlendingTransitionEffect",
+    "hkbBlendingTransitionEffectEndMode": "_hkb.hkbBlendingTransitionEffectEndMode",
+    "hkbBlendingTransitionEffectFlagBits": "_hkb.hkbBlendingTransitionEffectFlagBits",
+    "hkbBoneIndexArray": "_hkb.hkbBoneIndexArray",
+    "hkbBoneWeightArray": "_hkb.hkbBoneWeightArray",
+    "hkbClipGenerator": "_hkb.hkbClipGenerator",
+    "hkbClipGeneratorPlaybackMode": "_hkb.hkbClipGeneratorPlaybackMode",
+    "hkbClipTrigger": "_hkb.hkbClipTrigger",
+    "hkbClipTriggerArray": "_hkb.hkbClipTriggerArray",
+    "hkbCondition": "_hkb.hkbCondition",
+    "hkbCustomIdSelector": "_hkb.hkbCustomIdSelector",
+    "hkbEvent": "_hkb.hkbEvent",
+    "hkbEventBase": "_hkb.hkbEventBase",
+    "hkbEventDrivenBlendingObject": "_hkb.hkbEventDrivenBlendingObject",
+    "hkbEventDrivenBlendingObjectInternalState": "_hkb.hkbEventDrivenBlendingObjectInternalState",
+    "hkbEventDrivenBlendingObjectInternalStateFadingState": "_hkb.hkbEventDrivenBlendingObjectInternalStateFadingState",
+    "hkbEventInfo": "_hkb.hkbEventInfo",
+    "hkbEventInfoFlags": "_hkb.hkbEventInfoFlags",
+    "hkbEventPayload": "_hkb.hkbEventPayload",
+    "hkbEventProperty": "_hkb.hkbEventProperty",
+    "hkbGenerator": "_hkb.hkbGenerator",
+    "hkbGeneratorPartitionInfo": "_hkb.hkbGeneratorPartitionInfo",
+    "hkbHoldFromBlendingTransitionEffect": "_hkb.hkbHoldFromBlendingTransitionEffect",
+    "hkbKeyframeBonesModifier": "_hkb.hkbKeyframeBonesModifier",
+    "hkbKeyframeBonesModifierKeyframeInfo": "_hkb.hkbKeyframeBonesModifierKeyframeInfo",
+    "hkbLayer": "_hkb.hkbLayer",
+    "hkbLayerGenerator": "_hkb.hkbLayerGenerator",
+    "hkbLayerGeneratorLayerFlagBits": "_hkb.hkbLayerGeneratorLayerFlagBits",
+    "hkbManualSelectorGenerator": "_hkb.hkbManualSelectorGenerator",
+    "hkbModifier": "_hkb.hkbModifier",
+    "hkbModifierGenerator": "_hkb.hkbModifierGenerator",
+    "hkbModifierList": "_hkb.hkbModifierList",
+    "hkbNode": "_hkb.hkbNode",
+    "hkbNodeCloneState": "_hkb.hkbNodeCloneState",
+    "hkbNodeType": "_hkb.hkbNodeType",
+    "hkbProjectData": "_hkb.hkbProjectData",
+    "hkbProjectStringData": "_hkb.hkbProjectStringData",
+    "hkbReferencePoseGenerator": "_hkb.hkbReferencePoseGenerator",
+    "hkbRoleAttribute": "_hkb.hkbRoleAttribute",
+    "hkbRoleAttributeRole": "_hkb.hkbRoleAttributeRole",
+    "hkbRoleAttributeRoleFlags": "_hkb.hkbRoleAttributeRoleFlags",
+    "hkbScriptGenerator": "_hkb.hkbScriptGenerator",
+    "hkbStateListener": "_hkb.hkbStateListener",
+    "hkbStateMachine": "_hkb.hkbStateMachine",
+    "hkbStateMachineEventPropertyArray": "_hkb.hkbStateMachineEventPropertyArray",
+    "hkbStateMachineStartStateMode": "_hkb.hkbStateMachineStartStateMode",
+    "hkbStateMachineStateInfo": "_hkb.hkbStateMachineStateInfo",
+    "hkbStateMachineStateMachineSelfTransitionMode": "_hkb.hkbStateMachineStateMachineSelfTransitionMode",
+    "hkbStateMachineTimeInterval": "_hkb.hkbStateMachineTimeInterval",
+    "hkbStateMachineTransitionInfo": "_hkb.hkbStateMachineTransitionInfo",
+    "hkbStateMachineTransitionInfoArray": "_hkb.hkbStateMachineTransitionInfoArray",
+    "hkbStateMachineTransitionInfoTransitionFlags": "_hkb.hkbStateMachineTransitionInfoTransitionFlags",
+    "hkbTransitionEffect": "_hkb.hkbTransitionEffect",
+    "hkbTransitionEffectEventMode": "_hkb.hkbTransitionEffectEventMode",
+    "hkbTransitionEffectSelfTransitionMode": "_hkb.hkbTransitionEffectSelfTransitionMode",
+    "hkbVariableBindingSet": "_hkb.hkbVariableBindingSet",
+    "hkbVariableBindingSetBinding": "_hkb.hkbVariableBindingSetBinding",
+    "hkbVariableBindingSetBindingBindingType": "_hkb.hkbVariableBindingSetBindingBindingType",
+    "hkbVariableBindingSetBindingInternalBindingFlags": "_hkb.hkbVariableBindingSetBindingInternalBindingFlags",
+    "hkbVariableBounds": "_hkb.hkbVariableBounds",
+    "hkbVariableInfo": "_hkb.hkbVariableInfo",
+    "hkbVariableInfoVariableType": "_hkb.hkbVariableInfoVariableType",
+    "hkbVariableValue": "_hkb.hkbVariableValue",
+    "hkbVariableValueSet": "_hkb.hkbVariableValueSet",
+    "hkbVerifiable": "_hkb.hkbVerifiable",
+    "hkcdCompressedAabbCodecsAabb6BytesCodec": "_hkcd.hkcdCompressedAabbCodecsAabb6BytesCodec",
+    "hkcdCompressedAabbCodecsAabbCodecBase": "_hkcd.hkcdCompressedAabbCodecsAabbCodecBase",
+    "hkcdCompressedAabbCodecsCompressedAabbCodec": "_hkcd.hkcdCompressedAabbCodecsCompressedAabbCodec",
+    "hkcdStaticAabbTree": "_hkcd.hkcdStaticAabbTree",
+    "hkcdStaticAabbTreeImpl": "_hkcd.hkcdStaticAabbTreeImpl",
+    "hkcdStaticTreeAabb6BytesTree": "_hkcd.hkcdStaticTreeAabb6BytesTree",
+    "hkcdStaticTreeAabbTree": "_hkcd.hkcdStaticTreeAabbTree",
+    "hkcdStaticTreeAabbTreeBase": "_hkcd.hkcdStaticTreeAabbTreeBase",
+    "hknpBodyCinfo": "_hknp.hknpBodyCinfo",
+    "hknpBodyId": "_hknp.hknpBodyId",
+    "hknpBodyIntegrator": "_hknp.hknpBodyIntegrator",
+    "hknpBodyQuality": "_hknp.hknpBodyQuality",
+    "hknpBodyQualityFlagsEnum": "_hknp.hknpBodyQualityFlagsEnum",
+    "hknpBodyQualityLibrary": "_hknp.hknpBodyQualityLibrary",
+    "hknpBroadPhaseConfig": "_hknp.hknpBroadPhaseConfig",
+    "hknpCapsuleShape": "_hknp.hknpCapsuleShape",
+    "hknpCollisionDispatchTypeEnum": "_hknp.hknpCollisionDispatchTypeEnum",
+    "hknpCollisionFilter": "_hknp.hknpCollisionFilter",
+    "hknpCollisionFilterType": "_hknp.hknpCollisionFilterType",
+    "hknpConstraintCinfo": "_hknp.hknpConstraintCinfo",
+    "hknpConstraintFlagsEnum": "_hknp.hknpConstraintFlagsEnum",
+    "hknpConstraintGroupId": "_hknp.hknpConstraintGroupId",
+    "hknpConstraintId": "_hknp.hknpConstraintId",
+    "hknpConvexPolytopeShape": "_hknp.hknpConvexPolytopeShape",
+    "hknpConvexPolytopeShapeConnectivity": "_hknp.hknpConvexPolytopeShapeConnectivity",
+    "hknpConvexPolytopeShapeConnectivityEdge": "_hknp.hknpConvexPolytopeShapeConnectivityEdge",
+    "hknpConvexPolytopeShapeFace": "_hknp.hknpConvexPolytopeShapeFace",
+    "hknpConvexShape": "_hknp.hknpConvexShape",
+    "hknpDragProperties": "_hknp.hknpDragProperties",
+    "hknpLodManagerCinfo": "_hknp.hknpLodManagerCinfo",
+    "hknpManifoldTypeEnum": "_hknp.hknpManifoldTypeEnum",
+    "hknpMassDistribution": "_hknp.hknpMassDistribution",
+    "hknpMaterial": "_hknp.hknpMaterial",
+    "hknpMaterialCombinePolicy": "_hknp.hknpMaterialCombinePolicy",
+    "hknpMaterialLibrary": "_hknp.hknpMaterialLibrary",
+    "hknpMaterialMassChangerCategory": "_hknp.hknpMaterialMassChangerCategory",
+    "hknpMaterialTriggerType": "_hknp.hknpMaterialTriggerType",
+    "hknpMotionProperties": "_hknp.hknpMotionProperties",
+    "hknpMotionPropertiesDeactivationSettings": "_hknp.hknpMotionPropertiesDeactivationSettings",
+    "hknpMotionPropertiesFullCastSettings": "_hknp.hknpMotionPropertiesFullCastSettings",
+    "hknpMotionPropertiesLibrary": "_hknp.hknpMotionPropertiesLibrary",
+    "hknpMotionRangeBreachPolicyEnum": "_hknp.hknpMotionRangeBreachPolicyEnum",
+    "hknpPhysicsSceneData": "_hknp.hknpPhysicsSceneData",
+    "hknpPhysicsSystemData": "_hknp.hknpPhysicsSystemData",
+    "hknpPhysicsSystemDatabodyCinfoWithAttachment": "_hknp.hknpPhysicsSystemDatabodyCinfoWithAttachment",
+    "hknpRagdollData": "_hknp.hknpRagdollData",
+    "hknpRefDragProperties": "_hknp.hknpRefDragProperties",
+    "hknpRefMassDistribution": "_hknp.hknpRefMassDistribution",
+    "hknpRefWorldCinfo": "_hknp.hknpRefWorldCinfo",
+    "hknpShape": "_hknp.hknpShape",
+    "hknpShapeFlagsEnum": "_hknp.hknpShapeFlagsEnum",
+    "hknpShapeMassProperties": "_hknp.hknpShapeMassProperties",
+    "hknpShapeTagCodec": "_hknp.hknpShapeTagCodec",
+    "hknpShapeTagCodecHints": "_hknp.hknpShapeTagCodecHints",
+    "hknpShapeTagCodecType": "_hknp.hknpShapeTagCodecType",
+    "hknpShapeTypeEnum": "_hknp.hknpShapeTypeEnum",
+    "hknpSurfaceVelocity": "_hknp.hknpSurfaceVelocity",
+    "hknpWeldingConfig": "_hknp.hknpWeldingConfig",
+    "hknpWorldCinfo": "_hknp.hknpWorldCinfo",
+    "hkp2dAngConstraintAtom": "_hkp.hkp2dAngConstraintAtom",
+    "hkpAngFrictionConstraintAtom": "_hkp.hkpAngFrictionConstraintAtom",
+    "hkpAngLimitConstraintAtom": "_hkp.hkpAngLimitConstraintAtom",
+    "hkpAngMotorConstraintAtom": "_hkp.hkpAngMotorConstraintAtom",
+    "hkpBallSocketConstraintAtom": "_hkp.hkpBallSocketConstraintAtom",
+    "hkpConeLimitConstraintAtom": "_hkp.hkpConeLimitConstraintAtom",
+    "hkpConeLimitConstraintAtomMeasurementMode": "_hkp.hkpConeLimitConstraintAtomMeasurementMode",
+    "hkpConstraintAtom": "_hkp.hkpConstraintAtom",
+    "hkpConstraintAtomAtomType": "_hkp.hkpConstraintAtomAtomType",
+    "hkpConstraintAtomSolvingMethod": "_hkp.hkpConstraintAtomSolvingMethod",
+    "hkpConstraintData": "_hkp.hkpConstraintData",
+    "hkpConstraintMotor": "_hkp.hkpConstraintMotor",
+    "hkpConstraintMotorMotorType": "_hkp.hkpConstraintMotorMotorType",
+    "hkpLimitedForceConstraintMotor": "_hkp.hkpLimitedForceConstraintMotor",
+    "hkpLimitedHingeConstraintData": "_hkp.hkpLimitedHingeConstraintData",
+    "hkpLimitedHingeConstraintDataAtoms": "_hkp.hkpLimitedHingeConstraintDataAtoms",
+    "hkpPositionConstraintMotor": "_hkp.hkpPositionConstraintMotor",
+    "hkpRagdollConstraintData": "_hkp.hkpRagdollConstraintData",
+    "hkpRagdollConstraintDataAtoms": "_hkp.hkpRagdollConstraintDataAtoms",
+    "hkpRagdollMotorConstraintAtom": "_hkp.hkpRagdollMotorConstraintAtom",
+    "hkpSetLocalTransformsConstraintAtom": "_hkp.hkpSetLocalTransformsConstraintAtom",
+    "hkpSetupStabilizationAtom": "_hkp.hkpSetupStabilizationAtom",
+    "hkpTwistLimitConstraintAtom": "_hkp.hkpTwistLimitConstraintAtom",
+    "hkxAttribute": "_hkx.hkxAttribute",
+    "hkxAttributeGroup": "_hkx.hkxAttributeGroup",
+    "hkxAttributeHolder": "_hkx.hkxAttributeHolder",
+    "hkxIndexBuffer": "_hkx.hkxIndexBuffer",
+    "hkxIndexBufferIndexType": "_hkx.hkxIndexBufferIndexType",
+    "hkxMaterial": "_hkx.hkxMaterial",
+    "hkxMaterialProperty": "_hkx.hkxMaterialProperty",
+    "hkxMaterialTextureStage": "_hkx.hkxMaterialTextureStage",
+    "hkxMaterialTextureType": "_hkx.hkxMaterialTextureType",
+    "hkxMaterialTransparency": "_hkx.hkxMaterialTransparency",
+    "hkxMaterialUVMappingAlgorithm": "_hkx.hkxMaterialUVMappingAlgorithm",
+    "hkxMesh": "_hkx.hkxMesh",
+    "hkxMeshSection": "_hkx.hkxMeshSection",
+    "hkxMeshUserChannelInfo": "_hkx.hkxMeshUserChannelInfo",
+    "hkxVertexAnimation": "_hkx.hkxVertexAnimation",
+    "hkxVertexAnimationUsageMap": "_hkx.hkxVertexAnimationUsageMap",
+    "hkxVertexBuffer": "_hkx.hkxVertexBuffer",
+    "hkxVertexBufferVertexData": "_hkx.hkxVertexBufferVertexData",
+    "hkxVertexDescription": "_hkx.hkxVertexDescription",
+    "hkxVertexDescriptionDataType": "_hkx.hkxVertexDescriptionDataType",
+    "hkxVertexDescriptionDataUsage": "_hkx.hkxVertexDescriptionDataUsage",
+    "hkxVertexDescriptionElementDecl": "_hkx.hkxVertexDescriptionElementDecl",
+    "hkAabb": "hkAabb",
+    "hkAssetRefPtr": "hkAssetRefPtr",
+    "hkBitField": "hkBitField",
+    "hkBitFieldBase": "hkBitFieldBase",
+    "hkBitFieldStorage": "hkBitFieldStorage",
+    "hkCompressedMassProperties": "hkCompressedMassProperties",
+    "hkDefaultPropertyBag": "hkDefaultPropertyBag",
+    "hkHandle": "hkHandle",
+    "hkLocalFrame": "hkLocalFrame",
+    "hkMeshBoneIndexMapping": "hkMeshBoneIndexMapping",
+    "hkPackedVector3": "hkPackedVector3",
+    "hkPropertyFlagsEnum": "hkPropertyFlagsEnum",
+    "hkRefCountedProperties": "hkRefCountedProperties",
+    "hkRefCountedPropertiesEntry": "hkRefCountedPropertiesEntry",
+    "hkRootLevelContainer": "hkRootLevelContainer",
+    "hkRootLevelContainerNamedVariant": "hkRootLevelContainerNamedVariant",
+}
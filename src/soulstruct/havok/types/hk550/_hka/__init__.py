@@ -1,26 +1,29 @@
-from .hkaAnimatedReferenceFrame import hkaAnimatedReferenceFrame
-from .hkaAnimationAnimationType import hkaAnimationAnimationType
-from .hkaAnimationBinding import hkaAnimationBinding
-from .hkaAnimationBindingBlendHint import hkaAnimationBindingBlendHint
-from .hkaAnimationContainer import hkaAnimationContainer
-from .hkaAnnotationTrack import hkaAnnotationTrack
-from .hkaAnnotationTrackAnnotation import hkaAnnotationTrackAnnotation
-from .hkaBone import hkaBone
-from .hkaBoneAttachment import hkaBoneAttachment
-from .hkaDefaultAnimatedReferenceFrame import hkaDefaultAnimatedReferenceFrame
-from .hkaInterleavedSkeletalAnimation import hkaInterleavedSkeletalAnimation
-from .hkaMeshBinding import hkaMeshBinding
-from .hkaMeshBindingMapping import hkaMeshBindingMapping
-from .hkaRagdollInstance import hkaRagdollInstance
-from .hkaSkeletalAnimation import hkaSkeletalAnimation
-from .hkaSkeleton import hkaSkeleton
-from .hkaSkeletonLocalFrameOnBone import hkaSkeletonLocalFrameOnBone
-from .hkaSkeletonMapper import hkaSkeletonMapper
-from .hkaSkeletonMapperData import hkaSkeletonMapperData
-from .hkaSkeletonMapperDataChainMapping import hkaSkeletonMapperDataChainMapping
-from .hkaSkeletonMapperDataMappingType import hkaSkeletonMapperDataMappingType
-from .hkaSkeletonMapperDataSimpleMapping import hkaSkeletonMapperDataSimpleMapping
-from .hkaSplineSkeletalAnimation import hkaSplineSkeletalAnimation
-from .hkaWaveletSkeletalAnimation import hkaWaveletSkeletalAnimation
-from .hkaWaveletSkeletalAnimationCompressionParams import hkaWaveletSkeletalAnimationCompressionParams
-from .hkaWaveletSkeletalAnimationQuantizationFormat import hkaWaveletSkeletalAnimationQuantizationFormat
+import typing as tp
+
+if tp.TYPE_CHECKING:
+    from .hkaAnimatedReferenceFrame import hkaAnimatedReferenceFrame
+    from .hkaAnimationAnimationType import hkaAnimationAnimationType
+    from .hkaAnimationBinding import hkaAnimationBinding
+    from .hkaAnimationBindingBlendHint import hkaAnimationBindingBlendHint
+    from .hkaAnimationContainer import hkaAnimationContainer
+    from .hkaAnnotationTrack import hkaAnnotationTrack
+    from .hkaAnnotationTrackAnnotation import hkaAnnotationTrackAnnotation
+    from .hkaBone import hkaBone
+    from .hkaBoneAttachment import hkaBoneAttachment
+    from .hkaDefaultAnimatedReferenceFrame import hkaDefaultAnimatedReferenceFrame
+    from .hkaInterleavedSkeletalAnimation import hkaInterleavedSkeletalAnimation
+    from .hkaMeshBinding import hkaMeshBinding
+    from .hkaMeshBindingMapping import hkaMeshBindingMapping
+    from .hkaRagdollInstance import hkaRagdollInstance
+    from .hkaSkeletalAnimation import hkaSkeletalAnimation
+    from .hkaSkeleton import hkaSkeleton
+    from .hkaSkeletonLocalFrameOnBone import hkaSkeletonLocalFrameOnBone
+    from .hkaSkeletonMapper import hkaSkeletonMapper
+    from .hkaSkeletonMapperData import hkaSkeletonMapperData
+    from .hkaSkeletonMapperDataChainMapping import hkaSkeletonMapperDataChainMapping
+    from .hkaSkeletonMapperDataMappingType import hkaSkeletonMapperDataMappingType
+    from .hkaSkeletonMapperDataSimpleMapping import hkaSkeletonMapperDataSimpleMapping
+    from .hkaSplineSkeletalAnimation import hkaSplineSkeletalAnimation
+    from .hkaWaveletSkeletalAnimation import hkaWaveletSkeletalAnimation
+    from .hkaWaveletSkeletalAnimationCompressionParams import hkaWaveletSkeletalAnimationCompressionParams
+    from .hkaWaveletSkeletalAnimationQuantizationFormat import hkaWaveletSkeletalAnimationQuantizationFormat
@@ -1,92 +1,96 @@
+import typing as tp
 
-from .hkpAction import hkpAction
-from .hkpAngFrictionConstraintAtom import hkpAngFrictionConstraintAtom
-from .hkpBallSocketConstraintAtom import hkpBallSocketConstraintAtom
-from .hkpBallSocketConstraintAtomSolvingMethod import hkpBallSocketConstraintAtomSolvingMethod
-from .hkpBroadPhaseHandle import hkpBroadPhaseHandle
-from .hkpBvTreeShape import hkpBvTreeShape
-from .hkpBvTreeShapeBvTreeType import hkpBvTreeShapeBvTreeType
-from .hkpCapsuleShape import hkpCapsuleShape
-from .hkpCdBody import hkpCdBody
-from .hkpCollidable import hkpCollidable
-from .hkpCollidableBoundingVolumeData import hkpCollidableBoundingVolumeData
-from .hkpCollisionFilter import hkpCollisionFilter
-from .hkpCollisionFilterhkpFilterType import hkpCollisionFilterhkpFilterType
-from .hkpConeLimitConstraintAtom import hkpConeLimitConstraintAtom
-from .hkpConeLimitConstraintAtomMeasurementMode import hkpConeLimitConstraintAtomMeasurementMode
-from .hkpConstraintAtom import hkpConstraintAtom
-from .hkpConstraintAtomAtomType import hkpConstraintAtomAtomType
-from .hkpConstraintData import hkpConstraintData
-from .hkpConstraintInstance import hkpConstraintInstance
-from .hkpConstraintInstanceConstraintPriority import hkpConstraintInstanceConstraintPriority
-from .hkpConstraintInstanceOnDestructionRemapInfo import hkpConstraintInstanceOnDestructionRemapInfo
-from .hkpConstraintInstanceSmallArraySerializeOverrideType import hkpConstraintInstanceSmallArraySerializeOverrideType
-from .hkpConstraintMotor import hkpConstraintMotor
-from .hkpConstraintMotorMotorType import hkpConstraintMotorMotorType
-from .hkpConvexListFilter import hkpConvexListFilter
-from .hkpConvexShape import hkpConvexShape
-from .hkpEntity import hkpEntity
-from .hkpEntityExtendedListeners import hkpEntityExtendedListeners
-from .hkpEntitySmallArraySerializeOverrideType import hkpEntitySmallArraySerializeOverrideType
-from .hkpEntitySpuCollisionCallback import hkpEntitySpuCollisionCallback
-from .hkpExtendedMeshShape import hkpExtendedMeshShape
-from .hkpExtendedMeshShapeIndexStridingType import hkpExtendedMeshShapeIndexStridingType
-from .hkpExtendedMeshShapeMaterialIndexStridingType import hkpExtendedMeshShapeMaterialIndexStridingType
-from .hkpExtendedMeshShapeShapesSubpart import hkpExtendedMeshShapeShapesSubpart
-from .hkpExtendedMeshShapeSubpart import hkpExtendedMeshShapeSubpart
-from .hkpExtendedMeshShapeSubpartType import hkpExtendedMeshShapeSubpartType
-from .hkpExtendedMeshShapeTrianglesSubpart import hkpExtendedMeshShapeTrianglesSubpart
-from .hkpKeyframedRigidMotion import hkpKeyframedRigidMotion
-from .hkpLimitedForceConstraintMotor import hkpLimitedForceConstraintMotor
-from .hkpLinkedCollidable import hkpLinkedCollidable
-from .hkpMaterial import hkpMaterial
-from .hkpMaterialResponseType import hkpMaterialResponseType
-from .hkpMaxSizeMotion import hkpMaxSizeMotion
-from .hkpMeshMaterial import hkpMeshMaterial
-from .hkpMeshShape import hkpMeshShape
-from .hkpMeshShapeIndexStridingType import hkpMeshShapeIndexStridingType
-from .hkpMeshShapeMaterialIndexStridingType import hkpMeshShapeMaterialIndexStridingType
-from .hkpMeshShapeSubpart import hkpMeshShapeSubpart
-from .hkpModifierConstraintAtom import hkpModifierConstraintAtom
-from .hkpMoppBvTreeShape import hkpMoppBvTreeShape
-from .hkpMoppCode import hkpMoppCode
-from .hkpMoppCodeBuildType import hkpMoppCodeBuildType
-from .hkpMoppCodeCodeInfo import hkpMoppCodeCodeInfo
-from .hkpMotion import hkpMotion
-from .hkpMotionMotionType import hkpMotionMotionType
-from .hkpNamedMeshMaterial import hkpNamedMeshMaterial
-from .hkpPhantom import hkpPhantom
-from .hkpPhysicsData import hkpPhysicsData
-from .hkpPhysicsSystem import hkpPhysicsSystem
-from .hkpPositionConstraintMotor import hkpPositionConstraintMotor
-from .hkpProperty import hkpProperty
-from .hkpPropertyValue import hkpPropertyValue
-from .hkpRagdollConstraintData import hkpRagdollConstraintData
-from .hkpRagdollConstraintDataAtoms import hkpRagdollConstraintDataAtoms
-from .hkpRagdollMotorConstraintAtom import hkpRagdollMotorConstraintAtom
-from .hkpRigidBody import hkpRigidBody
-from .hkpSetLocalTransformsConstraintAtom import hkpSetLocalTransformsConstraintAtom
-from .hkpSetupStabilizationAtom import hkpSetupStabilizationAtom
-from .hkpShape import hkpShape
-from .hkpShapeCollection import hkpShapeCollection
-from .hkpShapeCollectionFilter import hkpShapeCollectionFilter
-from .hkpShapeContainer import hkpShapeContainer
-from .hkpShapeShapeType import hkpShapeShapeType
-from .hkpSimpleMeshShape import hkpSimpleMeshShape
-from .hkpSimpleMeshShapeTriangle import hkpSimpleMeshShapeTriangle
-from .hkpSingleShapeContainer import hkpSingleShapeContainer
-from .hkpSphereRepShape import hkpSphereRepShape
-from .hkpStorageExtendedMeshShape import hkpStorageExtendedMeshShape
-from .hkpStorageExtendedMeshShapeMeshSubpartStorage import hkpStorageExtendedMeshShapeMeshSubpartStorage
-from .hkpStorageExtendedMeshShapeShapeSubpartStorage import hkpStorageExtendedMeshShapeShapeSubpartStorage
-from .hkpStorageMeshShape import hkpStorageMeshShape
-from .hkpStorageMeshShapeSubpartStorage import hkpStorageMeshShapeSubpartStorage
-from .hkpTwistLimitConstraintAtom import hkpTwistLimitConstraintAtom
-from .hkpTypedBroadPhaseHandle import hkpTypedBroadPhaseHandle
-from .hkpWeldingUtilityWeldingType import hkpWeldingUtilityWeldingType
-from .hkpWorldCinfo import hkpWorldCinfo
-from .hkpWorldCinfoBroadPhaseBorderBehaviour import hkpWorldCinfoBroadPhaseBorderBehaviour
-from .hkpWorldCinfoContactPointGeneration import hkpWorldCinfoContactPointGeneration
-from .hkpWorldCinfoSimulationType import hkpWorldCinfoSimulationType
-from .hkpWorldCinfoTreeUpdateType import hkpWorldCinfoTreeUpdateType
-from .hkpWorldObject import hkpWorldObject
+if tp.TYPE_CHECKING:
+    from .hkpAction import hkpAction
+    from .hkpAngFrictionConstraintAtom import hkpAngFrictionConstraintAtom
+    from .hkpBallSocketConstraintAtom import hkpBallSocketConstraintAtom
+    from .hkpBallSocketConstraintAtomSolvingMethod import hkpBallSocketConstraintAtomSolvingMethod
+    from .hkpBroadPhaseHandle import hkpBroadPhaseHandle
+    from .hkpBvTreeShape import hkpBvTreeShape
+    from .hkpBvTreeShapeBvTreeType import hkpBvTreeShapeBvTreeType
+    from .hkpCapsuleShape import hkpCapsuleShape
+    from .hkpCdBody import hkpCdBody
+    from .hkpCollidable import hkpCollidable
+    from .hkpCollidableBoundingVolumeData import hkpCollidableBoundingVolumeData
+    from .hkpCollisionFilter import hkpCollisionFilter
+    from .hkpCollisionFilterhkpFilterType import hkpCollisionFilterhkpFilterType
+    from .hkpConeLimitConstraintAtom import hkpConeLimitConstraintAtom
+    from .hkpConeLimitConstraintAtomMeasurementMode import hkpConeLimitConstraintAtomMeasurementMode
+    from .hkpConstraintAtom import hkpConstraintAtom
+    from .hkpConstraintAtomAtomType import hkpConstraintAtomAtomType
+    from .hkpConstraintData import hkpConstraintData
+    from .hkpConstraintInstance import hkpConstraintInstance
+    from .hkpConstraintInstanceConstraintPriority import hkpConstraintInstanceConstraintPriority
+    from .hkpConstraintInstanceOnDestructionRemapInfo import hkpConstraintInstanceOnDestructionRemapInfo
+    from .hkpConstraintInstanceSmallArraySerializeOverrideType import (
+        hkpConstraintInstanceSmallArraySerializeOverrideType
+    )
+    from .hkpConstraintMotor import hkpConstraintMotor
+    from .hkpConstraintMotorMotorType import hkpConstraintMotorMotorType
+    from .hkpConvexListFilter import hkpConvexListFilter
+    from .hkpConvexShape import hkpConvexShape
+    from .hkpEntity import hkpEntity
+    from .hkpEntityExtendedListeners import hkpEntityExtendedListeners
+    from .hkpEntitySmallArraySerializeOverrideType import hkpEntitySmallArraySerializeOverrideType
+    from .hkpEntitySpuCollisionCallback import hkpEntitySpuCollisionCallback
+    from .hkpExtendedMeshShape import hkpExtendedMeshShape
+    from .hkpExtendedMeshShapeIndexStridingType import hkpExtendedMeshShapeIndexStridingType
+    from .hkpExtendedMeshShapeMaterialIndexStridingType import hkpExtendedMeshShapeMaterialIndexStridingType
+    from .hkpExtendedMeshShapeShapesSubpart import hkpExtendedMeshShapeShapesSubpart
+    from .hkpExtendedMeshShapeSubpart import hkpExtendedMeshShapeSubpart
+    from .hkpExtendedMeshShapeSubpartType import hkpExtendedMeshShapeSubpartType
+    from .hkpExtendedMeshShapeTrianglesSubpart import hkpExtendedMeshShapeTrianglesSubpart
+    from .hkpKeyframedRigidMotion import hkpKeyframedRigidMotion
+    from .hkpLimitedForceConstraintMotor import hkpLimitedForceConstraintMotor
+    from .hkpLinkedCollidable import hkpLinkedCollidable
+    from .hkpMaterial import hkpMaterial
+    from .hkpMaterialResponseType import hkpMaterialResponseType
+    from .hkpMaxSizeMotion import hkpMaxSizeMotion
+    from .hkpMeshMaterial import hkpMeshMaterial
+    from .hkpMeshShape import hkpMeshShape
+    from .hkpMeshShapeIndexStridingType import hkpMeshShapeIndexStridingType
+    from .hkpMeshShapeMaterialIndexStridingType import hkpMeshShapeMaterialIndexStridingType
+    from .hkpMeshShapeSubpart import hkpMeshShapeSubpart
+    from .hkpModifierConstraintAtom import hkpModifierConstraintAtom
+    from .hkpMoppBvTreeShape import hkpMoppBvTreeShape
+    from .hkpMoppCode import hkpMoppCode
+    from .hkpMoppCodeBuildType import hkpMoppCodeBuildType
+    from .hkpMoppCodeCodeInfo import hkpMoppCodeCodeInfo
+    from .hkpMotion import hkpMotion
+    from .hkpMotionMotionType import hkpMotionMotionType
+    from .hkpNamedMeshMaterial import hkpNamedMeshMaterial
+    from .hkpPhantom import hkpPhantom
+    from .hkpPhysicsData import hkpPhysicsData
+    from .hkpPhysicsSystem import hkpPhysicsSystem
+    from .hkpPositionConstraintMotor import hkpPositionConstraintMotor
+    from .hkpProperty import hkpProperty
+    from .hkpPropertyValue import hkpPropertyValue
+    from .hkpRagdollConstraintData import hkpRagdollConstraintData
+    from .hkpRagdollConstraintDataAtoms import hkpRagdollConstraintDataAtoms
+    from .hkpRagdollMotorConstraintAtom import hkpRagdollMotorConstraintAtom
+    from .hkpRigidBody import hkpRigidBody
+    from .hkpSetLocalTransformsConstraintAtom import hkpSetLocalTransformsConstraintAtom
+    from .hkpSetupStabilizationAtom import hkpSetupStabilizationAtom
+    from .hkpShape import hkpShape
+    from .hkpShapeCollection import hkpShapeCollection
+    from .hkpShapeCollectionFilter import hkpShapeCollectionFilter
+    from .hkpShapeContainer import hkpShapeContainer
+    from .hkpShapeShapeType import hkpShapeShapeType
+    from .hkpSimpleMeshShape import hkpSimpleMeshShape
+    from .hkpSimpleMeshShapeTriangle import hkpSimpleMeshShapeTriangle
+    from .hkpSingleShapeContainer import hkpSingleShapeContainer
+    from .hkpSphereRepShape import hkpSphereRepShape
+    from .hkpStorageExtendedMeshShape import hkpStorageExtendedMeshShape
+    from .hkpStorageExtendedMeshShapeMeshSubpartStorage import hkpStorageExtendedMeshShapeMeshSubpartStorage
+    from .hkpStorageExtendedMeshShapeShapeSubpartStorage import hkpStorageExtendedMeshShapeShapeSubpartStorage
+    from .hkpStorageMeshShape import hkpStorageMeshShape
+    from .hkpStorageMeshShapeSubpartStorage import hkpStorageMeshShapeSubpartStorage
+    from .hkpTwistLimitConstraintAtom import hkpTwistLimitConstraintAtom
+    from .hkpTypedBroadPhaseHandle import hkpTypedBroadPhaseHandle
+    from .hkpWeldingUtilityWeldingType import hkpWeldingUtilityWeldingType
+    from .hkpWorldCinfo import hkpWorldCinfo
+    from .hkpWorldCinfoBroadPhaseBorderBehaviour import hkpWorldCinfoBroadPhaseBorderBehaviour
+    from .hkpWorldCinfoContactPointGeneration import hkpWorldCinfoContactPointGeneration
+    from .hkpWorldCinfoSimulationType import hkpWorldCinfoSimulationType
+    from .hkpWorldCinfoTreeUpdateType import hkpWorldCinfoTreeUpdateType
+    from .hkpWorldObject import hkpWorldObject
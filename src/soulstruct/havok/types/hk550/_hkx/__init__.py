@@ -1,22 +1,25 @@
-from .hkxAttribute import hkxAttribute
-from .hkxAttributeGroup import hkxAttributeGroup
-from .hkxAttributeHolder import hkxAttributeHolder
-from .hkxIndexBuffer import hkxIndexBuffer
-from .hkxIndexBufferIndexType import hkxIndexBufferIndexType
-from .hkxLight import hkxLight
-from .hkxLightLightType import hkxLightLightType
-from .hkxMaterial import hkxMaterial
-from .hkxMaterialTextureStage import hkxMaterialTextureStage
-from .hkxMaterialTextureType import hkxMaterialTextureType
-from .hkxMesh import hkxMesh
-from .hkxMeshSection import hkxMeshSection
-from .hkxMeshUserChannelInfo import hkxMeshUserChannelInfo
-from .hkxNode import hkxNode
-from .hkxNodeAnnotationData import hkxNodeAnnotationData
-from .hkxNodeSelectionSet import hkxNodeSelectionSet
-from .hkxScene import hkxScene
-from .hkxSkinBinding import hkxSkinBinding
-from .hkxTextureFile import hkxTextureFile
-from .hkxTextureInplace import hkxTextureInplace
-from .hkxVertexBuffer import hkxVertexBuffer
-from .hkxVertexFormat import hkxVertexFormat
+import typing as tp
+
+if tp.TYPE_CHECKING:
+    from .hkxAttribute import hkxAttribute
+    from .hkxAttributeGroup import hkxAttributeGroup
+    from .hkxAttributeHolder import hkxAttributeHolder
+    from .hkxIndexBuffer import hkxIndexBuffer
+    from .hkxIndexBufferIndexType import hkxIndexBufferIndexType
+    from .hkxLight import hkxLight
+    from .hkxLightLightType import hkxLightLightType
+    from .hkxMaterial import hkxMaterial
+    from .hkxMaterialTextureStage import hkxMaterialTextureStage
+    from .hkxMaterialTextureType import hkxMaterialTextureType
+    from .hkxMesh import hkxMesh
+    from .hkxMeshSection import hkxMeshSection
+    from .hkxMeshUserChannelInfo import hkxMeshUserChannelInfo
+    from .hkxNode import hkxNode
+    from .hkxNodeAnnotationData import hkxNodeAnnotationData
+    from .hkxNodeSelectionSet import hkxNodeSelectionSet
+    from .hkxScene import hkxScene
+    from .hkxSkinBinding import hkxSkinBinding
+    from .hkxTextureFile import hkxTextureFile
+    from .hkxTextureInplace import hkxTextureInplace
+    from .hkxVertexBuffer import hkxVertexBuffer
+    from .hkxVertexFormat import hkxVertexFormat
@@ -95,13 +95,12 @@ from dataclasses import dataclass, field
 import numpy as np
 
 from soulstruct.havok.utilities.maths import Quaternion, TRSTransform, Vector3, Vector4
+from soulstruct.havok.utilities.memory_reader import read_array_buffer
 from soulstruct.havok.enums import MemberFlags
 from soulstruct.havok.types.base import *
 
 if tp.TYPE_CHECKING:
     from soulstruct.utilities.binary import BinaryReader
-    from soulstruct.havok.tagfile.structs import TagFileItem
-    from soulstruct.havok.packfile.structs import PackFileDataItem
 
 
 # --- Invalid Types --- #
@@ -249,22 +248,13 @@ class hkVector4f(hkStruct(_float, 4)):
     byte_size = 16
     __tag_format_flags = 11
     tag_type_flags = 1064
+    value_type = Vector4
     local_members = ()
 
-    @classmethod
-    def unpack_tagfile(cls, reader: BinaryReader, offset: int, items: list[TagFileItem] = None) -> Vector4:
-        value = Vector4(super(hkVector4f, cls).unpack_tagfile(reader, offset, items))
-        return value
-    
-    @classmethod
-    def unpack_packfile(cls, item: PackFileDataItem, offset: int = None) -> Vector4:
-        value = Vector4(super(hkVector4f, cls).unpack_packfile(item, offset))
-        return value
-
     @classmethod
     def unpack_primitive_array(cls, reader: BinaryReader, length: int, offset: int = None) -> np.ndarray:
         """Unpack an array of vectors with `numpy`."""
-        data = reader.read(length * 4 * cls.length, offset=offset)
+        data = read_array_buffer(reader, length * 4 * cls.length, offset)
         dtype = np.dtype(f"{reader.byte_order}f4")
         return np.frombuffer(data, dtype=dtype).reshape((length, cls.length))
 
@@ -275,6 +265,7 @@ class hkQuaternionf(hkStruct(_float, 4)):
     byte_size = 16
     __tag_format_flags = 43
     tag_type_flags = 1064
+    value_type = Quaternion
 
     local_members = (
         Member(0, "vec", hkVector4f),
@@ -283,16 +274,6 @@ class hkQuaternionf(hkStruct(_float, 4)):
 
     vec: Vector4
 
-    @classmethod
-    def unpack_tagfile(cls, reader: BinaryReader, offset: int, items: list[TagFileItem] = None) -> Quaternion:
-        value = Quaternion(super(hkQuaternionf, cls).unpack_tagfile(reader, offset, items))
-        return value
-    
-    @classmethod
-    def unpack_packfile(cls, item: PackFileDataItem, offset: int = None) -> Quaternion:
-        value = Quaternion(super(hkQuaternionf, cls).unpack_packfile(item, offset))
-        return value
-
 
 @dataclass(slots=True, eq=False, repr=False, kw_only=True)
 class hkRotationImpl(hkStruct(_float, 12)):
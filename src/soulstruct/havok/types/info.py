@@ -43,9 +43,9 @@ class TemplateInfo:
     type_info: None | TypeInfo = None
     type_py_name: None | str = None
 
-    def indexify(self, type_py_names: list[str]):
+    def indexify(self, type_py_indices: dict[str, int]):
         if self.name.startswith("t"):
-            self.value = type_py_names.index(self.type_py_name)
+            self.value = type_py_indices[self.type_py_name]
         # Otherwise, do nothing ('v' template).
 
     @property
@@ -78,10 +78,10 @@ class MemberInfo:
     type_hint: str | None = None
     required_types: list[str] = field(default_factory=list)
 
-    def indexify(self, type_py_names: list[str]):
+    def indexify(self, type_py_indices: dict[str, int]):
         try:
-            self.type_index = type_py_names.index(self.type_py_name)
-        except ValueError:
+            self.type_index = type_py_indices[self.type_py_name]
+        except KeyError:
             raise ValueError(f"Could not find {self.type_py_name} in types (member \"{self.name}\")")
 
     def deindexify(self, type_infos: list[TypeInfo]):
@@ -125,8 +125,8 @@ class InterfaceInfo:
     type_info: TypeInfo | None = None
     type_py_name: str | None = None
 
-    def indexify(self, type_py_names: list[str]):
-        self.type_index = type_py_names.index(self.type_py_name)
+    def indexify(self, type_py_indices: dict[str, int]):
+        self.type_index = type_py_indices[self.type_py_name]
 
     def __repr__(self):
         return f"InterfaceInfo({self.flags}, <{self.type_py_name}>)"
@@ -175,32 +175,31 @@ class TypeInfo:
 
     py_class: type[hk] | None = None
 
-    def indexify(self, type_py_names: list[str]):
-        """Use `type_py_names` indices and `self.py_class`, if present, to fill in indices.
-
-        `type_py_names` will be padded at the front with an empty string to allow easy retrieval of 1-indices.
+    def indexify(self, type_py_indices: dict[str, int]):
+        """Use `type_py_indices` (which maps type Python names to their 1-indices in the file) and `self.py_class`, if
+        present, to fill in indices.
         """
         for template in self.templates:
-            template.indexify(type_py_names)
+            template.indexify(type_py_indices)
 
         if self.parent_type_py_name is not None:
-            self.parent_type_index = type_py_names.index(self.parent_type_py_name)
+            self.parent_type_index = type_py_indices[self.parent_type_py_name]
         else:
             self.parent_type_index = 0
 
         if self.pointer_type_py_name is not None:
-            self.pointer_type_index = type_py_names.index(self.pointer_type_py_name)
+            self.pointer_type_index = type_py_indices[self.pointer_type_py_name]
         else:
             self.pointer_type_index = 0
 
         for member in self.members:
             try:
-                member.indexify(type_py_names)
+                member.indexify(type_py_indices)
             except ValueError as ex:
                 raise ValueError(f"Error indexifying members of {self.name}: {ex}")
 
         for interface in self.interfaces:
-            interface.indexify(type_py_names)
+            interface.indexify(type_py_indices)
 
     def get_member_info(self, name: str) -> MemberInfo:
         for member in self.members:
@@ -32,7 +32,7 @@ from soulstruct.havok.types.debug import get_indented_array
 
 from soulstruct.havok.enums import TagDataType, HavokModule
 from soulstruct.havok.packfile.structs import PackItemCreationQueues, PackFileDataItem, PackFileTypeItem
-from .info import get_py_name
+from .plans import PackPlanRun, get_pack_plan
 
 from . import debug
 
@@ -188,6 +188,29 @@ def pack_class(
     """`data_pack_queues` can be `None` here for `float` classes packed as classes (with `value` member)."""
     members_start_offset = item.writer.position
 
+    plan = None if debug.DEBUG_PRINT_PACK else get_pack_plan(hk_type, item.writer.byte_order, "pack_packfile")
+    if plan is not None:
+        if plan.has_base_object_pointer:
+            item.writer.pack("V", 0)
+        item.pending_rel_arrays.append(deque())
+        for segment in plan.segments:
+            if item.writer.position > members_start_offset + segment.offset:
+                segment_name = "<primitives>" if type(segment) is PackPlanRun else segment.name
+                try_pad_to_offset(  # will raise
+                    item,
+                    members_start_offset + segment.offset,
+                    f"{segment_name} @ {hex(members_start_offset)} + {hex(segment.offset)}",
+                )
+            item.writer.pad_to_offset(members_start_offset + segment.offset)
+            if type(segment) is PackPlanRun:
+                segment.pack(item.writer, value)
+            else:
+                segment.type.pack_packfile(item, getattr(value, segment.py_name), existing_items, data_pack_queues)
+        try_pad_to_offset(item, members_start_offset + hk_type.get_byte_size(item.long_varints), "End of class")
+        for pending_rel_array in item.pending_rel_arrays.pop():
+            pending_rel_array()
+        return
+
     if "hkBaseObject" in [parent_type.__name__ for parent_type in hk_type.get_type_hierarchy()]:
         # Pointer for the mysterious base object type (probably a pointer to self).
         item.writer.pack("V", 0)
@@ -605,6 +628,8 @@ def unpack_struct(
                 offset=struct_start_offset + i * byte_size,
             ) for i in range(length)
         )
+    elif isinstance(value, np.ndarray) and value.ndim == 1:
+        value = tuple(value.tolist())  # Python scalars, as in non-NumPy mode
     else:
         value = tuple(value)
 
@@ -698,60 +723,39 @@ def pack_string(
     data_pack_queues.child_pointers.append(delayed_string_write)
 
 
-def unpack_named_variant(hk_type: type[hk], item: PackFileDataItem, havok_module: HavokModule) -> hk:
-    """Detects `variant` type dynamically from `className` member."""
+def unpack_named_variant(
+    hk_type: type[hk], item: PackFileDataItem, havok_module: HavokModule, variant_names: tp.Container[str] | None = None
+) -> hk:
+    """Unpack named variant. The variant's type is already known from the item it points to.
 
-    # TODO: Testing just `unpack_class()`. We don't actually need to read 'className' since the variant's type is
-    #  already known from the pointed item.
-    return unpack_class(hk_type, item)
+    If `variant_names` is given and does not contain `className`, the variant is not unpacked and is set to `None`.
+    """
+    if variant_names is None:
+        return unpack_class(hk_type, item)
 
     member_start_offset = item.reader.position
-
-    def _debug_print(member_):
-        if debug.DEBUG_PRINT_UNPACK:
-            offset_hex = hex(member_.offset)
-            item_offset_hex = hex(member_start_offset + member_.offset)
-            # Simple one-off indent.
-            debug.debug_print(
-                f"{Y}{item_offset_hex} ({offset_hex}){X}: {G}'{member_.name}' = {member_.type.__name__}{X}"
-            )
-
-    kwargs = {}
-    # "variant" member type is a subclass of `hkReferencedObject` with name "className".
     name_member, class_name_member, variant_member = hk_type.members[:3]
+    class_name_offset = member_start_offset + class_name_member.offset
+    if class_name_offset in item.all_child_pointers:
+        # Peek at class name without consuming its pointer.
+        variant_type_name = item.reader.unpack_string(
+            offset=item.all_child_pointers[class_name_offset], reset_old_offset=True, encoding=STRING_ENCODING
+        )
+    else:
+        variant_type_name = ""
+    if variant_type_name in variant_names:
+        return unpack_class(hk_type, item)
 
-    _debug_print(name_member)
-    name = name_member.type.unpack_packfile(
-        item, offset=member_start_offset + name_member.offset
-    )
-    kwargs[name_member.name] = name
-
-    _debug_print(class_name_member)
-    variant_type_name = class_name_member.type.unpack_packfile(
-        item, offset=member_start_offset + class_name_member.offset
-    )
-    kwargs[class_name_member.name] = variant_type_name
-
-    variant_py_name = get_py_name(variant_type_name)
-    try:
-        variant_type = types_module[variant_py_name]
-    except KeyError:
-        item.print_item_dump()
-        raise ValueError(f"Variant type '{variant_type_name}' not found in Python types module.")
-    _debug_print(variant_member)
-    item.reader.seek(member_start_offset + variant_member.offset)
     if debug.DEBUG_PRINT_UNPACK:
-        debug.debug_print(f"{Y}{item.hex}: {U}Named Variant '{name}' = {variant_py_name}{X}")
-    variant_instance = unpack_pointer(variant_type, item)
-    if debug.DEBUG_PRINT_UNPACK:
-        debug.debug_print(f"-> {variant_instance}")
-        # debug.decrement_debug_indent()
-    kwargs[variant_member.name] = variant_instance
-
+        debug.debug_print(f"{Y}{item.hex}: {U}Skipping unselected named variant: {variant_type_name}{X}")
+    kwargs = {
+        name_member.name: name_member.type.unpack_packfile(item, member_start_offset + name_member.offset),
+        class_name_member.name: class_name_member.type.unpack_packfile(item, class_name_offset),
+        variant_member.name: None,
+    }
+    item.reader.seek(member_start_offset + hk_type.get_byte_size(item.long_varints))
     # noinspection PyArgumentList
-    instance = hk_type(**kwargs)
-
-    return instance
+    return hk_type(**kwargs)
 
 
 def pack_named_variant(
@@ -0,0 +1,306 @@
+"""Compiled per-type 'plans' for unpacking and packing the members of `hk` classes with few `struct` calls.
+
+Unpacking/packing a class member by member means a dispatching method call (with debug checks) for every bool, int,
+and float in the file. Instead, the members of each `hk` class are classified once (per byte order and file format) and
+all the 'primitive' members -- bools, ints, 32-bit floats, enums/flags stored as those, and fixed-length structs of
+them like `hkVector4f` -- are handled with precompiled `struct.Struct` objects. Any other members (pointers, arrays,
+strings, named variants, nested classes, etc.) still use their type's usual method.
+
+Primitive classification must exactly mirror the dispatch in `hk.unpack_tagfile()`/`hk.pack_tagfile()` (and the
+`hkStruct_` and `hkEnum_` methods), so any type that overrides those methods is never considered primitive.
+
+Plans are not used while debug printing is enabled.
+"""
+from __future__ import annotations
+
+__all__ = [
+    "TagFileUnpackPlan",
+    "get_unpack_plan",
+    "PackPlanRun",
+    "PackPlan",
+    "get_pack_plan",
+]
+
+import struct
+import typing as tp
+
+from soulstruct.havok.enums import TagDataType
+
+if tp.TYPE_CHECKING:
+    from soulstruct.utilities.binary import BinaryWriter
+    from .hk import hk, Member
+
+
+# Maps `(hk_type, byte_order)` to compiled plan (or `None` if a plan could not be compiled for that type).
+_UNPACK_PLANS = {}  # type: dict[tuple[type[hk], str], TagFileUnpackPlan | None]
+# Maps `(hk_type, byte_order, pack_method_name)` to compiled plan (or `None`, as above).
+_PACK_PLANS = {}  # type: dict[tuple[type[hk], str, str], PackPlan | None]
+
+
+def _get_scalar_fmt(hk_type: type[hk], count: int) -> str | None:
+    """Get `struct` format for `count` tightly-packed bools, ints, or 32-bit floats of `hk_type`, if it is one."""
+    tag_data_type = hk_type.get_tag_data_type()
+    if tag_data_type in {TagDataType.Bool, TagDataType.Int}:
+        return TagDataType.get_int_fmt(hk_type.tag_type_flags, count=count)
+    if hk_type.tag_type_flags == TagDataType.FloatAndFloat32:
+        return f"{count}f"
+    return None
+
+
+def _get_method_func(hk_type: type, method_name: str):
+    return getattr(getattr(hk_type, method_name), "__func__", None)
+
+
+# region Unpacking
+
+class TagFileUnpackPlan(tp.NamedTuple):
+    """Compiled recipe for unpacking the members of a given `hk` class from a tagfile.
+
+    All primitive members are unpacked with a single call of `primitive_struct`, which skips over the bytes of any other
+    members. Each entry of `primitive_getters` then pulls one member value out of the resulting tuple. Remaining members
+    are listed in `other_members` and unpacked with their usual type method.
+    """
+    byte_size: int  # number of bytes covered by `primitive_struct`
+    primitive_struct: struct.Struct | None
+    primitive_getters: tuple[tuple[str, tp.Callable[[tuple], tp.Any]], ...]
+    other_members: tuple[tuple[str, type[hk], int], ...]
+
+
+def _get_primitive_unpack_fmt(member_type: type[hk]) -> tuple[str, int, tp.Callable[[tuple], tp.Any] | None] | None:
+    """Get `(fmt, value_count, convert_values)` for a member type that is unpacked straight from bytes, or `None` if
+    the member type must be unpacked with its own `unpack_tagfile()` method.
+    """
+    from .hk import hk
+    from .base import hkEnum_, hkStruct_
+
+    if not isinstance(member_type, type):
+        return None  # unresolved `DefType`
+
+    unpack_func = _get_method_func(member_type, "unpack_tagfile")
+    if unpack_func is _get_method_func(hkEnum_, "unpack_tagfile"):
+        return _get_primitive_unpack_fmt(member_type.storage_type)
+
+    if unpack_func is _get_method_func(hkStruct_, "unpack_tagfile"):
+        data_type = member_type.get_data_type()
+        if not isinstance(data_type, type) or data_type.get_tag_data_type() == TagDataType.Invalid:
+            return None  # rare enough that the normal path is fine
+        length = member_type.length
+        fmt = _get_scalar_fmt(data_type, length)
+        if fmt is None:
+            return None
+        is_bool = data_type.get_tag_data_type() == TagDataType.Bool
+        value_type = member_type.value_type
+        if is_bool and value_type is not None:
+            return fmt, length, lambda values: value_type(tuple(v > 0 for v in values))
+        elif is_bool:
+            return fmt, length, lambda values: tuple(v > 0 for v in values)
+        elif value_type is not None:
+            return fmt, length, value_type
+        return fmt, length, tuple
+
+    if unpack_func is _get_method_func(hk, "unpack_tagfile") and member_type.__name__ != "hkRootLevelContainerNamedVariant":
+        if member_type.get_tag_data_type() == TagDataType.Invalid:
+            return "", 0, lambda _: None
+        fmt = _get_scalar_fmt(member_type, 1)
+        if fmt is None:
+            return None
+        if member_type.get_tag_data_type() == TagDataType.Bool:
+            return fmt, 1, lambda values: values[0] > 0
+        return fmt, 1, None  # single value taken directly
+
+    return None
+
+
+def _make_value_getter(index: int, count: int, convert: tp.Callable | None) -> tp.Callable[[tuple], tp.Any]:
+    if count == 0:
+        return lambda values: convert(())
+    if convert is None:
+        return lambda values: values[index]
+    end = index + count
+    return lambda values: convert(values[index:end])
+
+
+def _compile_unpack_plan(hk_type: type[hk], byte_order: str) -> TagFileUnpackPlan | None:
+    primitives = []  # type: list[tuple[int, str, str, int, tp.Callable | None]]
+    other_members = []
+    for member in hk_type.members:
+        primitive = _get_primitive_unpack_fmt(member.type)
+        if primitive is None:
+            other_members.append((member.py_name, member.type, member.offset))
+        else:
+            primitives.append((member.offset, member.py_name, *primitive))
+
+    fmt = byte_order
+    position = 0
+    value_index = 0
+    primitive_getters = []
+    for offset, py_name, member_fmt, value_count, convert in sorted(primitives, key=lambda p: p[0]):
+        if offset < position:
+            return None  # overlapping members; leave this type to the normal path
+        if offset > position:
+            fmt += f"{offset - position}x"
+        fmt += member_fmt
+        position = offset + struct.calcsize(byte_order + member_fmt)
+        primitive_getters.append((py_name, _make_value_getter(value_index, value_count, convert)))
+        value_index += value_count
+
+    primitive_struct = struct.Struct(fmt) if primitive_getters else None
+    return TagFileUnpackPlan(position, primitive_struct, tuple(primitive_getters), tuple(other_members))
+
+
+def get_unpack_plan(hk_type: type[hk], byte_order: str) -> TagFileUnpackPlan | None:
+    """Get (and cache) the compiled tagfile unpack plan for `hk_type` members with the given `byte_order` (e.g. "<").
+
+    Returns `None` if `hk_type` cannot use a compiled plan, in which case its members are unpacked one at a time.
+    """
+    key = (hk_type, byte_order)
+    try:
+        return _UNPACK_PLANS[key]
+    except KeyError:
+        plan = _UNPACK_PLANS[key] = _compile_unpack_plan(hk_type, byte_order)
+        return plan
+
+# endregion
+
+
+# region Packing
+
+class PackPlanRun(tp.NamedTuple):
+    """Consecutive primitive members of a class, packed with one call of `struct` (which includes null padding)."""
+    offset: int  # relative to class start
+    struct: struct.Struct
+    members: tuple[tuple[str, tp.Callable[[tp.Any], tp.Iterable] | None], ...]  # `(py_name, get_values)`
+
+    def pack(self, writer: BinaryWriter, value: hk):
+        values = []
+        for py_name, get_values in self.members:
+            if get_values is None:
+                values.append(getattr(value, py_name))
+            else:
+                values.extend(get_values(getattr(value, py_name)))
+        writer.pack_struct(self.struct, *values)
+
+
+class PackPlan(tp.NamedTuple):
+    """Compiled recipe for packing the members of a given `hk` class.
+
+    `segments` are in member order. Each is either a `PackPlanRun` of primitive members, or a `Member` that must be
+    packed with its type's usual method.
+    """
+    segments: tuple[PackPlanRun | Member, ...]
+    has_base_object_pointer: bool  # only relevant to packfiles
+
+
+def _get_struct_values_func(
+    data_type: type[hk], length: int, is_bool: bool
+) -> tp.Callable[[tp.Any], tp.Iterable]:
+    """Mirrors the validation in `pack_struct()` and the packing in `hk.try_pack_primitive_array()`."""
+    import numpy as np
+
+    def get_values(value) -> tp.Iterable:
+        if isinstance(value, np.ndarray) and value.ndim > 1:
+            value = value.flatten()
+        if len(value) != length:
+            raise ValueError(f"Length of `{data_type.__name__}` struct is not {length}: {value}")
+        if is_bool:
+            return [int(v) for v in value]
+        return value
+
+    return get_values
+
+
+def _get_primitive_pack_fmt(
+    member_type: type[hk], pack_method_name: str
+) -> tuple[str, tp.Callable[[tp.Any], tp.Iterable] | None] | None:
+    """Get `(fmt, get_values)` for a member type whose value is packed straight to bytes, or `None` if the member type
+    must be packed with its own `pack_method_name` method (`pack_tagfile` or `pack_packfile`).
+    """
+    from .hk import hk
+    from .base import hkEnum_, hkStruct_
+
+    if not isinstance(member_type, type):
+        return None  # unresolved `DefType`
+
+    pack_func = _get_method_func(member_type, pack_method_name)
+    if pack_func is _get_method_func(hkEnum_, pack_method_name):
+        return _get_primitive_pack_fmt(member_type.storage_type, pack_method_name)
+
+    if pack_func is _get_method_func(hkStruct_, pack_method_name):
+        data_type = member_type.get_data_type()
+        if (
+            not isinstance(data_type, type)
+            or data_type.get_tag_data_type() == TagDataType.Invalid
+            or data_type.get_type_name() in {"hkVector4", "hkVector4f"}  # special case in `try_pack_primitive_array()`
+            or _get_method_func(data_type, "try_pack_primitive_array")
+            is not _get_method_func(hk, "try_pack_primitive_array")
+        ):
+            return None
+        fmt = _get_scalar_fmt(data_type, member_type.length)
+        if fmt is None:
+            return None
+        is_bool = data_type.get_tag_data_type() == TagDataType.Bool
+        return fmt, _get_struct_values_func(data_type, member_type.length, is_bool)
+
+    if pack_func is _get_method_func(hk, pack_method_name) and member_type.__name__ != "hkRootLevelContainerNamedVariant":
+        if member_type.get_tag_data_type() == TagDataType.Invalid:
+            return "", lambda _: ()
+        fmt = _get_scalar_fmt(member_type, 1)
+        if fmt is None:
+            return None
+        if member_type.get_tag_data_type() == TagDataType.Bool:
+            return fmt, lambda value: (int(value),)
+        return fmt, None  # single value packed directly
+
+    return None
+
+
+def _compile_pack_plan(hk_type: type[hk], byte_order: str, pack_method_name: str) -> PackPlan | None:
+    segments = []
+    run_offset = run_end = 0
+    run_fmt = ""
+    run_members = []
+
+    def end_run():
+        if run_members:
+            segments.append(PackPlanRun(run_offset, struct.Struct(byte_order + run_fmt), tuple(run_members)))
+            run_members.clear()
+
+    position = 0
+    for member in hk_type.members:
+        if member.offset < position:
+            return None  # overlapping or unordered members; leave this type to the normal path
+        primitive = _get_primitive_pack_fmt(member.type, pack_method_name)
+        if primitive is None:
+            end_run()
+            segments.append(member)
+            position = member.offset  # size of non-primitive member is unknown here
+            continue
+        member_fmt, get_values = primitive
+        if not run_members:
+            run_offset = run_end = member.offset
+            run_fmt = ""
+        if member.offset > run_end:
+            run_fmt += f"{member.offset - run_end}x"
+        run_fmt += member_fmt
+        run_end = position = member.offset + struct.calcsize(byte_order + member_fmt)
+        run_members.append((member.py_name, get_values))
+    end_run()
+
+    has_base_object_pointer = "hkBaseObject" in [parent_type.__name__ for parent_type in hk_type.get_type_hierarchy()]
+    return PackPlan(tuple(segments), has_base_object_pointer)
+
+
+def get_pack_plan(hk_type: type[hk], byte_order: str, pack_method_name: str) -> PackPlan | None:
+    """Get (and cache) the compiled pack plan for `hk_type` members with the given `byte_order` (e.g. "<"), for either
+    the `pack_tagfile` or `pack_packfile` method.
+
+    Returns `None` if `hk_type` cannot use a compiled plan, in which case its members are packed one at a time.
+    """
+    key = (hk_type, byte_order, pack_method_name)
+    try:
+        return _PACK_PLANS[key]
+    except KeyError:
+        plan = _PACK_PLANS[key] = _compile_pack_plan(hk_type, byte_order, pack_method_name)
+        return plan
+
+# endregion
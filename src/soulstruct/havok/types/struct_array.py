@@ -0,0 +1,296 @@
+"""List-like arrays of fixed-layout, pointer-free `hk` types (e.g. `hkQsTransform`, `hkMatrix4`) that are backed by one
+`(N, K)` float32 NumPy array.
+
+Any `hk` tuple of 32-bit floats (like `hkMatrix4f` or `hkQuaternionf`), and any `hk` class made only of such tuples and
+32-bit floats with no padding (like `hkQsTransformf`, which is 12 floats), has its arrays unpacked with a single
+`np.frombuffer` call and packed with a single `tobytes` call. Elements (e.g. `hkQsTransform` instances holding a
+`Quaternion`, or tuple rows of `hkMatrix4`) are only created when they are first indexed, and are then kept, so that
+in-place edits to them are packed as usual.
+
+Arrays are only unpacked as `StructArray`s within `hk.struct_arrays()`. Otherwise, they are still read in one go, but
+all elements are created and returned in a plain list.
+
+(`hkVector4f` arrays are already unpacked as plain `(N, 4)` NumPy arrays and are not affected.)
+"""
+from __future__ import annotations
+
+__all__ = [
+    "FloatRowLayout",
+    "get_float_row_layout",
+    "StructArray",
+    "get_struct_array_or_list",
+]
+
+import typing as tp
+from collections.abc import MutableSequence
+
+import numpy as np
+
+from soulstruct.havok.enums import TagDataType
+from soulstruct.havok.utilities.memory_reader import read_array_buffer
+
+from .plans import _get_method_func
+
+if tp.TYPE_CHECKING:
+    from soulstruct.utilities.binary import BinaryReader, BinaryWriter
+    from .hk import hk
+
+
+# Maps `hk_type` to its float row layout (or `None` if it does not have one).
+_FLOAT_ROW_LAYOUTS = {}  # type: dict[type[hk], FloatRowLayout | None]
+
+
+class FloatRowLayout(tp.NamedTuple):
+    """Describes how one element of a fixed-layout `hk` type maps to a row of 32-bit floats.
+
+    For tuple types, `members` is empty and the whole row is the element. For class types, each entry of `members` gives
+    the member's `py_name`, its columns in the row, and its value type (`float`, `tuple`, or a tuple `value_type` like
+    `Vector4`).
+    """
+    hk_type: type[hk]
+    row_size: int
+    members: tuple[tuple[str, slice, type], ...]
+
+    def get_element(self, row: np.ndarray):
+        """Create a Python element from one row, exactly as `unpack_tagfile()` would have from the same bytes."""
+        values = row.tolist()
+        if not self.members:
+            value_type = getattr(self.hk_type, "value_type", None)
+            return value_type(tuple(values)) if value_type is not None else tuple(values)
+        kwargs = {}
+        for py_name, columns, value_type in self.members:
+            if value_type is float:
+                kwargs[py_name] = values[columns.start]
+            else:
+                kwargs[py_name] = value_type(tuple(values[columns]))
+        return self.hk_type(**kwargs)
+
+    def get_row(self, element) -> np.ndarray:
+        """Flatten a Python element (an `hk` instance, tuple, `Vector4`, etc.) back into one row of floats."""
+        if not self.members:
+            return self._get_floats(element, self.row_size, self.hk_type)
+        row = np.empty(self.row_size, dtype=np.float32)
+        for py_name, columns, _ in self.members:
+            row[columns] = self._get_floats(getattr(element, py_name), columns.stop - columns.start, self.hk_type)
+        return row
+
+    @staticmethod
+    def _get_floats(value, count: int, hk_type: type[hk]) -> np.ndarray:
+        if not isinstance(value, np.ndarray):
+            value = getattr(value, "data", value)  # `Vector4`, `Quaternion`, etc.
+        floats = np.asarray(value, dtype=np.float32).ravel()
+        if floats.size != count:
+            raise ValueError(f"Length of `{hk_type.__name__}` value is not {count}: {value}")
+        return floats
+
+
+def _get_float_tuple_size(hk_type: type[hk]) -> int:
+    """Get the number of floats in `hk_type` if it is a plain, tightly-packed tuple of 32-bit floats, or zero."""
+    from .base import hkStruct_
+
+    if (
+        not isinstance(hk_type, type)
+        or not issubclass(hk_type, hkStruct_)
+        or _get_method_func(hk_type, "unpack_tagfile") is not _get_method_func(hkStruct_, "unpack_tagfile")
+        or _get_method_func(hk_type, "unpack_packfile") is not _get_method_func(hkStruct_, "unpack_packfile")
+        or _get_method_func(hk_type, "pack_tagfile") is not _get_method_func(hkStruct_, "pack_tagfile")
+        or _get_method_func(hk_type, "pack_packfile") is not _get_method_func(hkStruct_, "pack_packfile")
+    ):
+        return 0
+    data_type = hk_type.get_data_type()
+    if not isinstance(data_type, type) or data_type.tag_type_flags != TagDataType.FloatAndFloat32:
+        return 0
+    if hk_type.length <= 0 or hk_type.get_byte_size(True) != 4 * hk_type.length:
+        return 0
+    return hk_type.length
+
+
+def _compile_float_row_layout(hk_type: type[hk]) -> FloatRowLayout | None:
+    from .hk import hk
+
+    if not isinstance(hk_type, type):
+        return None  # unresolved `DefType`
+
+    if tuple_size := _get_float_tuple_size(hk_type):
+        return FloatRowLayout(hk_type, tuple_size, ())
+
+    if (
+        hk_type.get_tag_data_type() != TagDataType.Class
+        or hk_type.__name__ == "hkRootLevelContainerNamedVariant"
+        or not hk_type.members
+        or any(
+            _get_method_func(hk_type, method_name) is not _get_method_func(hk, method_name)
+            for method_name in ("unpack_tagfile", "unpack_packfile", "pack_tagfile", "pack_packfile")
+        )
+    ):
+        return None
+
+    members = []
+    column = 0
+    for member in hk_type.members:
+        if member.offset != 4 * column:
+            return None  # padding or overlap
+        member_type = member.type
+        if isinstance(member_type, type) and member_type.tag_type_flags == TagDataType.FloatAndFloat32:
+            members.append((member.py_name, slice(column, column + 1), float))
+            column += 1
+        elif tuple_size := _get_float_tuple_size(member_type):
+            value_type = member_type.value_type if member_type.value_type is not None else tuple
+            members.append((member.py_name, slice(column, column + tuple_size), value_type))
+            column += tuple_size
+        else:
+            return None
+    if hk_type.get_byte_size(True) != 4 * column:
+        return None  # trailing padding
+    return FloatRowLayout(hk_type, column, tuple(members))
+
+
+def get_float_row_layout(hk_type: type[hk]) -> FloatRowLayout | None:
+    """Get the cached float row layout of `hk_type`, or `None` if its arrays cannot be represented as float rows."""
+    try:
+        return _FLOAT_ROW_LAYOUTS[hk_type]
+    except KeyError:
+        layout = _FLOAT_ROW_LAYOUTS[hk_type] = _compile_float_row_layout(hk_type)
+        return layout
+
+
+class StructArray(MutableSequence):
+    """Lazy, list-like view of an array of a fixed-layout `hk` type, stored as one `(N, K)` float32 NumPy array.
+
+    Indexing creates (and keeps) element objects on demand, so existing code that reads and edits elements like a list
+    (e.g. `skeleton.referencePose[i].translation = ...`) still works. Materialized elements always take precedence over
+    their rows in `array`; use `to_array()` to get an up-to-date `(N, K)` array of all elements.
+
+    Slicing returns a plain `list` of elements, as with the `list` this replaces.
+    """
+
+    __slots__ = ("hk_type", "array", "_elements")
+
+    hk_type: type[hk]
+    array: np.ndarray
+    _elements: list
+
+    def __init__(self, hk_type: type[hk], array: np.ndarray):
+        layout = get_float_row_layout(hk_type)
+        if layout is None:
+            raise TypeError(f"`{hk_type.__name__}` does not have a fixed layout of 32-bit floats.")
+        array = np.asarray(array)
+        if array.dtype.kind != "f":
+            array = array.astype(np.float32)
+        self.hk_type = hk_type
+        self.array = array.reshape((-1, layout.row_size))
+        self._elements = [None] * len(self.array)
+
+    @classmethod
+    def unpack(cls, hk_type: type[hk], reader: BinaryReader, length: int, offset: int = None) -> StructArray:
+        """Read `length` elements of `hk_type` with one read and no element creation."""
+        layout = get_float_row_layout(hk_type)
+        data = read_array_buffer(reader, length * 4 * layout.row_size, offset)
+        array = np.frombuffer(data, dtype=np.dtype(f"{reader.byte_order}f4"))
+        return cls(hk_type, array)
+
+    @staticmethod
+    def try_pack(hk_type: type[hk], writer: BinaryWriter, value: tp.Iterable) -> bool:
+        """Pack `value` (a `StructArray`, NumPy array, or sequence of elements) as an array of `hk_type` in one write.
+
+        Returns `False` if `hk_type` does not have a fixed float layout.
+        """
+        layout = get_float_row_layout(hk_type)
+        if layout is None:
+            return False
+        if isinstance(value, StructArray):
+            array = value.to_array()
+        elif isinstance(value, np.ndarray):
+            array = value
+        else:
+            array = np.array([layout.get_row(element) for element in value], dtype=np.float32)
+        if array.size % layout.row_size:
+            raise ValueError(
+                f"Size of `{hk_type.__name__}` array data ({array.size}) is not a multiple of {layout.row_size}."
+            )
+        writer.append(array.astype(f"{writer.byte_order}f4", copy=False).tobytes())
+        return True
+
+    @property
+    def layout(self) -> FloatRowLayout:
+        return get_float_row_layout(self.hk_type)
+
+    def to_array(self) -> np.ndarray:
+        """Get a new `(N, K)` float32 array of all elements, including any changes to materialized elements."""
+        array = self.array.astype(np.float32)  # always a copy
+        layout = self.layout
+        for i, element in enumerate(self._elements):
+            if element is not None:
+                array[i] = layout.get_row(element)
+        return array
+
+    def _get_element(self, index: int):
+        element = self._elements[index]
+        if element is None:
+            element = self._elements[index] = self.layout.get_element(self.array[index])
+        return element
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def __getitem__(self, index: int | slice):
+        if isinstance(index, slice):
+            return [self._get_element(i) for i in range(*index.indices(len(self)))]
+        return self._get_element(index)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._get_element(i)
+
+    def __setitem__(self, index: int | slice, value):
+        if not isinstance(index, slice):
+            self._elements[index] = value
+            return
+        value = list(value)
+        start, stop, step = index.indices(len(self))
+        if step != 1:
+            indices = range(start, stop, step)
+            if len(value) != len(indices):
+                raise ValueError(
+                    f"attempt to assign sequence of size {len(value)} to extended slice of size {len(indices)}"
+                )
+            for i, element in zip(indices, value):
+                self._elements[i] = element
+            return
+        del self[start:stop]
+        for i, element in enumerate(value):
+            self.insert(start + i, element)
+
+    def __delitem__(self, index: int | slice):
+        if isinstance(index, slice):
+            indices = list(range(*index.indices(len(self))))
+        else:
+            indices = [range(len(self))[index]]  # raises `IndexError`
+        self.array = np.delete(self.array, indices, axis=0)
+        del self._elements[index]
+
+    def insert(self, index: int, value):
+        index = max(0, index + len(self)) if index < 0 else min(index, len(self))  # same clamping as `list.insert()`
+        self.array = np.insert(self.array, index, 0.0, axis=0)  # row is never used while element is set
+        self._elements.insert(index, value)
+
+    def __eq__(self, other):
+        if isinstance(other, StructArray):
+            return self.hk_type is other.hk_type and np.array_equal(self.to_array(), other.to_array())
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"StructArray[{self.hk_type.__name__}]({len(self)} elements)"
+
+
+def get_struct_array_or_list(hk_type: type[hk], array: np.ndarray) -> StructArray | list:
+    """Get a `StructArray` of `hk_type` for `(N, K)` float `array` within `hk.struct_arrays()`, or a plain list of its
+    elements otherwise, matching what unpacking the same array would return."""
+    from .hk import hk
+
+    struct_array = StructArray(hk_type, array)
+    return struct_array if hk._STRUCT_ARRAYS else list(struct_array)
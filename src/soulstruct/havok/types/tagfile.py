@@ -33,6 +33,7 @@ from soulstruct.havok.enums import TagDataType, HavokModule
 from soulstruct.havok.exceptions import TypeNotDefinedError
 from soulstruct.havok.tagfile.structs import TagItemCreationQueues, TagFileItem
 from .info import get_py_name
+from .plans import PackPlanRun, get_unpack_plan, get_pack_plan
 
 from . import debug
 
@@ -104,9 +105,25 @@ def unpack_class(hk_type: type[hk], reader: BinaryReader, items: list[TagFileIte
     NOTE: Some Havok member names start with numbers, which is invalid in Python. These are renamed in the `hk` class
     definitions to start with an underscore.
     """
-    kwargs = {}
     member_start_offset = reader.position
 
+    plan = None if debug.DEBUG_PRINT_UNPACK else get_unpack_plan(hk_type, reader.byte_order)
+    if plan is not None:
+        if plan.primitive_struct is not None:
+            values = plan.primitive_struct.unpack(reader.read(plan.byte_size))
+            kwargs = {py_name: get_value(values) for py_name, get_value in plan.primitive_getters}
+        else:
+            kwargs = {}
+        for py_name, member_type, member_offset in plan.other_members:
+            kwargs[py_name] = member_type.unpack_tagfile(reader, member_start_offset + member_offset, items)
+        if instance is None:
+            # noinspection PyArgumentList
+            return hk_type(**kwargs)
+        for key, value in kwargs.items():
+            setattr(instance, key, value)
+        return instance
+
+    kwargs = {}
     if debug.DEBUG_PRINT_UNPACK:
         debug.increment_debug_indent()
     for member in hk_type.members:
@@ -137,6 +154,19 @@ def pack_class(
 ):
     member_start_offset = item.writer.position
 
+    plan = None if debug.DEBUG_PRINT_PACK else get_pack_plan(hk_type, item.writer.byte_order, "pack_tagfile")
+    if plan is not None:
+        for segment in plan.segments:
+            item.writer.pad_to_offset(member_start_offset + segment.offset)
+            if type(segment) is PackPlanRun:
+                segment.pack(item.writer, value)
+            else:
+                segment.type.pack_tagfile(
+                    item, getattr(value, segment.py_name), items, existing_items, item_creation_queues
+                )
+        item.writer.pad_to_offset(member_start_offset + hk_type.get_byte_size(True))
+        return
+
     if debug.DEBUG_PRINT_PACK:
         debug.increment_debug_indent()
     for member in hk_type.members:
@@ -223,7 +253,7 @@ def pack_pointer(
         # Item may have been created since this function was queued.
         if value in existing_items:
             existing_item = existing_items[value]
-            item.writer.fill("ptr_offset", items.index(existing_item), obj=value)
+            item.writer.fill("ptr_offset", existing_item.index, obj=value)
             return None
 
         # Create new `TagFileItem`.
@@ -231,6 +261,7 @@ def pack_pointer(
         value_data_hk_type = type(value)  # type: type[hk]  # may be a subclass of `data_hk_type`
         new_item = TagFileItem(
             hk_type=ptr_hk_type,
+            index=len(items),
             is_ptr=value_data_hk_type.get_tag_data_type() == TagDataType.Class,
             value=value,
             writer=BinaryWriter(byte_order=_item_creation_queues.byte_order),
@@ -315,6 +346,7 @@ def pack_array(
         item.writer.fill("array_offset", len(items), obj=value)
         new_item = TagFileItem(
             hk_type=array_hk_type,
+            index=len(items),
             is_ptr=False,
             length=len(value),
             value=value,
@@ -439,6 +471,7 @@ def pack_string(
         encoded = value.encode("shift_jis_2004") + b"\0"
         new_item = TagFileItem(
             hk_type=string_hk_type,
+            index=len(items),
             is_ptr=False,
             length=len(encoded),
             value=value,
@@ -463,9 +496,16 @@ def pack_string(
 
 
 def unpack_named_variant(
-    hk_type: type[hk], reader: BinaryReader, items: list[TagFileItem], havok_module: HavokModule
+    hk_type: type[hk],
+    reader: BinaryReader,
+    items: list[TagFileItem],
+    havok_module: HavokModule,
+    variant_names: tp.Container[str] | None = None,
 ) -> hk:
-    """Detects `variant` type dynamically from `className` member."""
+    """Detects `variant` type dynamically from `className` member.
+
+    If `variant_names` is given and does not contain `className`, the variant is not unpacked and is set to `None`.
+    """
     kwargs = {}
     member_start_offset = reader.position
     # "variant" member type is a subclass of `hkReferencedObject` with name "className".
@@ -478,6 +518,12 @@ def unpack_named_variant(
         reader, member_start_offset + class_name_member.offset, items
     )
     kwargs[class_name_member.name] = variant_type_name
+    if variant_names is not None and variant_type_name not in variant_names:
+        if debug.DEBUG_PRINT_UNPACK:
+            debug.debug_print(f"Skipping unselected named variant: {variant_type_name}")
+        kwargs[variant_member.name] = None
+        # noinspection PyArgumentList
+        return hk_type(**kwargs)
     variant_py_name = get_py_name(variant_type_name)
     try:
         variant_type = havok_module.get_type(variant_py_name)
@@ -0,0 +1,95 @@
+"""Lazy loading of the Python classes in each Havok version subpackage (`hk2015`, etc.).
+
+Every version subpackage defines hundreds of `hk` subclasses, one per module. Rather than importing all of them when
+the subpackage is first imported, each subpackage `__init__.py` loads a generated `_type_index.py` module that maps
+type names to the submodules that define them, and only imports a type's submodule (which imports the types it depends
+on) the first time that type is accessed as an attribute of the subpackage. All `core` types are still imported up
+front.
+
+Run `write_type_index()` again for a version after adding or removing type modules.
+"""
+from __future__ import annotations
+
+__all__ = ["LazyTypeModule", "set_lazy_type_module", "get_type_index", "write_type_index"]
+
+import ast
+import importlib
+import sys
+from pathlib import Path
+from types import ModuleType
+
+# Modules in a version subpackage that never hold lazily-loaded types.
+_NON_TYPE_MODULE_NAMES = {"__init__", "core", "enums", "_type_index"}
+
+
+class LazyTypeModule(ModuleType):
+    """Module class of a Havok version subpackage, which imports the submodule of a type on first attribute access."""
+
+    _TYPE_MODULES: dict[str, str]
+
+    def __getattr__(self, name: str):
+        try:
+            submodule_name = self._TYPE_MODULES[name]
+        except KeyError:
+            raise AttributeError(f"Havok module '{self.__name__}' has no attribute '{name}'.") from None
+        submodule = importlib.import_module(f"{self.__name__}.{submodule_name}")
+        havok_type = getattr(submodule, name)
+        self.__dict__[name] = havok_type
+        return havok_type
+
+    def __setattr__(self, name: str, value):
+        if isinstance(value, ModuleType) and name in self._TYPE_MODULES:
+            # Import system is binding a type's newly imported submodule to this package. The type itself will be bound
+            # instead the first time it is accessed.
+            return
+        super().__setattr__(name, value)
+
+    def __dir__(self) -> list[str]:
+        return sorted({*super().__dir__(), *self._TYPE_MODULES})
+
+
+def set_lazy_type_module(module_name: str, type_modules: dict[str, str]):
+    """Convert already-imported version subpackage `module_name` into a `LazyTypeModule` using `type_modules` index.
+
+    Also sets `__all__` so that `from hk2015 import *` (for example) still provides all types, at the cost of loading
+    them all.
+    """
+    module = sys.modules[module_name]
+    module._TYPE_MODULES = type_modules
+    module.__all__ = [*module.core.__all__, "VERSION", *type_modules]
+    module.__class__ = LazyTypeModule
+
+
+def get_type_index(version_path: Path) -> dict[str, str]:
+    """Find all classes defined at the top level of type modules in version subpackage directory `version_path`.
+
+    Returns a dictionary mapping class names to relative submodule names (e.g. `'_hka.hkaSkeleton'`).
+    """
+    type_modules = {}
+    for module_path in sorted(version_path.rglob("*.py")):
+        if module_path.stem in _NON_TYPE_MODULE_NAMES:
+            continue
+        submodule_name = ".".join(module_path.relative_to(version_path).with_suffix("").parts)
+        for node in ast.parse(module_path.read_text(encoding="utf-8")).body:
+            if isinstance(node, ast.ClassDef):
+                if node.name in type_modules:
+                    raise ValueError(
+                        f"Type `{node.name}` is defined in both `{type_modules[node.name]}` and `{submodule_name}`."
+                    )
+                type_modules[node.name] = submodule_name
+    return type_modules
+
+
+def write_type_index(version_name: str):
+    """Regenerate `_type_index.py` for version subpackage `version_name` (e.g. `'hk2015'`)."""
+    version_path = Path(__file__).parent / version_name
+    type_modules = get_type_index(version_path)
+    lines = [
+        f'"""Generated by `soulstruct.havok.types.type_index.write_type_index("{version_name}")`. Do not edit."""',
+        "",
+        "TYPE_MODULES = {",
+        *(f'    "{name}": "{submodule_name}",' for name, submodule_name in type_modules.items()),
+        "}",
+        "",
+    ]
+    (version_path / "_type_index.py").write_text("\n".join(lines), encoding="utf-8")
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
-__all__ = ["convert_hk"]
+__all__ = ["convert_hk", "ConversionPlan", "get_conversion_plan"]
 
-import copy
 import typing as tp
 from types import ModuleType
 
 from soulstruct.havok.enums import MemberFlags
-from soulstruct.havok.types.hk import hk
+from soulstruct.havok.types.hk import Member, hk
 from soulstruct.havok.types.base import hkBasePointer
+from soulstruct.havok.types.struct_array import StructArray
 
 
 class HKConversionError(Exception):
@@ -23,6 +23,43 @@ def find_type(types_module: ModuleType, name: str):
         raise HKConversionError(f"Could not find a class named `{name}` in dest types module.")
 
 
+class ConversionPlan(tp.NamedTuple):
+    """Member mapping from one `hk` class to another, computed once per (source type, dest type) pair."""
+
+    # (name, member type) of members in both types, in source order.
+    shared_members: tuple[tuple[str, type[hk]], ...]
+    # (name, is not serializable) of source members missing from dest type, in source order.
+    source_only_members: tuple[tuple[str, bool], ...]
+    # Dest members missing from source type.
+    dest_only_members: tuple[Member, ...]
+
+
+_CONVERSION_PLANS = {}  # type: dict[tuple[type[hk], type[hk]], ConversionPlan]
+
+
+def get_conversion_plan(source_type: type[hk], dest_type: type[hk]) -> ConversionPlan:
+    """Get the (cached) member mapping used by `convert_hk()` to convert `source_type` instances to `dest_type`."""
+    try:
+        return _CONVERSION_PLANS[source_type, dest_type]
+    except KeyError:
+        pass
+    dest_member_names = set(dest_type.get_member_names())
+    source_member_names = {member.name for member in source_type.members}
+    plan = ConversionPlan(
+        shared_members=tuple(
+            (member.name, member.type) for member in source_type.members if member.name in dest_member_names
+        ),
+        source_only_members=tuple(
+            (member.name, bool(member.extra_flags & MemberFlags.NotSerializable))
+            for member in source_type.members
+            if member.name not in dest_member_names
+        ),
+        dest_only_members=tuple(member for member in dest_type.members if member.name not in source_member_names),
+    )
+    _CONVERSION_PLANS[source_type, dest_type] = plan
+    return plan
+
+
 # Source error handler: takes `source_object`, `member_name`, `source_member_value`, and `dest_kwargs` and returns
 # a list of member names that were handled. If the handler cannot resolve the problem, it should return `None` and
 # the error will be raised to the caller.
@@ -39,13 +76,21 @@ def convert_hk(
     dest_types_module: ModuleType,
     source_error_handler: SOURCE_ERROR_HANDLER_TYPING = None,
     dest_error_handler: DEST_ERROR_HANDLER_TYPING = None,
-    indent="",
+    memo: dict[int, tuple[hk, hk]] = None,
 ):
     """Recursively convert all member values in `source_object` to members of an instance of `dest_object_type`.
 
     This operates by iterating over the members of the class and calling this function again when another `hk` instance
     is found as a member value, passing in the `hk` type detected in that member's information in `dest_object_type`.
-    Non-`hk` members (primitive Python types or arrays) are deep-copied directly.
+    Non-`hk` members (primitive Python types, `Vector4`s, arrays, etc.) are NOT copied: the dest object shares them with
+    the source object, so the source object should be discarded or treated as read-only afterward. Lists are new lists.
+
+    Which members are copied, dropped, or filled with defaults is only worked out once for each pair of source and dest
+    types (see `get_conversion_plan()`). Every `hk` instance is converted only once, even if it is referenced by more
+    than one member (e.g. an animation in both an `hkaAnimationContainer` and its `hkaAnimationBinding`), and all
+    references to it will point to the same dest instance. Pass the same `memo` dictionary to multiple calls to share
+    converted instances between them. Like `copy.deepcopy()` memos, it maps the `id()` of each source instance to a
+    `(source, dest)` tuple, which keeps the source instance alive so that its `id()` cannot be reused.
 
     If a member name in `source_object` is not found in `dest_object_type`, an error will be raised and the converter
     will attempt to handle it automatically: the `source_object`, the member name, the member value, and the in-progress
@@ -63,33 +108,67 @@ def convert_hk(
 
     Typically, you will call this on the `hkRootLevelContainer` at the top of the HKX file.
     """
-    dest_kwargs = {}
-    dest_object_member_names = dest_object_type.get_member_names()
-    handled_dest_member_names = []
-
-    for member in source_object.members:
-
-        member_name = member.name
-        source_member_value = getattr(source_object, member_name)
-
-        if member_name not in dest_object_member_names:
-            if source_error_handler:
-                handled_names = source_error_handler(source_object, member_name, source_member_value, dest_kwargs)
-                if handled_names is None:
-
-                    if member.extra_flags & MemberFlags.NotSerializable:
-                        # This member is not serialized, so we can just skip it.
-                        continue
-
-                    raise HKConversionError(
-                        f"Error handler could not resolve missing member '{member_name}' for destination object "
-                        f"{dest_object_type.__name__}."
-                    )
-                # Handled names could be empty (e.g., deleted members).
-                handled_dest_member_names += handled_names
-                continue
+    if memo is None:
+        memo = {}
+    converter = _HKConverter(dest_types_module, source_error_handler, dest_error_handler, memo)
+    return converter.convert(source_object, dest_object_type)
+
+
+class _HKConverter:
+    """Holds the arguments of one `convert_hk()` call while recurring through `hk` instances."""
+
+    def __init__(
+        self,
+        dest_types_module: ModuleType,
+        source_error_handler: SOURCE_ERROR_HANDLER_TYPING | None,
+        dest_error_handler: DEST_ERROR_HANDLER_TYPING | None,
+        memo: dict[int, tuple[hk, hk]],
+    ):
+        self.dest_types_module = dest_types_module
+        self.source_error_handler = source_error_handler
+        self.dest_error_handler = dest_error_handler
+        self.memo = memo
+        self.dest_types = {}  # type: dict[type[hk], type[hk]]
+
+    def get_dest_type(self, source_type: type[hk]) -> type[hk]:
+        """Find dest class with the same name as `source_type` (which may be a subclass of a member's documented type)."""
+        try:
+            return self.dest_types[source_type]
+        except KeyError:
+            dest_type = self.dest_types[source_type] = find_type(self.dest_types_module, source_type.__name__)
+            return dest_type
+
+    def convert(self, source_object: hk, dest_object_type: type[hk]) -> hk:
+        try:
+            return self.memo[id(source_object)][1]
+        except KeyError:
+            pass
+
+        plan = get_conversion_plan(type(source_object), dest_object_type)
+        dest_kwargs = {}
+        handled_dest_member_names = set()
+
+        for member_name, member_type in plan.shared_members:
+            dest_kwargs[member_name] = self.convert_value(source_object, member_name, member_type)
+            handled_dest_member_names.add(member_name)
+
+        for member_name, is_not_serializable in plan.source_only_members:
+            if self.source_error_handler:
+                source_member_value = getattr(source_object, member_name)
+                handled_names = self.source_error_handler(source_object, member_name, source_member_value, dest_kwargs)
+                if handled_names is not None:
+                    # Handled names could be empty (e.g., deleted members).
+                    handled_dest_member_names.update(handled_names)
+                    continue
+                if is_not_serializable:
+                    # This member is not serialized, so we can just skip it.
+                    continue
+                raise HKConversionError(
+                    f"Error handler could not resolve missing member '{member_name}' for destination object "
+                    f"{dest_object_type.__name__}."
+                )
 
-            if member.extra_flags & MemberFlags.NotSerializable:
+            if is_not_serializable:
                 # This member is not serialized, so we can just skip it. Note that we still allow manual handling above,
                 # though I can't think you'd ever want to do this except to be maximally explicit.
                 continue
@@ -98,70 +177,12 @@ def convert_hk(
                 f"Cannot find member name '{member_name}' in destination object {dest_object_type.__name__}"
             )
 
-        if isinstance(source_member_value, hk):
-            # Find matching class (may be a subclass of documented type for `hk` instances) and recur converter.
-            source_member_type = type(source_member_value)  # type: type[hk]  # could be a subclass
-            dest_member_type = find_type(dest_types_module, source_member_type.__name__)
-            dest_member_value = convert_hk(
-                source_member_value,
-                dest_member_type,
-                dest_types_module,
-                source_error_handler,
-                dest_error_handler,
-                indent + " " * 4,
-            )
-        elif isinstance(source_member_value, (list, tuple)):
-            source_member_type = source_object.get_member(member_name).type
-            if not issubclass(source_member_type, hkBasePointer):
-                raise TypeError(
-                    f"Expected list/tuple member '{member_name}' type `{source_member_type.__name__}` to be a "
-                    f"`hkBasePointer` subclass, but it is not."
-                )
-            source_member_type: tp.Type[hkBasePointer]
-
-            dest_elements = []
-            dest_element_type = None
-
-            for source_element in source_member_value:
-                if isinstance(source_element, hk):
-                    if dest_element_type is None:  # only needed for first element (which could be a subclass)
-                        dest_element_type = find_type(dest_types_module, type(source_element).__name__)
-                    dest_element = convert_hk(
-                        source_element,
-                        dest_element_type,
-                        dest_types_module,
-                        source_error_handler,
-                        dest_error_handler,
-                        indent + " " * 4,
-                    )
-                    dest_elements.append(dest_element)
-                elif isinstance(source_element, (list, tuple)):
-                    # Assert primitive/empty.
-                    if not source_element or isinstance(source_element[0], (float, int)):
-                        dest_elements.append(copy.deepcopy(source_element))
-                    else:
-                        raise NotImplementedError(
-                            f"Too lazy to implement conversion for lists/tuples of lists/tuples yet. Source object "
-                            f"type {source_object.get_type_name()}, member name {member_name}."
-                        )
-                else:  # primitive (could still be a class such as `Vector4`, so we copy)
-                    dest_elements.append(copy.deepcopy(source_element))
-
-            if isinstance(source_member_value, tuple):
-                dest_member_value = tuple(dest_elements)
-            else:
-                dest_member_value = dest_elements  # list is correct
-        else:  # primitive (could still be a class such as `Vector4`, so we copy)
-            dest_member_value = copy.deepcopy(source_member_value)
-
-        dest_kwargs[member_name] = dest_member_value
-        handled_dest_member_names.append(member_name)
-
-    # Check that all dest members were handled.
-    for dest_member in dest_object_type.members:
-        dest_member_name = dest_member.name
-        if dest_member_name not in handled_dest_member_names:
-            if dest_error_handler and dest_error_handler(dest_object_type, dest_kwargs, dest_member_name):
+        # Check that all dest members were handled.
+        for dest_member in plan.dest_only_members:
+            dest_member_name = dest_member.name
+            if dest_member_name in handled_dest_member_names:
+                continue
+            if self.dest_error_handler and self.dest_error_handler(dest_object_type, dest_kwargs, dest_member_name):
                 continue  # error was handled
 
             # Try to get default value (`NotSerializable` members only).
@@ -182,5 +203,45 @@ def convert_hk(
                 f"set and no default value is available."
             )
 
-    # noinspection PyArgumentList
-    return dest_object_type(**dest_kwargs)
+        # noinspection PyArgumentList
+        dest_object = dest_object_type(**dest_kwargs)
+        self.memo[id(source_object)] = (source_object, dest_object)
+        return dest_object
+
+    def convert_value(self, source_object: hk, member_name: str, member_type: type[hk]) -> tp.Any:
+        source_member_value = getattr(source_object, member_name)
+
+        if isinstance(source_member_value, hk):
+            return self.convert(source_member_value, self.get_dest_type(type(source_member_value)))
+
+        if isinstance(source_member_value, StructArray):
+            # Fixed float layout (e.g. `hkQsTransform`) is the same in all versions. Elements are created lazily.
+            dest_element_type = self.get_dest_type(source_member_value.hk_type)
+            return StructArray(dest_element_type, source_member_value.to_array())
+
+        if isinstance(source_member_value, (list, tuple)):
+            if not issubclass(member_type, hkBasePointer):
+                raise TypeError(
+                    f"Expected list/tuple member '{member_name}' type `{member_type.__name__}` to be a "
+                    f"`hkBasePointer` subclass, but it is not."
+                )
+            dest_elements = []
+            for source_element in source_member_value:
+                if isinstance(source_element, hk):
+                    dest_elements.append(self.convert(source_element, self.get_dest_type(type(source_element))))
+                elif isinstance(source_element, (list, tuple)):
+                    # Assert primitive/empty.
+                    if source_element and not isinstance(source_element[0], (float, int)):
+                        raise NotImplementedError(
+                            f"Too lazy to implement conversion for lists/tuples of lists/tuples yet. Source object "
+                            f"type {source_object.get_type_name()}, member name {member_name}."
+                        )
+                    dest_elements.append(source_element)
+                else:  # primitive (could still be a class such as `Vector4`, which is shared)
+                    dest_elements.append(source_element)
+            if isinstance(source_member_value, tuple):
+                return tuple(dest_elements)
+            return dest_elements  # list is correct
+
+        # Primitive (could still be a class such as `Vector4`, which is shared).
+        return source_member_value
@@ -9,9 +9,27 @@ __all__ = [
     "next_power_of_two",
     "Quaternion",
     "TRSTransform",
+    "QuaternionArray",
+    "TRSTransformArray",
+    "multiply_quaternions",
+    "invert_quaternions",
+    "normalize_quaternions",
+    "rotate_vectors",
+    "compose_trs_arrays",
+    "invert_trs_arrays",
 ]
 
 from soulstruct.utilities.maths import Vector3, Vector4, Matrix3, Matrix4
 from .misc import invert_matrix3, invert_matrix4, float32, next_power_of_two
 from .quaternion import Quaternion
 from .trs_transform import TRSTransform
+from .quaternion_array import QuaternionArray
+from .trs_transform_array import TRSTransformArray
+from .batched import (
+    multiply_quaternions,
+    invert_quaternions,
+    normalize_quaternions,
+    rotate_vectors,
+    compose_trs_arrays,
+    invert_trs_arrays,
+)
@@ -0,0 +1,87 @@
+"""Vectorized operations on NumPy arrays of quaternions and TRS transforms, for processing many bones and/or frames
+at once instead of composing `Quaternion` and `TRSTransform` instances one at a time.
+
+Quaternions are stored as `[x, y, z, w]` (like Havok and `scipy`) in the last axis of arrays with shape `(..., 4)`.
+TRS transforms are stored as `[tx, ty, tz, qx, qy, qz, qw, sx, sy, sz]` (like `TRSTransform.ravel()`) in the last axis
+of arrays with shape `(..., 10)`. All functions broadcast over any leading axes (e.g. frames and tracks).
+"""
+from __future__ import annotations
+
+__all__ = [
+    "multiply_quaternions",
+    "invert_quaternions",
+    "normalize_quaternions",
+    "rotate_vectors",
+    "compose_trs_arrays",
+    "invert_trs_arrays",
+]
+
+import numpy as np
+
+
+def multiply_quaternions(q1: np.ndarray, q2: np.ndarray) -> np.ndarray:
+    """Hamilton product `q1 * q2` of quaternions, equivalent to `Quaternion.__matmul__` (composing rotations)."""
+    x1, y1, z1, w1 = np.moveaxis(np.asarray(q1), -1, 0)
+    x2, y2, z2, w2 = np.moveaxis(np.asarray(q2), -1, 0)
+    return np.stack(
+        [
+            w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+            w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+            w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+            w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+        ],
+        axis=-1,
+    )
+
+
+def invert_quaternions(q: np.ndarray) -> np.ndarray:
+    """Conjugate quaternions, which inverts them if they are normalized."""
+    q_inv = np.array(q, dtype=np.float64)
+    q_inv[..., :3] *= -1.0
+    return q_inv
+
+
+def normalize_quaternions(q: np.ndarray) -> np.ndarray:
+    """Normalize quaternions. Zero-norm quaternions (e.g. from spline control points) become the identity, as they do
+    for `Quaternion`."""
+    q = np.asarray(q, dtype=np.float64)
+    norms = np.linalg.norm(q, axis=-1, keepdims=True)
+    normalized = np.divide(q, norms, out=np.zeros_like(q), where=norms > 0.0)
+    normalized[..., 3] = np.where(norms[..., 0] > 0.0, normalized[..., 3], 1.0)
+    return normalized
+
+
+def rotate_vectors(q: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """Rotate 3D vectors `v` by normalized quaternions `q`."""
+    q = np.asarray(q)
+    u = q[..., :3]
+    uv = np.cross(u, v)
+    return v + 2.0 * (q[..., 3:4] * uv + np.cross(u, uv))
+
+
+def compose_trs_arrays(trs1: np.ndarray, trs2: np.ndarray, scale_translation=True) -> np.ndarray:
+    """Compose TRS transforms `trs1` and `trs2` exactly like `TRSTransform.compose()` (or `@` by default).
+
+    Rotations must be normalized.
+    """
+    trs1 = np.asarray(trs1)
+    trs2 = np.asarray(trs2)
+    translation2 = trs1[..., 7:10] * trs2[..., :3] if scale_translation else trs2[..., :3]
+    return np.concatenate(
+        [
+            trs1[..., :3] + rotate_vectors(trs1[..., 3:7], translation2),
+            multiply_quaternions(trs1[..., 3:7], trs2[..., 3:7]),
+            trs1[..., 7:10] * trs2[..., 7:10],
+        ],
+        axis=-1,
+    )
+
+
+def invert_trs_arrays(trs: np.ndarray) -> np.ndarray:
+    """Invert TRS transforms exactly like `TRSTransform.inverse()`. Rotations must be normalized."""
+    trs = np.asarray(trs)
+    inv_rotation = invert_quaternions(trs[..., 3:7])
+    return np.concatenate(
+        [-rotate_vectors(inv_rotation, trs[..., :3]), inv_rotation, 1.0 / trs[..., 7:10]],
+        axis=-1,
+    )
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+__all__ = ["QuaternionArray"]
+
+import typing as tp
+
+import numpy as np
+from scipy.spatial.transform import Rotation
+
+from soulstruct.utilities.maths import Vector4
+
+from .batched import multiply_quaternions, invert_quaternions, normalize_quaternions, rotate_vectors
+from .quaternion import Quaternion
+
+
+class QuaternionArray:
+    """Sequence of quaternions backed by one contiguous `(N, 4)` float64 array of `[x, y, z, w]` rows.
+
+    Supports the same core operations as `Quaternion` (composition with `@`, inversion, slerping, vector rotation, and
+    Euler angle conversion), but for all `N` quaternions at once, without creating a `Quaternion` (and `scipy`
+    `Rotation`) for each one. Indexing with an integer returns a `Quaternion`; indexing with a slice or index array
+    returns another `QuaternionArray`.
+
+    Like `Quaternion`, rows may be zero-norm (e.g. spline control points with weight zero). These are treated as the
+    identity whenever they must be normalized.
+    """
+
+    __slots__ = ("data",)
+
+    data: np.ndarray
+
+    def __init__(self, data: np.ndarray | tp.Sequence[tp.Sequence[float]] | QuaternionArray):
+        if isinstance(data, QuaternionArray):
+            data = data.data
+        data = np.ascontiguousarray(data, dtype=np.float64)
+        if data.ndim != 2 or data.shape[1] != 4:
+            raise ValueError(f"`QuaternionArray` data must have shape `(N, 4)`, not {data.shape}.")
+        self.data = data
+
+    # region Construction and Conversion
+
+    @classmethod
+    def identity(cls, count: int) -> QuaternionArray:
+        data = np.zeros((count, 4), dtype=np.float64)
+        data[:, 3] = 1.0
+        return cls(data)
+
+    @classmethod
+    def from_quaternions(cls, quaternions: tp.Iterable[Quaternion | Vector4 | tp.Sequence[float]]) -> QuaternionArray:
+        """Create from `Quaternion` instances (or anything else with four `[x, y, z, w]` elements)."""
+        rows = [q.data if isinstance(q, (Quaternion, Vector4)) else q for q in quaternions]
+        return cls(np.reshape(np.array(rows, dtype=np.float64), (-1, 4)))
+
+    def to_quaternions(self) -> list[Quaternion]:
+        return [Quaternion(row) for row in self.data]
+
+    @classmethod
+    def from_rotation(cls, rotation: Rotation) -> QuaternionArray:
+        """Create from a (multiple) `scipy` `Rotation`."""
+        return cls(np.reshape(rotation.as_quat(), (-1, 4)))
+
+    def to_rotation(self) -> Rotation:
+        """Get a single `scipy` `Rotation` holding all quaternions (e.g. to get rotation matrices)."""
+        return Rotation.from_quat(normalize_quaternions(self.data))
+
+    @classmethod
+    def from_euler_angles_rad(cls, euler_xyz: np.ndarray, order="xzy") -> QuaternionArray:
+        """Create from an `(N, 3)` array of `(x, y, z)` Euler angles in radians.
+
+        Angles are applied in `order` about the fixed axes, exactly like `Quaternion.from_euler_angles_rad()` (i.e. the
+        default 'xzy' order means the rotation matrix `Ry @ Rz @ Rx`).
+        """
+        euler_xyz = np.reshape(np.asarray(euler_xyz, dtype=np.float64), (-1, 3))
+        return cls.from_rotation(Rotation.from_euler(order, euler_xyz[:, cls._get_euler_columns(order)]))
+
+    @classmethod
+    def from_euler_angles_deg(cls, euler_xyz: np.ndarray, order="xzy") -> QuaternionArray:
+        return cls.from_euler_angles_rad(np.radians(euler_xyz), order=order)
+
+    def to_euler_angles_rad(self, order="xzy") -> np.ndarray:
+        """Decompose into an `(N, 3)` array of `(x, y, z)` Euler angles in radians. Any `order` of the three axes is
+        supported (unlike `Quaternion.to_euler_angles_rad()`)."""
+        euler_xyz = np.empty((len(self), 3), dtype=np.float64)
+        euler_xyz[:, self._get_euler_columns(order)] = self.to_rotation().as_euler(order)
+        return euler_xyz
+
+    def to_euler_angles_deg(self, order="xzy") -> np.ndarray:
+        return np.degrees(self.to_euler_angles_rad(order=order))
+
+    @staticmethod
+    def _get_euler_columns(order: str) -> list[int]:
+        """Get the `(x, y, z)` columns of Euler angles in the given (lower-case, extrinsic) axis `order`."""
+        if sorted(order) != ["x", "y", "z"]:
+            raise ValueError(f"Euler angle `order` must contain each of 'x', 'y', and 'z' once, not '{order}'.")
+        return ["xyz".index(axis) for axis in order]
+
+    # endregion
+
+    # region Arithmetic
+
+    def inverse(self) -> QuaternionArray:
+        """Get inverse rotations. Quaternions are normalized first."""
+        return QuaternionArray(invert_quaternions(normalize_quaternions(self.data)))
+
+    def normalized(self) -> QuaternionArray:
+        return QuaternionArray(normalize_quaternions(self.data))
+
+    def norms(self) -> np.ndarray:
+        return np.linalg.norm(self.data, axis=1)
+
+    def dot(self, other: QuaternionArray | Quaternion | np.ndarray) -> np.ndarray:
+        """Row-wise dot products with `other` (which may also be a single quaternion)."""
+        return np.sum(self.data * self._get_other_data(other), axis=-1)
+
+    def rotate_vectors(self, vectors: np.ndarray) -> np.ndarray:
+        """Rotate an `(N, 3)` array of vectors (or one vector) by each normalized quaternion."""
+        return rotate_vectors(normalize_quaternions(self.data), np.asarray(vectors, dtype=np.float64))
+
+    def __matmul__(self, other: QuaternionArray | Quaternion) -> QuaternionArray:
+        """Compose rotations row-wise, like `Quaternion.__matmul__`. `other` may be a single `Quaternion`, and either
+        side may have length one to compose it with every row of the other side."""
+        return QuaternionArray(multiply_quaternions(self.data, self._get_other_data(other)))
+
+    def __neg__(self) -> QuaternionArray:
+        return QuaternionArray(-self.data)
+
+    @staticmethod
+    def _get_other_data(other: QuaternionArray | Quaternion | np.ndarray) -> np.ndarray:
+        if isinstance(other, (QuaternionArray, Quaternion)):
+            return np.asarray(other.data, dtype=np.float64)
+        return np.asarray(other, dtype=np.float64)
+
+    @staticmethod
+    def slerp(
+        q1: QuaternionArray | Quaternion,
+        q2: QuaternionArray | Quaternion,
+        t: float | np.ndarray,
+        shortest_path=False,
+    ) -> QuaternionArray:
+        """Spherically interpolate row-wise between `q1` and `q2` by `t` in interval [0, 1], which may be a single value
+        or an array of `N` values. Either of `q1` and `q2` may also be a single `Quaternion`.
+
+        If `shortest_path = True`, rows of `q1` with a negative dot product with `q2` are negated first, which gives the
+        same rotations as `Quaternion.slerp()`. Otherwise, the quaternions themselves are interpolated as given.
+        """
+        data1, data2, t, dots = QuaternionArray._get_interpolation_args(q1, q2, t, shortest_path)
+        angles = np.arccos(np.clip(dots, -1.0, 1.0))
+        sin_angles = np.sin(angles)
+        # Fall back to linear interpolation for (almost) identical quaternions.
+        is_linear = sin_angles < 1e-8
+        safe_sin_angles = np.where(is_linear, 1.0, sin_angles)
+        w1 = np.where(is_linear, 1.0 - t, np.sin((1.0 - t) * angles) / safe_sin_angles)
+        w2 = np.where(is_linear, t, np.sin(t * angles) / safe_sin_angles)
+        return QuaternionArray(normalize_quaternions(w1[:, np.newaxis] * data1 + w2[:, np.newaxis] * data2))
+
+    @staticmethod
+    def nlerp(
+        q1: QuaternionArray | Quaternion,
+        q2: QuaternionArray | Quaternion,
+        t: float | np.ndarray,
+        shortest_path=False,
+    ) -> QuaternionArray:
+        """Linearly interpolate row-wise between `q1` and `q2` and normalize the results. Cheaper than `slerp()` and
+        very close to it for nearby quaternions (e.g. adjacent animation frames). Arguments are the same as `slerp()`.
+        """
+        data1, data2, t, _ = QuaternionArray._get_interpolation_args(q1, q2, t, shortest_path)
+        return QuaternionArray(normalize_quaternions(data1 + (data2 - data1) * t[:, np.newaxis]))
+
+    @staticmethod
+    def _get_interpolation_args(
+        q1: QuaternionArray | Quaternion,
+        q2: QuaternionArray | Quaternion,
+        t: float | np.ndarray,
+        shortest_path: bool,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        data1 = normalize_quaternions(np.atleast_2d(QuaternionArray._get_other_data(q1)))
+        data2 = normalize_quaternions(np.atleast_2d(QuaternionArray._get_other_data(q2)))
+        data1, data2 = np.broadcast_arrays(data1, data2)
+        t = np.broadcast_to(np.asarray(t, dtype=np.float64), data1.shape[:1])
+        dots = np.sum(data1 * data2, axis=1)
+        if shortest_path:
+            data1 = np.where(dots[:, np.newaxis] < 0.0, -data1, data1)
+            dots = np.abs(dots)
+        return data1, data2, t, dots
+
+    # endregion
+
+    # region Sequence
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index: int | slice | np.ndarray) -> Quaternion | QuaternionArray:
+        if isinstance(index, (int, np.integer)):
+            return Quaternion(self.data[index])
+        return QuaternionArray(self.data[index])
+
+    def __setitem__(self, index: int | slice | np.ndarray, value: Quaternion | QuaternionArray | np.ndarray):
+        self.data[index] = self._get_other_data(value)
+
+    def __iter__(self) -> tp.Iterator[Quaternion]:
+        return iter(self.to_quaternions())
+
+    def __eq__(self, other: QuaternionArray) -> bool:
+        if not isinstance(other, QuaternionArray):
+            return False
+        return np.array_equal(self.data, other.data)
+
+    def copy(self) -> QuaternionArray:
+        return QuaternionArray(self.data.copy())
+
+    def __repr__(self) -> str:
+        return f"QuaternionArray(<{len(self)} quaternions>)"
+
+    # endregion
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+__all__ = ["TRSTransformArray"]
+
+import typing as tp
+
+import numpy as np
+
+from soulstruct.utilities.maths import Vector3
+
+from .batched import compose_trs_arrays, invert_trs_arrays, normalize_quaternions, rotate_vectors
+from .quaternion import Quaternion
+from .quaternion_array import QuaternionArray
+from .trs_transform import TRSTransform
+
+if tp.TYPE_CHECKING:
+    from soulstruct.havok.types.hk import hk
+    from soulstruct.havok.types.struct_array import StructArray
+
+
+class TRSTransformArray:
+    """Sequence of TRS transforms backed by one contiguous `(N, 10)` float64 array of `TRSTransform.ravel()` rows, i.e.
+    `[tx, ty, tz, qx, qy, qz, qw, sx, sy, sz]`.
+
+    Supports the same core operations as `TRSTransform` (composition with `@`, inversion, lerping, and transforming
+    vectors), but for all `N` transforms at once. Indexing with an integer returns a `TRSTransform`; indexing with a
+    slice or index array returns another `TRSTransformArray`.
+
+    Can be converted to and from `hkQsTransform` rows of 12 floats (see `StructArray`) without creating any `hk`
+    instances.
+    """
+
+    __slots__ = ("data",)
+
+    data: np.ndarray
+
+    def __init__(self, data: np.ndarray | tp.Sequence[tp.Sequence[float]] | TRSTransformArray):
+        if isinstance(data, TRSTransformArray):
+            data = data.data
+        data = np.ascontiguousarray(data, dtype=np.float64)
+        if data.ndim != 2 or data.shape[1] != 10:
+            raise ValueError(f"`TRSTransformArray` data must have shape `(N, 10)`, not {data.shape}.")
+        self.data = data
+
+    # region Components
+
+    @property
+    def translations(self) -> np.ndarray:
+        """`(N, 3)` view of translations."""
+        return self.data[:, 0:3]
+
+    @translations.setter
+    def translations(self, value: np.ndarray):
+        self.data[:, 0:3] = value
+
+    @property
+    def rotations(self) -> QuaternionArray:
+        """Copy of rotations. Assign a new `QuaternionArray` (or `(N, 4)` array) to this property to modify them."""
+        return QuaternionArray(self.data[:, 3:7])
+
+    @rotations.setter
+    def rotations(self, value: QuaternionArray | np.ndarray):
+        self.data[:, 3:7] = value.data if isinstance(value, QuaternionArray) else value
+
+    @property
+    def scales(self) -> np.ndarray:
+        """`(N, 3)` view of scales."""
+        return self.data[:, 7:10]
+
+    @scales.setter
+    def scales(self, value: np.ndarray):
+        self.data[:, 7:10] = value
+
+    # endregion
+
+    # region Construction and Conversion
+
+    @classmethod
+    def identity(cls, count: int) -> TRSTransformArray:
+        data = np.zeros((count, 10), dtype=np.float64)
+        data[:, 6:10] = 1.0  # rotation W and scale
+        return cls(data)
+
+    @classmethod
+    def from_components(
+        cls,
+        translations: np.ndarray = None,
+        rotations: QuaternionArray | np.ndarray = None,
+        scales: np.ndarray = None,
+        count: int = None,
+    ) -> TRSTransformArray:
+        """Create from separate `(N, 3)` translations, `(N, 4)` rotations, and `(N, 3)` scales. Missing components are
+        set to identity, in which case `count` must be given if no components are given at all."""
+        if count is None:
+            for component in (translations, rotations, scales):
+                if component is not None:
+                    count = len(component)
+                    break
+            else:
+                raise ValueError("`count` must be given if no transform components are given.")
+        transforms = cls.identity(count)
+        if translations is not None:
+            transforms.translations = translations
+        if rotations is not None:
+            transforms.rotations = rotations
+        if scales is not None:
+            transforms.scales = scales
+        return transforms
+
+    @classmethod
+    def from_trs_transforms(cls, transforms: tp.Iterable[TRSTransform]) -> TRSTransformArray:
+        return cls(np.reshape(np.array([t.ravel() for t in transforms], dtype=np.float64), (-1, 10)))
+
+    def to_trs_transforms(self) -> list[TRSTransform]:
+        return [self._get_trs_transform(row) for row in self.data]
+
+    @staticmethod
+    def _get_trs_transform(row: np.ndarray) -> TRSTransform:
+        return TRSTransform(Vector3(row[0:3]), Quaternion(row[3:7]), Vector3(row[7:10]))
+
+    @classmethod
+    def from_qs_transform_rows(cls, rows: np.ndarray) -> TRSTransformArray:
+        """Create from an `(N, 12)` array of `hkQsTransform` float rows (e.g. `StructArray.to_array()`), which have a
+        fourth padding component after translation and scale."""
+        rows = np.asarray(rows)
+        if rows.ndim != 2 or rows.shape[1] != 12:
+            raise ValueError(f"`hkQsTransform` rows must have shape `(N, 12)`, not {rows.shape}.")
+        return cls(np.concatenate([rows[:, 0:3], rows[:, 4:8], rows[:, 8:11]], axis=1))
+
+    def to_qs_transform_rows(self) -> np.ndarray:
+        """Get an `(N, 12)` float32 array of `hkQsTransform` rows. Translation and scale padding are set to 1.0, as they
+        are by `hkQsTransform.from_trs_transform()`."""
+        rows = np.ones((len(self), 12), dtype=np.float32)
+        rows[:, 0:3] = self.data[:, 0:3]
+        rows[:, 4:8] = self.data[:, 3:7]
+        rows[:, 8:11] = self.data[:, 7:10]
+        return rows
+
+    @classmethod
+    def from_qs_transforms(cls, qs_transforms: StructArray | tp.Iterable[hk]) -> TRSTransformArray:
+        """Create from a `StructArray` of `hkQsTransform`s (read directly from its float rows) or any other iterable of
+        `hkQsTransform` instances."""
+        from soulstruct.havok.types.struct_array import StructArray
+        if isinstance(qs_transforms, StructArray):
+            return cls.from_qs_transform_rows(qs_transforms.to_array())
+        return cls.from_trs_transforms(t.to_trs_transform() for t in qs_transforms)
+
+    def to_qs_transforms(self, qs_transform_type: type[hk]) -> StructArray:
+        """Get a `StructArray` of the given `hkQsTransform` type (from the appropriate Havok module)."""
+        from soulstruct.havok.types.struct_array import StructArray
+        return StructArray(qs_transform_type, self.to_qs_transform_rows())
+
+    # endregion
+
+    # region Arithmetic
+
+    def compose(self, other: TRSTransformArray | TRSTransform, scale_translation=False) -> TRSTransformArray:
+        """Compose transforms row-wise, exactly like `TRSTransform.compose()`. `other` may be a single `TRSTransform`,
+        and either side may have length one to compose it with every row of the other side.
+
+        Rotations are normalized first.
+        """
+        return TRSTransformArray(
+            compose_trs_arrays(self.normalized().data, self._get_other_data(other), scale_translation)
+        )
+
+    def __matmul__(self, other: TRSTransformArray | TRSTransform) -> TRSTransformArray:
+        """Shortcut for `compose(other, scale_translation=True)`."""
+        return self.compose(other, scale_translation=True)
+
+    def inverse(self) -> TRSTransformArray:
+        """Get inverse transforms, exactly like `TRSTransform.inverse()`."""
+        return TRSTransformArray(invert_trs_arrays(self.normalized().data))
+
+    def normalized(self) -> TRSTransformArray:
+        """Get a copy with normalized rotations."""
+        data = self.data.copy()
+        data[:, 3:7] = normalize_quaternions(data[:, 3:7])
+        return TRSTransformArray(data)
+
+    def transform_vectors(self, vectors: np.ndarray) -> np.ndarray:
+        """Apply each transform to each row of an `(N, 3)` array of vectors (or apply all transforms to one vector)."""
+        rotations = normalize_quaternions(self.data[:, 3:7])
+        return self.data[:, 0:3] + rotate_vectors(rotations, self.data[:, 7:10] * np.asarray(vectors))
+
+    @staticmethod
+    def _get_other_data(other: TRSTransformArray | TRSTransform | np.ndarray) -> np.ndarray:
+        if isinstance(other, TRSTransformArray):
+            data = other.data.copy()
+        elif isinstance(other, TRSTransform):
+            data = np.array([other.ravel()], dtype=np.float64)
+        else:
+            data = np.array(other, dtype=np.float64)
+        data[..., 3:7] = normalize_quaternions(data[..., 3:7])
+        return data
+
+    @classmethod
+    def lerp(
+        cls,
+        transforms1: TRSTransformArray | TRSTransform,
+        transforms2: TRSTransformArray | TRSTransform,
+        t: float | np.ndarray,
+    ) -> TRSTransformArray:
+        """Interpolate row-wise exactly like `TRSTransform.lerp()`: translation and scale are linearly interpolated and
+        rotation is spherically interpolated along the shortest path. `t` may be a single value or an array of `N`
+        values, and will be clamped to [0, 1] interval.
+        """
+        data1, data2 = np.broadcast_arrays(cls._get_other_data(transforms1), cls._get_other_data(transforms2))
+        t = np.broadcast_to(np.clip(np.asarray(t, dtype=np.float64), 0.0, 1.0), data1.shape[:1])
+        data = data1 + (data2 - data1) * t[:, np.newaxis]
+        data[:, 3:7] = QuaternionArray.slerp(
+            QuaternionArray(data1[:, 3:7]), QuaternionArray(data2[:, 3:7]), t, shortest_path=True
+        ).data
+        return cls(data)
+
+    # endregion
+
+    # region Sequence
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index: int | slice | np.ndarray) -> TRSTransform | TRSTransformArray:
+        if isinstance(index, (int, np.integer)):
+            return self._get_trs_transform(self.data[index])
+        return TRSTransformArray(self.data[index])
+
+    def __setitem__(self, index: int | slice | np.ndarray, value: TRSTransform | TRSTransformArray | np.ndarray):
+        if isinstance(value, TRSTransform):
+            value = value.ravel()
+        elif isinstance(value, TRSTransformArray):
+            value = value.data
+        self.data[index] = value
+
+    def __iter__(self) -> tp.Iterator[TRSTransform]:
+        return iter(self.to_trs_transforms())
+
+    def __eq__(self, other: TRSTransformArray) -> bool:
+        if not isinstance(other, TRSTransformArray):
+            return False
+        return np.array_equal(self.data, other.data)
+
+    def copy(self) -> TRSTransformArray:
+        return TRSTransformArray(self.data.copy())
+
+    def __repr__(self) -> str:
+        return f"TRSTransformArray(<{len(self)} transforms>)"
+
+    # endregion
@@ -0,0 +1,134 @@
+"""`BinaryReader` over binary data that is already in memory (`bytes`, `bytearray`, `memoryview`) or memory-mapped from
+a file (`mmap`), which parses that data in place rather than copying it into a new stream.
+
+Small reads (for `struct` unpacking) still return new `bytes`, but sub-buffers like packfile sections and items are
+`memoryview` slices of the same data, and large primitive arrays (e.g. spline-compressed animation `data`, navmesh
+vertices, or MOPP code) can be NumPy views over it if the reader was created with `zero_copy=True`. Such arrays are only
+writable if the data is (e.g. a copy-on-write file mapping from `map_file()`, or a `bytearray`), and keep the data (and
+any mapped file) open for as long as they exist.
+"""
+from __future__ import annotations
+
+__all__ = ["MemoryReader", "map_file", "read_array_buffer"]
+
+import io
+import mmap
+from pathlib import Path
+
+from soulstruct.utilities.binary import BinaryReader, ByteOrder
+
+
+class MemoryViewStream(io.BufferedIOBase):
+    """Minimal seekable binary stream over a `memoryview` that does not copy it (unlike `io.BytesIO`)."""
+
+    def __init__(self, view: memoryview):
+        super().__init__()
+        self._view = view
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: int | None = -1) -> bytes:
+        start = self._position
+        end = len(self._view) if size is None or size < 0 else min(start + size, len(self._view))
+        if end <= start:
+            return b""
+        self._position = end
+        return self._view[start:end].tobytes()
+
+    read1 = read
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        if offset < 0:
+            raise ValueError(f"Negative seek position: {offset}")
+        self._position = offset
+        return offset
+
+    def tell(self) -> int:
+        return self._position
+
+
+class MemoryReader(BinaryReader):
+    """`BinaryReader` over in-memory `data` that can also return zero-copy `memoryview` slices with `read_view()`.
+
+    `bytes` are read with a shared (uncopied) `io.BytesIO` and `mmap` objects directly, which are both as fast as the
+    default `BinaryReader` streams. Other buffers (e.g. `memoryview` slices of packfile sections) use a `MemoryViewStream`.
+
+    If `zero_copy` is True, array buffers read with `read_array_buffer()` are views of `data`. Otherwise, they are new
+    writable copies, exactly as with a standard `BinaryReader`.
+    """
+
+    view: memoryview
+    zero_copy: bool
+
+    def __init__(
+        self,
+        data: bytes | bytearray | memoryview | mmap.mmap,
+        byte_order=ByteOrder.LittleEndian,
+        long_varints: bool = None,
+        zero_copy=False,
+    ):
+        if isinstance(data, bytes):
+            stream = io.BytesIO(data)  # shares `data` (never written to)
+        elif isinstance(data, mmap.mmap):
+            data.seek(0)
+            stream = data
+        else:
+            stream = MemoryViewStream(memoryview(data).cast("B"))
+        super().__init__(b"", byte_order=byte_order, long_varints=long_varints)
+        self.buffer = stream  # `BinaryReader` would copy `mmap` and `memoryview` data
+        self.view = memoryview(data).cast("B")
+        self.zero_copy = zero_copy
+
+    def read_view(self, size: int, offset: int = None) -> memoryview:
+        """Return a view of `size` bytes at `offset` (without moving) or at the current position (moving past them)."""
+        start = self.position if offset is None else offset
+        if start + size > len(self.view):
+            raise ValueError(f"Cannot read {size} bytes at offset {start} from buffer of size {len(self.view)}.")
+        if offset is None:
+            self.seek(start + size)
+        return self.view[start:start + size]
+
+    def close(self):
+        """Release the stream, but not `data` itself, which zero-copy views may still be using."""
+        self.buffer = None
+
+    def __del__(self):
+        pass
+
+
+def map_file(path: str | Path) -> mmap.mmap | bytes:
+    """Map the file at `path` into memory with copy-on-write access, so arrays viewing it are writable without changing
+    the file. (Empty files cannot be mapped and just return empty `bytes`.)
+
+    Note that on Windows, a file cannot be overwritten while any views of its mapping exist.
+    """
+    with Path(path).open("rb") as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        except ValueError:
+            return b""
+
+
+def read_array_buffer(reader: BinaryReader, size: int, offset: int = None) -> bytearray | memoryview:
+    """Read `size` bytes for an array from `reader`, at `offset` (without moving) or the current position.
+
+    Returns a view of the data for zero-copy `MemoryReader`s, or a new writable `bytearray` otherwise.
+    """
+    if isinstance(reader, MemoryReader):
+        view = reader.read_view(size, offset)
+        return view if reader.zero_copy else bytearray(view)
+    return bytearray(reader.read(size, offset=offset))
@@ -4,6 +4,8 @@ from __future__ import annotations
 import io
 
 import numpy as np
+from scipy.sparse import coo_array
+from scipy.sparse.csgraph import connected_components
 from scipy.spatial import KDTree
 
 from soulstruct.utilities.maths import Vector3
@@ -15,29 +17,102 @@ except ModuleNotFoundError:
 
 
 class Mesh:
+    """Vertices and polygonal faces of any size.
+
+    Faces are stored as one flat array of vertex indices, `face_indices`, and an array of `face_count + 1` offsets into
+    it, `face_offsets`, so face `i` is `face_indices[face_offsets[i]:face_offsets[i + 1]]`. The `faces` property
+    returns them as a list of lists instead, which is created on first access and kept, so it can be modified in place
+    (e.g. `mesh.faces[0][1] = 5` or `mesh.faces.append(...)`). While that list exists, it is the source of truth and
+    the face arrays are rebuilt from it whenever they are accessed, so avoid accessing them in loops while it is in use.
+    Assigning `face_indices` or `face_offsets` discards the list (and any changes to it).
+    """
+
     vertices: np.ndarray
-    faces: list[list[int]]  # does NOT assume triangles
     triangulated_faces: dict[int, list[tuple[list[int], bool]]]  # `faces` -> lists of triangles and their convexity
 
+    _faces: list[list[int]] | None  # list of faces returned by `faces`, if any
+    _face_indices: np.ndarray | None  # flat vertex indices of all faces
+    _face_offsets: np.ndarray | None  # start of each face in `face_indices`, plus final end
+
     def __init__(self, vertices: np.ndarray, faces: list[list[int]]):
+        """Create from a list of faces of any size (does NOT assume triangles). See `from_flat_faces()` to use
+        `face_indices` and `face_offsets` arrays directly.
+        """
         self.vertices = vertices
         self.faces = faces
         self.triangulated_faces = {}
 
+    @classmethod
+    def from_flat_faces(cls, vertices: np.ndarray, face_indices: np.ndarray, face_offsets: np.ndarray) -> Mesh:
+        mesh = cls(vertices, [])
+        mesh.face_indices = face_indices
+        mesh.face_offsets = face_offsets
+        return mesh
+
+    @property
+    def faces(self) -> list[list[int]]:
+        if self._faces is None:
+            if len(self._face_offsets) <= 1:
+                self._faces = []  # `np.split()` would give one empty face
+            else:
+                self._faces = [face.tolist() for face in np.split(self._face_indices, self._face_offsets[1:-1])]
+        return self._faces
+
+    @faces.setter
+    def faces(self, faces: list[list[int]]):
+        self._faces = faces
+        self._face_indices = self._face_offsets = None
+
+    @property
+    def face_indices(self) -> np.ndarray:
+        """Flat vertex indices of all faces."""
+        self._update_face_arrays()
+        return self._face_indices
+
+    @face_indices.setter
+    def face_indices(self, face_indices: np.ndarray):
+        self._update_face_arrays()
+        self._faces = None
+        self._face_indices = np.asarray(face_indices, dtype=np.int64)
+
+    @property
+    def face_offsets(self) -> np.ndarray:
+        """Start of each face in `face_indices`, plus final end."""
+        self._update_face_arrays()
+        return self._face_offsets
+
+    @face_offsets.setter
+    def face_offsets(self, face_offsets: np.ndarray):
+        self._update_face_arrays()
+        self._faces = None
+        self._face_offsets = np.asarray(face_offsets, dtype=np.int64)
+
+    def _update_face_arrays(self):
+        """Rebuild face arrays from `faces` list, if it exists (as it may have been modified)."""
+        if self._faces is None:
+            return
+        faces = self._faces
+        self._face_indices = np.fromiter((i for face in faces for i in face), dtype=np.int64)
+        self._face_offsets = np.zeros(len(faces) + 1, dtype=np.int64)
+        np.cumsum([len(face) for face in faces], out=self._face_offsets[1:])
+
+    @property
+    def face_sizes(self) -> np.ndarray:
+        return np.diff(self.face_offsets)
+
     @property
     def vertex_count(self):
         return len(self.vertices)
 
     @property
     def face_count(self):
-        return len(self.faces)
+        if self._faces is not None:
+            return len(self._faces)
+        return len(self._face_offsets) - 1
 
     @property
     def has_triangles_only(self):
-        for face in self.faces:
-            if len(face) != 3:
-                return False
-        return True
+        return bool(np.all(self.face_sizes == 3))
 
     def get_string(self, **header) -> str:
         """Get a string of the mesh data, suitable for writing to a text file.
@@ -193,72 +268,127 @@ class Mesh:
         return fig, ax
 
     def merge_vertices_by_distance(self, merge_dist: float = 0.5) -> Mesh:
-        """Reduce `Mesh` by merging all vertices within `merge_dist` of each other into their mean 3D position.
+        """Reduce `Mesh` by merging all vertices within `merge_dist` of each other (including via other vertices) into
+        their mean 3D position. Vertices in the new `Mesh` are ordered by their first original vertex.
 
         This may involve face side count changing. Degenerate faces will be handled.
         """
+        vertex_count = len(self.vertices)
+        face_indices, face_offsets = self.face_indices, self.face_offsets
+        face_count = len(face_offsets) - 1
+
+        # Find connected components of vertices that are within `merge_dist` of each other.
+        pairs = KDTree(self.vertices).query_pairs(merge_dist, output_type="ndarray")
+        graph = coo_array(
+            (np.ones(len(pairs), dtype=bool), (pairs[:, 0], pairs[:, 1])), shape=(vertex_count, vertex_count)
+        )
+        merged_count, old_to_merged = connected_components(graph, directed=False)  # labels ordered by first vertex
+
+        # Merge clusters by taking mean.
+        cluster_sizes = np.bincount(old_to_merged, minlength=merged_count)
+        merged_vertices = np.zeros((merged_count, self.vertices.shape[1]), dtype=np.float64)
+        np.add.at(merged_vertices, old_to_merged, self.vertices)
+        merged_vertices = (merged_vertices / cluster_sizes[:, None]).astype(self.vertices.dtype, copy=False)
+
+        merged_indices = old_to_merged[face_indices]
+        face_sizes = np.diff(face_offsets)
+        face_ids = np.repeat(np.arange(face_count), face_sizes)
+
+        # Drop vertices repeated by their next vertex (cyclically), as that edge has vanished. Faces that collapse
+        # entirely simply vanish from `face_ids`.
+        next_indices = np.arange(1, len(merged_indices) + 1)
+        non_empty = face_sizes > 0
+        next_indices[face_offsets[1:][non_empty] - 1] = face_offsets[:-1][non_empty]
+        keep = merged_indices != merged_indices[next_indices]
+        merged_indices, face_ids = merged_indices[keep], face_ids[keep]
+
+        # Faces that still contain the same merged vertex more than once have folded over themselves (and may need to be
+        # split). These are rare and handled one at a time.
+        face_vertex_keys = np.sort(face_ids * merged_count + merged_indices)
+        folded_faces = np.unique(face_vertex_keys[1:][np.diff(face_vertex_keys) == 0] // merged_count)
+
+        merged_sizes = np.bincount(face_ids, minlength=face_count)
+        valid_faces = merged_sizes >= 3  # drop degenerate faces
+        valid_faces[folded_faces] = False  # replaced below
+        kept = valid_faces[face_ids]
+        merged_indices, face_ids = merged_indices[kept], face_ids[kept]
+        face_keys = np.flatnonzero(valid_faces)
+        merged_sizes = merged_sizes[valid_faces]
+
+        if len(folded_faces):
+            split_indices, split_ids, split_keys, split_sizes = [], [], [], []
+            for face_index in folded_faces.tolist():
+                start, end = face_offsets[face_index], face_offsets[face_index + 1]
+                for split_face in self._split_folded_face(old_to_merged[face_indices[start:end]].tolist()):
+                    split_indices += split_face
+                    split_ids += [face_index] * len(split_face)
+                    split_keys.append(face_index)
+                    split_sizes.append(len(split_face))
+            # Insert split faces at their original face's position.
+            index_order = np.argsort(np.concatenate((face_ids, split_ids)), kind="stable")
+            merged_indices = np.concatenate((merged_indices, split_indices)).astype(np.int64)[index_order]
+            face_order = np.argsort(np.concatenate((face_keys, split_keys)), kind="stable")
+            merged_sizes = np.concatenate((merged_sizes, split_sizes)).astype(np.int64)[face_order]
+
+        merged_offsets = np.zeros(len(merged_sizes) + 1, dtype=np.int64)
+        np.cumsum(merged_sizes, out=merged_offsets[1:])
+        return Mesh.from_flat_faces(merged_vertices, merged_indices, merged_offsets)
 
-        vertices_tree = KDTree(self.vertices)
-        is_merged = np.zeros(len(self.vertices), dtype=bool)
-
-        for i, vertex in enumerate(self.vertices):
-            if not is_merged[i]:
-                # Get vertex indices within the merge distance.
-                indices = vertices_tree.query_ball_point(vertex, merge_dist)
-                # Merge points by taking mean.
-                if len(indices) > 1:
-                    mean_vertex = np.mean(self.vertices[indices], axis=0)
-                    self.vertices[indices] = mean_vertex
-                    is_merged[indices] = True
-
-        # Filter out duplicate (merged) vertices, and get mapping from old vertex indices to new ones.
-        merged_vertices, old_to_merged = np.unique(self.vertices, axis=0, return_inverse=True)
-
-        # Update vertex indices of faces, carefully to spot now-degenerate faces or even now-split concave faces.
+    @staticmethod
+    def _split_folded_face(merged_face_indices: list[int]) -> list[list[int]]:
+        """Update vertex indices of a face with repeated merged vertices, carefully to spot now-degenerate faces or even
+        now-split concave faces.
+        """
         merged_faces = []
-        for face in self.faces:
-            merged_face = [old_to_merged[face[0]]]  # initialize with first merged vertex
-            for old_i in face[1:]:
-                i = old_to_merged[old_i]
-                if merged_face[-1] == i:
-                    # Vertex repeated (this edge has vanished). Just skip this repeated occurrence.
+        merged_face = [merged_face_indices[0]]  # initialize with first merged vertex
+        for i in merged_face_indices[1:]:
+            if merged_face[-1] == i:
+                # Vertex repeated (this edge has vanished). Just skip this repeated occurrence.
+                continue
+            if i in merged_face:
+                # Same merged vertex is already in face.
+                if len(merged_face) >= 2 and merged_face[-2] == i:
+                    # Face contains the same edge in both directions. Previous vertex is degenerate, and we skip
+                    # this repeated one.
+                    merged_face = merged_face[:-1]
                     continue
-                if i in merged_face:
-                    # Same merged vertex is already in face.
-                    if merged_face[-2] == i:
-                        # Face contains the same edge in both directions. Previous vertex is degenerate, and we skip
-                        # this repeated one.
-                        merged_face = merged_face[:-1]
-                        continue
-                    # Finish current merged face (will loop back to this repeated vertex) and start a new one.
-                    if len(merged_face) >= 3:
-                        merged_faces.append(merged_face)
-                    merged_face = [i]
-                else:
-                    # Continue face normally.
-                    merged_face.append(i)
-
-            # Face completed naturally. We just check size, and if the last vertex has merged with the first.
-
-            if merged_face[-1] == merged_face[0]:
-                merged_face = merged_face[:-1]  # ignore last vertex
-            if len(merged_face) < 3:
-                continue  # ignore degenerate face
+                # Finish current merged face (will loop back to this repeated vertex) and start a new one.
+                if len(merged_face) >= 3:
+                    merged_faces.append(merged_face)
+                merged_face = [i]
+            else:
+                # Continue face normally.
+                merged_face.append(i)
 
+        # Face completed naturally. We just check size, and if the last vertex has merged with the first.
+        if merged_face[-1] == merged_face[0]:
+            merged_face = merged_face[:-1]  # ignore last vertex
+        if len(merged_face) >= 3:
             merged_faces.append(merged_face)
+        return merged_faces
+
+    def get_vertex_faces(self) -> tuple[np.ndarray, np.ndarray]:
+        """Get indices of faces that use each vertex, as a flat array of face indices and an array of `vertex_count + 1`
+        offsets into it (like `face_indices` and `face_offsets`).
 
-        return Mesh(merged_vertices, merged_faces)
+        Makes it much faster to detect connected faces.
+        """
+        face_indices, face_offsets = self.face_indices, self.face_offsets
+        face_ids = np.repeat(np.arange(len(face_offsets) - 1), np.diff(face_offsets))
+        order = np.argsort(face_indices, kind="stable")
+        vertex_offsets = np.zeros(self.vertex_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(face_indices, minlength=self.vertex_count), out=vertex_offsets[1:])
+        return face_ids[order], vertex_offsets
 
     def get_vertex_to_face_map(self) -> dict[int, list[int]]:
         """Get a dictionary mapping indices of `vertices` to indices of `faces` that use that vertex.
 
-        Makes it much faster to detect connected faces.
+        Makes it much faster to detect connected faces. See `get_vertex_faces()` for an array version.
         """
-        vertex_to_faces = {}
-        for i, face in enumerate(self.faces):
-            for v_i in face:
-                vertex_to_faces.setdefault(v_i, []).append(i)
-        return vertex_to_faces
+        vertex_faces, vertex_offsets = self.get_vertex_faces()
+        used_vertices = np.flatnonzero(np.diff(vertex_offsets))
+        face_lists = np.split(vertex_faces, vertex_offsets[used_vertices[1:]]) if len(used_vertices) else []
+        return {v_i: faces.tolist() for v_i, faces in zip(used_vertices.tolist(), face_lists)}
 
     @staticmethod
     def get_triangle_area(tri: np.ndarray) -> float:
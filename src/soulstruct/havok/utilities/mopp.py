@@ -0,0 +1,344 @@
+"""Build and query Havok MOPP (Memory Optimized Partial Polytope) code for triangle mesh shapes.
+
+MOPP code is a bounding volume tree compiled to byte code, stored in `hkpMoppCode.data` of the `hkpMoppBvTreeShape`
+used by Demon's Souls and Dark Souls 1 map collisions. Havok steps through it to find the shape keys of all triangles
+that may touch a query.
+
+Query positions are first quantized to 24-bit integers with `hkpMoppCode.info.offset`: `(position - offset.xyz) *
+offset.w`. Commands then compare the current 8-bit grid cell of the query (initially the top byte of each coordinate)
+with their (big-endian) operands:
+
+    0x01-0x04   RESCALE (x, y, z): move the grid origin to cell (x, y, z) and shrink cells by 2 ** (1-4)
+    0x05-0x07   JUMP8/16/24: skip ahead
+    0x09-0x0B   TERM_REOFFSET8/16/32: add to (8/16-bit) or set (32-bit) the base of later terminal shape keys
+    0x10-0x1C   SPLIT (max, min, jump8): check the 'left' child (next command) if the query cell is <= `max` along
+                one of 13 directions, and the 'right' child (skipping `jump8` more bytes) if it is >= `min`
+    0x20-0x22   SINGLE_SPLIT (value, jump8): as SPLIT along X, Y, or Z, with `max == min`
+    0x23-0x25   SPLIT_JUMP (max, min, jump16, jump16): as SPLIT along X, Y, or Z, with separate jumps for each child
+    0x26-0x28   DOUBLE_CUT (min, max): stop unless the query cell is in [`min`, `max`] along X, Y, or Z
+    0x30-0x4F   TERM4: shape key 0-31 (plus base) is a possible hit
+    0x50-0x53   TERM8/16/24/32: shape key (plus base) is a possible hit
+
+The SPLIT directions are X, Y, Z, Y+Z, Y-Z, X+Z, X-Z, X+Y, X-Y, X+Y+Z, X+Y-Z, X-Y+Z, and X-Y-Z. Diagonal cells are
+the sum of the axis cells (plus 256 for each subtracted axis) divided by the number of axes.
+
+This layout was confirmed against vanilla collisions, which use all of these commands. The builder here only uses
+axis-aligned commands. Its trees are not identical to Havok's, but they are valid, and bound each triangle just as
+tightly.
+"""
+from __future__ import annotations
+
+__all__ = [
+    "build_mopp_code",
+    "query_mopp_code",
+]
+
+import math
+import typing as tp
+
+import numpy as np
+
+from soulstruct.havok.utilities.maths import Vector4
+
+# Quantized length of the longest AABB axis. Leaves a little headroom below 2 ** 24 for query tolerances.
+_QUANTIZED_EXTENT = 0xFE0000
+# Triangle bounds are grown by this fraction of the largest absolute vertex coordinate (a few float32 ULPs), so that
+# rounding errors when Havok quantizes query positions can never exclude a touching triangle.
+_RELATIVE_MARGIN = 2.0 ** -21
+# Directions of SPLIT commands 0x10-0x1C.
+_SPLIT_DIRECTIONS = (
+    (1, 0, 0), (0, 1, 0), (0, 0, 1),
+    (0, 1, 1), (0, 1, -1), (1, 0, 1), (1, 0, -1), (1, 1, 0), (1, -1, 0),
+    (1, 1, 1), (1, 1, -1), (1, -1, 1), (1, -1, -1),
+)
+
+
+def build_mopp_code(
+    subparts: list[tuple[np.ndarray, np.ndarray]], subpart_index_bit_count: int = 12
+) -> tuple[bytes, Vector4]:
+    """Build MOPP code for the triangles of all `(vertices, faces)` subparts of an `hkpExtendedMeshShape`.
+
+    `vertices` must have at least three columns (XYZ) and `faces` at least three columns (vertex indices). The shape key
+    of each triangle is its subpart index, shifted up by `32 - subpart_index_bit_count` bits, plus its face index.
+
+    Returns the byte code (for `hkpMoppCode.data`) and the quantization offset and scale (for `hkpMoppCode.info.offset`).
+    """
+    triangles = []
+    keys = []
+    key_shift = 32 - subpart_index_bit_count
+    for subpart_index, (vertices, faces) in enumerate(subparts):
+        vertices = np.asarray(vertices, dtype=np.float32)[:, :3]
+        faces = np.asarray(faces)[:, :3].astype(np.int64)
+        triangles.append(vertices[faces])
+        keys.append((subpart_index << key_shift) + np.arange(len(faces), dtype=np.int64))
+    if not triangles or not sum(len(subpart_keys) for subpart_keys in keys):
+        raise ValueError("Cannot build MOPP code for a mesh with no triangles.")
+    triangles = np.concatenate(triangles)  # (triangle_count, 3, 3) float32
+    keys = np.concatenate(keys)
+
+    # Quantize to 24 bits, with the AABB minimum at zero and the longest AABB axis filling `_QUANTIZED_EXTENT`.
+    offset = triangles.min(axis=(0, 1))
+    extent = float((triangles.max(axis=(0, 1)) - offset).max())
+    scale = np.float32(_QUANTIZED_EXTENT / extent if extent > 0.0 else 1.0)
+    quantized = (triangles.astype(np.float64) - offset.astype(np.float64)) * float(scale)
+    margin = float(np.abs(triangles).max()) * _RELATIVE_MARGIN * float(scale)
+
+    builder = _MoppBuilder(
+        mins=quantized.min(axis=1) - margin,
+        maxs=quantized.max(axis=1) + margin,
+        keys=keys,
+    )
+    code = builder.build_node(
+        np.arange(len(keys)),
+        aabb=(builder.mins.min(axis=0).tolist(), builder.maxs.max(axis=0).tolist()),
+        origin=(0, 0, 0),
+        shift=16,
+        bounds=((0, 0, 0), (255, 255, 255)),
+        key_base=0,
+    )
+    return bytes(code), Vector4((*offset.tolist(), float(scale)))
+
+
+class _MoppBuilder:
+    """Recursively splits triangles in two, down to one triangle per leaf."""
+
+    mins: np.ndarray  # (triangle_count, 3) quantized, including margin
+    maxs: np.ndarray
+    centers: np.ndarray
+    keys: np.ndarray
+
+    def __init__(self, mins: np.ndarray, maxs: np.ndarray, keys: np.ndarray):
+        self.mins = mins
+        self.maxs = maxs
+        self.centers = (mins + maxs) / 2.0
+        self.keys = keys
+
+    def split(self, indices: np.ndarray) -> tuple[tuple[np.ndarray, list[float], list[float]], ...]:
+        """Split triangles (sorted by center) in two along X, Y, or Z, minimizing the surface area heuristic (sum of
+        child AABB surface areas, weighted by triangle count).
+
+        Each child gets at least an eighth of the triangles, which keeps the tree depth logarithmic. Returns the
+        triangles and AABB of each child.
+        """
+        count = len(indices)
+        if count == 2:  # common, and much faster to do directly
+            centers = self.centers[indices].tolist()
+            axis = max(range(3), key=lambda a: abs(centers[0][a] - centers[1][a]))
+            order = indices if centers[0][axis] <= centers[1][axis] else indices[::-1]
+            return (
+                (order[:1], self.mins[order[0]].tolist(), self.maxs[order[0]].tolist()),
+                (order[1:], self.mins[order[1]].tolist(), self.maxs[order[1]].tolist()),
+                axis,
+            )
+
+        best_cost, best_split = np.inf, None
+        min_count = max(1, count // 8)
+        left_counts = np.arange(min_count, count - min_count + 1)
+        for axis in range(3):
+            order = indices[np.argsort(self.centers[indices, axis], kind="stable")]
+            mins, maxs = self.mins[order], self.maxs[order]
+            # AABBs of the first `i` and last `count - i` triangles for each possible left count `i`.
+            left_mins = np.minimum.accumulate(mins, axis=0)[left_counts - 1]
+            left_maxs = np.maximum.accumulate(maxs, axis=0)[left_counts - 1]
+            right_mins = np.minimum.accumulate(mins[::-1], axis=0)[count - left_counts - 1]
+            right_maxs = np.maximum.accumulate(maxs[::-1], axis=0)[count - left_counts - 1]
+            costs = (
+                _get_half_areas(left_maxs - left_mins) * left_counts
+                + _get_half_areas(right_maxs - right_mins) * (count - left_counts)
+            )
+            i = int(np.argmin(costs))
+            if costs[i] < best_cost:
+                left_count = int(left_counts[i])
+                best_cost = costs[i]
+                best_split = (
+                    (order[:left_count], left_mins[i].tolist(), left_maxs[i].tolist()),
+                    (order[left_count:], right_mins[i].tolist(), right_maxs[i].tolist()),
+                    axis,
+                )
+        return best_split
+
+    def build_node(
+        self,
+        indices: np.ndarray,
+        aabb: tuple[list[float], list[float]],
+        origin: tuple[int, int, int],
+        shift: int,
+        bounds: tuple[tuple[int, ...], tuple[int, ...]],
+        key_base: int,
+    ) -> bytearray:
+        """Build code for triangles `indices` (with quantized `aabb`), where queries are already known to be within
+        cells `bounds`.
+        """
+        code = bytearray()
+        lo, hi = _get_cells(aabb, origin, shift)
+
+        # Zoom in (RESCALE) by four bits once the triangles span few enough cells (or fewer bits at the bottom level).
+        width = max(h - l for l, h in zip(lo, hi)) + 1
+        zoom = min(4, shift)
+        if zoom and width << zoom <= 256:
+            code += bytes((zoom, *lo))
+            origin = tuple(o + (l << shift) for o, l in zip(origin, lo))
+            shift -= zoom
+            bounds = ((0, 0, 0), tuple(min(((h - l + 1) << zoom) - 1, 255) for l, h in zip(lo, hi)))
+            lo, hi = _get_cells(aabb, origin, shift)
+
+        # Cut off empty space (DOUBLE_CUT) on each axis where that removes at least a quarter of the known query bounds.
+        bounds_lo, bounds_hi = list(bounds[0]), list(bounds[1])
+        for axis in range(3):
+            bounds_width = bounds_hi[axis] - bounds_lo[axis] + 1
+            if (bounds_width - (hi[axis] - lo[axis] + 1)) * 4 >= bounds_width:
+                code += bytes((0x26 + axis, lo[axis], hi[axis]))
+                bounds_lo[axis], bounds_hi[axis] = lo[axis], hi[axis]
+
+        # Move terminal key base (TERM_REOFFSET) once all keys below are close enough.
+        keys = self.keys[indices]
+        min_key, max_key = int(keys.min()), int(keys.max())
+        if key_base == 0 and min_key >= 65536 and max_key - min_key < 65536:
+            code += bytes((0x0B, *min_key.to_bytes(4, "big")))  # e.g. all in one subpart
+            key_base = min_key
+        elif max_key - min_key < 256 <= max_key - key_base:
+            key_delta = min_key - key_base
+            code += bytes((0x09, key_delta)) if key_delta < 256 else bytes((0x0A, *key_delta.to_bytes(2, "big")))
+            key_base = min_key
+
+        if len(indices) == 1:
+            key = min_key - key_base
+            if key < 32:
+                code += bytes((0x30 + key,))
+            elif key < 256:
+                code += bytes((0x50, key))
+            else:
+                code += bytes((0x51, *key.to_bytes(2, "big")))
+            return code
+
+        (left_indices, *left_aabb), (right_indices, *right_aabb), axis = self.split(indices)
+        left_max = _get_cells(left_aabb, origin, shift)[1][axis]
+        right_min = _get_cells(right_aabb, origin, shift)[0][axis]
+
+        left_bounds_hi = bounds_hi.copy()
+        left_bounds_hi[axis] = left_max
+        left_code = self.build_node(
+            left_indices, left_aabb, origin, shift, (tuple(bounds_lo), tuple(left_bounds_hi)), key_base
+        )
+        right_bounds_lo = bounds_lo.copy()
+        right_bounds_lo[axis] = right_min
+        right_code = self.build_node(
+            right_indices, right_aabb, origin, shift, (tuple(right_bounds_lo), tuple(bounds_hi)), key_base
+        )
+
+        if len(left_code) < 256:
+            code += bytes((0x10 + axis, left_max, right_min, len(left_code)))
+            code += left_code
+            code += right_code
+        elif len(left_code) < 65536:
+            code += bytes((0x23 + axis, left_max, right_min, 0, 0, *len(left_code).to_bytes(2, "big")))
+            code += left_code
+            code += right_code
+        else:
+            # Left child is a JUMP24 over the right child.
+            code += bytes((0x10 + axis, left_max, right_min, 4, 0x07, *len(right_code).to_bytes(3, "big")))
+            code += right_code
+            code += left_code
+        return code
+
+
+def _get_half_areas(sizes: np.ndarray) -> np.ndarray:
+    """Get half the surface area of each AABB with `sizes` (shape `(n, 3)`)."""
+    return sizes[:, 0] * sizes[:, 1] + sizes[:, 1] * sizes[:, 2] + sizes[:, 2] * sizes[:, 0]
+
+
+def _get_cells(
+    aabb: tuple[list[float], list[float]], origin: tuple[int, int, int], shift: int
+) -> tuple[list[int], list[int]]:
+    """Get the min and max cells of quantized `aabb` along each axis, clamped to the 8-bit grid."""
+    cell_size = float(1 << shift)
+    lo = [min(max(math.floor((m - o) / cell_size), 0), 255) for m, o in zip(aabb[0], origin)]
+    hi = [min(max(math.floor((m - o) / cell_size), 0), 255) for m, o in zip(aabb[1], origin)]
+    return lo, hi
+
+
+def query_mopp_code(
+    data: bytes | list[int], offset: Vector4 | tuple[float, ...], minimum: tp.Sequence[float], maximum: tp.Sequence[float]
+) -> list[int]:
+    """Get the shape keys of all triangles that MOPP code `data` may have within the AABB from `minimum` to `maximum`.
+
+    Supports all commands found in vanilla FromSoftware collisions, so this can be used to inspect or check any MOPP
+    code, not just code built by `build_mopp_code()`.
+    """
+    data = bytes(data)
+    offset = tuple(offset)
+    query_min = [(minimum[i] - offset[i]) * offset[3] for i in range(3)]
+    query_max = [(maximum[i] - offset[i]) * offset[3] for i in range(3)]
+
+    def get_cells(direction: int, origin: tuple[int, ...], shift: int) -> tuple[int, int]:
+        signs = _SPLIT_DIRECTIONS[direction]
+        low = high = float((256 << shift) * signs.count(-1))
+        for sign, axis_min, axis_max, axis_origin in zip(signs, query_min, query_max, origin):
+            if sign > 0:
+                low += axis_min - axis_origin
+                high += axis_max - axis_origin
+            elif sign < 0:
+                low -= axis_max - axis_origin
+                high -= axis_min - axis_origin
+        divisor = (1 << shift) * (3 - signs.count(0))
+        return int(np.floor(low / divisor)), int(np.floor(high / divisor))
+
+    keys = []
+    stack = [(0, (0, 0, 0), 16, 0)]  # (position, origin, shift, key_base)
+    while stack:
+        position, origin, shift, key_base = stack.pop()
+        while True:
+            command = data[position]
+            if 0x30 <= command <= 0x4F:
+                keys.append(key_base + command - 0x30)
+                break
+            elif 0x50 <= command <= 0x53:
+                size = command - 0x4F
+                keys.append(key_base + int.from_bytes(data[position + 1:position + 1 + size], "big"))
+                break
+            elif 0x01 <= command <= 0x04:
+                origin = tuple(o + (data[position + 1 + i] << shift) for i, o in enumerate(origin))
+                shift -= command
+                position += 4
+            elif 0x05 <= command <= 0x07:
+                size = command - 0x04
+                position += 1 + size + int.from_bytes(data[position + 1:position + 1 + size], "big")
+            elif command == 0x09:
+                key_base += data[position + 1]
+                position += 2
+            elif command == 0x0A:
+                key_base += int.from_bytes(data[position + 1:position + 3], "big")
+                position += 3
+            elif command == 0x0B:
+                key_base = int.from_bytes(data[position + 1:position + 5], "big")
+                position += 5
+            elif 0x10 <= command <= 0x1C or 0x20 <= command <= 0x25:
+                if command <= 0x1C:
+                    direction, left_max, right_min = command - 0x10, data[position + 1], data[position + 2]
+                    left, right = position + 4, position + 4 + data[position + 3]
+                elif command <= 0x22:
+                    direction, left_max = command - 0x20, data[position + 1]
+                    right_min = left_max
+                    left, right = position + 3, position + 3 + data[position + 2]
+                else:
+                    direction, left_max, right_min = command - 0x23, data[position + 1], data[position + 2]
+                    left = position + 7 + int.from_bytes(data[position + 3:position + 5], "big")
+                    right = position + 7 + int.from_bytes(data[position + 5:position + 7], "big")
+                low, high = get_cells(direction, origin, shift)
+                if high >= right_min:
+                    if low <= left_max:
+                        stack.append((right, origin, shift, key_base))
+                    else:
+                        position = right
+                        continue
+                if low > left_max:
+                    break
+                position = left
+            elif 0x26 <= command <= 0x28:
+                low, high = get_cells(command - 0x26, origin, shift)
+                if high < data[position + 1] or low > data[position + 2]:
+                    break
+                position += 3
+            else:
+                raise ValueError(f"Unsupported MOPP command {hex(command)} at position {position}.")
+    return keys
@@ -11,7 +11,10 @@ __all__ = ["write_skeleton_mapper_input", "exe_output_to_skeleton_mapper"]
 
 from pathlib import Path
 
-from soulstruct.havok.types.hk2015 import *
+from soulstruct.havok.types.hk2015 import (
+    hkQsTransform, hkaSkeleton, hkaSkeletonMapper, hkaSkeletonMapperData, hkaSkeletonMapperDataChainMapping,
+    hkaSkeletonMapperDataSimpleMapping,
+)
 from soulstruct.havok.utilities.maths import Vector4, Quaternion
 
 
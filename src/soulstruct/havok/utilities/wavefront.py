@@ -1,72 +1,227 @@
+"""Minimal Wavefront OBJ reading and writing for triangle meshes (e.g. map collisions).
+
+Only vertex positions (`v`), faces (`f`), and object/group names (`o`/`g`) are used. Lines are classified in one pass
+and all vertex and face numbers are then converted to NumPy arrays in bulk, rather than line-by-line, and meshes are
+written back with one string formatting call per array, so OBJ files with hundreds of thousands of faces are fast.
+"""
 from __future__ import annotations
 
-__all__ = ["read_obj"]
+__all__ = ["read_obj", "parse_obj", "format_obj", "write_obj"]
 
 import re
+import typing as tp
+import warnings
 from pathlib import Path
 
 import numpy as np
 
+# Strips texture/normal indices from face vertices (`f 1/2/3 4//6 ...` -> `f 1 4 ...`).
+_FACE_VERTEX_SUFFIX_RE = re.compile(r"/\S*")
+
 
 def read_obj(obj_path: Path | str, invert_x=True) -> list[tuple[np.ndarray, np.ndarray]]:
-    """Reads OBJ file and returns a list of meshes, each of which is a list of `Vector4` vertices and a list of faces
-    (vertex index triples).
+    """Reads OBJ file and returns a list of meshes, each of which is an `(n, 3)` array of vertices and an `(m, 3)`
+    array of faces (zero-indexed vertex index triples into that mesh's vertices).
 
     If `invert_x=True` (default), X coordinates will be negated, which is sufficient for having collisions appear
     properly in Blender (assuming they were also negated on conversion to OBJ or import into Blender).
 
     TODO: Not sure if `invert_x` is still correct with my improved Blender conversion.
     """
-    o_re = re.compile(r"^o .*$")
-    v_re = re.compile(r"^v ([-\d.]+) ([-\d.]+) ([-\d.]+)$")
-    f_re = re.compile(r"^f (\d+)(?://\d+)? (\d+)(?://\d+)? (\d+)(?://\d+)?$")
+    return parse_obj(Path(obj_path).read_text(), invert_x=invert_x)
 
-    global_v_i = 0
 
-    meshes = []  # type: list[tuple[np.ndarray, np.ndarray]]
-    vertex_list = None  # type: None | list[tuple[float, float, float]]
-    face_list = None  # type: None | list[tuple[int, int, int]]
+def parse_obj(obj_text: str, invert_x=True) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Parse OBJ text into a list of `(vertices, faces)` meshes. See `read_obj()`.
 
-    with Path(obj_path).open("r") as f:
-        lines = f.readlines()
+    Each `o` object line starts a new mesh. If there are no `o` lines, each `g` group line starts a new mesh instead.
+    Vertices and faces before the first object/group form their own mesh, if there are any. Faces may use negative
+    (relative) indices, include texture/normal indices, or be polygons (which are fan-triangulated), and may also
+    reference vertices outside their own object, in which case those vertices are copied into the mesh.
+    """
+    lines = obj_text.splitlines()
 
+    v_lines = []  # type: list[str]
+    f_lines = []  # type: list[str]
+    o_starts = []  # type: list[tuple[int, int]]  # `(v_start, f_start)` for each `o` line
+    g_starts = []  # type: list[tuple[int, int]]  # `(v_start, f_start)` for each `g` line
+    v_append = v_lines.append
+    f_append = f_lines.append
     for line in lines:
-        if o_re.match(line):
-            # New object definition.
-            if vertex_list is not None:
-                global_v_i += len(vertex_list)  # increase global vertex count
-            # Finish previous mesh.
-            meshes.append((np.array(vertex_list), np.array(face_list)))
-
-            # Start new mesh.
-            vertex_list = []
-            face_list = []
-        elif v := v_re.match(line):
-            # Vertex definition.
-            if vertex_list is None:
-                raise ValueError("Found 'v' vertex line before an 'o' object definition.")
-            if face_list:
-                raise ValueError("Found 'v' vertex line after 'f' face lines.")
-            x, y, z = float(v.group(1)), float(v.group(2)), float(v.group(3))
-            if invert_x:
-                x = -x
-            vertex_list.append((x, y, z))
-        elif f := f_re.match(line):
-            if vertex_list is None:
-                raise ValueError("Found 'f' face line before an 'o' object definition.")
-            if not vertex_list:
-                raise ValueError("Found 'f' face line before any 'v' vertex lines.")
-            # Switch to 0-indexing, localize vertex indices, and insert zero that appears between triplets in HKX.
-            face = (
-                int(f.group(1)) - global_v_i - 1,
-                int(f.group(2)) - global_v_i - 1,
-                int(f.group(3)) - global_v_i - 1,
-            )
-            face_list.append(face)
-        else:
-            pass  # ignore all other lines
+        key = line[:2]
+        if key == "v ":
+            v_append(line[2:])
+        elif key == "f ":
+            f_append(line[2:])
+        elif key == "o ":
+            o_starts.append((len(v_lines), len(f_lines)))
+        elif key == "g ":
+            g_starts.append((len(v_lines), len(f_lines)))
+        # All other lines are ignored.
 
-    # Finish final mesh.
-    meshes.append((np.array(vertex_list), np.array(face_list)))
+    vertices = _parse_vertices(v_lines)
+    if invert_x:
+        vertices[:, 0] *= -1.0
+    faces, face_line_triangles = _parse_faces(f_lines, lines, len(vertices))
+
+    mesh_starts = [(0, 0)] + (o_starts or g_starts)
+    mesh_ends = mesh_starts[1:] + [(len(vertices), len(f_lines))]
+    if face_line_triangles is not None:
+        # Convert `f` line indices to triangle indices.
+        triangle_starts = np.concatenate(([0], np.cumsum(face_line_triangles))).tolist()
+        mesh_starts = [(v_start, triangle_starts[f_start]) for v_start, f_start in mesh_starts]
+        mesh_ends = [(v_end, triangle_starts[f_end]) for v_end, f_end in mesh_ends]
+    meshes = []  # type: list[tuple[np.ndarray, np.ndarray]]
+    for i, ((v_start, f_start), (v_end, f_end)) in enumerate(zip(mesh_starts, mesh_ends)):
+        if i == 0 and v_start == v_end and f_start == f_end:
+            continue  # no default mesh before first object/group
+        mesh_vertices = vertices[v_start:v_end]
+        mesh_faces = faces[f_start:f_end] - v_start
+        if mesh_faces.size and (mesh_faces.min() < 0 or mesh_faces.max() >= v_end - v_start):
+            # Faces use vertices from other objects. Copy all (and only) the vertices used by this mesh.
+            used_indices, mesh_faces = np.unique(faces[f_start:f_end], return_inverse=True)
+            mesh_vertices = vertices[used_indices]
+            mesh_faces = mesh_faces.reshape((-1, 3))
+        meshes.append((mesh_vertices, mesh_faces))
 
     return meshes
+
+
+def format_obj(
+    meshes: tp.Sequence[tuple[np.ndarray, np.ndarray]],
+    names: tp.Sequence[str] = (),
+    invert_x=True,
+    header_lines: tp.Sequence[str] = (),
+) -> str:
+    """Format `(vertices, faces)` meshes as OBJ text, with one object per mesh named from `names` (or 'Mesh {i}').
+
+    Only the first three columns of `vertices` and `faces` are used (e.g. HKX vertices and faces have a fourth column).
+    Faces are zero-indexed into their own mesh's vertices, and are written with OBJ's global one-based indices. X
+    coordinates are negated if `invert_x=True` (default), which should be reversed on import.
+
+    `float32` vertices are written with nine significant digits and other vertices with the shortest `repr()`, so that
+    either can be read back exactly.
+    """
+    obj_lines = [f"# {line}" for line in header_lines]
+    global_v_i = 0
+
+    for i, (vertices, faces) in enumerate(meshes):
+        name = names[i] if i < len(names) else f"Mesh {i}"
+        vertices = np.asarray(vertices)
+        faces = np.asarray(faces)
+        is_float32 = vertices.dtype.kind == "f" and vertices.dtype.itemsize == 4  # may be big-endian
+        positions = vertices[:, :3].astype(np.float32 if is_float32 else np.float64)
+        if invert_x:
+            positions[:, 0] *= -1.0
+        v_format = "v %.9g %.9g %.9g\n" if is_float32 else "v %r %r %r\n"
+        face_indices = faces[:, :3].astype(np.int64) + (global_v_i + 1)  # 1-indexed vertices
+        obj_lines += [
+            "",
+            f"o {name}",
+            v_format * len(positions) % tuple(positions.ravel().tolist()) + "s off",
+        ]
+        if len(face_indices):
+            obj_lines.append(("f %d %d %d\n" * len(face_indices) % tuple(face_indices.ravel().tolist()))[:-1])
+        global_v_i += len(vertices)
+
+    return "\n".join(obj_lines) + "\n"
+
+
+def write_obj(
+    obj_path: Path | str,
+    meshes: tp.Sequence[tuple[np.ndarray, np.ndarray]],
+    names: tp.Sequence[str] = (),
+    invert_x=True,
+    header_lines: tp.Sequence[str] = (),
+):
+    """Write `meshes` to an OBJ file at `obj_path`. See `format_obj()`."""
+    Path(obj_path).write_text(format_obj(meshes, names, invert_x, header_lines))
+
+
+def _parse_numbers(text: str, dtype: type, count: int) -> np.ndarray | None:
+    """Parse `count` whitespace-separated numbers from `text` in one call, or return None if that fails."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)  # NumPy warns before raising on unparsed trailing data
+        try:
+            numbers = np.fromstring(text, dtype=dtype, sep=" ")
+        except ValueError:
+            return None
+    return numbers if numbers.size == count else None
+
+
+def _parse_vertices(v_lines: list[str]) -> np.ndarray:
+    """Parse `(n, 3)` `float64` positions from `v` lines (without their `v ` prefix)."""
+    if not v_lines:
+        return np.zeros((0, 3), dtype=np.float64)
+    numbers = _parse_numbers(" ".join(v_lines), np.float64, 3 * len(v_lines))
+    if numbers is not None:
+        return numbers.reshape((-1, 3))
+    # Some lines have optional `w` or vertex color components (or are malformed).
+    try:
+        return np.array([line.split()[:3] for line in v_lines], dtype=np.float64)
+    except ValueError as ex:
+        raise ValueError(f"Invalid 'v' vertex line in OBJ file: {ex}")
+
+
+def _parse_faces(
+    f_lines: list[str], lines: list[str], vertex_count: int
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """Parse `(m, 3)` zero-indexed global vertex indices from `f` lines (without their `f ` prefix).
+
+    Polygons are fan-triangulated, in which case the number of triangles from each line is also returned (or None if
+    all lines are triangles). All `lines` are needed only to resolve negative (relative) indices.
+    """
+    if not f_lines:
+        return np.zeros((0, 3), dtype=np.int64), None
+    f_text = "\n".join(f_lines)
+    if "/" in f_text:
+        f_text = _FACE_VERTEX_SUFFIX_RE.sub("", f_text)
+
+    indices = _parse_numbers(f_text, np.int64, 3 * len(f_lines))
+    if indices is not None:
+        faces = indices.reshape((-1, 3))
+        face_sizes = None
+    else:
+        # Not all faces are triangles (or some are malformed).
+        f_tokens = [line.split() for line in f_text.split("\n")]
+        face_sizes = np.array([len(tokens) for tokens in f_tokens])
+        if face_sizes.min() < 3:
+            raise ValueError("Found 'f' face line with fewer than three vertices in OBJ file.")
+        try:
+            indices = np.array([index for tokens in f_tokens for index in tokens], dtype=np.int64)
+        except ValueError as ex:
+            raise ValueError(f"Invalid 'f' face line in OBJ file: {ex}")
+        faces = None
+
+    if (indices < 0).any():
+        # Relative indices count back from the latest vertex line before each face.
+        vertex_counts = []
+        v_count = 0
+        for line in lines:
+            key = line[:2]
+            if key == "v ":
+                v_count += 1
+            elif key == "f ":
+                vertex_counts.append(v_count)
+        if face_sizes is None:
+            vertex_counts = np.repeat(vertex_counts, 3)
+        else:
+            vertex_counts = np.repeat(vertex_counts, face_sizes)
+        indices = np.where(indices < 0, indices + vertex_counts + 1, indices)
+        if faces is not None:
+            faces = indices.reshape((-1, 3))
+
+    triangle_counts = None
+    if faces is None:
+        # Fan-triangulate each face: (0, 1, 2), (0, 2, 3), ...
+        face_starts = np.concatenate(([0], np.cumsum(face_sizes)[:-1]))
+        triangle_counts = face_sizes - 2
+        triangle_starts = np.cumsum(triangle_counts) - triangle_counts
+        first = np.repeat(face_starts, triangle_counts)  # first vertex of each triangle's face
+        second = first + 1 + np.arange(triangle_counts.sum()) - np.repeat(triangle_starts, triangle_counts)
+        faces = np.stack((indices[first], indices[second], indices[second + 1]), axis=1)
+
+    faces = faces - 1  # zero-indexed
+    if faces.size and (faces.min() < 0 or faces.max() >= vertex_count):
+        raise ValueError(f"OBJ face vertex index out of range (only {vertex_count} vertices).")
+    return faces, triangle_counts
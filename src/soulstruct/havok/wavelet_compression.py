@@ -0,0 +1,451 @@
+"""Decompress and compress Demon's Souls (Havok 5.5.0) animations based on wavelets.
+
+There is no public reference for this format. The layout below was worked out from vanilla Demon's Souls animations,
+and decompressing them gives unit quaternions and smooth tracks across block boundaries.
+
+`hkaWaveletSkeletalAnimation.dataBuffer` is always little-endian (even in big-endian packfiles) and contains, in order:
+    - four reserved (zero) bytes
+    - one `uint16` static mask per transform track (at `staticMaskIdx`)
+    - `float32` values of static degrees of freedom (DOFs) (at `staticDOFsIdx`, 4-aligned)
+    - `float32` quantization offset for each dynamic DOF (at `qFormat.offsetIdx`)
+    - `float32` quantization scale for each dynamic DOF (at `qFormat.scaleIdx`)
+    - `uint8` quantization bit width for each dynamic DOF (at `qFormat.bitWidthIdx`)
+    - `uint32` offset of each block relative to the start of quantized data (at `blockIndexIdx`, 4-aligned)
+    - quantized data for all blocks (at `quantizedDataIdx`)
+
+Each track's static mask has a two-bit type for translation (bits 0-1), rotation (bits 2-3), and scale (bits 4-5): 0 is
+dynamic, 1 is static, and 2 is identity ('clear'). The remaining bits flag dynamic components of translation (bits 6-8),
+rotation (bits 9-12), and scale (bits 13-15), with the last component in the lowest bit (e.g. bit 9 is rotation W).
+Static values are stored for every non-dynamic component of non-clear transforms. A static rotation component of +/-2
+means 'reconstruct from the other three components, with this sign' (W, in practice).
+
+Dynamic DOFs are sampled in blocks of `blockSize` frames (the last block padded), which are each transformed with a
+periodic Daubechies-4 wavelet over all `log2(blockSize)` levels, giving coefficients in the usual pyramid order:
+    [approximation, coarsest detail, ..., finest details]
+Coefficients are scaled such that the approximation is the block mean.
+
+In each block, each DOF is stored as a `blockSize`-bit mask of omitted (zero) coefficients followed by the remaining
+coefficients, quantized as `offset + scale * q / (2 ** bit_width - 1)`. Bits are read from least significant bit up
+and each DOF record is padded to a whole byte.
+"""
+from __future__ import annotations
+
+__all__ = [
+    "WaveletCompressedAnimationData",
+]
+
+import logging
+from dataclasses import dataclass
+from enum import IntEnum
+
+import numpy as np
+
+from soulstruct.havok.utilities.maths import normalize_quaternions
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TransformType(IntEnum):
+    """Type of each of a track's translation, rotation, and scale in its static mask."""
+    Dynamic = 0
+    Static = 1
+    Clear = 2
+
+
+# Interleaved array columns, static mask type shift, and static mask dynamic component lowest bit of each transform part.
+_TRANSFORM_PARTS = (
+    (range(0, 3), 0, 6),  # translation
+    (range(3, 7), 2, 9),  # rotation
+    (range(7, 10), 4, 13),  # scale
+)
+_IDENTITY_ROW = np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0])
+# Static rotation components of +/- this value are reconstructed from the other components, with that sign.
+_RECONSTRUCTED_ROTATION_VALUE = 2.0
+# Largest quantization bit width used when compressing (vanilla animations all use 12).
+_MAX_BIT_WIDTH = 16
+
+_D4 = np.array([1.0 + np.sqrt(3.0), 3.0 + np.sqrt(3.0), 3.0 - np.sqrt(3.0), 1.0 - np.sqrt(3.0)]) / (4.0 * np.sqrt(2.0))
+
+
+def _align(offset: int, alignment: int = 4) -> int:
+    return -(-offset // alignment) * alignment
+
+
+def get_synthesis_matrix(block_size: int) -> np.ndarray:
+    """Get the `(block_size, block_size)` matrix `M` such that `coefficients @ M` gives the samples of a block.
+
+    `block_size` must be a power of two.
+    """
+    if block_size < 2 or block_size & (block_size - 1):
+        raise ValueError(f"Wavelet block size must be a power of two, not {block_size}.")
+    level_count = block_size.bit_length() - 1
+    high_pass = np.array([-_D4[3], _D4[2], -_D4[1], _D4[0]])
+    matrix = np.empty((block_size, block_size))
+    for i, coefficients in enumerate(np.eye(block_size)):
+        approximation = coefficients[:1]
+        while len(approximation) < block_size:
+            n = len(approximation)
+            details = coefficients[n:2 * n]
+            samples = np.zeros(2 * n)
+            for k in range(n):
+                for j in range(4):
+                    samples[(2 * k + j) % (2 * n)] += _D4[j] * approximation[k] + high_pass[j] * details[k]
+            approximation = samples
+        matrix[i] = approximation * 2.0 ** (level_count / 2)
+    return matrix
+
+
+@dataclass(slots=True)
+class WaveletCompressedAnimationData:
+    """Unpacked contents of `hkaWaveletSkeletalAnimation.dataBuffer`.
+
+    Quantized coefficients are kept exactly as stored, so unpacking and packing vanilla data is lossless.
+    """
+
+    frame_count: int
+    block_size: int
+    # One `uint16` per transform track.
+    static_masks: np.ndarray
+    # `float32` values of all static DOFs, in track order.
+    static_values: np.ndarray
+    # `float32` quantization offset and scale, and `uint8` bit width, of each dynamic DOF.
+    offsets: np.ndarray
+    scales: np.ndarray
+    bit_widths: np.ndarray
+    # `(block_count, dynamic_dof_count, block_size)` quantized wavelet coefficients. Omitted coefficients are -1.
+    quantized_coefficients: np.ndarray
+
+    @property
+    def track_count(self) -> int:
+        return len(self.static_masks)
+
+    @property
+    def dynamic_dof_count(self) -> int:
+        return len(self.offsets)
+
+    @property
+    def block_count(self) -> int:
+        return len(self.quantized_coefficients)
+
+    @classmethod
+    def from_wavelet_animation(cls, animation) -> WaveletCompressedAnimationData:
+        """Unpack the data buffer of an `hkaWaveletSkeletalAnimation`, using its index members."""
+        q_format = animation.qFormat
+        return cls.unpack(
+            bytes(animation.dataBuffer),
+            frame_count=animation.numberOfPoses,
+            block_size=animation.blockSize,
+            track_count=animation.numberOfTransformTracks,
+            dynamic_dof_count=q_format.numD,
+            static_mask_idx=animation.staticMaskIdx,
+            static_dofs_idx=animation.staticDOFsIdx,
+            offset_idx=q_format.offsetIdx,
+            scale_idx=q_format.scaleIdx,
+            bit_width_idx=q_format.bitWidthIdx,
+            block_index_idx=animation.blockIndexIdx,
+            block_count=animation.blockIndexSize,
+            quantized_data_idx=animation.quantizedDataIdx,
+        )
+
+    @classmethod
+    def unpack(
+        cls,
+        data_buffer: bytes,
+        frame_count: int,
+        block_size: int,
+        track_count: int,
+        dynamic_dof_count: int,
+        static_mask_idx: int,
+        static_dofs_idx: int,
+        offset_idx: int,
+        scale_idx: int,
+        bit_width_idx: int,
+        block_index_idx: int,
+        block_count: int,
+        quantized_data_idx: int,
+    ) -> WaveletCompressedAnimationData:
+        static_masks = np.frombuffer(data_buffer, "<u2", track_count, static_mask_idx).copy()
+        static_values = np.frombuffer(data_buffer, "<f4", (offset_idx - static_dofs_idx) // 4, static_dofs_idx).copy()
+        offsets = np.frombuffer(data_buffer, "<f4", dynamic_dof_count, offset_idx).copy()
+        scales = np.frombuffer(data_buffer, "<f4", dynamic_dof_count, scale_idx).copy()
+        bit_widths = np.frombuffer(data_buffer, "u1", dynamic_dof_count, bit_width_idx).copy()
+        block_offsets = np.frombuffer(data_buffer, "<u4", block_count, block_index_idx).astype(np.int64)
+        block_ends = np.append(block_offsets[1:], len(data_buffer) - quantized_data_idx)
+
+        quantized_coefficients = np.full((block_count, dynamic_dof_count, block_size), -1, dtype=np.int32)
+        for block_index, (block_start, block_end) in enumerate(zip(block_offsets, block_ends)):
+            block_data = np.frombuffer(
+                data_buffer, np.uint8, block_end - block_start, quantized_data_idx + block_start
+            )
+            bits = np.unpackbits(block_data, bitorder="little")
+            position = 0
+            for dof_index, bit_width in enumerate(bit_widths):
+                is_omitted = bits[position:position + block_size].astype(bool)
+                position += block_size
+                stored_count = block_size - np.count_nonzero(is_omitted)
+                value_bits = bits[position:position + stored_count * bit_width].reshape(stored_count, bit_width)
+                position += stored_count * bit_width
+                quantized_coefficients[block_index, dof_index, ~is_omitted] = value_bits @ (1 << np.arange(bit_width))
+                position = _align(position, 8)
+            if position != len(bits):
+                raise ValueError(
+                    f"Wavelet block {block_index} has {len(bits) // 8} bytes, but its records use {position // 8}."
+                )
+
+        return cls(
+            frame_count=frame_count,
+            block_size=block_size,
+            static_masks=static_masks,
+            static_values=static_values,
+            offsets=offsets,
+            scales=scales,
+            bit_widths=bit_widths,
+            quantized_coefficients=quantized_coefficients,
+        )
+
+    def pack(self) -> tuple[bytes, dict[str, int]]:
+        """Pack data buffer. Also returns a dictionary of the `hkaWaveletSkeletalAnimation` (and `qFormat`) index members
+        that locate each part of the buffer."""
+        indices = {"staticMaskIdx": 4}
+        indices["staticDOFsIdx"] = _align(indices["staticMaskIdx"] + 2 * self.track_count)
+        indices["offsetIdx"] = indices["staticDOFsIdx"] + 4 * len(self.static_values)
+        indices["scaleIdx"] = indices["offsetIdx"] + 4 * self.dynamic_dof_count
+        indices["bitWidthIdx"] = indices["scaleIdx"] + 4 * self.dynamic_dof_count
+        indices["blockIndexIdx"] = _align(indices["bitWidthIdx"] + self.dynamic_dof_count)
+        indices["blockIndexSize"] = self.block_count
+        indices["quantizedDataIdx"] = indices["blockIndexIdx"] + 4 * self.block_count
+
+        packed_blocks = [self._pack_block(block) for block in self.quantized_coefficients]
+        block_offsets = np.cumsum([0] + [len(block) for block in packed_blocks[:-1]])
+        indices["quantizedDataSize"] = sum(len(block) for block in packed_blocks)
+
+        header = bytearray(indices["quantizedDataIdx"])
+        for idx, array in (
+            ("staticMaskIdx", self.static_masks.astype("<u2")),
+            ("staticDOFsIdx", self.static_values.astype("<f4")),
+            ("offsetIdx", self.offsets.astype("<f4")),
+            ("scaleIdx", self.scales.astype("<f4")),
+            ("bitWidthIdx", self.bit_widths.astype("u1")),
+            ("blockIndexIdx", block_offsets.astype("<u4")),
+        ):
+            data = array.tobytes()
+            header[indices[idx]:indices[idx] + len(data)] = data
+
+        return bytes(header) + b"".join(packed_blocks), indices
+
+    def _pack_block(self, block_coefficients: np.ndarray) -> bytes:
+        records = []
+        for dof_coefficients, bit_width in zip(block_coefficients, self.bit_widths):
+            is_omitted = dof_coefficients < 0
+            values = dof_coefficients[~is_omitted]
+            value_bits = (values[:, np.newaxis] >> np.arange(bit_width)) & 1
+            bits = np.concatenate([is_omitted.astype(np.uint8), value_bits.astype(np.uint8).ravel()])
+            records.append(np.packbits(bits, bitorder="little").tobytes())  # pads each record to a whole byte
+        return b"".join(records)
+
+    def get_dynamic_dof_samples(self) -> np.ndarray:
+        """Dequantize and inverse-transform all blocks into a `(frame_count, dynamic_dof_count)` array."""
+        if self.dynamic_dof_count == 0:
+            return np.zeros((self.frame_count, 0))  # all tracks static (or only one frame)
+        max_values = (1 << self.bit_widths.astype(np.int64)) - 1
+        coefficients = self.offsets[:, np.newaxis] + self.quantized_coefficients * (
+            self.scales / max_values
+        )[:, np.newaxis]
+        coefficients = np.where(self.quantized_coefficients < 0, 0.0, coefficients)
+        samples = coefficients @ get_synthesis_matrix(self.block_size)  # (blocks, DOFs, block frames)
+        return samples.transpose(0, 2, 1).reshape(-1, self.dynamic_dof_count)[:self.frame_count]
+
+    def to_interleaved_array(self) -> np.ndarray:
+        """Decompress into a `(frame_count, track_count, 10)` array of `TRSTransform.ravel()` rows.
+
+        Rotations are normalized.
+        """
+        samples = self.get_dynamic_dof_samples()
+        array = np.tile(_IDENTITY_ROW, (self.frame_count, self.track_count, 1))
+        is_reconstructed = np.zeros((self.track_count, 4), dtype=bool)  # static rotation components marked with +/-2
+        static_index = 0
+        dof_index = 0
+        for track_index, mask in enumerate(self.static_masks):
+            for columns, type_shift, dynamic_bit in _TRANSFORM_PARTS:
+                transform_type = (mask >> type_shift) & 3
+                if transform_type == TransformType.Clear:
+                    continue
+                for i, column in enumerate(columns):
+                    is_dynamic = mask >> (dynamic_bit + len(columns) - 1 - i) & 1
+                    if transform_type == TransformType.Dynamic and is_dynamic:
+                        array[:, track_index, column] = samples[:, dof_index]
+                        dof_index += 1
+                    else:
+                        static_value = self.static_values[static_index]
+                        array[:, track_index, column] = static_value
+                        if type_shift == 2 and abs(static_value) == _RECONSTRUCTED_ROTATION_VALUE:
+                            is_reconstructed[track_index, i] = True
+                        static_index += 1
+
+        rotations = array[:, :, 3:7]
+        for component in range(4):
+            # Static components with no real value are reconstructed from the other components.
+            is_component_reconstructed = is_reconstructed[:, component]
+            if np.any(is_component_reconstructed):
+                others = np.delete(rotations[:, is_component_reconstructed], component, axis=-1)
+                magnitudes = np.sqrt(np.maximum(0.0, 1.0 - np.sum(others ** 2, axis=-1)))
+                signs = np.sign(rotations[:, is_component_reconstructed, component])
+                rotations[:, is_component_reconstructed, component] = signs * magnitudes
+        array[:, :, 3:7] = normalize_quaternions(rotations)
+        return array
+
+    @classmethod
+    def from_interleaved_array(
+        cls,
+        array: np.ndarray,
+        block_size: int = 8,
+        bit_width: int = 12,
+        translation_tolerance: float = 0.001,
+        rotation_tolerance: float = 0.001,
+        scale_tolerance: float = 0.001,
+    ) -> WaveletCompressedAnimationData:
+        """Compress a `(frame_count, track_count, 10)` array of `TRSTransform.ravel()` rows.
+
+        Tolerances are the maximum error of each decompressed component (rotations being compared in the same
+        hemisphere). Components that stay within tolerance of their mean are stored as static values, and transform
+        parts that stay within tolerance of identity are cleared. Dynamic components are quantized with `bit_width`
+        bits, which is increased (up to 16 bits) for any transform part whose decompressed error exceeds its tolerance.
+        A warning is logged if any error still exceeds its tolerance. The defaults for `block_size` and `bit_width`
+        match vanilla Demon's Souls animations.
+        """
+        array = np.array(array, dtype=np.float64)
+        if array.ndim != 3 or array.shape[2] != 10:
+            raise ValueError(f"Interleaved array must have shape `(frame_count, track_count, 10)`, not {array.shape}.")
+        frame_count, track_count, _ = array.shape
+
+        # Keep each track's rotations in one hemisphere from frame to frame, so their components are smooth.
+        rotations = normalize_quaternions(array[:, :, 3:7])
+        for frame_index in range(1, frame_count):
+            flip = np.sum(rotations[frame_index] * rotations[frame_index - 1], axis=-1) < 0.0
+            rotations[frame_index, flip] *= -1.0
+        array[:, :, 3:7] = rotations
+
+        tolerances = np.array([translation_tolerance, rotation_tolerance, scale_tolerance])
+        static_masks = np.zeros(track_count, dtype=np.uint16)
+        static_values = []
+        dynamic_samples = []
+        dynamic_parts = []  # `(track_index, part_index)` of each dynamic DOF
+        reconstructed_values = {}  # static value index of each reconstructed W -> `(track_index, mean W)`
+        for track_index in range(track_count):
+            track = array[:, track_index]
+            mask = 0
+            for part_index, (columns, type_shift, dynamic_bit) in enumerate(_TRANSFORM_PARTS):
+                tolerance = tolerances[part_index]
+                part = track[:, columns]
+                is_rotation = columns.start == 3
+                is_dynamic = np.ptp(part, axis=0) > tolerance
+                if not np.any(is_dynamic):
+                    value = np.mean(part, axis=0)
+                    if is_rotation:
+                        # Static rotations are normalized on decompression.
+                        value = normalize_quaternions(value)
+                        is_dynamic = np.abs(part - value).max(axis=0) > tolerance
+                if not np.any(is_dynamic):
+                    if np.abs((np.abs(part) if is_rotation else part) - _IDENTITY_ROW[columns]).max() <= tolerance:
+                        mask |= TransformType.Clear << type_shift
+                    else:
+                        mask |= TransformType.Static << type_shift
+                        static_values.extend(value)
+                    continue
+                # Dynamic (type 0).
+                for i, column in enumerate(columns):
+                    if is_dynamic[i]:
+                        mask |= 1 << (dynamic_bit + len(columns) - 1 - i)
+                        dynamic_samples.append(part[:, i])
+                        dynamic_parts.append((track_index, part_index))
+                    elif is_rotation and i == 3:
+                        # Static W of a dynamic rotation is reconstructed from X, Y, and Z (if accurate enough).
+                        mean_w = np.mean(part[:, i])
+                        reconstructed_values[len(static_values)] = (track_index, mean_w)
+                        static_values.append(np.copysign(_RECONSTRUCTED_ROTATION_VALUE, mean_w))
+                    else:
+                        static_values.append(np.mean(part[:, i]))
+            static_masks[track_index] = mask
+
+        block_count = -(-frame_count // block_size)
+        dynamic_dof_count = len(dynamic_samples)
+        # Pad the last block by repeating the last frame.
+        samples = np.zeros((block_count * block_size, dynamic_dof_count))
+        if dynamic_dof_count:
+            samples[:frame_count] = np.stack(dynamic_samples, axis=1)
+            samples[frame_count:] = samples[frame_count - 1]
+        analysis_matrix = np.linalg.inv(get_synthesis_matrix(block_size))
+        # (blocks, DOFs, block frames) samples to coefficients.
+        coefficients = samples.reshape(block_count, block_size, dynamic_dof_count).transpose(0, 2, 1) @ analysis_matrix
+
+        # Quantization range always includes zero, which omitted coefficients are decompressed as.
+        offsets = coefficients.min(axis=(0, 2), initial=0.0).astype(np.float32)
+        maxima = coefficients.max(axis=(0, 2), initial=0.0)
+        scales = (maxima - offsets).astype(np.float32)
+        scales[scales == 0.0] = 1.0
+
+        wavelet_data = cls(
+            frame_count=frame_count,
+            block_size=block_size,
+            static_masks=static_masks,
+            static_values=np.array(static_values, dtype=np.float32),
+            offsets=offsets,
+            scales=scales,
+            bit_widths=np.full(dynamic_dof_count, bit_width, dtype=np.uint8),
+            quantized_coefficients=np.empty((block_count, dynamic_dof_count, block_size), dtype=np.int32),
+        )
+
+        # Widen the quantization of (or stop reconstructing W of) transform parts until they are within tolerance.
+        dof_tracks, dof_parts = np.array(dynamic_parts, dtype=np.int64).reshape(-1, 2).T
+        while True:
+            wavelet_data.quantized_coefficients = _quantize_coefficients(
+                coefficients, offsets, scales, wavelet_data.bit_widths
+            )
+            part_errors = wavelet_data._get_part_errors(array)
+            is_too_far = part_errors > tolerances
+            if not np.any(is_too_far):
+                break
+            stored_w_tracks = []
+            for static_index, (track_index, mean_w) in list(reconstructed_values.items()):
+                if is_too_far[track_index, 1]:
+                    # Reconstructing W from quantized X, Y, and Z is inaccurate when W is small. Store it instead.
+                    wavelet_data.static_values[static_index] = mean_w
+                    reconstructed_values.pop(static_index)
+                    stored_w_tracks.append(track_index)
+            is_widened = (
+                is_too_far[dof_tracks, dof_parts]
+                & (wavelet_data.bit_widths < _MAX_BIT_WIDTH)
+                & ~(np.isin(dof_tracks, stored_w_tracks) & (dof_parts == 1))  # check stored W first
+            )
+            if not stored_w_tracks and not np.any(is_widened):
+                _LOGGER.warning(
+                    f"Wavelet-compressed animation exceeds tolerance in {np.count_nonzero(is_too_far)} transform parts "
+                    f"(maximum error {part_errors.max():.6f})."
+                )
+                break
+            wavelet_data.bit_widths[is_widened] += 1
+
+        return wavelet_data
+
+    def _get_part_errors(self, array: np.ndarray) -> np.ndarray:
+        """Get maximum decompressed error of each transform part of each track, compared to interleaved `array`, as a
+        `(track_count, 3)` array."""
+        decompressed = self.to_interleaved_array()
+        rotation_signs = np.sum(decompressed[..., 3:7] * array[..., 3:7], axis=-1, keepdims=True) < 0.0
+        decompressed[..., 3:7] *= np.where(rotation_signs, -1.0, 1.0)
+        errors = np.abs(decompressed - array)
+        return np.stack([errors[:, :, columns].max(axis=(0, 2)) for columns, _, _ in _TRANSFORM_PARTS], axis=1)
+
+
+def _quantize_coefficients(
+    coefficients: np.ndarray, offsets: np.ndarray, scales: np.ndarray, bit_widths: np.ndarray
+) -> np.ndarray:
+    """Quantize `(block_count, dynamic_dof_count, block_size)` wavelet coefficients with the given offset, scale, and
+    bit width of each dynamic DOF. Coefficients that quantize to zero are omitted (-1)."""
+    max_values = ((1 << bit_widths.astype(np.int64)) - 1)[:, np.newaxis]
+    quantized_coefficients = np.clip(
+        np.round((coefficients - offsets[:, np.newaxis]) / scales[:, np.newaxis] * max_values), 0, max_values
+    ).astype(np.int32)
+    zero_levels = np.round(-offsets[:, np.newaxis] / scales[:, np.newaxis] * max_values).astype(np.int32)
+    quantized_coefficients[quantized_coefficients == zero_levels] = -1
+    return quantized_coefficients
@@ -0,0 +1,499 @@
+"""Standalone speed and memory benchmarks for HKX pack/unpack, animation codecs, armature conversion, `convert_hk`, map
+collisions (including OBJ conversion), mesh welding, and navmesh arrays, run over the bundled `tests/resources` files
+and some larger synthetic files built from them.
+
+Results are written as JSON so that runs on different commits can be compared offline:
+    python tests/benchmarks/run_benchmarks.py run --output before.json
+    (check out another commit)
+    python tests/benchmarks/run_benchmarks.py run --output after.json
+    python tests/benchmarks/run_benchmarks.py compare before.json after.json
+
+Each benchmark is timed over `--rounds` rounds (after one warm-up call), and calls that take less than `MIN_ROUND_TIME`
+are repeated within each round. Peak memory allocated by one separate call is measured with `tracemalloc` (which also
+traces NumPy arrays), as it slows down the timed calls too much to use at the same time.
+
+Use `--filter` to only run benchmarks whose names contain any of the given strings, e.g. `--filter spline armature`.
+
+Soulstruct is only imported inside each benchmark's setup function, so that this script also runs on older commits.
+Benchmarks whose imports fail there (e.g. features that do not exist yet) are reported as skipped, and benchmarks that
+raise any other error are reported as failed.
+"""
+from __future__ import annotations
+
+import argparse
+import copy
+import fnmatch
+import gc
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+import typing as tp
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+if tp.TYPE_CHECKING:
+    from soulstruct.havok.core import HKX
+    from soulstruct.havok.fromsoft import darksouls1r, demonssouls
+    from soulstruct.havok.fromsoft.eldenring import NavmeshArrays
+    from soulstruct.havok.fromsoft.shared.map_collision import MapCollisionModel
+
+RESOURCES = Path(__file__).parent.parent / "resources"
+MIN_ROUND_TIME = 0.01  # seconds
+
+# Benchmark name -> setup function, which returns the (untimed) function to benchmark.
+BENCHMARKS = {}  # type: dict[str, tp.Callable[[], tp.Callable[[], tp.Any]]]
+
+
+def benchmark(name: str):
+    def decorator(setup: tp.Callable[[], tp.Callable[[], tp.Any]]):
+        if name in BENCHMARKS:
+            raise ValueError(f"Benchmark name '{name}' is already used.")
+        BENCHMARKS[name] = setup
+        return setup
+    return decorator
+
+
+# region Synthetic Files
+
+def get_long_interleaved_animation(repeats: int = 10) -> darksouls1r.AnimationHKX:
+    """DSR Capra Demon attack 3000, decompressed to interleaved and played `repeats` times in a row."""
+    from soulstruct.havok.fromsoft import darksouls1r
+
+    animation_hkx = darksouls1r.AnimationHKX.from_path(RESOURCES / "DSR/c2240/a00_3000.hkx").to_interleaved_hkx()
+    animation = animation_hkx.animation_container.hkx_animation
+    animation.transforms = list(animation.transforms) * repeats  # elements are shared, but packed separately
+    animation.duration *= repeats
+    return animation_hkx
+
+
+def get_large_map_collision(copies: int = 50) -> MapCollisionModel:
+    """DeS map collision `h0004b0`, with `copies` translated copies of each mesh."""
+    from soulstruct.havok.core import HKX
+    from soulstruct.havok.fromsoft.shared.map_collision import MapCollisionModel, MapCollisionModelMesh
+
+    model = MapCollisionModel.from_hkx(HKX.from_path(RESOURCES / "DES/h0004b0.hkx"))
+    meshes = []
+    for i in range(copies):
+        offset = np.array([100.0 * i, 0.0, 0.0, 0.0], dtype=np.float32)
+        for mesh in model.meshes:
+            meshes.append(MapCollisionModelMesh(mesh.vertices + offset, mesh.faces.copy(), mesh.material_index))
+    model.meshes = meshes
+    return model
+
+
+def get_many_animations_hkx(animation_count: int = 1100) -> HKX:
+    """DSR animation file with `animation_count` copies of its animation, each with its own binding (~100k items)."""
+    from soulstruct.havok.core import HKX
+
+    hkx = HKX.from_path(RESOURCES / "DSR/c2240/a00_0000.hkx")
+    container = hkx.root.namedVariants[0].variant
+    animation, binding = container.animations[0], container.bindings[0]
+    container.animations = [copy.copy(animation) for _ in range(animation_count)]
+    container.bindings = []
+    for new_animation in container.animations:
+        new_binding = copy.copy(binding)
+        new_binding.animation = new_animation
+        container.bindings.append(new_binding)
+    return hkx
+
+# endregion
+
+
+# region Benchmarks
+
+def _register_unpack_and_pack(name: str, load: tp.Callable[[], bytes], pack=True):
+    @benchmark(f"{name}.unpack")
+    def _():
+        from soulstruct.havok.core import HKX
+
+        data = load()
+        return lambda: HKX.from_bytes(data)
+
+    if pack:
+        @benchmark(f"{name}.pack")
+        def _():
+            from soulstruct.havok.core import HKX
+
+            hkx = HKX.from_bytes(load())
+            return hkx.to_bytes
+
+
+for _name, _path, _pack in (
+    ("tagfile.dsr_animation", "DSR/c2240/a00_3000.hkx", True),
+    ("tagfile.dsr_skeleton", "DSR/c2240/Skeleton.HKX", True),
+    ("tagfile.dsr_ragdoll", "DSR/c2240/c2240.hkx", False),  # ragdoll constraint motors cannot be repacked yet
+    ("packfile.ptde_animation", "PTDE/c2240/a00_3000.hkx", True),
+    ("packfile.ptde_skeleton", "PTDE/c2240/Skeleton.HKX", True),
+    ("packfile.des_map_collision", "DES/h0004b0.hkx", True),
+):
+    _register_unpack_and_pack(_name, (RESOURCES / _path).read_bytes, _pack)
+_register_unpack_and_pack("tagfile.long_interleaved_animation", lambda: get_long_interleaved_animation().to_bytes())
+
+
+@benchmark("tagfile.pack_25k_items")
+def _():
+    return get_many_animations_hkx(275).to_bytes
+
+
+@benchmark("tagfile.pack_100k_items")
+def _():
+    return get_many_animations_hkx().to_bytes
+
+
+@benchmark("spline.decompress")
+def _():
+    from soulstruct.havok.fromsoft import darksouls1r
+
+    animation_hkx = darksouls1r.AnimationHKX.from_path(RESOURCES / "DSR/c2240/a00_3000.hkx")
+    return animation_hkx.to_interleaved_hkx
+
+
+@benchmark("spline.decompress_struct_arrays")
+def _():
+    from soulstruct.havok.fromsoft import darksouls1r
+    from soulstruct.havok.types.hk import hk
+
+    if not hasattr(hk, "struct_arrays"):
+        raise ImportError("`hk.struct_arrays()` is not available.")
+    animation_hkx = darksouls1r.AnimationHKX.from_path(RESOURCES / "DSR/c2240/a00_3000.hkx")
+
+    def decompress():
+        with hk.struct_arrays():
+            return animation_hkx.to_interleaved_hkx()
+
+    return decompress
+
+
+@benchmark("spline.compress")
+def _():
+    from soulstruct.havok.fromsoft import darksouls1r
+
+    animation_hkx = darksouls1r.AnimationHKX.from_path(RESOURCES / "DSR/c2240/a00_3000.hkx").to_interleaved_hkx()
+    return animation_hkx.to_spline_hkx
+
+
+@benchmark("spline.compress_long")
+def _():
+    return get_long_interleaved_animation().to_spline_hkx
+
+
+def _load_des_animation(anim_id: int) -> demonssouls.AnimationHKX:
+    from soulstruct.havok.fromsoft.demonssouls.anibnd import ANIBND
+
+    anibnd = ANIBND.from_path(RESOURCES / "DES/c5020.anibnd")
+    for entry in anibnd.entries:
+        entry.path = entry.path.replace("\\", "/")  # Windows entry paths
+    anibnd.load_from_entries()
+    return anibnd.animations_hkx[anim_id]
+
+
+@benchmark("wavelet.decompress")
+def _():
+    return _load_des_animation(3000).to_interleaved_hkx
+
+
+@benchmark("wavelet.compress")
+def _():
+    return _load_des_animation(3000).to_interleaved_hkx().to_wavelet_hkx
+
+
+def _get_armature_benchmark_data(long: bool):
+    from soulstruct.havok.fromsoft import darksouls1r
+
+    skeleton = darksouls1r.SkeletonHKX.from_path(RESOURCES / "DSR/c2240/Skeleton.HKX").skeleton
+    if long:
+        animation_hkx = get_long_interleaved_animation()
+    else:
+        animation_hkx = darksouls1r.AnimationHKX.from_path(RESOURCES / "DSR/c2240/a00_3000.hkx").to_interleaved_hkx()
+    return skeleton, animation_hkx.animation_container
+
+
+for _suffix, _long in (("", False), ("_long", True)):
+    @benchmark(f"armature.local_to_armature{_suffix}")
+    def _(long=_long):
+        skeleton, container = _get_armature_benchmark_data(long)
+        return lambda: container.get_interleaved_array_in_armature_space(skeleton)
+
+    @benchmark(f"armature.armature_to_local{_suffix}")
+    def _(long=_long):
+        skeleton, container = _get_armature_benchmark_data(long)
+        arma_array = container.get_interleaved_array_in_armature_space(skeleton)
+        track_parent_indices = container.get_track_parent_indices(skeleton)
+        return lambda: container.armature_array_to_local_array(arma_array, track_parent_indices)
+
+
+@benchmark("convert_hk.dsr_spline_to_2010")
+def _():
+    from soulstruct.havok.fromsoft import darksouls1r
+
+    return darksouls1r.AnimationHKX.from_path(RESOURCES / "DSR/c2240/a00_3000.hkx").to_2010_hkx
+
+
+@benchmark("convert_hk.ptde_spline_to_2015")
+def _():
+    from soulstruct.havok.fromsoft import darksouls1r
+    from soulstruct.havok.fromsoft.darksouls1r.core import AnimationHKX_PTDE
+
+    animation_hkx = AnimationHKX_PTDE.from_path(RESOURCES / "PTDE/c2240/a00_3000.hkx")
+    return lambda: darksouls1r.AnimationHKX.from_2010_hkx(animation_hkx)
+
+
+@benchmark("convert_hk.long_interleaved_to_2010")
+def _():
+    return get_long_interleaved_animation().to_2010_hkx
+
+
+@benchmark("map_collision.from_hkx")
+def _():
+    from soulstruct.havok.core import HKX
+    from soulstruct.havok.fromsoft.shared.map_collision import MapCollisionModel
+
+    hkx = HKX.from_path(RESOURCES / "DES/h0004b0.hkx")
+    return lambda: MapCollisionModel.from_hkx(hkx)
+
+
+@benchmark("map_collision.to_hkx")
+def _():
+    from soulstruct.havok.core import HKX
+    from soulstruct.havok.fromsoft.shared.map_collision import MapCollisionModel
+
+    return MapCollisionModel.from_hkx(HKX.from_path(RESOURCES / "DES/h0004b0.hkx")).to_hkx
+
+
+@benchmark("map_collision.large_to_hkx")
+def _():
+    return get_large_map_collision().to_hkx
+
+
+@benchmark("map_collision.large_from_hkx")
+def _():
+    from soulstruct.havok.core import HKX
+    from soulstruct.havok.fromsoft.shared.map_collision import MapCollisionModel
+
+    hkx = HKX.from_bytes(get_large_map_collision().to_hkx().to_bytes())
+    return lambda: MapCollisionModel.from_hkx(hkx)
+
+
+@benchmark("map_collision.large_to_obj")
+def _():
+    return get_large_map_collision().to_obj
+
+
+@benchmark("map_collision.large_parse_obj")
+def _():
+    from soulstruct.havok.utilities.wavefront import parse_obj
+
+    obj_text = get_large_map_collision().to_obj()
+    return lambda: parse_obj(obj_text)
+
+
+@benchmark("mesh.merge_vertices_by_distance")
+def _():
+    """Weld a 200x200 grid of quads that each have their own (jittered) vertices, like a navmesh."""
+    from soulstruct.havok.utilities.mesh import Mesh
+
+    size = 200
+    corners = np.array([[0, 0], [1, 0], [1, 1], [0, 1]])
+    cells = np.stack(np.meshgrid(np.arange(size), np.arange(size), indexing="ij"), axis=-1).reshape(-1, 1, 2)
+    vertices = np.zeros((size * size * 4, 3))
+    vertices[:, :2] = (cells + corners).reshape(-1, 2) * 2.0
+    vertices += np.random.default_rng(0).uniform(-0.1, 0.1, size=vertices.shape)
+    mesh = Mesh.from_flat_faces(vertices, np.arange(len(vertices)), np.arange(0, len(vertices) + 1, 4))
+    return lambda: mesh.merge_vertices_by_distance(merge_dist=0.5)
+
+
+def get_grid_quads(size: int = 200) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get vertices, flat face vertex indices, and face offsets of a `size` x `size` grid of quads."""
+    grid = np.stack(np.meshgrid(np.arange(size + 1), np.arange(size + 1), indexing="ij"), axis=-1).reshape(-1, 2)
+    vertices = np.hstack((grid, np.zeros((len(grid), 1))))
+    corners = (np.arange(size)[:, None] * (size + 1) + np.arange(size)).ravel()
+    face_indices = np.stack((corners, corners + size + 1, corners + size + 2, corners + 1), axis=1).ravel()
+    return vertices, face_indices, np.arange(0, len(face_indices) + 1, 4)
+
+
+def get_grid_navmesh_arrays(size: int = 200) -> NavmeshArrays:
+    """Build Elden Ring navmesh arrays for a `size` x `size` grid of quads."""
+    from soulstruct.havok.fromsoft.eldenring import NavmeshArrays
+
+    return NavmeshArrays.from_mesh(*get_grid_quads(size))
+
+
+@benchmark("navmesh.build_arrays")
+def _():
+    from soulstruct.havok.fromsoft.eldenring import NavmeshArrays
+
+    vertices, face_indices, face_offsets = get_grid_quads()
+    return lambda: NavmeshArrays.from_mesh(vertices, face_indices, face_offsets)
+
+
+@benchmark("navmesh.to_hkai_navmesh")
+def _():
+    return get_grid_navmesh_arrays().to_hkai_navmesh
+
+
+@benchmark("navmesh.from_hkai_navmesh")
+def _():
+    from soulstruct.havok.fromsoft.eldenring import NavmeshArrays
+
+    navmesh = get_grid_navmesh_arrays().to_hkai_navmesh()
+    return lambda: NavmeshArrays.from_hkai_navmesh(navmesh)
+
+# endregion
+
+
+# region Runner
+
+def time_function(func: tp.Callable[[], tp.Any], rounds: int) -> tuple[list[float], int]:
+    """Returns time per call for each round, and the number of calls per round."""
+    func()  # warm-up (and any lazy imports/caches)
+    start = time.perf_counter()
+    func()
+    iterations = max(1, int(MIN_ROUND_TIME / max(time.perf_counter() - start, 1e-9)))
+    times = []
+    for _ in range(rounds):
+        gc.collect()
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        times.append((time.perf_counter() - start) / iterations)
+    return times, iterations
+
+
+def measure_peak_memory(func: tp.Callable[[], tp.Any]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def get_git_commit() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], cwd=Path(__file__).parent, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(names: list[str], rounds: int) -> dict[str, tp.Any]:
+    from soulstruct.havok.types.debug import SET_DEBUG_PRINT
+
+    SET_DEBUG_PRINT(False)
+    logging.getLogger("soulstruct").setLevel(logging.WARNING)
+    results = {}
+    skipped = {}  # type: dict[str, str]
+    failed = {}  # type: dict[str, str]
+    for name in names:
+        try:
+            func = BENCHMARKS[name]()
+            times, iterations = time_function(func, rounds)
+            peak_memory = measure_peak_memory(func)
+        except ImportError as ex:
+            # Benchmarked feature does not exist in this commit.
+            skipped[name] = str(ex)
+            print(f"{name:<45} skipped ({ex})")
+            continue
+        except Exception as ex:
+            failed[name] = f"{type(ex).__name__}: {ex}"
+            print(f"{name:<45} FAILED ({failed[name]})")
+            continue
+        results[name] = {
+            "rounds": rounds,
+            "iterations": iterations,
+            "times": times,
+            "min": min(times),
+            "median": statistics.median(times),
+            "mean": statistics.mean(times),
+            "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+            "peak_memory": peak_memory,
+        }
+        print(f"{name:<45} {1000 * results[name]['median']:>10.3f} ms {peak_memory / 2 ** 20:>10.2f} MiB")
+    return {
+        "machine_info": {
+            "python": sys.version,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+        },
+        "commit": get_git_commit(),
+        "datetime": datetime.now(timezone.utc).isoformat(),
+        "benchmarks": results,
+        "skipped": skipped,
+        "failed": failed,
+    }
+
+
+def compare_results(old_path: Path, new_path: Path, threshold: float) -> bool:
+    """Print median time and peak memory ratios of benchmarks in both files. Returns `False` if any benchmark got slower
+    or used more memory by more than `threshold` (as a fraction)."""
+    old = json.loads(old_path.read_text())
+    new = json.loads(new_path.read_text())
+    print(f"Old: {old_path} (commit {old.get('commit')})")
+    print(f"New: {new_path} (commit {new.get('commit')})")
+    print(f"{'benchmark':<45} {'old ms':>10} {'new ms':>10} {'time':>7} {'memory':>7}")
+    passed = True
+    for name in new.get("skipped", {}):
+        print(f"{name:<45} (skipped)")
+    for name in new.get("failed", {}):
+        print(f"{name:<45} (FAILED)")
+        passed = False
+    for name, new_result in new["benchmarks"].items():
+        old_result = old["benchmarks"].get(name)
+        if old_result is None:
+            print(f"{name:<45} {'-':>10} {1000 * new_result['median']:>10.3f}   (new)")
+            continue
+        time_ratio = new_result["median"] / old_result["median"]
+        memory_ratio = new_result["peak_memory"] / max(old_result["peak_memory"], 1)
+        flags = []
+        if time_ratio > 1.0 + threshold:
+            flags.append("SLOWER")
+        if memory_ratio > 1.0 + threshold:
+            flags.append("MORE MEMORY")
+        passed &= not flags
+        print(
+            f"{name:<45} {1000 * old_result['median']:>10.3f} {1000 * new_result['median']:>10.3f} "
+            f"{time_ratio:>6.2f}x {memory_ratio:>6.2f}x {' '.join(flags)}".rstrip()
+        )
+    return passed
+
+
+def main(args: list[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    run_parser = subparsers.add_parser("run", help="Run benchmarks and write JSON results.")
+    run_parser.add_argument("--output", type=Path, default=None, help="JSON results path (default: print only).")
+    run_parser.add_argument("--rounds", type=int, default=5)
+    run_parser.add_argument("--filter", nargs="*", default=(), help="Only run benchmarks containing these strings.")
+    compare_parser = subparsers.add_parser("compare", help="Compare two JSON results files.")
+    compare_parser.add_argument("old", type=Path)
+    compare_parser.add_argument("new", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=0.1, help="Allowed fractional regression.")
+    parsed = parser.parse_args(args)
+
+    if parsed.command == "compare":
+        sys.exit(0 if compare_results(parsed.old, parsed.new, parsed.threshold) else 1)
+
+    names = [
+        name for name in BENCHMARKS
+        if not parsed.filter or any(fnmatch.fnmatch(name, f"*{pattern}*") for pattern in parsed.filter)
+    ]
+    results = run_benchmarks(names, parsed.rounds)
+    if parsed.output:
+        parsed.output.write_text(json.dumps(results, indent=2))
+        print(f"Wrote results to {parsed.output}")
+
+# endregion
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""Check that ANIBND animations can be loaded lazily or in parallel, with the same results as a serial load."""
+from pathlib import Path
+
+from soulstruct.havok.fromsoft.base.anibnd import LazyAnimationsHKX
+from soulstruct.havok.fromsoft.demonssouls.anibnd import ANIBND
+from soulstruct.havok.types.debug import SET_DEBUG_PRINT
+
+RESOURCES = Path(__file__).parent / "resources"
+
+
+def get_anibnd() -> ANIBND:
+    anibnd = ANIBND.from_path(RESOURCES / "DES/c5020.anibnd")
+    for entry in anibnd.entries:
+        entry.path = entry.path.replace("\\", "/")  # Windows entry paths
+    return anibnd
+
+
+def test_anibnd_loading():
+    SET_DEBUG_PRINT(False)
+
+    serial_anibnd = get_anibnd()
+    serial_anibnd.load_from_entries()
+    anim_ids = list(serial_anibnd.animations_hkx)
+    assert len(anim_ids) > 1
+
+    parallel_anibnd = get_anibnd()
+    parallel_anibnd.load_from_entries(processes=2)
+    assert list(parallel_anibnd.animations_hkx) == anim_ids
+    for anim_id in anim_ids:
+        assert parallel_anibnd.animations_hkx[anim_id].to_bytes() == serial_anibnd.animations_hkx[anim_id].to_bytes()
+
+    lazy_anibnd = get_anibnd()
+    lazy_anibnd.load_from_entries(lazy=True)
+    lazy_animations = lazy_anibnd.animations_hkx
+    assert isinstance(lazy_animations, LazyAnimationsHKX)
+    assert list(lazy_animations) == anim_ids
+    assert not any(lazy_animations.is_loaded(anim_id) for anim_id in anim_ids)
+    animation_hkx = lazy_anibnd[anim_ids[1]].hkx_animation  # via `get_animation_container()`
+    assert animation_hkx.duration == serial_anibnd[anim_ids[1]].hkx_animation.duration
+    assert [lazy_animations.is_loaded(anim_id) for anim_id in anim_ids[:3]] == [False, True, False]
+    assert lazy_animations[anim_ids[1]] is lazy_animations[anim_ids[1]]
+
+
+if __name__ == '__main__':
+    test_anibnd_loading()
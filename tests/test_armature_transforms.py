@@ -0,0 +1,56 @@
+"""Check that vectorized armature-space conversion of animation frames matches composing `TRSTransform`s one at a time,
+and that it can be inverted.
+"""
+from pathlib import Path
+
+import numpy as np
+
+from soulstruct.havok.fromsoft.darksouls1r import AnimationHKX, SkeletonHKX
+from soulstruct.havok.types.debug import SET_DEBUG_PRINT
+
+RESOURCES = Path(__file__).parent / "resources"
+
+
+def test_armature_transforms():
+    SET_DEBUG_PRINT(False)
+
+    skeleton = SkeletonHKX.from_path(RESOURCES / "DSR/c2240/Skeleton.HKX").skeleton
+    container = AnimationHKX.from_path(RESOURCES / "DSR/c2240/a00_3000.hkx").to_interleaved_hkx().animation_container
+    track_parent_indices = container.get_track_parent_indices(skeleton)
+
+    local_array = container.get_interleaved_array()
+    assert local_array.shape == (container.frame_count, container.track_count, 10)
+    container.load_interleaved_data()
+    assert np.allclose(container.get_interleaved_array(), local_array)  # from loaded `TRSTransform`s
+
+    arma_array = container.get_interleaved_array_in_armature_space(skeleton)
+    for frame_index in (0, 50):
+        frame = container.interleaved_data[frame_index]
+        expected = []
+        for track_index, local_transform in enumerate(frame):
+            parent_index = track_parent_indices[track_index]
+            while parent_index != -1:
+                local_transform = frame[parent_index] @ local_transform
+                parent_index = track_parent_indices[parent_index]
+            expected.append(local_transform.ravel())
+        assert np.allclose(arma_array[frame_index], expected, atol=1e-5)
+
+    re_local_array = container.armature_array_to_local_array(arma_array, track_parent_indices)
+    local_array[..., 3:7] /= np.linalg.norm(local_array[..., 3:7], axis=-1, keepdims=True)
+    assert np.allclose(re_local_array, local_array, atol=1e-5)
+
+    # List wrappers give the same results.
+    arma_frames = container.get_interleaved_data_in_armature_space(skeleton)
+    assert np.allclose(container.transforms_to_array(arma_frames), arma_array)
+    re_local_frames = container.armature_transforms_to_local_transforms(arma_frames, track_parent_indices)
+    assert np.allclose(container.transforms_to_array(re_local_frames), re_local_array)
+
+    # Empty frames and tracks.
+    assert container.transforms_to_array([]).shape == (0, 0, 10)
+    assert container.transforms_to_array([[], []]).shape == (2, 0, 10)
+    assert container.armature_transforms_to_local_transforms([], []) == []
+    assert container.local_transforms_to_armature_transforms([], [], []) == []
+
+
+if __name__ == '__main__':
+    test_armature_transforms()
@@ -0,0 +1,119 @@
+"""Check that `QuaternionArray` and `TRSTransformArray` operations match `Quaternion` and `TRSTransform` operations applied
+one at a time."""
+from pathlib import Path
+
+import numpy as np
+
+from soulstruct.havok.fromsoft.darksouls1r import AnimationHKX
+from soulstruct.havok.types import hk
+from soulstruct.havok.types.debug import SET_DEBUG_PRINT
+from soulstruct.havok.types.struct_array import StructArray
+from soulstruct.havok.utilities.maths import Quaternion, QuaternionArray, TRSTransform, TRSTransformArray, Vector3
+
+RESOURCES = Path(__file__).parent / "resources"
+
+
+def random_transforms(rng: np.random.Generator, count: int) -> list[TRSTransform]:
+    return [
+        TRSTransform(
+            Vector3(rng.uniform(-2.0, 2.0, 3)),
+            Quaternion(QuaternionArray(rng.normal(size=(1, 4))).normalized().data[0]),
+            Vector3(np.full(3, rng.uniform(0.5, 2.0))),
+        )
+        for _ in range(count)
+    ]
+
+
+def assert_same_rotations(array: QuaternionArray, quaternions: list[Quaternion]):
+    dots = np.abs(array.normalized().dot(QuaternionArray.from_quaternions(quaternions)))
+    assert np.allclose(dots, 1.0), dots
+
+
+def test_quaternion_array():
+    rng = np.random.default_rng(0)
+    transforms1 = random_transforms(rng, 20)
+    transforms2 = random_transforms(rng, 20)
+    q1 = [t.rotation for t in transforms1]
+    q2 = [t.rotation for t in transforms2]
+    array1 = QuaternionArray.from_quaternions(q1)
+    array2 = QuaternionArray.from_quaternions(q2)
+
+    assert np.array_equal(array1[3].data, q1[3].data)
+    assert np.array_equal(array1[2:5].data, array1.data[2:5])
+    assert_same_rotations(array1 @ array2, [a @ b for a, b in zip(q1, q2)])
+    assert_same_rotations(array1 @ q2[0], [a @ q2[0] for a in q1])
+    assert_same_rotations(array1.inverse(), [q.inverse() for q in q1])
+
+    vector = np.array([0.3, -1.0, 2.0])
+    assert np.allclose(array1.rotate_vectors(vector), [q.rotate_vector(vector) for q in q1])
+
+    for t in (0.0, 0.25, 0.8, 1.0):
+        assert_same_rotations(
+            QuaternionArray.slerp(array1, array2, t, shortest_path=True),
+            [Quaternion.slerp(a, b, t, shortest_path=True) for a, b in zip(q1, q2)],
+        )
+    t = np.linspace(0.0, 1.0, len(array1))
+    nlerped = QuaternionArray.nlerp(array1, array2, t, shortest_path=True)
+    assert np.allclose(nlerped.norms(), 1.0)
+    assert np.allclose(nlerped.data[0] * np.sign(array1.dot(array2)[0]), array1.data[0])
+
+    euler_deg = np.column_stack([rng.uniform(-80.0, 80.0, 20) for _ in range(3)])
+    from_euler = QuaternionArray.from_euler_angles_deg(euler_deg)
+    assert_same_rotations(from_euler, [Quaternion.from_euler_angles_deg(Vector3(e)) for e in euler_deg])
+    assert np.allclose(from_euler.to_euler_angles_deg(), euler_deg)
+    assert np.allclose(from_euler.to_euler_angles_deg(), [q.to_euler_angles_deg() for q in from_euler])
+    assert np.allclose(QuaternionArray.from_euler_angles_deg(euler_deg, "zyx").to_euler_angles_deg("zyx"), euler_deg)
+
+
+def test_trs_transform_array():
+    rng = np.random.default_rng(1)
+    transforms1 = random_transforms(rng, 20)
+    transforms2 = random_transforms(rng, 20)
+    array1 = TRSTransformArray.from_trs_transforms(transforms1)
+    array2 = TRSTransformArray.from_trs_transforms(transforms2)
+
+    assert np.allclose(array1[5].ravel(), transforms1[5].ravel())
+    assert array1[2:4] == TRSTransformArray.from_trs_transforms(transforms1[2:4])
+    assert np.allclose((array1 @ array2).data, [(a @ b).ravel() for a, b in zip(transforms1, transforms2)])
+    assert np.allclose(
+        array1.compose(transforms2[0]).data, [a.compose(transforms2[0]).ravel() for a in transforms1]
+    )
+    assert np.allclose(array1.inverse().data, [a.inverse().ravel() for a in transforms1])
+
+    vectors = rng.normal(size=(len(array1), 3))
+    assert np.allclose(
+        array1.transform_vectors(vectors), [a.transform_vector(Vector3(v)) for a, v in zip(transforms1, vectors)]
+    )
+
+    lerped = TRSTransformArray.lerp(array1, array2, 0.3)
+    for lerped_transform, a, b in zip(lerped, transforms1, transforms2):
+        expected = TRSTransform.lerp(a, b, 0.3)
+        assert np.allclose(lerped_transform.translation, expected.translation)
+        assert np.allclose(lerped_transform.scale, expected.scale)
+        assert abs(lerped_transform.rotation.dot(expected.rotation)) > 1.0 - 1e-9
+
+
+def test_qs_transform_conversion():
+    SET_DEBUG_PRINT(False)
+
+    animation_hkx = AnimationHKX.from_path(RESOURCES / "DSR/c2240/a00_3000.hkx")
+    list_transforms = animation_hkx.to_interleaved_hkx().animation_container.hkx_animation.transforms
+    assert type(list_transforms) is list
+    with hk.struct_arrays():
+        animation = animation_hkx.to_interleaved_hkx().animation_container
+    qs_transforms = animation.hkx_animation.transforms
+    assert isinstance(qs_transforms, StructArray)
+
+    array = TRSTransformArray.from_qs_transforms(qs_transforms)
+    assert len(array) == len(qs_transforms)
+    assert np.allclose(array.data[:50], [t.to_trs_transform().ravel() for t in qs_transforms[:50]])
+    assert np.array_equal(TRSTransformArray.from_qs_transforms(list_transforms).data, array.data)
+
+    repacked = array.to_qs_transforms(type(qs_transforms[0]))
+    assert np.array_equal(repacked.to_array(), qs_transforms.to_array())
+
+
+if __name__ == '__main__':
+    test_quaternion_array()
+    test_trs_transform_array()
+    test_qs_transform_conversion()
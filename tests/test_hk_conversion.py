@@ -0,0 +1,53 @@
+"""Check that `convert_hk` round-trips animations between Havok versions, converts each shared `hk` instance only once,
+and shares non-`hk` values rather than copying them.
+"""
+from pathlib import Path
+
+from soulstruct.havok.fromsoft.darksouls1r import AnimationHKX
+from soulstruct.havok.types import hk2010, hk2015
+from soulstruct.havok.types.debug import SET_DEBUG_PRINT
+from soulstruct.havok.utilities.hk_conversion import convert_hk, get_conversion_plan
+
+RESOURCES = Path(__file__).parent / "resources"
+
+
+def test_hk_conversion():
+    SET_DEBUG_PRINT(False)
+
+    animation_hkx = AnimationHKX.from_path(RESOURCES / "DSR/c2240/a00_3000.hkx")
+    hkx2010 = animation_hkx.to_2010_hkx()
+    container2010 = hkx2010.root.namedVariants[0].variant
+    assert isinstance(container2010, hk2010.hkaAnimationContainer)
+    # Animation is referenced by both the container and the binding, and must only be converted once.
+    assert container2010.bindings[0].animation is container2010.animations[0]
+
+    re_animation_hkx = AnimationHKX.from_2010_hkx(hkx2010)
+    assert re_animation_hkx.to_bytes() == animation_hkx.to_bytes()
+
+    # Non-`hk` values are shared, not copied.
+    animation2010 = container2010.animations[0]
+    animation2015 = animation_hkx.animation_container.hkx_animation
+    assert animation2010.data is not animation2015.data  # new list
+    assert animation2010.extractedMotion.up is animation2015.extractedMotion.up
+
+    # Member mapping plans are only computed once per pair of types.
+    plan = get_conversion_plan(hk2015.hkaAnimationBinding, hk2010.hkaAnimationBinding)
+    assert get_conversion_plan(hk2015.hkaAnimationBinding, hk2010.hkaAnimationBinding) is plan
+    assert "partitionIndices" in [name for name, _ in plan.source_only_members]
+
+    # A shared `memo` also shares converted instances between calls.
+    memo = {}
+    root_variant = animation_hkx.root.namedVariants[0]
+
+    def source_error_handler(_, name: str, __, ___):
+        if name in {"frameType", "partitionIndices"}:
+            return []
+
+    container = convert_hk(root_variant.variant, hk2010.hkaAnimationContainer, hk2010, source_error_handler, memo=memo)
+    animation = convert_hk(animation2015, hk2010.hkaSplineCompressedAnimation, hk2010, source_error_handler, memo=memo)
+    assert animation is container.animations[0]
+    assert memo[id(animation2015)] == (animation2015, animation)
+
+
+if __name__ == '__main__':
+    test_hk_conversion()
@@ -0,0 +1,47 @@
+"""Check that `HKXBHD` only decodes each collision entry once, and that parallel loading and writing match serial."""
+from pathlib import Path
+
+from soulstruct.havok.fromsoft.shared.hkx_binder import HKXBHD
+from soulstruct.havok.fromsoft.shared.map_collision import MapCollisionModel
+from soulstruct.havok.types.debug import SET_DEBUG_PRINT
+
+RESOURCES = Path(__file__).parent / "resources"
+HKX_STEMS = ("h0004b0", "h0004b1", "h0004b2")
+
+
+def get_hkxbhd(processes: int) -> HKXBHD:
+    hkx_data = (RESOURCES / "DES/h0004b0.hkx").read_bytes()
+    hkxbhd = HKXBHD(map_stem="m00_00_00_00", processes=processes)
+    for entry_id, hkx_stem in enumerate(HKX_STEMS):
+        # Forward slashes so that entry names are also parsed correctly on non-Windows systems.
+        entry_path = hkxbhd.get_hkx_entry_path(hkx_stem).replace("\\", "/")
+        hkxbhd.set_default_entry(entry_path, new_id=entry_id).set_uncompressed_data(hkx_data)
+    return hkxbhd
+
+
+def test_hkx_binder():
+    SET_DEBUG_PRINT(False)
+
+    serial = get_hkxbhd(processes=1)
+    hkx = serial.get_hkx("h0004b1.hkx.dcx")
+    assert isinstance(hkx, MapCollisionModel)
+    assert serial.get_hkx("h0004b1") is hkx  # cached
+    serial.load_all()
+    assert list(serial.hkxs) == ["h0004b1", "h0004b0", "h0004b2"]
+    assert serial.hkxs["h0004b1"] is hkx  # not decoded again
+
+    parallel = get_hkxbhd(processes=2)
+    parallel.load_all()
+    assert list(parallel.hkxs) == list(HKX_STEMS)
+    assert parallel.hkxs["h0004b2"].path == Path("m00_00_00_00/h0004b2.hkx.dcx")
+
+    # Rebuild all entries from the loaded HKXs.
+    for hkxbhd in (serial, parallel):
+        hkxbhd.clear_entries()
+        hkxbhd.entry_autogen()
+    assert [entry.path for entry in parallel.entries] == [f"m00_00_00_00\\{hkx_stem}.hkx.dcx" for hkx_stem in HKX_STEMS]
+    assert [entry.data for entry in parallel.entries] == [entry.data for entry in serial.entries]
+
+
+if __name__ == '__main__':
+    test_hkx_binder()
@@ -0,0 +1,46 @@
+"""Check that Havok version type modules are only imported as their types are needed."""
+import subprocess
+import sys
+from pathlib import Path
+
+RESOURCES = Path(__file__).parent / "resources"
+
+# Run in a fresh interpreter, as other tests will already have imported type modules.
+CHECK_SCRIPT = f"""
+import sys
+from pathlib import Path
+
+from soulstruct.havok import HKX
+from soulstruct.havok.enums import HavokModule
+from soulstruct.havok.types.type_index import get_type_index
+
+def get_loaded(version):
+    return {{name for name in sys.modules if name.startswith(f"soulstruct.havok.types.{{version}}.")}}
+
+assert not any(get_loaded(version) for version in ("hk550", "hk2010", "hk2014", "hk2015", "hk2016", "hk2018"))
+
+hkx = HKX.from_path({str(RESOURCES / "DSR/c2240/a00_3000.hkx")!r})
+from soulstruct.havok.types import hk2015
+assert type(hkx.root) is hk2015.hkRootLevelContainer
+assert not get_loaded("hk2010")
+loaded_count = len(get_loaded("hk2015"))
+assert 0 < loaded_count < len(hk2015._TYPE_MODULES) // 2, loaded_count
+
+# Types are bound in place of their submodules.
+assert isinstance(hk2015.hkRootLevelContainerNamedVariant, type)
+assert HavokModule.hk2015.get_type("hkaSkeleton").__name__ == "hkaSkeleton"
+assert "hkpRigidBody" in dir(hk2015)
+assert hk2015._TYPE_MODULES == get_type_index(Path(hk2015.__path__[0]))  # generated index is up to date
+
+from soulstruct.havok.types.hk2015 import *
+assert isinstance(hkpRigidBody, type)
+assert len(get_loaded("hk2015")) > loaded_count
+"""
+
+
+def test_lazy_types():
+    subprocess.run([sys.executable, "-c", CHECK_SCRIPT], check=True)
+
+
+if __name__ == '__main__':
+    test_lazy_types()
@@ -0,0 +1,58 @@
+"""Check that HKX files parsed in place from memory-mapped files or `bytes` match normally parsed files, and that their
+zero-copy arrays are views of the source data that can still be copied and pickled.
+"""
+import copy
+import pickle
+from pathlib import Path
+
+import numpy as np
+
+from soulstruct.havok.core import HKX
+from soulstruct.havok.types.debug import SET_DEBUG_PRINT
+from soulstruct.havok.utilities.memory_reader import MemoryReader, read_array_buffer
+
+RESOURCES = Path(__file__).parent / "resources"
+
+
+def test_memory_reader():
+    reader = MemoryReader(bytearray(range(16)))
+    assert reader.unpack_value("I") == 0x03020100
+    view = reader.read_view(4)
+    assert isinstance(view, memoryview) and bytes(view) == bytes(range(4, 8))
+    assert reader.position == 8
+    assert bytes(reader.read_view(2, offset=0)) == b"\0\1" and reader.position == 8
+    assert isinstance(read_array_buffer(reader, 4), bytearray)  # copy unless `zero_copy`
+    sub_reader = MemoryReader(reader.read_view(4), zero_copy=True)
+    assert read_array_buffer(sub_reader, 4).obj is reader.view.obj
+
+
+def test_memory_mapped_hkx():
+    SET_DEBUG_PRINT(False)
+
+    for relative_path in ("DSR/c2240/a00_3000.hkx", "PTDE/c2240/a00_3000.hkx", "DES/h0004b0.hkx"):
+        path = RESOURCES / relative_path
+        hkx = HKX.from_path(path)
+        mapped_hkx = HKX.from_path(path, memory_map=True)
+        assert mapped_hkx.to_bytes() == hkx.to_bytes()
+        assert HKX.from_bytes(path.read_bytes()).to_bytes() == hkx.to_bytes()
+        assert pickle.loads(pickle.dumps(mapped_hkx)).to_bytes() == hkx.to_bytes()
+        assert copy.deepcopy(mapped_hkx).to_bytes() == hkx.to_bytes()
+
+    # Spline data is a writable view of the (copy-on-write) mapped file.
+    path = RESOURCES / "DSR/c2240/a00_3000.hkx"
+    animation = HKX.from_path(path, memory_map=True).root.namedVariants[0].variant.animations[0]
+    assert isinstance(animation.data, np.ndarray) and animation.data.flags.writeable
+    assert isinstance(animation.data.base, memoryview)
+    animation.data[0] ^= 0xFF
+    assert HKX.from_path(path).root.namedVariants[0].variant.animations[0].data[0] == animation.data[0] ^ 0xFF
+
+    # Views of immutable `bytes` are read-only.
+    data = path.read_bytes()
+    animation = HKX.from_bytes(data, zero_copy=True).root.namedVariants[0].variant.animations[0]
+    assert not animation.data.flags.writeable
+    assert np.shares_memory(animation.data, np.frombuffer(data, dtype=np.uint8))
+
+
+if __name__ == '__main__':
+    test_memory_reader()
+    test_memory_mapped_hkx()
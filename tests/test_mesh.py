@@ -0,0 +1,111 @@
+"""Check that `Mesh` faces can be modified in place, and that vertex welding merges vertex clusters and remaps, cleans,
+and splits faces correctly.
+"""
+import numpy as np
+
+from soulstruct.havok.fromsoft.eldenring import NavmeshArrays
+from soulstruct.havok.utilities.mesh import Mesh
+
+
+def test_modify_faces():
+    vertices = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0]], dtype=float)
+    faces = [[0, 1, 2, 3]]
+    mesh = Mesh(vertices, faces)
+    assert mesh.faces is faces
+
+    mesh.faces[0][1] = 4
+    mesh.faces.append([1, 4, 2])
+    assert faces == [[0, 4, 2, 3], [1, 4, 2]]
+    assert mesh.face_count == 2
+    assert np.array_equal(mesh.face_indices, [0, 4, 2, 3, 1, 4, 2])
+    assert np.array_equal(mesh.face_offsets, [0, 4, 7])
+
+    # Faces list created from arrays is also kept.
+    mesh = Mesh.from_flat_faces(vertices, [0, 1, 2, 3, 1, 4, 2], [0, 4, 7])
+    assert mesh.faces is mesh.faces
+    mesh.faces[1][0] = 3
+    del mesh.faces[0]
+    assert mesh.face_count == 1 and mesh.faces == [[3, 4, 2]]
+    assert np.array_equal(mesh.face_sizes, [3])
+    assert mesh.get_vertex_to_face_map() == {2: [0], 3: [0], 4: [0]}
+
+    # Assigning face arrays discards the list.
+    mesh.face_indices = [0, 1, 2]
+    mesh.face_offsets = [0, 3]
+    assert mesh.faces == [[0, 1, 2]]
+
+
+def test_merge_vertices_by_distance():
+    vertices = np.array([
+        [0.0, 0.0, 0.0],
+        [1.0, 0.0, 0.0],
+        [1.0, 1.0, 0.0],
+        [0.0, 1.0, 0.0],
+        [1.1, 0.0, 0.0],  # merges with 1
+        [1.0, 1.1, 0.0],  # merges with 2
+        [2.0, 0.5, 0.0],
+        [0.0, 1.1, 0.0],  # merges with 3
+        [1.0, 1.2, 0.0],  # merges with 2 (via 5)
+    ])
+    faces = [
+        [0, 1, 2, 3],
+        [4, 6, 5],
+        [1, 4, 5],  # degenerate
+        [7, 3, 8, 2],  # degenerate
+        [0, 1, 6, 4, 2, 3],  # folds back on itself (1 -> 6 -> 4 -> 1): spike is removed
+        [],
+    ]
+    mesh = Mesh(vertices, faces)
+    assert mesh.face_count == 6 and not mesh.has_triangles_only
+    assert np.array_equal(mesh.face_offsets, [0, 4, 7, 10, 14, 20, 20])
+
+    merged = mesh.merge_vertices_by_distance(merge_dist=0.15)
+    assert merged.vertex_count == 5
+    assert np.allclose(merged.vertices, [[0, 0, 0], [1.05, 0, 0], [1, 1.1, 0], [0, 1.05, 0], [2, 0.5, 0]])
+    assert merged.faces == [[0, 1, 2, 3], [1, 4, 2], [0, 1, 2, 3]]
+    assert merged.get_vertex_to_face_map() == {0: [0, 2], 1: [0, 1, 2], 2: [0, 1, 2], 3: [0, 2], 4: [1]}
+    vertex_faces, vertex_offsets = merged.get_vertex_faces()
+    assert np.array_equal(vertex_offsets, [0, 2, 5, 8, 10, 11])
+    assert np.array_equal(vertex_faces, [0, 2, 0, 1, 2, 0, 1, 2, 0, 2, 1])
+
+    # Nothing to merge.
+    same = mesh.merge_vertices_by_distance(merge_dist=0.01)
+    assert np.array_equal(same.vertices, vertices)
+    assert same.faces == faces[:5]  # empty face dropped
+
+    empty = Mesh(np.empty((0, 3)), []).merge_vertices_by_distance()
+    assert empty.vertex_count == 0 and empty.face_count == 0
+
+    # All faces collapse.
+    collapsed = Mesh(vertices[[1, 4, 5, 2, 8]], [[0, 1, 2], [1, 3, 4]]).merge_vertices_by_distance(merge_dist=0.15)
+    assert collapsed.vertex_count == 2 and collapsed.face_count == 0
+    assert collapsed.faces == [] and collapsed.face_count == 0
+    assert np.array_equal(collapsed.face_offsets, [0])
+    arrays = NavmeshArrays.from_simple_mesh(collapsed)
+    assert arrays.face_count == 0 and arrays.edge_count == 0
+
+
+def test_merge_large_mesh():
+    """Weld a grid of quads that each have their own vertices."""
+    size = 100
+    rng = np.random.default_rng(0)
+    corners = np.array([[0, 0], [1, 0], [1, 1], [0, 1]])
+    cells = np.stack(np.meshgrid(np.arange(size), np.arange(size), indexing="ij"), axis=-1).reshape(-1, 1, 2)
+    vertices = np.zeros((size * size * 4, 3))
+    vertices[:, :2] = (cells + corners).reshape(-1, 2) * 2.0
+    vertices += rng.uniform(-0.1, 0.1, size=vertices.shape)
+    mesh = Mesh.from_flat_faces(vertices, np.arange(len(vertices)), np.arange(0, len(vertices) + 1, 4))
+
+    merged = mesh.merge_vertices_by_distance(merge_dist=0.5)
+    assert merged.vertex_count == (size + 1) ** 2
+    assert merged.face_count == size * size and merged.has_triangles_only is False
+    assert np.all(merged.face_sizes == 4)
+    # All quad corners are in the right place.
+    merged_corners = merged.vertices[merged.face_indices].reshape(-1, 4, 3)[:, :, :2]
+    assert np.allclose(merged_corners, (cells + corners) * 2.0, atol=0.1)
+
+
+if __name__ == '__main__':
+    test_modify_faces()
+    test_merge_vertices_by_distance()
+    test_merge_large_mesh()
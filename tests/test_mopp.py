@@ -0,0 +1,45 @@
+"""Check that MOPP code built natively for map collisions finds every triangle, like vanilla MOPP code does."""
+from pathlib import Path
+
+import numpy as np
+
+from soulstruct.havok.core import HKX
+from soulstruct.havok.fromsoft.shared.map_collision import MapCollisionModel
+from soulstruct.havok.types.debug import SET_DEBUG_PRINT
+from soulstruct.havok.utilities.mopp import query_mopp_code
+
+RESOURCES = Path(__file__).parent / "resources"
+
+
+def check_mopp_code(hkx: HKX):
+    """Query the AABB of every triangle and check that its shape key is returned."""
+    _, physics_system = MapCollisionModel.get_hkx_physics(hkx)
+    shape, _ = MapCollisionModel.get_child_shape(physics_system)
+    mopp_code = MapCollisionModel.get_mopp_code(physics_system)
+    subpart_bit_count = getattr(shape, "numBitsForSubpartIndex", 12)
+    for subpart_index, mesh in enumerate(shape.meshstorage):
+        vertices = np.asarray(mesh.vertices, dtype=np.float32)[:, :3]
+        vertex_indices, _ = MapCollisionModel.get_vertex_indices_and_dtype(mesh)
+        faces = np.asarray(vertex_indices).reshape((-1, 4))[:, :3]
+        for face_index, face in enumerate(faces):
+            triangle = vertices[face]
+            shape_keys = query_mopp_code(mopp_code.data, mopp_code.info.offset, triangle.min(0), triangle.max(0))
+            assert (subpart_index << (32 - subpart_bit_count)) | face_index in shape_keys
+
+
+def test_mopp():
+    SET_DEBUG_PRINT(False)
+
+    vanilla_hkx = HKX.from_path(RESOURCES / "DES/h0004b0.hkx")
+    check_mopp_code(vanilla_hkx)
+
+    model = MapCollisionModel.from_hkx(vanilla_hkx)
+    hkx = model.to_hkx()
+    check_mopp_code(hkx)
+    re_hkx = HKX.from_bytes(hkx.to_bytes())
+    check_mopp_code(re_hkx)
+    assert len(MapCollisionModel.from_hkx(re_hkx).meshes) == len(model.meshes)
+
+
+if __name__ == '__main__':
+    test_mopp()
@@ -0,0 +1,110 @@
+"""Check that Elden Ring navmesh faces and edges are built from mesh arrays with correct opposite links, and converted
+to and from `hkaiNavMesh` instances and `Mesh`es.
+"""
+import numpy as np
+
+from soulstruct.havok.core import HavokFileFormat
+from soulstruct.havok.fromsoft.eldenring import NavmeshArrays, NavmeshHKX
+from soulstruct.havok.fromsoft.eldenring.navmesh import INVALID_PACKED_KEY, NAVMESH_EDGE_DTYPE, NAVMESH_FACE_DTYPE
+from soulstruct.havok.types import hk2018
+from soulstruct.havok.utilities.mesh import Mesh
+
+
+def test_navmesh_arrays():
+    assert NAVMESH_FACE_DTYPE.itemsize == hk2018.hkaiNavMeshFace.byte_size
+    assert NAVMESH_EDGE_DTYPE.itemsize == hk2018.hkaiNavMeshEdge.byte_size
+    assert NAVMESH_EDGE_DTYPE.fields["oppositeFace"][1] == 12
+
+    vertices = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0.5]], dtype=float)
+    mesh = Mesh(vertices, [[0, 1, 2, 3], [1, 4, 2]])
+    arrays = NavmeshArrays.from_simple_mesh(mesh, edge_flags=4)
+
+    assert arrays.faces["startEdgeIndex"].tolist() == [0, 4]
+    assert arrays.faces["numEdges"].tolist() == [4, 3]
+    assert arrays.edges["a"].tolist() == [0, 1, 2, 3, 1, 4, 2]
+    assert arrays.edges["b"].tolist() == [1, 2, 3, 0, 4, 2, 1]
+    # Only edges 1 (1 -> 2) and 6 (2 -> 1) are shared.
+    invalid = INVALID_PACKED_KEY
+    assert arrays.edges["oppositeEdge"].tolist() == [invalid, 6, invalid, invalid, invalid, invalid, 1]
+    assert arrays.edges["oppositeFace"].tolist() == [invalid, 1, invalid, invalid, invalid, invalid, 0]
+    assert np.all(arrays.edges["flags"] == 4)
+    assert arrays.get_edge_faces().tolist() == [0, 0, 0, 0, 1, 1, 1]
+
+    navmesh = arrays.to_hkai_navmesh()
+    assert navmesh.edges[1].oppositeEdge == 6 and navmesh.faces[1].numEdges == 3
+    assert navmesh.faceDataStriding == 0 and navmesh.faceData == []
+    assert np.allclose(navmesh.aabb.min, [0, 0, 0, 0]) and np.allclose(navmesh.aabb.max, [2, 1, 0.5, 0])
+
+    root = hk2018.hkRootLevelContainer(
+        namedVariants=[
+            hk2018.hkRootLevelContainerNamedVariant(name="NavMesh", className="hkaiNavMesh", variant=navmesh),
+        ],
+    )
+    hkx = NavmeshHKX(root=root, hk_format=HavokFileFormat.Tagfile, hk_version="20180100")
+    re_arrays = hkx.get_navmesh_arrays()
+    for name in ("vertices", "faces", "edges", "face_data", "edge_data"):
+        assert np.array_equal(getattr(re_arrays, name), getattr(arrays, name)), name
+    re_mesh = hkx.get_simple_mesh()
+    assert re_mesh.faces == mesh.faces
+    assert np.array_equal(re_mesh.vertices, vertices)
+
+    # Replace with a single triangle (with face data) in place.
+    triangle = NavmeshArrays.from_mesh(vertices[:3], [0, 1, 2], [0, 3], face_data=[[7]])
+    hkx.set_navmesh_arrays(triangle)
+    assert hkx.get_variant(0, hk2018.hkaiNavMesh) is navmesh
+    assert navmesh.faceData == [7] and navmesh.faceDataStriding == 1
+    assert hkx.get_simple_mesh().faces == [[0, 1, 2]]
+
+
+def test_large_navmesh_arrays():
+    """Build a grid of quads and check that all interior edges are linked."""
+    size = 100
+    grid = np.stack(np.meshgrid(np.arange(size + 1), np.arange(size + 1), indexing="ij"), axis=-1).reshape(-1, 2)
+    vertices = np.hstack((grid, np.zeros((len(grid), 1))))
+    corners = (np.arange(size)[:, None] * (size + 1) + np.arange(size)).ravel()
+    face_indices = np.stack((corners, corners + size + 1, corners + size + 2, corners + 1), axis=1).ravel()
+    arrays = NavmeshArrays.from_mesh(vertices, face_indices, np.arange(0, len(face_indices) + 1, 4))
+
+    edges = arrays.edges
+    linked = edges["oppositeEdge"] != INVALID_PACKED_KEY
+    assert linked.sum() == 4 * size * size - 4 * size  # all but boundary edges
+    opposite_edges = edges["oppositeEdge"][linked]
+    assert np.array_equal(edges["a"][opposite_edges], edges["b"][linked])
+    assert np.array_equal(edges["b"][opposite_edges], edges["a"][linked])
+    assert np.array_equal(edges["oppositeFace"][linked], opposite_edges // 4)
+
+    re_arrays = NavmeshArrays.from_hkai_navmesh(arrays.to_hkai_navmesh())
+    assert np.array_equal(re_arrays.edges, edges)
+    assert np.array_equal(re_arrays.faces, arrays.faces)
+
+
+def test_navmesh_arrays_edge_cases():
+    # No faces.
+    empty = NavmeshArrays.from_mesh(np.zeros((0, 3)), [], [0])
+    assert empty.face_count == 0 and empty.edge_count == 0
+    assert empty.face_data.shape == (0, 0) and empty.edge_data.shape == (0, 0)
+    empty_mesh = empty.get_simple_mesh()
+    assert empty_mesh.faces == [] and empty_mesh.face_count == 0
+    assert NavmeshArrays.from_simple_mesh(empty_mesh).face_count == 0
+    empty = NavmeshArrays.from_mesh(np.zeros((0, 3)), [], [0], face_data=np.zeros((0, 2)))
+    assert empty.face_data.shape == (0, 2)
+    assert empty.to_hkai_navmesh().faceDataStriding == 2
+
+    # Degenerate edge (1 -> 1) is not its own opposite.
+    vertices = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], dtype=float)
+    arrays = NavmeshArrays.from_mesh(vertices, [0, 1, 1, 2, 0, 2, 3], [0, 4, 7])
+    assert arrays.edges["a"].tolist() == [0, 1, 1, 2, 0, 2, 3]
+    assert arrays.edges["b"].tolist() == [1, 1, 2, 0, 2, 3, 0]
+    invalid = INVALID_PACKED_KEY
+    assert arrays.edges["oppositeEdge"].tolist() == [invalid, invalid, invalid, 4, 3, invalid, invalid]
+    assert arrays.edges["oppositeFace"].tolist() == [invalid, invalid, invalid, 1, 0, invalid, invalid]
+
+    # One-dimensional user data still has its striding inferred.
+    arrays = NavmeshArrays.from_mesh(vertices, [0, 1, 2, 0, 2, 3], [0, 3, 6], face_data=[5, 6, 7, 8])
+    assert arrays.face_data.tolist() == [[5, 6], [7, 8]]
+
+
+if __name__ == '__main__':
+    test_navmesh_arrays()
+    test_navmesh_arrays_edge_cases()
+    test_large_navmesh_arrays()
@@ -0,0 +1,85 @@
+"""Check that primitive arrays unpacked as NumPy arrays or `bytearray`s within `hk.numpy_primitive_arrays()` have the
+right types, shapes, and values, and pack to the same bytes as the default list arrays for both tagfiles and packfiles.
+"""
+from pathlib import Path
+
+import numpy as np
+
+from soulstruct.havok import HKX
+from soulstruct.havok.types import hk, hk2015
+from soulstruct.havok.types.debug import SET_DEBUG_PRINT
+from soulstruct.utilities.binary import BinaryWriter
+
+RESOURCES = Path(__file__).parent / "resources"
+
+
+def _check_numpy_primitive_arrays(animation_path: Path, skeleton_path: Path):
+    list_animation_hkx = HKX.from_path(animation_path)
+    list_skeleton_hkx = HKX.from_path(skeleton_path)
+    with hk.numpy_primitive_arrays():
+        animation_hkx = HKX.from_path(animation_path)
+        skeleton_hkx = HKX.from_path(skeleton_path)
+    assert not hk._NUMPY_PRIMITIVE_ARRAYS  # reset on exit
+
+    list_animation = list_animation_hkx.root.namedVariants[0].variant.animations[0]
+    animation = animation_hkx.root.namedVariants[0].variant.animations[0]
+    assert isinstance(list_animation.blockOffsets, list)
+    assert isinstance(animation.blockOffsets, np.ndarray)
+    assert animation.blockOffsets.dtype == np.uint32
+    assert animation.blockOffsets.shape == (len(list_animation.blockOffsets),)
+    assert animation.blockOffsets.tolist() == list_animation.blockOffsets
+    assert isinstance(animation.data, bytearray)  # `hkUint8`
+    assert list(animation.data) == list_animation.data
+
+    list_skeleton = list_skeleton_hkx.root.namedVariants[0].variant.skeletons[0]
+    skeleton = skeleton_hkx.root.namedVariants[0].variant.skeletons[0]
+    assert isinstance(skeleton.parentIndices, np.ndarray)
+    assert skeleton.parentIndices.dtype == np.int16
+    assert skeleton.parentIndices.shape == (len(list_skeleton.bones),)
+    assert skeleton.parentIndices.tolist() == list_skeleton.parentIndices
+
+    assert animation_hkx.to_bytes() == list_animation_hkx.to_bytes()
+    assert skeleton_hkx.to_bytes() == list_skeleton_hkx.to_bytes()
+
+    # Modified arrays of compatible types are packed directly, and round trip.
+    skeleton.parentIndices = skeleton.parentIndices.copy()  # unpacked arrays may be read-only views
+    skeleton.parentIndices[1] = 0
+    list_skeleton.parentIndices[1] = 0
+    re_data = skeleton_hkx.to_bytes()
+    assert re_data == list_skeleton_hkx.to_bytes()
+    with hk.numpy_primitive_arrays():
+        re_skeleton = HKX.from_bytes(re_data).root.namedVariants[0].variant.skeletons[0]
+    assert np.array_equal(re_skeleton.parentIndices, skeleton.parentIndices)
+
+
+def test_tagfile_numpy_primitive_arrays():
+    SET_DEBUG_PRINT(False)
+    _check_numpy_primitive_arrays(RESOURCES / "DSR/c2240/a00_3000.hkx", RESOURCES / "DSR/c2240/Skeleton.HKX")
+
+
+def test_packfile_numpy_primitive_arrays():
+    SET_DEBUG_PRINT(False)
+    _check_numpy_primitive_arrays(RESOURCES / "PTDE/c2240/a00_3000.hkx", RESOURCES / "PTDE/c2240/Skeleton.HKX")
+
+
+def test_try_pack_buffer():
+    """Buffers are only packed directly if `struct` would pack their values the same way."""
+    for byte_order in "<>":
+        writer = BinaryWriter(byte_order=byte_order)
+        assert hk2015.hkUint16._try_pack_buffer(writer, np.array([1, 2, 3], dtype=np.uint16))
+        assert hk2015.hkReal._try_pack_buffer(writer, np.array([0.5, 1.5], dtype=np.float64))  # float64 -> float32
+        assert hk2015.hkUint8._try_pack_buffer(writer, bytearray(b"\x01\x02"))
+        assert bytes(writer) == np.array([1, 2, 3], dtype=f"{byte_order}u2").tobytes() + np.array(
+            [0.5, 1.5], dtype=f"{byte_order}f4"
+        ).tobytes() + b"\x01\x02"
+
+        # Incompatible types are left for `struct` range checks.
+        assert not hk2015.hkUint16._try_pack_buffer(writer, np.array([1, 2, 3], dtype=np.int64))
+        assert not hk2015.hkReal._try_pack_buffer(writer, np.array([1, 2], dtype=np.int32))
+        assert not hk2015.hkInt16._try_pack_buffer(writer, b"\x01\x02")
+
+
+if __name__ == '__main__':
+    test_tagfile_numpy_primitive_arrays()
+    test_packfile_numpy_primitive_arrays()
+    test_try_pack_buffer()
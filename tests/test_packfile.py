@@ -81,7 +81,7 @@ def ptde_packfile_test():
 
 
 def dsr_spline_conversion_test():
-    """Test conversion of 2015 spline animations to 2010 interleaved, and vice versa, with Hork's tool."""
+    """Test conversion of 2015 spline animations to interleaved, and back to spline."""
     from soulstruct.havok.fromsoft.darksouls1r import AnimationHKX
 
     SET_DEBUG_PRINT(unpack=False, pack=False)
@@ -0,0 +1,38 @@
+"""Check that only selected named variants are unpacked when `variants` is passed to `HKX.from_path()`."""
+from pathlib import Path
+
+from soulstruct.havok import HKX
+from soulstruct.havok.types.debug import SET_DEBUG_PRINT
+
+RESOURCES = Path(__file__).parent / "resources"
+
+
+def test_select_variants():
+    SET_DEBUG_PRINT(False)
+
+    for file_name in ("PTDE/c2240/c2240.hkx", "DSR/c2240/c2240.hkx"):  # packfile and tagfile
+        full_hkx = HKX.from_path(RESOURCES / file_name)
+        class_names = [named_variant.className for named_variant in full_hkx.root.namedVariants]
+        assert "hkaSkeletonMapper" in class_names
+
+        hkx = HKX.from_path(RESOURCES / file_name, variants={"hkaSkeletonMapper"})
+        assert [named_variant.className for named_variant in hkx.root.namedVariants] == class_names
+        for named_variant, full_named_variant in zip(hkx.root.namedVariants, full_hkx.root.namedVariants):
+            assert named_variant.name == full_named_variant.name
+            if named_variant.className == "hkaSkeletonMapper":
+                mapping = named_variant.variant.mapping
+                full_mapping = full_named_variant.variant.mapping
+                assert mapping.skeletonA.name == full_mapping.skeletonA.name
+                assert len(mapping.simpleMappings) == len(full_mapping.simpleMappings)
+            else:
+                assert named_variant.variant is None
+
+    # Selecting every variant is the same as a normal unpack.
+    full_hkx = HKX.from_path(RESOURCES / "PTDE/c2240/c2240.hkx")
+    class_names = {named_variant.className for named_variant in full_hkx.root.namedVariants}
+    hkx = HKX.from_path(RESOURCES / "PTDE/c2240/c2240.hkx", variants=class_names)
+    assert hkx.to_bytes() == full_hkx.to_bytes()
+
+
+if __name__ == '__main__':
+    test_select_variants()
@@ -0,0 +1,46 @@
+"""Check `Skeleton` bone hierarchy construction and cached armature-space reference poses."""
+from pathlib import Path
+
+import numpy as np
+
+from soulstruct.havok.fromsoft.darksouls1r import SkeletonHKX
+from soulstruct.havok.types.debug import SET_DEBUG_PRINT
+from soulstruct.havok.utilities.maths import TRSTransform, Vector3
+
+RESOURCES = Path(__file__).parent / "resources"
+
+
+def test_skeleton_hierarchy():
+    SET_DEBUG_PRINT(False)
+
+    skeleton = SkeletonHKX.from_path(RESOURCES / "DSR/c2240/Skeleton.HKX").skeleton
+    parent_indices = list(skeleton.skeleton.parentIndices)
+    assert [bone.index for bone in skeleton.bones] == list(range(len(skeleton.skeleton.bones)))
+    assert skeleton.get_parent_indices() == parent_indices
+    for bone in skeleton.bones:
+        assert bone.name == skeleton.skeleton.bones[bone.index].name
+        assert [child.index for child in bone.children] == [i for i, p in enumerate(parent_indices) if p == bone.index]
+        assert bone.descending_hierarchy[-1] is bone
+        assert bone.descending_hierarchy[0].parent is None
+        assert all(b.parent is a for a, b in zip(bone.descending_hierarchy, bone.descending_hierarchy[1:]))
+
+    arma_array = skeleton.get_arma_space_reference_pose_array()
+    assert np.allclose(arma_array, [bone.get_reference_pose_in_arma_space().ravel() for bone in skeleton.bones])
+    assert skeleton.get_arma_space_reference_pose_array() is arma_array  # cached
+    arma_poses = skeleton.get_arma_space_reference_poses()
+    assert list(arma_poses) == [bone.name for bone in skeleton.bones]
+
+    # Changing a reference pose invalidates the cache.
+    root_bone = skeleton.get_root_bones()[0]
+    root_bone.set_reference_pose(TRSTransform(Vector3((1.0, 2.0, 3.0))) @ root_bone.get_reference_pose())
+    new_arma_array = skeleton.get_arma_space_reference_pose_array()
+    assert new_arma_array is not arma_array
+    assert np.allclose(new_arma_array, [bone.get_reference_pose_in_arma_space().ravel() for bone in skeleton.bones])
+
+    # Rebuilding the hierarchy also invalidates it.
+    skeleton.refresh_bones()
+    assert skeleton.get_arma_space_reference_pose_array() is not new_arma_array
+
+
+if __name__ == '__main__':
+    test_skeleton_hierarchy()
@@ -0,0 +1,85 @@
+"""Check that interleaved animations are spline-compressed natively, within tolerance, and with vanilla block fields,
+and that batched decompression matches decompressing each frame of each track separately.
+"""
+from pathlib import Path
+
+import numpy as np
+
+from soulstruct.havok.fromsoft.darksouls1r import AnimationHKX
+from soulstruct.havok.spline_compression import SplineCompressedAnimationData
+from soulstruct.havok.types import hk
+from soulstruct.havok.types.debug import SET_DEBUG_PRINT
+
+RESOURCES = Path(__file__).parent / "resources"
+
+
+def get_transform_array(frame_transforms) -> np.ndarray:
+    array = np.array([[[*t.translation, *t.rotation.data, *t.scale] for t in frame] for frame in frame_transforms])
+    array[..., 3:7] /= np.linalg.norm(array[..., 3:7], axis=-1, keepdims=True)  # splines are normalized in game
+    return array
+
+
+def get_max_errors(expected: np.ndarray, actual: np.ndarray) -> tuple[float, float, float]:
+    actual = actual.copy()
+    actual[..., 3:7] *= np.sign(np.sum(expected[..., 3:7] * actual[..., 3:7], axis=-1, keepdims=True))
+    errors = np.abs(expected - actual)
+    return errors[..., :3].max(), errors[..., 3:7].max(), errors[..., 7:].max()
+
+
+def test_spline_compression():
+    SET_DEBUG_PRINT(False)
+
+    vanilla = AnimationHKX.from_path(RESOURCES / "DSR/c2240/a00_3000.hkx")
+    interleaved = vanilla.to_interleaved_hkx()
+    spline = interleaved.to_spline_hkx()
+
+    re_spline = AnimationHKX.from_bytes(spline.to_bytes())
+    vanilla_animation = vanilla.animation_container.hkx_animation
+    animation = re_spline.animation_container.hkx_animation
+    assert re_spline.animation_container.is_spline
+    assert re_spline.animation_container.hkx_binding.animation is animation
+    for name in ("type", "numFrames", "numBlocks", "maxFramesPerBlock", "maskAndQuantizationSize", "blockOffsets"):
+        assert getattr(animation, name) == getattr(vanilla_animation, name), name
+    assert np.isclose(animation.blockDuration, vanilla_animation.blockDuration)
+    assert animation.floatBlockOffsets == [len(animation.data)]
+
+    expected = get_transform_array(interleaved.animation_container.interleaved_data)
+    actual = get_transform_array(re_spline.to_interleaved_hkx().animation_container.interleaved_data)
+    assert max(get_max_errors(expected, actual)) <= 0.001
+
+    # Longer animations are split into blocks that share their boundary frames.
+    long_expected = np.concatenate([expected, expected[::-1], expected])  # 303 frames
+    spline_data = SplineCompressedAnimationData.from_interleaved_transforms(long_expected, max_frames_per_block=64)
+    data, block_count, track_count = spline_data.pack()
+    assert block_count == 5
+    re_spline_data = SplineCompressedAnimationData(data, track_count, block_count)
+    long_actual = get_transform_array(re_spline_data.to_interleaved_transforms(len(long_expected), 64))
+    assert max(get_max_errors(long_expected, long_actual)) <= 0.001
+
+
+def test_batched_decompression():
+    SET_DEBUG_PRINT(False)
+
+    container = AnimationHKX.from_path(RESOURCES / "DSR/c2240/a00_3000.hkx").animation_container
+    container.load_spline_data()
+    animation = container.hkx_animation
+    frame_array = container.spline_data.to_interleaved_array(animation.numFrames, animation.maxFramesPerBlock)
+    assert frame_array.shape == (animation.numFrames, animation.numberOfTransformTracks, 10)
+    for frame_index in range(animation.numFrames):
+        for track_index, track in enumerate(container.spline_data.blocks[0]):
+            transform = track.get_trs_transform_at_frame(float(frame_index))
+            expected_row = [*transform.translation, *transform.rotation.data, *transform.scale]
+            assert np.array_equal(frame_array[frame_index, track_index], np.array(expected_row, dtype=np.float32))
+
+    interleaved = container.to_interleaved_container()
+    assert len(interleaved.hkx_animation.transforms) == frame_array.shape[0] * frame_array.shape[1]
+    with hk.struct_arrays():
+        interleaved = container.to_interleaved_container()
+    assert interleaved.hkx_animation.transforms.array.shape == (frame_array.shape[0] * frame_array.shape[1], 12)
+    assert np.array_equal(interleaved.get_interleaved_array(), frame_array)
+    assert container.is_spline and container.spline_data is not None  # original is unchanged
+
+
+if __name__ == '__main__':
+    test_spline_compression()
+    test_batched_decompression()
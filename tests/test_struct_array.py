@@ -0,0 +1,55 @@
+"""Check that fixed-layout struct arrays (e.g. `hkaSkeleton.referencePose`) are unpacked lazily within
+`hk.struct_arrays()` (and as plain lists otherwise) and round-trip edits.
+"""
+from pathlib import Path
+
+import numpy as np
+
+from soulstruct.havok import HKX
+from soulstruct.havok.types import hk
+from soulstruct.havok.types.debug import SET_DEBUG_PRINT
+from soulstruct.havok.types.struct_array import StructArray
+from soulstruct.havok.utilities.maths import Vector4
+
+RESOURCES = Path(__file__).parent / "resources"
+
+
+def test_reference_pose_struct_array():
+    SET_DEBUG_PRINT(False)
+
+    for file_name in ("PTDE/c2240/Skeleton.HKX", "DSR/c2240/Skeleton.HKX"):  # packfile and tagfile
+        list_hkx = HKX.from_path(RESOURCES / file_name)
+        list_reference_pose = list_hkx.root.namedVariants[0].variant.skeletons[0].referencePose
+        assert type(list_reference_pose) is list
+
+        with hk.struct_arrays():
+            hkx = HKX.from_path(RESOURCES / file_name)
+        assert not hk._STRUCT_ARRAYS  # reset on exit
+        reference_pose = hkx.root.namedVariants[0].variant.skeletons[0].referencePose
+        list_rows = [reference_pose.layout.get_row(t) for t in list_reference_pose]
+        assert np.array_equal(reference_pose.to_array(), list_rows)
+        assert hkx.to_bytes() == list_hkx.to_bytes()
+        assert isinstance(reference_pose, StructArray)
+        assert reference_pose.array.shape == (len(reference_pose), 12)
+        assert reference_pose._elements.count(None) == len(reference_pose)  # nothing created yet
+
+        # Edit one element in place, and add and remove others like a list.
+        reference_pose[3].translation = Vector4((1.0, 2.0, 3.0, 1.0))
+        reference_pose.append(type(reference_pose[0]).identity())
+        del reference_pose[0]
+        expected_array = reference_pose.to_array()
+        assert np.array_equal(expected_array[2, :4], [1.0, 2.0, 3.0, 1.0])
+
+        with hk.struct_arrays():
+            re_hkx = HKX.from_bytes(hkx.to_bytes())
+        re_reference_pose = re_hkx.root.namedVariants[0].variant.skeletons[0].referencePose
+        assert np.array_equal(re_reference_pose.to_array(), expected_array)
+        assert re_reference_pose[2].translation == Vector4((1.0, 2.0, 3.0, 1.0))
+
+        # A plain list of `hkQsTransform` instances must still pack to the same bytes.
+        re_hkx.root.namedVariants[0].variant.skeletons[0].referencePose = list(re_reference_pose)
+        assert re_hkx.to_bytes() == hkx.to_bytes()
+
+
+if __name__ == '__main__':
+    test_reference_pose_struct_array()
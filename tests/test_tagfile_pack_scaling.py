@@ -0,0 +1,83 @@
+"""Regression test for tagfile packing of files with very many items.
+
+Builds a synthetic DSR animation file with over 100k items (many copies of one animation, each with its own binding, so
+that every binding holds a repeated pointer to an item created much earlier) and checks that packing never searches the
+item list for an item's index (which made packing quadratic in item count) and that all pointer indices survive a
+round trip. Packing time itself is tracked by the `tagfile.pack_100k_items` benchmark in `benchmarks/run_benchmarks.py`.
+"""
+import copy
+import time
+from pathlib import Path
+
+from soulstruct.havok import HKX
+from soulstruct.havok.tagfile.packer import TagFilePacker
+from soulstruct.havok.types.debug import SET_DEBUG_PRINT
+
+RESOURCES = Path(__file__).parent / "resources"
+ANIMATION_COUNT = 1100  # each animation and binding adds ~92 items (arrays, strings, annotation tracks, etc.)
+
+
+class _CountingList(list):
+    """List that counts linear `index()` and `in` searches."""
+
+    searches = 0
+
+    def index(self, *args):
+        _CountingList.searches += 1
+        return super().index(*args)
+
+    def __contains__(self, value):
+        _CountingList.searches += 1
+        return super().__contains__(value)
+
+
+class _CountingTagFilePacker(TagFilePacker):
+    """Wraps the packer's item list in a `_CountingList` whenever it is assigned."""
+
+    @property
+    def items(self):
+        return self._items
+
+    @items.setter
+    def items(self, value):
+        self._items = _CountingList(value)
+
+
+def get_synthetic_hkx(animation_count: int) -> HKX:
+    hkx = HKX.from_path(RESOURCES / "DSR/c2240/a00_0000.hkx")
+    container = hkx.root.namedVariants[0].variant
+    animation, binding = container.animations[0], container.bindings[0]
+    container.animations = [copy.copy(animation) for _ in range(animation_count)]
+    container.bindings = []
+    for new_animation in container.animations:
+        new_binding = copy.copy(binding)
+        new_binding.animation = new_animation
+        container.bindings.append(new_binding)
+    return hkx
+
+
+def test_pack_100k_items():
+    SET_DEBUG_PRINT(False)
+
+    hkx = get_synthetic_hkx(ANIMATION_COUNT)
+    packer = _CountingTagFilePacker(hkx)
+    _CountingList.searches = 0
+    start_time = time.perf_counter()
+    data = bytes(packer.to_writer(hsh_overrides=hkx.hsh_overrides))
+    pack_time = time.perf_counter() - start_time
+    item_count = len(packer.items) - 1  # ignore null item
+    print(f"Packed {item_count} items in {pack_time:.3f} s ({item_count / pack_time:.0f} items/s).")
+
+    assert isinstance(packer.items, _CountingList)
+    assert item_count >= 100_000
+    assert _CountingList.searches == 0
+    assert all(item.index == i for i, item in enumerate(packer.items) if item is not None)
+
+    re_hkx = HKX.from_bytes(data)
+    container = re_hkx.root.namedVariants[0].variant
+    assert len(container.bindings) == ANIMATION_COUNT
+    assert all(b.animation is a for a, b in zip(container.animations, container.bindings, strict=True))
+
+
+if __name__ == '__main__':
+    test_pack_100k_items()
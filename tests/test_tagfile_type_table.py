@@ -0,0 +1,59 @@
+"""Check that tagfile varints are decoded in bulk exactly like `TagFileUnpacker.unpack_var_int()`, and that `TYPE`
+sections parsed into a columnar `TagTypeTable` produce the expected `TypeInfo`s.
+"""
+import random
+from pathlib import Path
+
+from soulstruct.utilities.binary import BinaryReader
+
+from soulstruct.havok.core import HKX
+from soulstruct.havok.tagfile import unpacker
+from soulstruct.havok.tagfile.type_table import TagTypeTable, decode_var_int, decode_var_ints
+from soulstruct.havok.types.debug import SET_DEBUG_PRINT
+
+RESOURCES = Path(__file__).parent / "resources"
+
+
+def test_var_ints():
+    rng = random.Random(0)
+    stream = bytearray()
+    expected = []
+    for first_byte in range(0b1111_1000):  # all valid markers
+        data = bytes([first_byte]) + rng.randbytes(7)
+        reader = BinaryReader(data)
+        value = unpacker.TagFileUnpacker.unpack_var_int(reader)
+        assert decode_var_int(data, 0) == (value, reader.position)
+        stream += data[:reader.position]
+        expected.append(value)
+    assert decode_var_ints(bytes(stream)) == expected
+
+
+def test_tagfile_type_table():
+    SET_DEBUG_PRINT(False)
+
+    data = (RESOURCES / "DSR/c2240/a00_3000.hkx").read_bytes()
+    unpacker.TagFileUnpacker.clear_type_section_cache()  # parse `TYPE` section again
+    hkx = HKX.from_bytes(data)
+
+    type_section_offset = data.index(b"TYPE") - 4
+    type_section_size = int.from_bytes(data[type_section_offset:type_section_offset + 4], "big") & 0x3FFFFFFF
+    table = TagTypeTable.unpack(data, type_section_offset + 8, type_section_offset + type_section_size)
+    assert table.names == [""] + [type_info.name for type_info in hkx.hk_type_infos[1:]]
+    assert table.hashes
+
+    root_index = table.names.index("hkRootLevelContainer")
+    assert [table.member_names[j] for j in table.member_ranges[root_index]] == ["namedVariants"]
+    type_infos = table.get_type_infos()
+    for type_info, hkx_type_info in zip(type_infos[1:], hkx.hk_type_infos[1:]):
+        assert type_info.get_full_py_name() == hkx_type_info.get_full_py_name()
+        assert [(m.name, m.offset, m.type_py_name) for m in type_info.members] == [
+            (m.name, m.offset, m.type_py_name) for m in hkx_type_info.members
+        ]
+        assert type_info.hsh == hkx_type_info.hsh
+        if hkx_type_info.py_class is not None:  # not generic
+            assert type_info.get_parent_value("byte_size") == hkx_type_info.py_class.byte_size
+
+
+if __name__ == '__main__':
+    test_var_ints()
+    test_tagfile_type_table()
@@ -0,0 +1,53 @@
+"""Check that tagfiles with a `TYPE` section identical to one already unpacked reuse its resolved type infos."""
+from pathlib import Path
+
+from soulstruct.havok.core import HKX
+from soulstruct.havok.tagfile import unpacker
+from soulstruct.havok.tagfile.unpacker import TagFileUnpacker
+from soulstruct.havok.types.debug import SET_DEBUG_PRINT
+
+RESOURCES = Path(__file__).parent / "resources"
+
+
+def test_type_cache():
+    SET_DEBUG_PRINT(False)
+    TagFileUnpacker.clear_type_section_cache()
+
+    data = (RESOURCES / "DSR/c2240/a00_3000.hkx").read_bytes()
+    hkx = HKX.from_bytes(data)
+    re_hkx = HKX.from_bytes(data)
+    assert re_hkx.hk_type_infos is hkx.hk_type_infos
+    assert all(
+        type_info.py_class is not None
+        for type_info in hkx.hk_type_infos[1:]
+        if type_info.name not in type_info.GENERIC_TYPE_NAMES
+    )
+    assert re_hkx.hsh_overrides == hkx.hsh_overrides and re_hkx.hsh_overrides is not hkx.hsh_overrides
+    assert bytes(re_hkx) == bytes(hkx)
+
+    # Different type section is unpacked separately.
+    skeleton_hkx = HKX.from_path(RESOURCES / "DSR/c2240/Skeleton.HKX")
+    assert skeleton_hkx.hk_type_infos is not hkx.hk_type_infos
+    assert len(unpacker._RESOLVED_TYPE_SECTIONS) == 2
+
+    # Cleared cache is unpacked again.
+    TagFileUnpacker.clear_type_section_cache()
+    assert not unpacker._RESOLVED_TYPE_SECTIONS
+    cleared_hkx = HKX.from_bytes(data)
+    assert cleared_hkx.hk_type_infos is not hkx.hk_type_infos
+    assert bytes(cleared_hkx) == bytes(hkx)
+
+    # Oldest type section is forgotten when the cache is full.
+    max_size = unpacker._MAX_RESOLVED_TYPE_SECTIONS
+    unpacker._MAX_RESOLVED_TYPE_SECTIONS = 1
+    try:
+        HKX.from_path(RESOURCES / "DSR/c2240/Skeleton.HKX")
+        assert len(unpacker._RESOLVED_TYPE_SECTIONS) == 1
+        assert HKX.from_bytes(data).hk_type_infos is not cleared_hkx.hk_type_infos
+    finally:
+        unpacker._MAX_RESOLVED_TYPE_SECTIONS = max_size
+        TagFileUnpacker.clear_type_section_cache()
+
+
+if __name__ == '__main__':
+    test_type_cache()
@@ -0,0 +1,103 @@
+"""Check that OBJ meshes are parsed and formatted in bulk correctly, including map collisions, objects/groups, relative
+indices and polygons, and large meshes.
+"""
+import time
+from pathlib import Path
+
+import numpy as np
+
+from soulstruct.havok.core import HKX
+from soulstruct.havok.fromsoft.shared.map_collision import MapCollisionModel
+from soulstruct.havok.types.debug import SET_DEBUG_PRINT
+from soulstruct.havok.utilities.wavefront import format_obj, parse_obj
+
+RESOURCES = Path(__file__).parent / "resources"
+
+
+def test_map_collision_obj():
+    SET_DEBUG_PRINT(False)
+
+    model = MapCollisionModel.from_hkx(HKX.from_path(RESOURCES / "DES/h0004b0.hkx"))
+    obj_text = model.to_obj()
+    assert obj_text.startswith(f"# OBJ file generated by Soulstruct from HKX with name: {model.name}\n")
+
+    obj_path = Path("_test_obj.obj")
+    obj_path.write_text(obj_text)
+    try:
+        re_model = MapCollisionModel.from_obj_path(obj_path, hkx_name=model.name, havok_module=model.havok_module)
+    finally:
+        obj_path.unlink()
+    assert len(re_model.meshes) == len(model.meshes)
+    for mesh, re_mesh in zip(model.meshes, re_model.meshes):
+        assert re_mesh.material_index == mesh.material_index
+        assert re_mesh.vertices.dtype == np.float32
+        assert np.array_equal(re_mesh.vertices3D, mesh.vertices3D)
+        assert np.array_equal(re_mesh.face_vertex_indices, mesh.face_vertex_indices)
+        assert re_mesh.faces.dtype == mesh.faces.dtype
+    assert re_model.to_obj() == obj_text
+
+
+def test_parse_obj():
+    obj_text = "\n".join([
+        "# comment",
+        "mtllib test.mtl",
+        "v 1 2 3",  # default mesh before first object
+        "v 4 5 6 1.0",  # optional `w`
+        "v 7 8 9",
+        "f 1/1/1 2/2/2 3/3/3",
+        "o First",
+        "v 0 0 0",
+        "v 1 0 0",
+        "v 1 1 0",
+        "v 0 1 0",
+        "vn 0 0 1",
+        "s off",
+        "f -4//1 -3//1 -2//1 -1//1",  # relative quad
+        "o Second",
+        "f 1 5 7",  # uses vertices of other meshes only
+    ])
+    meshes = parse_obj(obj_text, invert_x=False)
+    assert len(meshes) == 3
+    (v0, f0), (v1, f1), (v2, f2) = meshes
+    assert np.array_equal(v0, [[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+    assert np.array_equal(f0, [[0, 1, 2]])
+    assert np.array_equal(v1, [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])
+    assert np.array_equal(f1, [[0, 1, 2], [0, 2, 3]])  # fan-triangulated
+    assert np.array_equal(v2, [[1, 2, 3], [1, 0, 0], [0, 1, 0]])
+    assert np.array_equal(f2, [[0, 1, 2]])
+
+    # Groups start new meshes if there are no objects.
+    meshes = parse_obj("g A\nv 1 2 3\nv 4 5 6\nv 7 8 9\nf 1 2 3\ng B\nv 1 1 1\nf 1 2 4\n")
+    assert len(meshes) == 2
+    assert np.array_equal(meshes[0][0][:, 0], [-1, -4, -7])  # `invert_x`
+    assert np.array_equal(meshes[1][1], [[0, 1, 2]])
+
+    # Formatted meshes parse back exactly.
+    rng = np.random.default_rng(0)
+    meshes = [(rng.normal(size=(10, 3)), rng.integers(0, 10, size=(20, 3))) for _ in range(3)]
+    re_meshes = parse_obj(format_obj(meshes, names=["A", "B", "C"]))
+    for (vertices, faces), (re_vertices, re_faces) in zip(meshes, re_meshes, strict=True):
+        assert np.array_equal(re_vertices, vertices)
+        assert np.array_equal(re_faces, faces)
+
+
+def test_large_obj():
+    rng = np.random.default_rng(0)
+    vertices = rng.normal(size=(60_000, 4)).astype(np.float32)
+    faces = rng.integers(0, len(vertices), size=(120_000, 4)).astype(np.uint32)
+    meshes = [(vertices, faces), (vertices[:1000], faces[:500] % 1000)]
+
+    start = time.perf_counter()
+    obj_text = format_obj(meshes)
+    re_meshes = parse_obj(obj_text)
+    print(f"{sum(len(f) for _, f in meshes)} faces formatted and parsed in {time.perf_counter() - start:.3f} s")
+
+    for (vertices, faces), (re_vertices, re_faces) in zip(meshes, re_meshes, strict=True):
+        assert np.array_equal(re_vertices.astype(np.float32), vertices[:, :3])
+        assert np.array_equal(re_faces, faces[:, :3])
+
+
+if __name__ == '__main__':
+    test_map_collision_obj()
+    test_parse_obj()
+    test_large_obj()
@@ -0,0 +1,154 @@
+"""Check that Demon's Souls wavelet animations are decompressed natively into valid interleaved animations, that their
+data buffers repack exactly, and that interleaved animations are wavelet-compressed within tolerance.
+"""
+from pathlib import Path
+
+import numpy as np
+
+from soulstruct.havok.fromsoft.demonssouls import AnimationHKX
+from soulstruct.havok.fromsoft.demonssouls.anibnd import ANIBND
+from soulstruct.havok.types.debug import SET_DEBUG_PRINT
+from soulstruct.havok.wavelet_compression import WaveletCompressedAnimationData
+
+RESOURCES = Path(__file__).parent / "resources"
+
+
+def get_anibnd() -> ANIBND:
+    anibnd = ANIBND.from_path(RESOURCES / "DES/c5020.anibnd")
+    for entry in anibnd.entries:
+        entry.path = entry.path.replace("\\", "/")  # Windows entry paths
+    anibnd.load_from_entries()
+    return anibnd
+
+
+def test_wavelet_data_buffer():
+    SET_DEBUG_PRINT(False)
+
+    anibnd = get_anibnd()
+    for animation_hkx in anibnd.animations_hkx.values():
+        if not animation_hkx.animation_container.is_wavelet:
+            continue
+        animation = animation_hkx.animation_container.hkx_animation
+        wavelet_data = WaveletCompressedAnimationData.from_wavelet_animation(animation)
+        data_buffer, indices = wavelet_data.pack()
+        assert indices["offsetIdx"] == animation.qFormat.offsetIdx
+        assert indices["quantizedDataSize"] == animation.quantizedDataSize
+        # Only alignment padding (uninitialized in vanilla files) may differ.
+        vanilla_buffer = bytearray(animation.dataBuffer)
+        for padding in (
+            slice(indices["staticMaskIdx"] + 2 * wavelet_data.track_count, indices["staticDOFsIdx"]),
+            slice(indices["bitWidthIdx"] + wavelet_data.dynamic_dof_count, indices["blockIndexIdx"]),
+        ):
+            vanilla_buffer[padding] = bytes(padding.stop - padding.start)
+        assert data_buffer == vanilla_buffer
+
+
+def test_wavelet_compression():
+    SET_DEBUG_PRINT(False)
+
+    anibnd = get_anibnd()
+    reference_pose_array = anibnd.skeleton_hkx.skeleton.get_reference_pose_array()
+    vanilla = anibnd.animations_hkx[3000]
+    assert vanilla.animation_container.is_wavelet
+
+    interleaved = vanilla.to_interleaved_hkx()
+    container = interleaved.animation_container
+    assert container.is_interleaved
+    assert container.frame_count == vanilla.animation_container.frame_count
+    assert container.hkx_binding.animation is container.hkx_animation
+    array = container.get_interleaved_array()
+    assert np.allclose(np.linalg.norm(array[..., 3:7], axis=-1), 1.0, atol=1e-6)
+    # Almost all tracks keep their reference pose translation (bone length).
+    bone_translations = reference_pose_array[container.get_track_bone_indices(), 0:3]
+    assert np.mean(np.all(np.isclose(array[:, :, 0:3], bone_translations, atol=1e-3), axis=-1)) > 0.9
+    # Tracks are smooth across wavelet block boundaries.
+    steps = np.abs(np.diff(array[..., :7], axis=0))
+    assert steps[7::8].mean() < 2.0 * steps.mean()
+
+    wavelet = AnimationHKX.from_bytes(interleaved.to_wavelet_hkx().to_bytes())
+    assert wavelet.animation_container.is_wavelet
+    assert interleaved.animation_container.is_interleaved  # unchanged
+    re_array = wavelet.to_interleaved_hkx().animation_container.get_interleaved_array()
+    re_array[..., 3:7] *= np.sign(np.sum(array[..., 3:7] * re_array[..., 3:7], axis=-1, keepdims=True))
+    assert np.abs(re_array - array).max() <= 0.001  # default tolerances
+
+    # Tolerances are respected where 12-bit quantization is not enough, and where W is too small to reconstruct.
+    for animation_id, tolerance in ((3040, 0.001), (2050, 0.001), (3000, 0.0002)):
+        array = anibnd.animations_hkx[animation_id].to_interleaved_hkx().animation_container.get_interleaved_array()
+        wavelet_data = WaveletCompressedAnimationData.from_interleaved_array(
+            array, translation_tolerance=tolerance, rotation_tolerance=tolerance, scale_tolerance=tolerance
+        )
+        re_array = wavelet_data.to_interleaved_array()
+        re_array[..., 3:7] *= np.sign(np.sum(array[..., 3:7] * re_array[..., 3:7], axis=-1, keepdims=True))
+        assert np.abs(re_array - array).max() <= tolerance, animation_id
+        assert wavelet_data.bit_widths.max() > 12 or animation_id == 2050
+
+
+def test_wavelet_quantization_widening():
+    """Quantization bit widths are increased only for transform parts that exceed their tolerance."""
+    frame_count = 16
+    t = np.linspace(0.0, 1.0, frame_count)
+    array = np.tile(np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0]), (frame_count, 2, 1))
+    array[:, 0, 0] = 10.0 * t  # needs more than 12 bits for a tolerance of 0.001
+    array[:, 1, 0] = 0.5 * t
+    wavelet_data = WaveletCompressedAnimationData.from_interleaved_array(array)
+    assert wavelet_data.bit_widths[0] > 12 and wavelet_data.bit_widths[1] == 12
+    assert np.abs(wavelet_data.to_interleaved_array() - array).max() <= 0.001
+
+
+def test_static_wavelet_compression():
+    """Animations with no dynamic DOFs (all tracks static, or one frame) round-trip."""
+    pose = np.array([
+        [0.5, 0.0, 0.0, 0.0, 0.0, 0.6, 0.8, 1.0, 1.0, 1.0],
+        [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0],  # identity (cleared)
+        [0.0, 1.0, 2.0, 0.0, 0.0, 0.0, 1.0, 2.0, 2.0, 2.0],
+    ])
+    for frame_count in (1, 5, 10):
+        array = np.tile(pose, (frame_count, 1, 1))
+        wavelet_data = WaveletCompressedAnimationData.from_interleaved_array(array)
+        assert wavelet_data.dynamic_dof_count == 0
+        data_buffer, indices = wavelet_data.pack()
+        assert indices["quantizedDataSize"] == 0
+        assert wavelet_data.get_dynamic_dof_samples().shape == (frame_count, 0)
+        assert np.allclose(wavelet_data.to_interleaved_array(), array)
+
+    # Static pose of a vanilla animation.
+    SET_DEBUG_PRINT(False)
+    interleaved = get_anibnd().animations_hkx[3000].to_interleaved_hkx()
+    container = interleaved.animation_container
+    container.interleaved_data = [container.interleaved_data[0]] * container.frame_count
+    container.save_interleaved_data()
+    array = container.get_interleaved_array()
+    wavelet = AnimationHKX.from_bytes(interleaved.to_wavelet_hkx().to_bytes())
+    assert WaveletCompressedAnimationData.from_wavelet_animation(
+        wavelet.animation_container.hkx_animation
+    ).dynamic_dof_count == 0
+    re_array = wavelet.to_interleaved_hkx().animation_container.get_interleaved_array()
+    re_array[..., 3:7] *= np.sign(np.sum(array[..., 3:7] * re_array[..., 3:7], axis=-1, keepdims=True))
+    assert np.abs(re_array - array).max() < 0.001
+
+
+def test_reconstructed_rotation_components():
+    """Only static rotation components marked with +/-2 are reconstructed, not dynamic ones that overshoot one."""
+    # One track with clear translation and scale, dynamic rotation Y, and static rotation X, Z, and W (reconstructed).
+    wavelet_data = WaveletCompressedAnimationData(
+        frame_count=8,
+        block_size=8,
+        static_masks=np.array([0b0000_1000_0010_0010], dtype=np.uint16),
+        static_values=np.array([0.0, 0.0, -2.0], dtype=np.float32),
+        offsets=np.array([1.05], dtype=np.float32),  # quantization overshoot of a Y rotation of one
+        scales=np.array([0.0], dtype=np.float32),
+        bit_widths=np.array([1], dtype=np.uint8),
+        quantized_coefficients=np.array([[[0, -1, -1, -1, -1, -1, -1, -1]]], dtype=np.int32),
+    )
+    array = wavelet_data.to_interleaved_array()
+    assert array.shape == (8, 1, 10)
+    assert np.allclose(array[:, 0, 3:7], [0.0, 1.0, 0.0, 0.0])  # W reconstructed as zero, not Y
+
+
+if __name__ == '__main__':
+    test_wavelet_data_buffer()
+    test_wavelet_compression()
+    test_wavelet_quantization_widening()
+    test_static_wavelet_compression()
+    test_reconstructed_rotation_components()